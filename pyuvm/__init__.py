@@ -16,6 +16,13 @@ from pyuvm._error_classes import (
 from pyuvm._extension_classes import test
 
 # Section 18 Register Layer
+from pyuvm._reg.uvm_hdl import (
+    uvm_hdl_check_path,
+    uvm_hdl_deposit,
+    uvm_hdl_force,
+    uvm_hdl_read,
+    uvm_hdl_release,
+)
 from pyuvm._reg.uvm_mem import uvm_mem
 from pyuvm._reg.uvm_mem_mam import (
     uvm_mem_mam,
@@ -23,13 +30,24 @@ from pyuvm._reg.uvm_mem_mam import (
     uvm_mem_mam_policy,
     uvm_mem_region,
 )
+from pyuvm._reg.uvm_mem_walk_seq import uvm_mem_single_walk_seq, uvm_mem_walk_seq
 from pyuvm._reg.uvm_reg import uvm_reg
+from pyuvm._reg.uvm_reg_access_seq import (
+    uvm_reg_access_seq,
+    uvm_reg_single_access_seq,
+)
 from pyuvm._reg.uvm_reg_adapter import (
     uvm_reg_adapter,
     uvm_reg_tlm_adapter,
 )
 from pyuvm._reg.uvm_reg_backdoor import uvm_reg_backdoor
+from pyuvm._reg.uvm_reg_bit_bash_seq import (
+    uvm_reg_bit_bash_seq,
+    uvm_reg_single_bit_bash_seq,
+)
 from pyuvm._reg.uvm_reg_block import uvm_reg_block
+from pyuvm._reg.uvm_reg_block_state import uvm_reg_block_state
+from pyuvm._reg.uvm_reg_coverage import uvm_reg_coverage
 from pyuvm._reg.uvm_reg_cbs import (
     uvm_mem_cb,
     uvm_mem_cb_iter,
@@ -46,6 +64,7 @@ from pyuvm._reg.uvm_reg_cbs import (
 from pyuvm._reg.uvm_reg_field import uvm_reg_field
 from pyuvm._reg.uvm_reg_fifo import uvm_reg_fifo
 from pyuvm._reg.uvm_reg_file import uvm_reg_file
+from pyuvm._reg.uvm_reg_hw_reset_seq import uvm_reg_hw_reset_seq
 from pyuvm._reg.uvm_reg_indirect import (
     uvm_reg_indirect_data,
     uvm_reg_indirect_ftdr_seq,
@@ -84,6 +103,11 @@ from pyuvm._reg.uvm_reg_model import (
     uvm_status_e,
 )
 from pyuvm._reg.uvm_reg_predictor import uvm_reg_predictor
+from pyuvm._reg.uvm_reg_rdl import (
+    uvm_reg_rdl_build,
+    uvm_reg_rdl_generate,
+    uvm_reg_rdl_load,
+)
 from pyuvm._reg.uvm_reg_sequence import uvm_reg_frontdoor, uvm_reg_sequence
 from pyuvm._reg.uvm_vreg import (
     uvm_vreg,
@@ -222,6 +246,18 @@ from pyuvm._s12_uvm_tlm_interfaces import (
     uvm_transport_export,
     uvm_transport_port,
 )
+from pyuvm._s12_uvm_tlm2 import (
+    uvm_tlm_b_initiator_socket,
+    uvm_tlm_b_target_socket,
+    uvm_tlm_command_e,
+    uvm_tlm_dmi,
+    uvm_tlm_generic_payload,
+    uvm_tlm_nb_initiator_socket,
+    uvm_tlm_nb_target_socket,
+    uvm_tlm_phase_e,
+    uvm_tlm_response_status_e,
+    uvm_tlm_sync_e,
+)
 
 # Section 13
 from pyuvm._s13_predefined_component_classes import (
@@ -244,6 +280,8 @@ from pyuvm._s13_uvm_component import (
 # Section 14, 15 (Done as fresh Python design)
 from pyuvm._s14_15_python_sequences import (
     ResponseQueue,
+    load_stimulus,
+    uvm_replay_sequencer,
     uvm_seq_item_export,
     uvm_seq_item_port,
     uvm_sequence,
@@ -251,6 +289,14 @@ from pyuvm._s14_15_python_sequences import (
     uvm_sequence_item,
     uvm_sequencer,
     uvm_sequencer_base,
+    uvm_stimulus_recorder,
+)
+
+# Section 16
+from pyuvm._s16_recording_classes import (
+    load_tr_database,
+    uvm_tr_database,
+    uvm_tr_stream,
 )
 from pyuvm._utility_classes import (
     FIFO_DEBUG,
@@ -263,8 +309,10 @@ from pyuvm._utility_classes import (
     Singleton,
     UVM_ROOT_Singleton,
     UVMQueue,
+    UVMThreadPool,
     count_bits,
     uvm_void,
+    wait_any,
 )
 from pyuvm._version import __version__
 
@@ -282,6 +330,12 @@ __all__ = [  # noqa: RUF022
     "UVMFatalError",
     # Extension classes
     "test",
+    # Register layer classes - uvm_hdl
+    "uvm_hdl_check_path",
+    "uvm_hdl_deposit",
+    "uvm_hdl_force",
+    "uvm_hdl_read",
+    "uvm_hdl_release",
     # Register layer classes - uvm_mem
     "uvm_mem",
     # Register layer classes - uvm_mem_mam
@@ -289,15 +343,28 @@ __all__ = [  # noqa: RUF022
     "uvm_mem_mam",
     "uvm_mem_region",
     "uvm_mem_mam_policy",
+    # Register layer classes - uvm_mem_walk_seq
+    "uvm_mem_single_walk_seq",
+    "uvm_mem_walk_seq",
     # Register layer classes - uvm_reg
     "uvm_reg",
+    # Register layer classes - uvm_reg_access_seq
+    "uvm_reg_single_access_seq",
+    "uvm_reg_access_seq",
     # Register layer classes - uvm_reg_adapter
     "uvm_reg_adapter",
     "uvm_reg_tlm_adapter",
     # Register layer classes - uvm_reg_backdoor
     "uvm_reg_backdoor",
+    # Register layer classes - uvm_reg_bit_bash_seq
+    "uvm_reg_single_bit_bash_seq",
+    "uvm_reg_bit_bash_seq",
     # Register layer classes - uvm_reg_block
     "uvm_reg_block",
+    # Register layer classes - uvm_reg_block_state
+    "uvm_reg_block_state",
+    # Register layer classes - uvm_reg_coverage
+    "uvm_reg_coverage",
     # Register layer classes - uvm_reg_cbs
     "uvm_reg_cbs",
     "uvm_reg_cb",
@@ -316,6 +383,8 @@ __all__ = [  # noqa: RUF022
     "uvm_reg_fifo",
     # Register layer classes - uvm_reg_file
     "uvm_reg_file",
+    # Register layer classes - uvm_reg_hw_reset_seq
+    "uvm_reg_hw_reset_seq",
     # Register layer classes - uvm_reg_indirect
     "uvm_reg_indirect_data",
     "uvm_reg_indirect_ftdr_seq",
@@ -352,6 +421,10 @@ __all__ = [  # noqa: RUF022
     "uvm_object_string_pool",
     # Register layer classes - uvm_reg_predictor
     "uvm_reg_predictor",
+    # Register layer classes - uvm_reg_rdl
+    "uvm_reg_rdl_build",
+    "uvm_reg_rdl_generate",
+    "uvm_reg_rdl_load",
     # Register layer classes - uvm_reg_sequence
     "uvm_reg_sequence",
     # Register layer classes - uvm_vreg
@@ -466,6 +539,17 @@ __all__ = [  # noqa: RUF022
     "uvm_tlm_analysis_fifo",
     "uvm_tlm_req_rsp_channel",
     "uvm_tlm_transport_channel",
+    # Section 12.3 - TLM-2.0
+    "uvm_tlm_command_e",
+    "uvm_tlm_response_status_e",
+    "uvm_tlm_phase_e",
+    "uvm_tlm_sync_e",
+    "uvm_tlm_generic_payload",
+    "uvm_tlm_dmi",
+    "uvm_tlm_b_initiator_socket",
+    "uvm_tlm_b_target_socket",
+    "uvm_tlm_nb_initiator_socket",
+    "uvm_tlm_nb_target_socket",
     # Section 13 - Predefined component classes
     "uvm_active_passive_enum",
     "uvm_test",
@@ -487,6 +571,13 @@ __all__ = [  # noqa: RUF022
     "uvm_sequencer_base",
     "uvm_sequence_base",
     "uvm_sequence",
+    "uvm_stimulus_recorder",
+    "uvm_replay_sequencer",
+    "load_stimulus",
+    # Section 16 - Recording classes
+    "uvm_tr_database",
+    "uvm_tr_stream",
+    "load_tr_database",
     # Utility classes
     "FIFO_DEBUG",
     "PYUVM_DEBUG",
@@ -500,6 +591,8 @@ __all__ = [  # noqa: RUF022
     "Objection",
     "ObjectionHandler",
     "UVMQueue",
+    "UVMThreadPool",
+    "wait_any",
     # Version
     "__version__",
 ]
@@ -0,0 +1,218 @@
+"""HDL access for register and memory backdoors.
+
+These are the pyuvm counterparts of the ``uvm_hdl_*`` DPI routines of the
+SystemVerilog UVM library, built on cocotb simulator handles.  A path is a
+dotted hierarchical name, optionally starting with the name of the cocotb
+toplevel, with ``[n]`` selecting an element of an array, for example
+``"top.u_regs.ctrl_q"`` or ``"u_ram.mem[3]"``.
+
+Resolving a name walks the simulator hierarchy, so resolved handles are
+cached per path.  The cache is dropped when ``cocotb.top`` changes.  Values
+are deposited with ``Immediate``, so a backdoor write can be read back in the
+same time step and takes no simulation time.  Before cocotb 2.0, which has no
+``Immediate``, they are deposited with ``Deposit`` and applied at the end of
+the current delta cycle, children are looked up with ``_id()`` as hierarchy
+objects cannot be indexed by name, and X and Z bits are read from
+``BinaryValue.binstr``.
+
+The GPI has no bulk array access: a memory backdoor access reads or writes
+one array element handle per word.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any
+
+import cocotb
+from cocotb.handle import Force, Release
+
+from pyuvm._reg.uvm_reg_model import uvm_status_e
+from pyuvm._utils import cocotb_version_info
+
+if cocotb_version_info < (2, 0):
+    from cocotb.handle import Deposit as _Deposit
+else:
+    from cocotb.handle import Immediate as _Deposit
+
+if TYPE_CHECKING:
+    from pyuvm._reg.uvm_reg_model import uvm_hdl_path_concat
+
+__all__ = [
+    "uvm_hdl_check_path",
+    "uvm_hdl_deposit",
+    "uvm_hdl_force",
+    "uvm_hdl_read",
+    "uvm_hdl_release",
+]
+
+_PATH_PART = re.compile(r"([^\[\]]+)((?:\[\d+\])*)")
+_INDEX = re.compile(r"\[(\d+)\]")
+# X, Z and the other non-binary characters of a cocotb 1.x BinaryValue
+_NOT_01 = re.compile(r"[^01]")
+
+_handles: dict[str, Any] = {}
+_handles_root: Any = None
+
+
+def _resolve(path: str) -> Any | None:
+    global _handles_root
+    root = getattr(cocotb, "top", None)
+    if root is None:
+        return None
+    if root is not _handles_root:
+        _handles.clear()
+        _handles_root = root
+    handle = _handles.get(path)
+    if handle is not None:
+        return handle
+    parts = path.split(".")
+    if parts[0] == root._name:
+        parts = parts[1:]
+    handle = root
+    try:
+        for part in parts:
+            match = _PATH_PART.fullmatch(part)
+            if match is None:
+                return None
+            handle = _child(handle, match.group(1))
+            for index in _INDEX.findall(match.group(2)):
+                handle = handle[int(index)]
+    except (AttributeError, IndexError, KeyError, TypeError):
+        return None
+    _handles[path] = handle
+    return handle
+
+
+def _child(handle: Any, name: str) -> Any:
+    if cocotb_version_info < (2, 0):
+        # cocotb 1.x hierarchy objects cannot be indexed by name
+        return handle._id(name, extended=False)
+    return handle[name]
+
+
+def _read_handle(handle: Any) -> tuple[uvm_status_e, int]:
+    value = handle.value
+    if not getattr(value, "is_resolvable", True):
+        if cocotb_version_info < (2, 0):
+            # A BinaryValue has no resolve()
+            return uvm_status_e.UVM_HAS_X, int(_NOT_01.sub("0", value.binstr), 2)
+        return uvm_status_e.UVM_HAS_X, int(value.resolve("zeros"))
+    return uvm_status_e.UVM_IS_OK, int(value)
+
+
+def uvm_hdl_check_path(path: str) -> bool:
+    """Return True if ``path`` names an object in the simulation."""
+    return _resolve(path) is not None
+
+
+def uvm_hdl_deposit(path: str, value: int) -> bool:
+    """Deposit ``value`` on ``path``. Returns False if the path is unknown."""
+    handle = _resolve(path)
+    if handle is None:
+        return False
+    handle.value = _Deposit(value)
+    return True
+
+
+def uvm_hdl_force(path: str, value: int) -> bool:
+    """Force ``value`` on ``path`` until released."""
+    handle = _resolve(path)
+    if handle is None:
+        return False
+    handle.value = Force(value)
+    return True
+
+
+def uvm_hdl_release(path: str) -> bool:
+    """Release a value forced on ``path``."""
+    handle = _resolve(path)
+    if handle is None:
+        return False
+    handle.value = Release()
+    return True
+
+
+def uvm_hdl_read(path: str) -> tuple[uvm_status_e, int]:
+    """
+    :param path: HDL path to read
+    :return: (status, value). X and Z bits read as 0 with UVM_HAS_X, and an
+        unknown path returns UVM_NOT_OK.
+    """
+    handle = _resolve(path)
+    if handle is None:
+        return uvm_status_e.UVM_NOT_OK, 0
+    return _read_handle(handle)
+
+
+# The register layer resolves the full HDL paths of a register or memory
+# once, to lists of (handle, offset, size) slices, and accesses those.
+_resolved_concat = list[tuple[Any, int, int]]
+
+
+def _join_hdl_path(prefix: str, path: str, separator: str = ".") -> str:
+    if not prefix:
+        return path
+    if not path:
+        return prefix
+    return f"{prefix}{separator}{path}"
+
+
+def _element_handles(element: Any, kind: str) -> list[_resolved_concat] | None:
+    # ``element`` is a uvm_reg or uvm_mem.  Its handles are kept in
+    # ``element._hdl_handles`` until its HDL paths change or cocotb.top does.
+    root = getattr(cocotb, "top", None)
+    cached = element._hdl_handles.get(kind)
+    if cached is not None and cached[0] is root:
+        return cached[1]
+    paths: list[uvm_hdl_path_concat] = []
+    element.get_full_hdl_path(paths, kind)
+    resolved = _resolve_concats(paths) if paths else None
+    if resolved is not None:
+        element._hdl_handles[kind] = (root, resolved)
+    return resolved
+
+
+def _resolve_concats(
+    concats: list[uvm_hdl_path_concat],
+) -> list[_resolved_concat] | None:
+    resolved = []
+    for concat in concats:
+        slices = []
+        for hdl_slice in concat.slices:
+            handle = _resolve(hdl_slice.path)
+            if handle is None:
+                return None
+            slices.append((handle, hdl_slice.offset, hdl_slice.size))
+        resolved.append(slices)
+    return resolved
+
+
+def _read_concat(
+    concat: _resolved_concat, index: int | None = None
+) -> tuple[uvm_status_e, int]:
+    status = uvm_status_e.UVM_IS_OK
+    value = 0
+    for handle, offset, size in concat:
+        slice_status, slice_value = _read_handle(
+            handle if index is None else handle[index]
+        )
+        if slice_status != uvm_status_e.UVM_IS_OK:
+            status = slice_status
+        if offset < 0:
+            value = slice_value
+        else:
+            value |= (slice_value & ((1 << size) - 1)) << offset
+    return status, value
+
+
+def _write_concat(
+    concat: _resolved_concat, value: int, index: int | None = None
+) -> None:
+    for handle, offset, size in concat:
+        if offset >= 0:
+            slice_value = (value >> offset) & ((1 << size) - 1)
+        else:
+            slice_value = value
+        target = handle if index is None else handle[index]
+        target.value = _Deposit(slice_value)
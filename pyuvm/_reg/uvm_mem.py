@@ -5,12 +5,22 @@ from typing import TYPE_CHECKING, ClassVar
 from cocotb.triggers import Lock
 
 from pyuvm._error_classes import UVMFatalError
+from pyuvm._reg.uvm_hdl import (
+    _element_handles,
+    _join_hdl_path,
+    _read_concat,
+    _write_concat,
+)
+from pyuvm._reg.uvm_mem_file import _read_mem_file, _write_mem_file
+from pyuvm._reg.uvm_mem_mam import uvm_mem_mam, uvm_mem_mam_cfg
+from pyuvm._reg.uvm_reg_coverage import _cvr_bits, _included_coverage
 from pyuvm._reg.uvm_reg_item import uvm_reg_item
 from pyuvm._reg.uvm_reg_model import (
     uvm_access_e,
     uvm_coverage_model_e,
     uvm_door_e,
     uvm_elem_kind_e,
+    uvm_hdl_path_concat,
     uvm_status_e,
 )
 from pyuvm._reg.uvm_reg_reporting import (
@@ -22,12 +32,12 @@ from pyuvm._reg.uvm_reg_reporting import (
 from pyuvm._s05_base_classes import uvm_object
 
 if TYPE_CHECKING:
-    from pyuvm._reg.uvm_mem_mam import uvm_mem_mam
+    import os
+
     from pyuvm._reg.uvm_reg_backdoor import uvm_reg_backdoor
     from pyuvm._reg.uvm_reg_block import uvm_reg_block
     from pyuvm._reg.uvm_reg_map import uvm_reg_map, uvm_reg_map_info
     from pyuvm._reg.uvm_reg_model import (
-        uvm_hdl_path_concat,
         uvm_hdl_path_slice,
         uvm_reg_addr_t,
         uvm_reg_cvr_t,
@@ -87,12 +97,14 @@ class uvm_mem(uvm_object):
         self._n_bits: int = n_bits
         self._backdoor: uvm_reg_backdoor = None
         self._is_powered_down: bool = False
-        self._has_coverage: int = has_coverage
+        self._has_coverage: int = _cvr_bits(has_coverage)
         self._cover_on: int = 0
         self._fname: str = ""
         self._lineno: int = 0
         self._vregs: list[uvm_vreg] = []
-        # self._hdl_paths_pool: uvm_object_string_pool = None
+        self._hdl_paths_pool: dict[str, list[uvm_hdl_path_concat]] = {}
+        # Resolved HDL handles per path kind, see uvm_hdl._element_handles()
+        self._hdl_handles: dict[str, tuple] = {}
         self._mam: uvm_mem_mam = None
         uvm_mem._max_size = max(uvm_mem._max_size, self._n_bits)
 
@@ -101,8 +113,17 @@ class uvm_mem(uvm_object):
             raise UVMFatalError("Configure: parent is None")
         self._parent = parent
         self._parent._add_memory(self)
-        # HDL paths and the memory allocation manager are intentionally
-        # deferred; basic frontdoor memory configuration must not create them.
+        if hdl_path != "":
+            self.add_hdl_path_slice(hdl_path, -1, -1)
+        # The memory allocation manager is created on first use of ``mam``
+
+    @property
+    def mam(self) -> uvm_mem_mam:
+        """Memory allocation manager of all the locations of the memory."""
+        if self._mam is None:
+            cfg = uvm_mem_mam_cfg(self.get_n_bytes(), 0, self._size - 1)
+            self._mam = uvm_mem_mam(self.get_full_name(), cfg, self)
+        return self._mam
 
     def set_offset(
         self, map: uvm_reg_map, offset: uvm_reg_addr_t, unmapped: bool = False
@@ -159,8 +180,11 @@ class uvm_mem(uvm_object):
                 parent_map = parent_map.get_parent_map()
         return False
 
-    def get_maps(self, maps: list[uvm_reg_map]) -> None:
-        return self._maps
+    def get_maps(self, maps: list[uvm_reg_map]) -> list[uvm_reg_map]:
+        # NOTE: The list is mutable, emulate the pass by reference
+        maps.clear()
+        maps.extend(self._maps)
+        return maps
 
     def get_local_map(self, map: uvm_reg_map) -> uvm_reg_map | None:
         if not map:
@@ -421,7 +445,23 @@ class uvm_mem(uvm_object):
         fname: str = "",
         lineno: int = 0,
     ) -> uvm_status_e:
-        raise NotImplementedError
+        mask = (1 << self._n_bits) - 1
+        async with self._atomic:
+            rw = uvm_reg_item("mem_burst_write_item")
+            rw.set_element(self)
+            rw.set_element_kind(uvm_elem_kind_e.UVM_MEM)
+            rw.set_kind(uvm_access_e.UVM_BURST_WRITE)
+            rw.set_offset(offset)
+            rw.set_value_array([data & mask for data in value])
+            rw.set_door(path)
+            rw.set_map(map)
+            rw.set_parent_sequence(parent)
+            rw.set_priority(prior)
+            rw.set_extension(extension)
+            rw.set_fname(fname)
+            rw.set_line(lineno)
+            await self.do_write(rw)
+        return rw.get_status()
 
     async def burst_read(
         self,
@@ -435,7 +475,104 @@ class uvm_mem(uvm_object):
         fname: str = "",
         lineno: int = 0,
     ) -> uvm_status_e:
-        raise NotImplementedError
+        # As in SystemVerilog, the length of ``value`` sets the burst length
+        # and the data read replaces its contents.
+        async with self._atomic:
+            rw = uvm_reg_item("mem_burst_read_item")
+            rw.set_element(self)
+            rw.set_element_kind(uvm_elem_kind_e.UVM_MEM)
+            rw.set_kind(uvm_access_e.UVM_BURST_READ)
+            rw.set_offset(offset)
+            rw.set_value_size(len(value))
+            rw.set_door(path)
+            rw.set_map(map)
+            rw.set_parent_sequence(parent)
+            rw.set_priority(prior)
+            rw.set_extension(extension)
+            rw.set_fname(fname)
+            rw.set_line(lineno)
+            await self.do_read(rw)
+        value[:] = rw.get_value_array()
+        return rw.get_status()
+
+    async def load_file(
+        self,
+        filename: str | os.PathLike,
+        offset: uvm_reg_addr_t = 0,
+        path: uvm_door_e = uvm_door_e.UVM_DEFAULT_DOOR,
+        map: uvm_reg_map = None,
+        parent: uvm_sequence_base = None,
+        fmt: str | None = None,
+    ) -> uvm_status_e:
+        """
+        Writes a memory image to the memory with a ``burst_write()`` per run
+        of consecutive words. Only the parsing of the file is fast: the HDL
+        backdoor still writes each word with its own simulator access, and
+        the frontdoor as many bus transfers as the adapter needs.
+
+        :param filename: Image in ``"bin"`` format if its suffix is ``.bin``,
+            else in ``"hex"`` (``$readmemh``) format
+        :param offset: Offset of the first word of the image, to which the
+            ``@`` addresses of a hex image are relative
+        :param path: Door of the writes
+        :param map: Map of frontdoor writes
+        :param parent: Parent sequence of the writes
+        :param fmt: ``"hex"`` or ``"bin"`` to override the format
+        :return: ``UVM_NOT_OK`` if the image cannot be parsed, has words
+            wider than the memory, does not fit in it, or a write failed
+        """
+        try:
+            runs = _read_mem_file(filename, self._n_bits, fmt)
+        except ValueError as exc:
+            _report_error(
+                self,
+                "MEM_LOAD",
+                f"Cannot load {str(filename)!r} in memory "
+                f"{self.get_full_name()!r}: {exc}",
+            )
+            return uvm_status_e.UVM_NOT_OK
+        status = uvm_status_e.UVM_IS_OK
+        for first, words in runs:
+            run_status = await self.burst_write(
+                offset + first, words, path, map, parent
+            )
+            if run_status != uvm_status_e.UVM_IS_OK:
+                status = run_status
+        return status
+
+    async def dump_file(
+        self,
+        filename: str | os.PathLike,
+        offset: uvm_reg_addr_t = 0,
+        size: int | None = None,
+        path: uvm_door_e = uvm_door_e.UVM_DEFAULT_DOOR,
+        map: uvm_reg_map = None,
+        parent: uvm_sequence_base = None,
+        fmt: str | None = None,
+    ) -> uvm_status_e:
+        """
+        Reads words of the memory in a single ``burst_read()`` and writes
+        them to a memory image that ``load_file()`` can load.
+
+        :param filename: Image to write, in ``"bin"`` format if its suffix
+            is ``.bin``, else in ``"hex"`` format starting with an ``@offset``
+            directive
+        :param offset: Offset of the first word
+        :param size: Number of words, up to the end of the memory by default
+        :param path: Door of the reads
+        :param map: Map of frontdoor reads
+        :param parent: Parent sequence of the reads
+        :param fmt: ``"hex"`` or ``"bin"`` to override the format
+        :return: Status of the read, the file is not written unless it is
+            ``UVM_IS_OK``
+        """
+        if size is None:
+            size = self._size - offset
+        words = [0] * size
+        status = await self.burst_read(offset, words, path, map, parent)
+        if status == uvm_status_e.UVM_IS_OK:
+            _write_mem_file(filename, [(offset, words)], self._n_bits, fmt)
+        return status
 
     async def poke(
         self,
@@ -447,7 +584,21 @@ class uvm_mem(uvm_object):
         fname: str = "",
         lineno: int = 0,
     ) -> uvm_status_e:
-        raise NotImplementedError
+        async with self._atomic:
+            rw = uvm_reg_item("mem_poke_item")
+            rw.set_element(self)
+            rw.set_element_kind(uvm_elem_kind_e.UVM_MEM)
+            rw.set_kind(uvm_access_e.UVM_WRITE)
+            rw.set_offset(offset)
+            rw.set_value(value & ((1 << self._n_bits) - 1))
+            rw.set_door(uvm_door_e.UVM_BACKDOOR)
+            rw.set_parent_sequence(parent)
+            rw.set_extension(extension)
+            rw.set_bd_kind(kind)
+            rw.set_fname(fname)
+            rw.set_line(lineno)
+            await self.do_write(rw)
+        return rw.get_status()
 
     async def peek(
         self,
@@ -458,9 +609,23 @@ class uvm_mem(uvm_object):
         fname: str = "",
         lineno: int = 0,
     ) -> tuple[uvm_status_e, uvm_reg_data_t]:
-        raise NotImplementedError
+        async with self._atomic:
+            rw = uvm_reg_item("mem_peek_item")
+            rw.set_element(self)
+            rw.set_element_kind(uvm_elem_kind_e.UVM_MEM)
+            rw.set_kind(uvm_access_e.UVM_READ)
+            rw.set_offset(offset)
+            rw.set_value(0)
+            rw.set_door(uvm_door_e.UVM_BACKDOOR)
+            rw.set_parent_sequence(parent)
+            rw.set_extension(extension)
+            rw.set_bd_kind(kind)
+            rw.set_fname(fname)
+            rw.set_line(lineno)
+            await self.do_read(rw)
+        return rw.get_status(), rw.get_value()
 
-    def _check_access(self, rw: uvm_reg_item) -> uvm_reg_map_info | None:
+    def _check_access(self, rw: uvm_reg_item) -> tuple[bool, uvm_reg_map_info | None]:
         if rw.get_offset() < 0 or rw.get_offset() >= self._size:
             _report_error(
                 self,
@@ -469,79 +634,109 @@ class uvm_mem(uvm_object):
                 f"{self.get_full_name()!r}",
             )
             rw.set_status(uvm_status_e.UVM_NOT_OK)
-            return None
+            return False, None
+        is_write = rw.get_kind() in (
+            uvm_access_e.UVM_WRITE,
+            uvm_access_e.UVM_BURST_WRITE,
+        )
+        if rw.get_kind() in (
+            uvm_access_e.UVM_BURST_READ,
+            uvm_access_e.UVM_BURST_WRITE,
+        ) and (
+            rw.get_value_size() == 0
+            or rw.get_offset() + rw.get_value_size() > self._size
+        ):
+            _report_error(
+                self,
+                "MEM_BOUNDS",
+                f"Burst of {rw.get_value_size()} elements at offset "
+                f"0x{rw.get_offset():X} does not fit in "
+                f"{self.get_full_name()!r}",
+            )
+            rw.set_status(uvm_status_e.UVM_NOT_OK)
+            return False, None
         if rw.get_door() == uvm_door_e.UVM_DEFAULT_DOOR:
             rw.set_door(self._parent.get_default_door())
+        if rw.get_door() == uvm_door_e.UVM_BACKDOOR:
+            if self.get_backdoor() is None and not self.has_hdl_path(
+                rw.get_bd_kind() or ""
+            ):
+                _report_error(
+                    self,
+                    "MEM_NO_BACKDOOR",
+                    f"No backdoor access available for memory {self.get_full_name()!r}",
+                )
+                rw.set_status(uvm_status_e.UVM_NOT_OK)
+                return False, None
+            return True, None
         if rw.get_door() != uvm_door_e.UVM_FRONTDOOR:
             rw.set_status(uvm_status_e.UVM_NOT_OK)
-            return None
+            return False, None
         local_map = self.get_local_map(rw.get_map())
         rw.set_local_map(local_map)
         if local_map is None:
             rw.set_status(uvm_status_e.UVM_NOT_OK)
-            return None
+            return False, None
         info = local_map.get_mem_map_info(self)
         if info.unmapped and info.frontdoor is None:
             rw.set_status(uvm_status_e.UVM_NOT_OK)
-            return None
-        if info.frontdoor is None and self.get_n_bytes() > local_map.get_n_bytes():
-            _report_error(
-                self,
-                "MEM_MULTIBEAT",
-                f"Memory {self.get_full_name()!r} element width "
-                f"({self.get_n_bytes()} bytes) exceeds map bus width "
-                f"({local_map.get_n_bytes()} bytes); multi-beat memory "
-                "access is not supported",
-            )
-            rw.set_status(uvm_status_e.UVM_NOT_OK)
-            return None
+            return False, None
         access = self.get_access(local_map)
-        if rw.get_kind() == uvm_access_e.UVM_WRITE and access == "RO":
+        if is_write and access == "RO":
             _report_error(
                 self,
                 "MEM_WRITE_RO",
                 f"Cannot write read-only memory {self.get_full_name()!r}",
             )
             rw.set_status(uvm_status_e.UVM_NOT_OK)
-            return None
-        if rw.get_kind() == uvm_access_e.UVM_READ and access == "WO":
+            return False, None
+        if not is_write and access == "WO":
             _report_error(
                 self,
                 "MEM_READ_WO",
                 f"Cannot read write-only memory {self.get_full_name()!r}",
             )
             rw.set_status(uvm_status_e.UVM_NOT_OK)
-            return None
+            return False, None
         if not rw.get_map():
             rw.set_map(local_map)
-        return info
+        return True, info
 
     async def do_write(self, rw: uvm_reg_item) -> None:
-        info = self._check_access(rw)
-        if info is None:
+        rc, info = self._check_access(rw)
+        if not rc:
             return
         self._write_in_progress = True
         rw.set_status(uvm_status_e.UVM_IS_OK)
         try:
-            if info.frontdoor is None:
+            if rw.get_door() == uvm_door_e.UVM_BACKDOOR:
+                await self._backdoor_write(rw)
+            elif info.frontdoor is None:
                 await rw.get_local_map().do_write(rw)
             else:
                 await rw.get_local_map().do_frontdoor(rw, info.frontdoor)
+            if info is not None and rw.get_status() == uvm_status_e.UVM_IS_OK:
+                self._sample_access(rw, info, False)
         finally:
             self._write_in_progress = False
 
     async def do_read(self, rw: uvm_reg_item) -> None:
-        info = self._check_access(rw)
-        if info is None:
+        rc, info = self._check_access(rw)
+        if not rc:
             return
         self._read_in_progress = True
         rw.set_status(uvm_status_e.UVM_IS_OK)
         try:
-            if info.frontdoor is None:
+            if rw.get_door() == uvm_door_e.UVM_BACKDOOR:
+                await self._backdoor_read(rw)
+            elif info.frontdoor is None:
                 await rw.get_local_map().do_read(rw)
             else:
                 await rw.get_local_map().do_frontdoor(rw, info.frontdoor)
-            rw.set_value(rw.get_value() & ((1 << self._n_bits) - 1))
+            mask = (1 << self._n_bits) - 1
+            rw.set_value_array([data & mask for data in rw.get_value_array()])
+            if info is not None and rw.get_status() == uvm_status_e.UVM_IS_OK:
+                self._sample_access(rw, info, True)
         finally:
             self._read_in_progress = False
 
@@ -571,46 +766,147 @@ class uvm_mem(uvm_object):
         return info.frontdoor
 
     def set_backdoor(
-        self, bkdr: uvm_reg_backdoor, fname: str = "", lineno: int = 0
+        self, bkdr: uvm_reg_backdoor | None, fname: str = "", lineno: int = 0
     ) -> None:
-        raise NotImplementedError
+        self._fname = fname
+        self._lineno = lineno
+        if bkdr is not None:
+            bkdr.fname = fname
+            bkdr.lineno = lineno
+        self._backdoor = bkdr
 
-    def get_backdoor(self, inherited: bool = True) -> uvm_reg_backdoor:
-        raise NotImplementedError
+    def get_backdoor(self, inherited: bool = True) -> uvm_reg_backdoor | None:
+        if self._backdoor is None and inherited and self._parent is not None:
+            return self._parent.get_backdoor()
+        return self._backdoor
 
     def clear_hdl_path(self, kind: str = "RTL") -> None:
-        raise NotImplementedError
+        if kind == "ALL":
+            self._hdl_paths_pool.clear()
+        else:
+            self._hdl_paths_pool.pop(kind or self._parent.get_default_hdl_path(), None)
+        self._hdl_handles.clear()
 
     def add_hdl_path(self, slices: list[uvm_hdl_path_slice], kind: str = "RTL") -> None:
-        raise NotImplementedError
+        concat = uvm_hdl_path_concat()
+        concat.set(slices)
+        self._hdl_paths_pool.setdefault(kind, []).append(concat)
+        self._hdl_handles.clear()
 
     def add_hdl_path_slice(
         self, name: str, offset: int, size: int, first: bool = False, kind: str = "RTL"
     ) -> None:
-        raise NotImplementedError
+        paths = self._hdl_paths_pool.setdefault(kind, [])
+        if first or not paths:
+            paths.append(uvm_hdl_path_concat())
+        paths[-1].add_path(name, offset, size)
+        self._hdl_handles.clear()
 
     def has_hdl_path(self, kind: str = "") -> bool:
-        raise NotImplementedError
+        return (kind or self._parent.get_default_hdl_path()) in self._hdl_paths_pool
 
     def get_hdl_path(self, paths: list[uvm_hdl_path_concat], kind: str = "") -> None:
-        raise NotImplementedError
+        kind = kind or self._parent.get_default_hdl_path()
+        if kind not in self._hdl_paths_pool:
+            _report_error(
+                self,
+                "MEM_NO_HDL_PATH",
+                f"Memory {self.get_full_name()!r} does not have an HDL path "
+                f"for abstraction {kind!r}",
+            )
+            return
+        paths.extend(self._hdl_paths_pool[kind])
 
     def get_full_hdl_path(
         self, paths: list[uvm_hdl_path_concat], kind: str = "", separator: str = "."
     ) -> None:
-        raise NotImplementedError
+        kind = kind or self._parent.get_default_hdl_path()
+        hdl_paths: list[uvm_hdl_path_concat] = []
+        self.get_hdl_path(hdl_paths, kind)
+        parent_paths: list[str] = []
+        self._parent.get_full_hdl_path(parent_paths, kind, separator)
+        for concat in hdl_paths:
+            for parent_path in parent_paths or [""]:
+                full_concat = uvm_hdl_path_concat()
+                for hdl_slice in concat.slices:
+                    full_concat.add_path(
+                        _join_hdl_path(parent_path, hdl_slice.path, separator),
+                        hdl_slice.offset,
+                        hdl_slice.size,
+                    )
+                paths.append(full_concat)
 
     def get_hdl_path_kinds(self, kinds: list[str]) -> None:
-        raise NotImplementedError
+        kinds.extend(self._hdl_paths_pool)
 
+    def _get_hdl_handles(self, kind: str) -> list | None:
+        kind = kind or self._parent.get_default_hdl_path()
+        handles = _element_handles(self, kind)
+        if handles is None:
+            _report_error(
+                self,
+                "MEM_HDL_PATH",
+                f"Cannot resolve the {kind!r} HDL path of memory "
+                f"{self.get_full_name()!r}",
+            )
+        return handles
+
+    async def _backdoor_write(self, rw: uvm_reg_item) -> None:
+        bkdr = self.get_backdoor()
+        if bkdr is not None:
+            await bkdr.write(rw)
+        else:
+            await self.backdoor_write(rw)
+
+    async def _backdoor_read(self, rw: uvm_reg_item) -> None:
+        bkdr = self.get_backdoor()
+        if bkdr is not None:
+            await bkdr.read(rw)
+        else:
+            await self.backdoor_read(rw)
+
+    # A burst through the backdoor writes or reads its whole value array
+    # here without simulation time, but one array element handle, so one
+    # GPI access, per location and HDL slice.
     async def backdoor_read(self, rw: uvm_reg_item) -> None:
-        raise NotImplementedError
+        rw.set_status(self.backdoor_read_func(rw))
 
     async def backdoor_write(self, rw: uvm_reg_item) -> None:
-        raise NotImplementedError
+        concats = self._get_hdl_handles(rw.get_bd_kind())
+        if concats is None:
+            rw.set_status(uvm_status_e.UVM_NOT_OK)
+            return
+        offset = rw.get_offset()
+        for concat in concats:
+            for ii, value in enumerate(rw.get_value_array()):
+                _write_concat(concat, value, offset + ii)
+        rw.set_status(uvm_status_e.UVM_IS_OK)
 
     def backdoor_read_func(self, rw: uvm_reg_item) -> uvm_status_e:
-        raise NotImplementedError
+        concats = self._get_hdl_handles(rw.get_bd_kind())
+        if concats is None:
+            return uvm_status_e.UVM_NOT_OK
+        status = uvm_status_e.UVM_IS_OK
+        offset = rw.get_offset()
+        values = []
+        for ii in range(rw.get_value_size()):
+            element_status, value = _read_concat(concats[0], offset + ii)
+            if element_status != uvm_status_e.UVM_IS_OK:
+                status = element_status
+            for concat in concats[1:]:
+                _, other_value = _read_concat(concat, offset + ii)
+                if other_value != value:
+                    _report_warning(
+                        self,
+                        "MEM_BKDR_COPIES",
+                        f"Backdoor read of memory {self.get_full_name()!r} "
+                        f"offset 0x{offset + ii:X} found different values in "
+                        f"its HDL copies (0x{value:X} and 0x{other_value:X}); "
+                        "using the first",
+                    )
+            values.append(value)
+        rw.set_value_array(values)
+        return status
 
     async def pre_write(self, rw: uvm_reg_item) -> None:
         raise NotImplementedError
@@ -625,23 +921,45 @@ class uvm_mem(uvm_object):
         raise NotImplementedError
 
     def build_coverage(self, models: uvm_reg_cvr_t) -> uvm_reg_cvr_t:
-        raise NotImplementedError
+        return _included_coverage(self.get_full_name()) & _cvr_bits(models)
 
     def add_coverage(self, models: uvm_reg_cvr_t) -> None:
-        raise NotImplementedError
+        self._has_coverage |= _cvr_bits(models)
+
+    def has_coverage(self, models: uvm_reg_cvr_t) -> bool:
+        models = _cvr_bits(models)
+        return self._has_coverage & models == models
 
     def set_coverage(self, is_on: uvm_reg_cvr_t) -> uvm_reg_cvr_t:
-        raise NotImplementedError
+        self._cover_on = self._has_coverage & _cvr_bits(is_on)
+        return self._cover_on
 
     def get_coverage(self, is_on: uvm_reg_cvr_t) -> bool:
-        raise NotImplementedError
+        is_on = _cvr_bits(is_on)
+        return self.has_coverage(is_on) and self._cover_on & is_on == is_on
 
     def sample(self, offset: uvm_reg_addr_t, is_read: bool, map: uvm_reg_map) -> None:
-        raise NotImplementedError
+        # Functional coverage of derived classes, sampled for each element
+        # of the frontdoor accesses while coverage is on
+        pass
 
     def _sample(self, addr: uvm_reg_addr_t, is_read: bool, map: uvm_reg_map) -> None:
         self.sample(addr, is_read, map)
 
+    def _sample_access(
+        self, rw: uvm_reg_item, info: uvm_reg_map_info, is_read: bool
+    ) -> None:
+        if self._cover_on:
+            first = rw.get_offset()
+            for index in range(first, first + max(rw.get_value_size(), 1)):
+                offset = index * info.stride
+                self._sample(offset, is_read, rw.get_map())
+                self._parent._sample(info.offset + offset, is_read, rw.get_map())
+        # The built-in address-map bins count an access, burst or not, once
+        coverage = self._parent._coverage
+        if coverage is not None and coverage.on:
+            coverage.sample(self, 0, is_read, rw.get_local_map())
+
     # TODO: Should this be dunder methods?
     # extern virtual function void do_print (uvm_printer printer);
     # extern virtual function string convert2string();
@@ -0,0 +1,167 @@
+# Memory image files
+#
+# uvm_mem.load_file()/dump_file() and uvm_reg_block.readmemh()/writememh()
+# read and write memory images in two formats:
+#
+# - "hex": $readmemh text. Words are hexadecimal numbers separated by
+#   white space, with optional "_" separators, "//" and "/* */" comments,
+#   and "@<hex address>" directives that set the address of the next word.
+# - "bin": raw binary, each word in the little-endian bytes of the memory
+#   width, starting at the first address.
+#
+# Files are mapped with mmap rather than read: binary words are converted
+# by NumPy, or array.array without it, straight from the mapping, and hex
+# words are split out of the mapping by a compiled pattern and converted
+# with int() in a single map() call, so no per-word Python code runs.
+
+from __future__ import annotations
+
+import mmap
+import re
+import sys
+from array import array
+from itertools import repeat
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+__all__: list[str] = []
+
+_HEX_WORD = re.compile(rb"\S+")
+_HEX_ADDRESS = re.compile(rb"@(\S+)")
+_HEX_COMMENT = re.compile(rb"//[^\n]*|/\*.*?\*/", re.DOTALL)
+
+# array.array type code of the words of 1, 2, 4 and 8 bytes
+_ARRAY_CODES = {array(code).itemsize: code for code in ("Q", "L", "I", "H", "B")}
+
+
+def _file_format(path, fmt: str | None) -> str:
+    if fmt is None:
+        return "bin" if Path(path).suffix == ".bin" else "hex"
+    if fmt not in ("hex", "bin"):
+        raise ValueError(f"Unknown memory file format {fmt!r}, expected 'hex' or 'bin'")
+    return fmt
+
+
+def _hex_words(words: Sequence[bytes]) -> list[int]:
+    try:
+        return list(map(int, words, repeat(16)))
+    except ValueError:
+        bad = next(word for word in words if not _is_hex(word))
+        raise ValueError(
+            f"{bad.decode(errors='replace')!r} is not a hex word"
+        ) from None
+
+
+def _is_hex(word: bytes) -> bool:
+    try:
+        int(word, 16)
+    except ValueError:
+        return False
+    return True
+
+
+def _parse_hex(data) -> list[tuple[int, list[int]]]:
+    if data.find(b"/") != -1:
+        data = _HEX_COMMENT.sub(b" ", data)
+    # (address, words) of the words before the first @ directive, then of
+    # the words following each directive
+    runs = []
+    address = start = 0
+    for directive in _HEX_ADDRESS.finditer(data):
+        words = _HEX_WORD.findall(data, start, directive.start())
+        if words:
+            runs.append((address, _hex_words(words)))
+        address = _hex_words([directive[1]])[0]
+        start = directive.end()
+    words = _HEX_WORD.findall(data, start)
+    if words:
+        runs.append((address, _hex_words(words)))
+    return runs
+
+
+def _parse_bin(data, n_bytes: int) -> list[int]:
+    if len(data) % n_bytes:
+        raise ValueError(
+            f"The size of the file ({len(data)} bytes) is not a multiple "
+            f"of the {n_bytes}-byte word"
+        )
+    if np is not None and n_bytes in (1, 2, 4, 8):
+        return np.frombuffer(data, dtype=f"<u{n_bytes}").tolist()
+    code = _ARRAY_CODES.get(n_bytes)
+    if code is not None:
+        words = array(code)
+        words.frombytes(data)
+        if sys.byteorder == "big":
+            words.byteswap()
+        return words.tolist()
+    return [
+        int.from_bytes(data[ii : ii + n_bytes], "little")
+        for ii in range(0, len(data), n_bytes)
+    ]
+
+
+def _check_width(words: Sequence[int], n_bits: int) -> None:
+    # A write would silently drop the bits above the memory width
+    widest = max(words, default=0)
+    if widest >> n_bits:
+        raise ValueError(f"Word {widest:x} is wider than {n_bits} bits")
+
+
+def _read_mem_file(path, n_bits: int, fmt: str | None) -> list[tuple[int, list[int]]]:
+    """
+    :return: The (first address, words) of each run of words of the file
+    :raises ValueError: If the file is not in the format or has a word
+        wider than ``n_bits``
+    """
+    fmt = _file_format(path, fmt)
+    # An empty file cannot be mapped
+    if Path(path).stat().st_size == 0:
+        return []
+    with open(path, "rb") as mem_file:
+        with mmap.mmap(mem_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if fmt == "hex":
+                runs = _parse_hex(data)
+            else:
+                words = _parse_bin(data, (n_bits + 7) // 8)
+                runs = [(0, words)] if words else []
+    for _, words in runs:
+        _check_width(words, n_bits)
+    return runs
+
+
+def _write_mem_file(
+    path, runs: Sequence[tuple[int, Sequence[int]]], n_bits: int, fmt: str | None
+) -> None:
+    """Writes the (first address, words) runs, the first address of a
+    binary file being implied"""
+    fmt = _file_format(path, fmt)
+    with open(path, "wb") as mem_file:
+        if fmt == "bin":
+            for _, words in runs:
+                mem_file.write(_bin_bytes(words, (n_bits + 7) // 8))
+            return
+        word = f"{{:0{(n_bits + 3) // 4}x}}".format
+        for address, words in runs:
+            mem_file.write(f"@{address:x}\n".encode())
+            mem_file.write("\n".join(map(word, words)).encode())
+            mem_file.write(b"\n")
+
+
+def _bin_bytes(words: Sequence[int], n_bytes: int) -> bytes:
+    if np is not None and n_bytes in (1, 2, 4, 8):
+        return np.array(words, dtype=f"<u{n_bytes}").tobytes()
+    code = _ARRAY_CODES.get(n_bytes)
+    if code is not None:
+        packed = array(code, words)
+        if sys.byteorder == "big":
+            packed.byteswap()
+        return packed.tobytes()
+    return b"".join(word.to_bytes(n_bytes, "little") for word in words)
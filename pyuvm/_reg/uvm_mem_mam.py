@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import logging
+from bisect import bisect_left, bisect_right, insort
 from enum import Enum
+from itertools import islice
 from typing import TYPE_CHECKING
 
 from pyuvm._reg.uvm_reg_model import (
@@ -9,9 +12,14 @@ from pyuvm._reg.uvm_reg_model import (
     uvm_reg_data_t,
     uvm_status_e,
 )
+from pyuvm._reg.uvm_reg_reporting import (
+    uvm_reg_report_error as _report_error,
+)
 from pyuvm._utility_classes import uvm_void
 
 if TYPE_CHECKING:
+    from collections.abc import Collection, Iterator
+
     from pyuvm._reg.uvm_mem import uvm_mem
     from pyuvm._reg.uvm_reg_map import uvm_reg_map
     from pyuvm._reg.uvm_vreg import uvm_vreg
@@ -19,14 +27,163 @@ if TYPE_CHECKING:
     from pyuvm._s14_15_python_sequences import uvm_sequence_base
 
 __all__ = ["uvm_mem_mam", "uvm_mem_mam_cfg", "uvm_mem_mam_policy", "uvm_mem_region"]
+logger = logging.getLogger("RegModel")
+
+
+class alloc_mode_e(Enum):
+    GREEDY = 0
+    THRIFTY = 1
+
+
+class locality_e(Enum):
+    BROAD = 0
+    NEARBY = 1
 
 
 class uvm_mem_mam(uvm_void):
+    """
+    Memory allocation manager: allocates regions of the locations
+    ``cfg.start_offset`` to ``cfg.end_offset`` of a memory.
+
+    Unallocated locations are kept as a sorted list of free intervals,
+    merged again when regions are released, plus the same intervals sorted
+    by size. In ``GREEDY`` mode regions are taken from locations that were
+    never allocated before released ones are reused; in ``THRIFTY`` mode
+    released locations are reused first, from the smallest free interval
+    that fits. Both find a region without visiting the allocated ones.
+    """
+
+    alloc_mode_e = alloc_mode_e
+    locality_e = locality_e
+
     def __init__(self, name: str, cfg: uvm_mem_mam_cfg, mem: uvm_mem = None) -> None:
-        raise NotImplementedError
+        self._name = name
+        self._cfg = cfg
+        self._memory = mem
+        self.default_alloc = uvm_mem_mam_policy()
+        # Allocated regions by start offset, in allocation order
+        self._in_use: dict[uvm_reg_addr_t, uvm_mem_region] = {}
+        # Sorted start offsets of the free intervals, their end offsets and
+        # the (number of locations, start offset) of each of them, sorted
+        self._free: list[uvm_reg_addr_t] = []
+        self._free_end: dict[uvm_reg_addr_t, uvm_reg_addr_t] = {}
+        self._free_by_len: list[tuple[int, uvm_reg_addr_t]] = []
+        # Locations from here on have never been allocated
+        self._next_offset: uvm_reg_addr_t = cfg.start_offset
+        self._for_each: Iterator[uvm_mem_region] | None = None
+        self._add_free(cfg.start_offset, cfg.end_offset)
+
+    def _error(self, report_id: str, msg: str) -> None:
+        if self._memory is not None:
+            _report_error(self._memory, report_id, msg)
+        else:
+            logger.error(msg)
+
+    def _add_free(self, start: uvm_reg_addr_t, end: uvm_reg_addr_t) -> None:
+        if start > end:
+            return
+        insort(self._free, start)
+        self._free_end[start] = end
+        insort(self._free_by_len, (end - start + 1, start))
+
+    def _remove_free(self, start: uvm_reg_addr_t) -> uvm_reg_addr_t:
+        end = self._free_end.pop(start)
+        del self._free[bisect_left(self._free, start)]
+        del self._free_by_len[bisect_left(self._free_by_len, (end - start + 1, start))]
+        return end
+
+    def _take(self, start: uvm_reg_addr_t, end: uvm_reg_addr_t) -> bool:
+        # Remove [start, end] from the free intervals if it is all free
+        index = bisect_right(self._free, start) - 1
+        if index < 0:
+            return False
+        free_start = self._free[index]
+        free_end = self._free_end[free_start]
+        if free_end < end:
+            return False
+        self._remove_free(free_start)
+        self._add_free(free_start, start - 1)
+        self._add_free(end + 1, free_end)
+        return True
+
+    def _give_back(self, start: uvm_reg_addr_t, end: uvm_reg_addr_t) -> None:
+        index = bisect_left(self._free, start) - 1
+        if index >= 0 and self._free_end[self._free[index]] == start - 1:
+            start = self._free[index]
+            self._remove_free(start)
+        if end + 1 in self._free_end:
+            end = self._remove_free(end + 1)
+        self._add_free(start, end)
+
+    def _rebuild_free(self) -> None:
+        self._free.clear()
+        self._free_end.clear()
+        self._free_by_len.clear()
+        offset = self._cfg.start_offset
+        for start in sorted(self._in_use):
+            self._add_free(offset, start - 1)
+            offset = self._in_use[start].get_end_offset() + 1
+        self._add_free(offset, self._cfg.end_offset)
+
+    def _place(self, alloc: uvm_mem_mam_policy) -> uvm_reg_addr_t | None:
+        length = alloc.len
+        align = max(alloc.alignment, 1)
+        low = max(alloc.min_offset, self._cfg.start_offset)
+        high = self._cfg.end_offset
+        if alloc.max_offset is not None:
+            high = min(high, alloc.max_offset)
+
+        def fit(start: uvm_reg_addr_t, end: uvm_reg_addr_t) -> uvm_reg_addr_t | None:
+            start = max(start, low)
+            start += -start % align
+            if start + length - 1 <= min(end, high):
+                return start
+            return None
+
+        if self._cfg.mode == alloc_mode_e.GREEDY:
+            index = bisect_right(self._free, self._next_offset) - 1
+            if index >= 0:
+                end = self._free_end[self._free[index]]
+                offset = fit(self._next_offset, end)
+                if offset is not None:
+                    return offset
+        # Smallest free interval that fits. Only intervals too small once
+        # aligned or outside [min_offset, max_offset] are skipped.
+        index = bisect_left(self._free_by_len, (length, -1))
+        for n_locations, start in islice(self._free_by_len, index, None):
+            offset = fit(start, start + n_locations - 1)
+            if offset is not None:
+                return offset
+        return None
 
     def reconfigure(self, cfg: uvm_mem_mam_cfg = None) -> uvm_mem_mam_cfg:
-        raise NotImplementedError
+        if cfg is None:
+            return self._cfg
+        if cfg.n_bytes != self._cfg.n_bytes:
+            self._error(
+                "MAM_CFG",
+                "Cannot reconfigure Memory Allocation Manager with a different "
+                f"number of bytes ({cfg.n_bytes} != {self._cfg.n_bytes})",
+            )
+            return self._cfg
+        for region in self._in_use.values():
+            if (
+                region.get_start_offset() < cfg.start_offset
+                or region.get_end_offset() > cfg.end_offset
+            ):
+                self._error(
+                    "MAM_CFG",
+                    "Cannot reconfigure Memory Allocation Manager with a "
+                    "currently allocated region outside of the managed address "
+                    f"range ([{region.get_start_offset()}:"
+                    f"{region.get_end_offset()}] outside of "
+                    f"[{cfg.start_offset}:{cfg.end_offset}])",
+                )
+                return self._cfg
+        previous, self._cfg = self._cfg, cfg
+        self._next_offset = max(self._next_offset, cfg.start_offset)
+        self._rebuild_free()
+        return previous
 
     def reserve_region(
         self,
@@ -34,8 +191,53 @@ class uvm_mem_mam(uvm_void):
         n_bytes: int,
         fname: str = "",
         lineno: int = 0,
-    ) -> uvm_mem_region:
-        raise NotImplementedError
+    ) -> uvm_mem_region | None:
+        """
+        :param start_offset: First location of the region
+        :param n_bytes: Number of bytes of the region
+        :return: The region, or None if the locations are not available
+        """
+        if n_bytes <= 0:
+            self._error("MAM_RESERVE", "Cannot reserve 0 bytes")
+            return None
+        cfg = self._cfg
+        if start_offset < cfg.start_offset:
+            self._error(
+                "MAM_RESERVE",
+                f"Cannot reserve before start of memory space: "
+                f"0x{start_offset:X} < 0x{cfg.start_offset:X}",
+            )
+            return None
+        end_offset = start_offset + (n_bytes - 1) // cfg.n_bytes
+        if end_offset > cfg.end_offset:
+            self._error(
+                "MAM_RESERVE",
+                f"Cannot reserve past end of memory space: "
+                f"0x{end_offset:X} > 0x{cfg.end_offset:X}",
+            )
+            return None
+        if not self._take(start_offset, end_offset):
+            overlapping = next(
+                region.convert2string()
+                for region in self._in_use.values()
+                if region.get_start_offset() <= end_offset
+                and region.get_end_offset() >= start_offset
+            )
+            self._error(
+                "MAM_RESERVE",
+                f"Cannot reserve [0x{start_offset:X}:0x{end_offset:X}] because "
+                f"it overlaps with {overlapping}",
+            )
+            return None
+        n_locations = end_offset - start_offset + 1
+        region = uvm_mem_region(
+            start_offset, end_offset, n_locations, n_locations * cfg.n_bytes, self
+        )
+        region._fname = fname
+        region._lineno = lineno
+        self._in_use[start_offset] = region
+        self._next_offset = max(self._next_offset, end_offset + 1)
+        return region
 
     def request_region(
         self,
@@ -43,26 +245,79 @@ class uvm_mem_mam(uvm_void):
         alloc: uvm_mem_mam_policy = None,
         fname: str = "",
         lineno: int = 0,
-    ) -> uvm_mem_region:
-        raise NotImplementedError
+    ) -> uvm_mem_region | None:
+        """
+        :param n_bytes: Number of bytes of the region
+        :param alloc: Constraints on the region, ``default_alloc`` if None
+        :return: The region, or None if there is no room for it
+        """
+        if n_bytes <= 0:
+            self._error("MAM_REQUEST", "Cannot request 0 bytes")
+            return None
+        if alloc is None:
+            alloc = self.default_alloc
+        alloc.len = (n_bytes - 1) // self._cfg.n_bytes + 1
+        alloc.in_use = self._in_use.values()
+        start_offset = self._place(alloc)
+        if start_offset is None:
+            self._error(
+                "MAM_REQUEST",
+                f"Unable to find a free region of {alloc.len} locations in "
+                f"memory allocation manager {self._name!r}",
+            )
+            return None
+        alloc.start_offset = start_offset
+        return self.reserve_region(start_offset, n_bytes, fname, lineno)
 
     def release_region(self, region: uvm_mem_region) -> None:
-        raise NotImplementedError
+        if region is None:
+            return
+        start_offset = region.get_start_offset()
+        if self._in_use.get(start_offset) is not region:
+            self._error(
+                "MAM_RELEASE",
+                f"Attempting to release unallocated region {region.convert2string()}",
+            )
+            return
+        del self._in_use[start_offset]
+        self._give_back(start_offset, region.get_end_offset())
 
     def release_all_regions(self) -> None:
-        raise NotImplementedError
-
-    def for_each(reset: bool = False) -> uvm_mem_region:
-        raise NotImplementedError
-
-    def get_memory(self) -> uvm_mem:
-        raise NotImplementedError
-
-    # TODO: Should these be dunder methods?
-    # extern function string convert2string();
+        self._in_use.clear()
+        self._next_offset = self._cfg.start_offset
+        self._rebuild_free()
+
+    def for_each(self, reset: bool = False) -> uvm_mem_region | None:
+        """
+        :param reset: Restart from the first allocated region
+        :return: The next allocated region, None after the last one
+        """
+        if reset or self._for_each is None:
+            self._for_each = iter(list(self._in_use.values()))
+        return next(self._for_each, None)
+
+    def get_memory(self) -> uvm_mem | None:
+        if self._memory is None:
+            logger.error(
+                "From memory allocation manager %r: no memory is associated with it",
+                self._name,
+            )
+        return self._memory
+
+    def convert2string(self) -> str:
+        lines = [
+            f"Allocated memory regions in {self._name}:",
+            *(
+                f"   {self._in_use[start].convert2string()}"
+                for start in sorted(self._in_use)
+            ),
+        ]
+        return "\n".join(lines)
 
 
 class uvm_mem_region(uvm_void):
+    """Locations allocated by a uvm_mem_mam; accesses are relative to them."""
+
     def __init__(
         self,
         start_offset: uvm_reg_addr_t,
@@ -71,30 +326,59 @@ class uvm_mem_region(uvm_void):
         n_bytes: int,
         parent: uvm_mem_mam,
     ) -> None:
-        raise NotImplementedError
+        self._start_offset = start_offset
+        self._end_offset = end_offset
+        self._len = len
+        self._n_bytes = n_bytes
+        self._parent = parent
+        self._vreg: uvm_vreg = None
+        self._fname: str = ""
+        self._lineno: int = 0
 
     def get_start_offset(self) -> uvm_reg_addr_t:
-        raise NotImplementedError
+        return self._start_offset
 
     def get_end_offset(self) -> uvm_reg_addr_t:
-        raise NotImplementedError
+        return self._end_offset
 
     def get_len(self) -> int:
-        raise NotImplementedError
+        return self._len
 
     def get_n_bytes(self) -> int:
-        raise NotImplementedError
+        return self._n_bytes
 
     def release_region(self) -> None:
-        raise NotImplementedError
+        self._parent.release_region(self)
 
-    def get_memory(self) -> uvm_mem:
-        raise NotImplementedError
+    def get_memory(self) -> uvm_mem | None:
+        return self._parent.get_memory()
 
     def get_virtual_registers(
         self,
     ) -> uvm_vreg:
-        raise NotImplementedError
+        return self._vreg
+
+    def convert2string(self) -> str:
+        return f"['h{self._start_offset:x}:'h{self._end_offset:x}]"
+
+    def _get_memory_for(self, what: str, offset: int, n_locations: int) -> uvm_mem:
+        # The memory to access, or None after reporting why it cannot be
+        mem = self.get_memory()
+        if mem is None:
+            logger.error(
+                "Cannot use uvm_mem_region.%s() on an unallocated region", what
+            )
+            return None
+        if offset < 0 or offset + n_locations > self._len:
+            _report_error(
+                mem,
+                "MAM_REGION",
+                f"Attempting to {what} outside of the allocated region "
+                f"{self.convert2string()}: offset {offset}, {n_locations} "
+                f"location(s), region length {self._len}",
+            )
+            return None
+        return mem
 
     async def write(
         self,
@@ -108,7 +392,20 @@ class uvm_mem_region(uvm_void):
         fname: str = "",
         lineno: int = 0,
     ) -> uvm_status_e:
-        raise NotImplementedError
+        mem = self._get_memory_for("write", offset, 1)
+        if mem is None:
+            return uvm_status_e.UVM_NOT_OK
+        return await mem.write(
+            self._start_offset + offset,
+            value,
+            path,
+            map,
+            parent,
+            prior,
+            extension,
+            fname,
+            lineno,
+        )
 
     async def read(
         self,
@@ -121,12 +418,24 @@ class uvm_mem_region(uvm_void):
         fname: str = "",
         lineno: int = 0,
     ) -> tuple[uvm_status_e, uvm_reg_data_t]:
-        raise NotImplementedError
+        mem = self._get_memory_for("read", offset, 1)
+        if mem is None:
+            return uvm_status_e.UVM_NOT_OK, 0
+        return await mem.read(
+            self._start_offset + offset,
+            path,
+            map,
+            parent,
+            prior,
+            extension,
+            fname,
+            lineno,
+        )
 
     async def burst_write(
         self,
         offset: uvm_reg_addr_t,
-        value: uvm_reg_data_t,
+        value: list[uvm_reg_data_t],
         path: uvm_door_e = uvm_door_e.UVM_DEFAULT_DOOR,
         map: uvm_reg_map = None,
         parent: uvm_sequence_base = None,
@@ -135,11 +444,25 @@ class uvm_mem_region(uvm_void):
         fname: str = "",
         lineno: int = 0,
     ) -> uvm_status_e:
-        raise NotImplementedError
+        mem = self._get_memory_for("burst_write", offset, len(value))
+        if mem is None:
+            return uvm_status_e.UVM_NOT_OK
+        return await mem.burst_write(
+            self._start_offset + offset,
+            value,
+            path,
+            map,
+            parent,
+            prior,
+            extension,
+            fname,
+            lineno,
+        )
 
     async def burst_read(
         self,
         offset: uvm_reg_addr_t,
+        value: list[uvm_reg_data_t],
         path: uvm_door_e = uvm_door_e.UVM_DEFAULT_DOOR,
         map: uvm_reg_map = None,
         parent: uvm_sequence_base = None,
@@ -147,8 +470,23 @@ class uvm_mem_region(uvm_void):
         extension: uvm_object = None,
         fname: str = "",
         lineno: int = 0,
-    ) -> tuple[uvm_status_e, list[uvm_reg_data_t]]:
-        raise NotImplementedError
+    ) -> uvm_status_e:
+        # As uvm_mem.burst_read(), the length of ``value`` sets the burst
+        # length and the data read replaces its contents.
+        mem = self._get_memory_for("burst_read", offset, len(value))
+        if mem is None:
+            return uvm_status_e.UVM_NOT_OK
+        return await mem.burst_read(
+            self._start_offset + offset,
+            value,
+            path,
+            map,
+            parent,
+            prior,
+            extension,
+            fname,
+            lineno,
+        )
 
     async def poke(
         self,
@@ -159,7 +497,17 @@ class uvm_mem_region(uvm_void):
         fname: str = "",
         lineno: int = 0,
     ) -> uvm_status_e:
-        raise NotImplementedError
+        mem = self._get_memory_for("poke", offset, 1)
+        if mem is None:
+            return uvm_status_e.UVM_NOT_OK
+        return await mem.poke(
+            self._start_offset + offset,
+            value,
+            parent=parent,
+            extension=extension,
+            fname=fname,
+            lineno=lineno,
+        )
 
     async def peek(
         self,
@@ -169,50 +517,48 @@ class uvm_mem_region(uvm_void):
         fname: str = "",
         lineno: int = 0,
     ) -> tuple[uvm_status_e, uvm_reg_data_t]:
-        raise NotImplementedError
-
-    # TODO: Should these be dunder methods?
-    # extern function string convert2string();
+        mem = self._get_memory_for("peek", offset, 1)
+        if mem is None:
+            return uvm_status_e.UVM_NOT_OK, 0
+        return await mem.peek(
+            self._start_offset + offset,
+            parent=parent,
+            extension=extension,
+            fname=fname,
+            lineno=lineno,
+        )
 
 
 class uvm_mem_mam_policy(uvm_void):
-    len: int
-    start_offset: uvm_reg_addr_t  # rand
-    min_offset: uvm_reg_addr_t
-    max_offset: uvm_reg_addr_t
-    in_use: list[uvm_mem_region]
-
-    # TODO: constraints
-    # constraint uvm_mem_mam_policy_valid {
-    #     start_offset >= min_offset;
-    #     start_offset <= max_offset - len + 1;
-    # }
-    # constraint uvm_mem_mam_policy_no_overlap {
-    #     foreach (in_use[i]) {
-    #     !(start_offset <= in_use[i].Xend_offsetX &&
-    #     start_offset + len - 1 >= in_use[i].Xstart_offsetX);
-    #     }
+    """
+    Constraints on the region placed by ``uvm_mem_mam.request_region()``:
+    its first location is a multiple of ``alignment`` between ``min_offset``
+    and ``max_offset`` (the managed range when None). The manager sets
+    ``len``, ``in_use`` and the chosen ``start_offset``.
+    """
+
+    def __init__(self) -> None:
+        self.len: int = 0
+        self.start_offset: uvm_reg_addr_t = 0
+        self.min_offset: uvm_reg_addr_t = 0
+        self.max_offset: uvm_reg_addr_t | None = None
+        self.alignment: int = 1
+        self.in_use: Collection[uvm_mem_region] = ()
 
 
 class uvm_mem_mam_cfg(uvm_void):
-    n_bytes: int  # rand
-    start_offset: uvm_reg_addr_t  # rand
-    end_offset: uvm_reg_addr_t  # rand
-    mode: alloc_mode_e  # rand
-    locality: locality_e  # rand
-
-    # TODO: constraints
-    # constraint uvm_mem_mam_cfg_valid {
-    #     end_offset > start_offset;
-    #     n_bytes < 64;
-    # }
-
-
-class alloc_mode_e(Enum):
-    GREEDY = 0
-    THRIFTY = 1
-
-
-class locality_e(Enum):
-    BROAD = 0
-    NEARBY = 1
+    def __init__(
+        self,
+        n_bytes: int = 1,
+        start_offset: uvm_reg_addr_t = 0,
+        end_offset: uvm_reg_addr_t = 0,
+        mode: alloc_mode_e = alloc_mode_e.GREEDY,
+        locality: locality_e = locality_e.BROAD,
+    ) -> None:
+        # Bytes per memory location and the managed locations. locality is
+        # kept for compatibility; it does not change the allocation.
+        self.n_bytes = n_bytes
+        self.start_offset = start_offset
+        self.end_offset = end_offset
+        self.mode = mode
+        self.locality = locality
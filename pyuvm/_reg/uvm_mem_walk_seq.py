@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from pyuvm._reg.uvm_reg_model import uvm_door_e, uvm_status_e
+from pyuvm._reg.uvm_reg_reporting import uvm_reg_report_error as _report_error
+from pyuvm._reg.uvm_reg_sequence import uvm_reg_sequence
+
+if TYPE_CHECKING:
+    from pyuvm._reg.uvm_mem import uvm_mem
+    from pyuvm._reg.uvm_reg_map import uvm_reg_map
+
+__all__ = ["uvm_mem_single_walk_seq", "uvm_mem_walk_seq"]
+logger = logging.getLogger("RegModel")
+
+
+class uvm_mem_single_walk_seq(uvm_reg_sequence):
+    """Run a walking-ones algorithm on memory ``mem`` in each RW map.
+
+    For each address ``k``, the complement of ``k`` is written at ``k``,
+    then the complement of ``k - 1`` is read back from ``k - 1``, which is
+    set to ``k - 1``.  The last address is read back as well.
+    """
+
+    def __init__(self, name: str = "uvm_mem_single_walk_seq"):
+        super().__init__(name)
+        self.mem: uvm_mem = None
+
+    async def body(self):
+        mem = self.mem
+        if mem is None:
+            _report_error(
+                self,
+                "REG_SEQUENCE",
+                f"No memory specified to run sequence {self.get_name()!r} on",
+            )
+            return
+        if self._is_excluded(mem, ("NO_REG_TESTS", "NO_MEM_TESTS", "NO_MEM_WALK_TEST")):
+            return
+        maps = []
+        mem.get_maps(maps)
+        for map in maps:
+            if mem.get_access(map) != "RW":
+                continue
+            logger.info(
+                "Walking memory %r in map %r", mem.get_full_name(), map.get_full_name()
+            )
+            await self._walk(mem, map)
+
+    async def _walk(self, mem: uvm_mem, map: uvm_reg_map) -> None:
+        mask = (1 << mem.get_n_bits()) - 1
+        last = mem.get_size() - 1
+        for kk in range(mem.get_size()):
+            if not await self._write(mem, map, kk, ~kk & mask):
+                return
+            if kk > 0:
+                if not await self._check(mem, map, kk - 1, ~(kk - 1) & mask):
+                    return
+                if not await self._write(mem, map, kk - 1, kk - 1):
+                    return
+            if kk == last and not await self._check(mem, map, kk, ~kk & mask):
+                return
+
+    async def _write(
+        self, mem: uvm_mem, map: uvm_reg_map, offset: int, value: int
+    ) -> bool:
+        status = await mem.write(offset, value, uvm_door_e.UVM_FRONTDOOR, map, self)
+        return self._status_ok(
+            status,
+            f"writing {mem.get_full_name()}[{offset}] through map "
+            f"{map.get_full_name()!r}",
+        )
+
+    async def _check(
+        self, mem: uvm_mem, map: uvm_reg_map, offset: int, expected: int
+    ) -> bool:
+        status, value = await mem.read(offset, uvm_door_e.UVM_FRONTDOOR, map, self)
+        if status != uvm_status_e.UVM_IS_OK:
+            return self._status_ok(
+                status,
+                f"reading {mem.get_full_name()}[{offset}] through map "
+                f"{map.get_full_name()!r}",
+            )
+        if value != expected:
+            _report_error(
+                self,
+                "REG_SEQUENCE",
+                f"{mem.get_full_name()}[{offset}] read back as 0x{value:X} "
+                f"instead of 0x{expected:X}",
+            )
+        return True
+
+
+class uvm_mem_walk_seq(uvm_reg_sequence):
+    """Run ``uvm_mem_single_walk_seq`` on the memories of ``model``.
+
+    Memories behind different bus sequencers are walked concurrently.
+    Blocks and memories with the ``NO_REG_TESTS``, ``NO_MEM_TESTS`` or
+    ``NO_MEM_WALK_TEST`` attribute are not tested.
+    """
+
+    def __init__(self, name: str = "uvm_mem_walk_seq"):
+        super().__init__(name)
+
+    async def body(self):
+        if self.model is None:
+            _report_error(
+                self,
+                "REG_SEQUENCE",
+                f"No register model specified to run sequence {self.get_name()!r} on",
+            )
+            return
+        mems = self._mems_to_test(("NO_REG_TESTS", "NO_MEM_TESTS", "NO_MEM_WALK_TEST"))
+        await self._run_by_sequencer(mems, self._walk_mem)
+
+    async def _walk_mem(self, mem: uvm_mem) -> None:
+        mem_seq = uvm_mem_single_walk_seq("single_mem_walk_seq")
+        mem_seq.model = self.model
+        mem_seq.mem = mem
+        await mem_seq.start()
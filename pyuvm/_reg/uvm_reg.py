@@ -7,14 +7,23 @@ from typing import TYPE_CHECKING, ClassVar
 from cocotb.triggers import Lock
 
 from pyuvm._error_classes import UVMFatalError
+from pyuvm._reg.uvm_hdl import (
+    _element_handles,
+    _join_hdl_path,
+    _read_concat,
+    _write_concat,
+)
+from pyuvm._reg.uvm_reg_coverage import _cvr_bits, _included_coverage
 from pyuvm._reg.uvm_reg_field import uvm_reg_field
 from pyuvm._reg.uvm_reg_file import uvm_reg_file
 from pyuvm._reg.uvm_reg_item import uvm_reg_item
+from pyuvm._reg.uvm_reg_map import uvm_reg_map
 from pyuvm._reg.uvm_reg_model import (
     uvm_access_e,
     uvm_check_e,
     uvm_door_e,
     uvm_elem_kind_e,
+    uvm_hdl_path_concat,
     uvm_predict_e,
     uvm_status_e,
 )
@@ -25,13 +34,13 @@ from pyuvm._reg.uvm_reg_reporting import (
     uvm_reg_report_warning as _report_warning,
 )
 from pyuvm._s05_base_classes import uvm_object
+from pyuvm._s13_uvm_component import ConfigDB
 
 if TYPE_CHECKING:
     from pyuvm._reg.uvm_reg_backdoor import uvm_reg_backdoor
     from pyuvm._reg.uvm_reg_block import uvm_reg_block
-    from pyuvm._reg.uvm_reg_map import uvm_reg_map, uvm_reg_map_info
+    from pyuvm._reg.uvm_reg_map import uvm_reg_map_info
     from pyuvm._reg.uvm_reg_model import (
-        uvm_hdl_path_concat,
         uvm_hdl_path_slice,
         uvm_reg_addr_t,
         uvm_reg_byte_en_t,
@@ -48,6 +57,30 @@ logger = logging.getLogger("RegModel")
 class uvm_reg(uvm_object):
     _max_size: ClassVar[int] = 0
     _reg_registry: ClassVar[dict[str, uvm_reg]] = {}
+    # The register state is kept in slots. What uvm_object sets (name,
+    # logger, verbosity) is still in the __dict__ of each register.
+    __slots__ = (
+        "_addr",
+        "_atomic_lock",
+        "_backdoor",
+        "_cover_on",
+        "_fields",
+        "_fname",
+        "_has_cover",
+        "_hdl_handles",
+        "_hdl_paths_pool",
+        "_is_busy",
+        "_lineno",
+        "_locked",
+        "_maps",
+        "_n_bits",
+        "_n_used_bits",
+        "_parent",
+        "_process",
+        "_read_in_progress",
+        "_regfile_parent",
+        "_write_in_progress",
+    )
 
     def __init__(
         self, name="", n_bits: int = 0, has_coverage: int = 0, **kwargs
@@ -63,9 +96,9 @@ class uvm_reg(uvm_object):
         self._n_used_bits: int = 0
         self._maps: list = []
         self._fields: list[uvm_reg_field] = []
-        self._has_cover = has_coverage
-        self._cover_on = 0
-        self._atomic = Lock()
+        self._has_cover: int = _cvr_bits(has_coverage)
+        self._cover_on: int = 0
+        self._atomic_lock: Lock | None = None
         self._process = None  # TODO: process
         self._fname: str = ""
         self._lineno: int = 0
@@ -73,7 +106,9 @@ class uvm_reg(uvm_object):
         self._write_in_progress: bool = False
         self._is_busy: bool = False
         self._backdoor: uvm_reg_backdoor = None
-        self._hdl_paths_pool: dict[str, list[str]] = {}
+        self._hdl_paths_pool: dict[str, list[uvm_hdl_path_concat]] = {}
+        # Resolved HDL handles per path kind, see uvm_hdl._element_handles()
+        self._hdl_handles: dict[str, tuple] = {}
 
         # TODO: remove backward compatibility
         self._addr = None
@@ -223,6 +258,11 @@ class uvm_reg(uvm_object):
         else:
             self._maps.append(map)
 
+    def _share_layout(self, reg: uvm_reg) -> None:
+        # Element of a register array whose first element is reg
+        for field, shared in zip(self._fields, reg._fields):
+            field._share_layout(shared)
+
     def _lock_model(self) -> None:
         if self._locked:
             return
@@ -236,6 +276,8 @@ class uvm_reg(uvm_object):
         for field in self._fields:
             del uvm_reg_field._reg_field_registry[field.get_full_name()]
         self._locked = False
+        for field in self._fields:
+            field._compile_policies()
 
     def unregister(self, map: uvm_reg_map) -> None:
         raise NotImplementedError
@@ -382,7 +424,7 @@ class uvm_reg(uvm_object):
             return self._addr
         # END: backward compatibility
         _, addr = self.get_addresses(map)
-        return addr[0]
+        return addr[0] if addr else -1
 
     def get_addresses(
         self,
@@ -390,7 +432,7 @@ class uvm_reg(uvm_object):
     ) -> tuple[int, list[uvm_reg_addr_t]]:
         local_map = self.get_local_map(map)
         if local_map is None:
-            return -1
+            return -1, []
         map_info = local_map.get_reg_map_info(self)
         if map_info.unmapped:
             if map is None:
@@ -434,16 +476,48 @@ class uvm_reg(uvm_object):
     def needs_update(self) -> bool:
         return any(field.needs_update() for field in self._fields)
 
+    def _mark_dirty(self) -> None:
+        # The parent block keeps the registers that may need an update, so
+        # uvm_reg_block.update() does not have to check all of them. Blocks
+        # with array storage compare the value arrays instead.
+        if self._parent is not None and self._parent._field_storage is None:
+            self._parent._dirty_regs.add(self)
+
+    def _refresh_dirty(self) -> None:
+        if self._parent is None or self._parent._field_storage is not None:
+            return
+        if self.needs_update():
+            self._parent._dirty_regs.add(self)
+        else:
+            self._parent._dirty_regs.discard(self)
+
     def reset(self, kind: str = "HARD") -> None:
         for field in self._fields:
             field.reset(kind)
-        try:
-            if self._atomic.locked():
-                self._atomic.release()
-        except TypeError:
-            # INFO: For backward compatibility with Cocotb <= 1.8
-            if self._atomic.locked:
-                self._atomic.release()
+        self._refresh_dirty()
+        self._reset_access_state()
+
+    @property
+    def _atomic(self) -> Lock:
+        # Created on first access, most registers of a large model never are
+        if self._atomic_lock is None:
+            self._atomic_lock = Lock()
+        return self._atomic_lock
+
+    @_atomic.setter
+    def _atomic(self, lock: Lock) -> None:
+        self._atomic_lock = lock
+
+    def _reset_access_state(self) -> None:
+        lock = self._atomic_lock
+        if lock is not None:
+            try:
+                if lock.locked():
+                    lock.release()
+            except TypeError:
+                # INFO: For backward compatibility with Cocotb <= 1.8
+                if lock.locked:
+                    lock.release()
 
         self._process = None
         self._set_is_busy(False)
@@ -557,6 +631,7 @@ class uvm_reg(uvm_object):
             rw.set_kind(uvm_access_e.UVM_WRITE)
             rw.set_value(value & self.get_mask())
             rw.set_door(uvm_door_e.UVM_BACKDOOR)
+            rw.set_map(uvm_reg_map.backdoor())
             rw.set_parent_sequence(parent)
             rw.set_extension(extension)
             rw.set_bd_kind(kind)
@@ -582,6 +657,7 @@ class uvm_reg(uvm_object):
             rw.set_kind(uvm_access_e.UVM_READ)
             rw.set_value(0)
             rw.set_door(uvm_door_e.UVM_BACKDOOR)
+            rw.set_map(uvm_reg_map.backdoor())
             rw.set_parent_sequence(parent)
             rw.set_extension(extension)
             rw.set_bd_kind(kind)
@@ -709,7 +785,18 @@ class uvm_reg(uvm_object):
         if rw.get_door() == uvm_door_e.UVM_DEFAULT_DOOR:
             rw.set_door(self._parent.get_default_door())
         if rw.get_door() == uvm_door_e.UVM_BACKDOOR:
-            raise NotImplementedError
+            if self.get_backdoor() is None and not self.has_hdl_path(
+                rw.get_bd_kind() or ""
+            ):
+                _report_error(
+                    self,
+                    "REG_NO_BACKDOOR",
+                    "No backdoor access available for register "
+                    f"{self.get_full_name()!r}",
+                )
+                rw.set_status(uvm_status_e.UVM_NOT_OK)
+                return False, None
+            return True, None
         if rw.get_door() != uvm_door_e.UVM_FRONTDOOR:
             rw.set_status(uvm_status_e.UVM_NOT_OK)
             return False, None
@@ -779,7 +866,10 @@ class uvm_reg(uvm_object):
             rw.set_status(uvm_status_e.UVM_IS_OK)
             # TODO: pre_write fields callbacks
             # TODO: pre_write reg callbacks
-            await self._do_write_frontdoor(rw, map_info)
+            if rw.get_door() == uvm_door_e.UVM_BACKDOOR:
+                await self._do_write_backdoor(rw, map_info)
+            else:
+                await self._do_write_frontdoor(rw, map_info)
             # TODO: post_write reg callbacks
             # TODO: post_write fields callbacks
             # TODO: report
@@ -789,7 +879,31 @@ class uvm_reg(uvm_object):
     async def _do_write_backdoor(
         self, rw: uvm_reg_item, map_info: uvm_reg_map_info
     ) -> None:
-        raise NotImplementedError
+        # poke() deposits the value as is. A write() through the backdoor
+        # mimics the field access policies of a bus write instead.
+        backdoor_map = uvm_reg_map.backdoor()
+        is_poke = rw.get_map() is backdoor_map
+        if not is_poke:
+            read_rw = self._backdoor_item(rw, uvm_access_e.UVM_READ)
+            await self._backdoor_read(read_rw)
+            if read_rw.get_status() == uvm_status_e.UVM_NOT_OK:
+                rw.set_status(uvm_status_e.UVM_NOT_OK)
+                return
+            value = 0
+            for field in self._fields:
+                lsb = field.get_lsb_pos()
+                value |= (
+                    field._predict(
+                        read_rw.get_value() >> lsb, rw.get_value() >> lsb, backdoor_map
+                    )
+                    << lsb
+                )
+            rw.set_value(value)
+        await self._backdoor_write(rw)
+        if not is_poke and rw.get_status() != uvm_status_e.UVM_NOT_OK:
+            status = rw.get_status()
+            self.do_predict(rw, uvm_predict_e.UVM_PREDICT_WRITE)
+            rw.set_status(status)
 
     async def _do_write_frontdoor(
         self, rw: uvm_reg_item, map_info: uvm_reg_map_info
@@ -805,9 +919,7 @@ class uvm_reg(uvm_object):
         finally:
             self._set_is_busy(False)
         if system_map.get_auto_predict() and rw.get_status() == uvm_status_e.UVM_IS_OK:
-            if self._cover_on:
-                self.sample(rw.get_value(), -1, False, rw.get_map())
-                self._parent._sample(map_info.offset, False, rw.get_map())
+            self._sample_access(rw, map_info, False)
             status = rw.get_status()
             self.do_predict(rw, uvm_predict_e.UVM_PREDICT_WRITE)
             rw.set_status(status)
@@ -823,7 +935,10 @@ class uvm_reg(uvm_object):
             rw.set_status(uvm_status_e.UVM_IS_OK)
             # TODO: pre_read fields callbacks
             # TODO: pre_read reg callbacks
-            await self._do_read_frontdoor(rw, map_info)
+            if rw.get_door() == uvm_door_e.UVM_BACKDOOR:
+                await self._do_read_backdoor(rw, map_info)
+            else:
+                await self._do_read_frontdoor(rw, map_info)
             # TODO: post_read reg callbacks
             # TODO: post_read fields callbacks
             # TODO: report
@@ -833,7 +948,61 @@ class uvm_reg(uvm_object):
     async def _do_read_backdoor(
         self, rw: uvm_reg_item, map_info: uvm_reg_map_info
     ) -> None:
-        raise NotImplementedError
+        # As for writes, only a read() through the backdoor mimics the
+        # clear-on-read and set-on-read side effects of a bus read.
+        backdoor_map = uvm_reg_map.backdoor()
+        await self._backdoor_read(rw)
+        if rw.get_status() == uvm_status_e.UVM_NOT_OK or rw.get_map() is backdoor_map:
+            return
+        value = rw.get_value()
+        final_value = value
+        wo_mask = 0
+        for field in self._fields:
+            access = field.get_access(backdoor_map)
+            field_mask = field.get_mask() << field.get_lsb_pos()
+            if access in ("RC", "WRC", "WSRC", "W1SRC", "W0SRC"):
+                final_value &= ~field_mask
+            elif access in ("RS", "WRS", "WCRS", "W1CRS", "W0CRS"):
+                final_value |= field_mask
+            elif access in ("WO", "WOC", "WOS", "WO1", "NOACCESS"):
+                wo_mask |= field_mask
+        if final_value != value:
+            write_rw = self._backdoor_item(rw, uvm_access_e.UVM_WRITE)
+            write_rw.set_value(final_value)
+            await self._backdoor_write(write_rw)
+        rw.set_value(value & ~wo_mask)
+        status = rw.get_status()
+        self.do_predict(rw, uvm_predict_e.UVM_PREDICT_READ)
+        rw.set_status(status)
+
+    def _backdoor_item(self, rw: uvm_reg_item, kind: uvm_access_e) -> uvm_reg_item:
+        item = uvm_reg_item("bkdr_mimic_item")
+        item.set_element(self)
+        item.set_element_kind(uvm_elem_kind_e.UVM_REG)
+        item.set_kind(kind)
+        item.set_value(0)
+        item.set_door(uvm_door_e.UVM_BACKDOOR)
+        item.set_map(uvm_reg_map.backdoor())
+        item.set_parent_sequence(rw.get_parent_sequence())
+        item.set_extension(rw.get_extension())
+        item.set_bd_kind(rw.get_bd_kind())
+        item.set_fname(rw.get_fname())
+        item.set_line(rw.get_line())
+        return item
+
+    async def _backdoor_write(self, rw: uvm_reg_item) -> None:
+        bkdr = self.get_backdoor()
+        if bkdr is not None:
+            await bkdr.write(rw)
+        else:
+            await self.backdoor_write(rw)
+
+    async def _backdoor_read(self, rw: uvm_reg_item) -> None:
+        bkdr = self.get_backdoor()
+        if bkdr is not None:
+            await bkdr.read(rw)
+        else:
+            await self.backdoor_read(rw)
 
     async def _do_read_frontdoor(
         self, rw: uvm_reg_item, map_info: uvm_reg_map_info
@@ -851,6 +1020,7 @@ class uvm_reg(uvm_object):
         finally:
             self._set_is_busy(False)
         if system_map.get_auto_predict() and rw.get_status() == uvm_status_e.UVM_IS_OK:
+            self._sample_access(rw, map_info, True)
             if local_map.get_check_on_read():
                 self.do_check(exp_value, rw.get_value(), system_map)
             status = rw.get_status()
@@ -877,6 +1047,7 @@ class uvm_reg(uvm_object):
                 byte_enable = be >> (int(field.get_lsb_pos() / 8))
                 field.do_predict(rw, kind, byte_enable)
             rw.set_value(reg_value)
+            self._refresh_dirty()
         else:
             logger.warning("Status UVM_NOT_OK; skipping prediction.")
 
@@ -921,68 +1092,142 @@ class uvm_reg(uvm_object):
         return self._backdoor
 
     def clear_hdl_path(self, kind: str = "RTL") -> None:
-        raise NotImplementedError
+        if kind == "ALL":
+            self._hdl_paths_pool.clear()
+        else:
+            self._hdl_paths_pool.pop(kind or self._parent.get_default_hdl_path(), None)
+        self._hdl_handles.clear()
 
     def add_hdl_path(self, slices: list[uvm_hdl_path_slice], kind: str = "RTL") -> None:
-        raise NotImplementedError
+        concat = uvm_hdl_path_concat()
+        concat.set(slices)
+        self._hdl_paths_pool.setdefault(kind, []).append(concat)
+        self._hdl_handles.clear()
 
     def add_hdl_path_slice(
         self, name: str, offset: int, size: int, first: bool = False, kind: str = "RTL"
     ) -> None:
-        # TODO: implement offset and size
-        paths = self._hdl_paths_pool.get(kind)
-        if not paths or first:
-            self._hdl_paths_pool[kind] = name
-        else:
-            self._hdl_paths_pool[kind].append(name)
+        paths = self._hdl_paths_pool.setdefault(kind, [])
+        if first or not paths:
+            paths.append(uvm_hdl_path_concat())
+        paths[-1].add_path(name, offset, size)
+        self._hdl_handles.clear()
 
     def has_hdl_path(self, kind: str = "") -> bool:
-        raise NotImplementedError
+        return (kind or self._parent.get_default_hdl_path()) in self._hdl_paths_pool
 
-    # TODO: Check method definition
     def get_hdl_path(self, paths: list[uvm_hdl_path_concat], kind: str = "") -> None:
-        raise NotImplementedError
+        kind = kind or self._parent.get_default_hdl_path()
+        if kind not in self._hdl_paths_pool:
+            _report_error(
+                self,
+                "REG_NO_HDL_PATH",
+                f"Register {self.get_full_name()!r} does not have an HDL path "
+                f"for abstraction {kind!r}",
+            )
+            return
+        paths.extend(self._hdl_paths_pool[kind])
 
-    # TODO: Check method definition
     def get_hdl_path_kind(self, kinds: list[str]) -> None:
-        raise NotImplementedError
+        kinds.extend(self._hdl_paths_pool)
 
     def get_full_hdl_path(
         self, paths: list[uvm_hdl_path_concat], kind: str = "", separator: str = "."
     ) -> None:
-        raise NotImplementedError
+        kind = kind or self._parent.get_default_hdl_path()
+        hdl_paths: list[uvm_hdl_path_concat] = []
+        self.get_hdl_path(hdl_paths, kind)
+        parent_paths: list[str] = []
+        self._parent.get_full_hdl_path(parent_paths, kind, separator)
+        for concat in hdl_paths:
+            for parent_path in parent_paths or [""]:
+                full_concat = uvm_hdl_path_concat()
+                for hdl_slice in concat.slices:
+                    full_concat.add_path(
+                        _join_hdl_path(parent_path, hdl_slice.path, separator),
+                        hdl_slice.offset,
+                        hdl_slice.size,
+                    )
+                paths.append(full_concat)
+
+    def _get_hdl_handles(self, kind: str) -> list | None:
+        kind = kind or self._parent.get_default_hdl_path()
+        handles = _element_handles(self, kind)
+        if handles is None:
+            _report_error(
+                self,
+                "REG_HDL_PATH",
+                f"Cannot resolve the {kind!r} HDL path of register "
+                f"{self.get_full_name()!r}",
+            )
+        return handles
 
     async def backdoor_read(self, rw: uvm_reg_item) -> None:
-        raise NotImplementedError
+        rw.set_status(self.backdoor_read_func(rw))
 
     async def backdoor_write(self, rw: uvm_reg_item) -> None:
-        raise NotImplementedError
+        concats = self._get_hdl_handles(rw.get_bd_kind())
+        if concats is None:
+            rw.set_status(uvm_status_e.UVM_NOT_OK)
+            return
+        for concat in concats:
+            _write_concat(concat, rw.get_value())
+        rw.set_status(uvm_status_e.UVM_IS_OK)
 
     def backdoor_read_func(self, rw: uvm_reg_item) -> uvm_status_e:
-        raise NotImplementedError
+        concats = self._get_hdl_handles(rw.get_bd_kind())
+        if concats is None:
+            return uvm_status_e.UVM_NOT_OK
+        status, value = _read_concat(concats[0])
+        for concat in concats[1:]:
+            _, other_value = _read_concat(concat)
+            if other_value != value:
+                _report_warning(
+                    self,
+                    "REG_BKDR_COPIES",
+                    f"Backdoor read of register {self.get_full_name()!r} found "
+                    f"different values in its HDL copies (0x{value:X} and "
+                    f"0x{other_value:X}); using the first",
+                )
+                break
+        rw.set_value(value)
+        return status
 
     def backdoor_watch(self) -> None:
         raise NotImplementedError
 
+    @staticmethod
     def include_coverage(
-        self, scope: str, models: uvm_reg_cvr_t, accessor: uvm_object = None
+        scope: str, models: uvm_reg_cvr_t, accessor: uvm_object = None
     ) -> None:
-        raise NotImplementedError
+        """
+        Includes coverage models in the register-model elements whose full
+        names match ``scope``, for their ``build_coverage()``
+
+        :param scope: Full name of the elements, with ``*`` wildcards
+        :param models: Coverage models to include
+        :param accessor: Not used
+        :return: None
+        """
+        ConfigDB().set(None, "REG." + scope, "include_coverage", _cvr_bits(models))
 
     def build_coverage(self, models: uvm_reg_cvr_t) -> uvm_reg_cvr_t:
-        raise NotImplementedError
+        return _included_coverage(self.get_full_name()) & _cvr_bits(models)
 
     def add_coverage(self, models: uvm_reg_cvr_t) -> None:
-        raise NotImplementedError
+        self._has_cover |= _cvr_bits(models)
 
     def has_coverage(self, models: uvm_reg_cvr_t) -> bool:
-        raise NotImplementedError
+        models = _cvr_bits(models)
+        return self._has_cover & models == models
 
     def set_coverage(self, is_on: uvm_reg_cvr_t) -> uvm_reg_cvr_t:
-        raise NotImplementedError
+        self._cover_on = self._has_cover & _cvr_bits(is_on)
+        return self._cover_on
 
     def get_coverage(self, is_on: uvm_reg_cvr_t) -> bool:
-        raise NotImplementedError
+        is_on = _cvr_bits(is_on)
+        return self.has_coverage(is_on) and self._cover_on & is_on == is_on
 
     def sample(
         self,
@@ -991,10 +1236,14 @@ class uvm_reg(uvm_object):
         is_read: bool,
         map: uvm_reg_map,
     ) -> None:
-        raise NotImplementedError
+        # Functional coverage of derived classes, sampled by the frontdoor
+        # accesses while coverage is on
+        pass
 
     def sample_values(self) -> None:
-        raise NotImplementedError
+        # Functional coverage of derived classes, sampled from the mirrored
+        # values by uvm_reg_block.sample_values()
+        pass
 
     def _sample(
         self,
@@ -1005,6 +1254,22 @@ class uvm_reg(uvm_object):
     ) -> None:
         self.sample(data, byte_en, is_read, map)
 
+    def _sample_access(
+        self,
+        rw: uvm_reg_item,
+        info: uvm_reg_map_info,
+        is_read: bool,
+        be: uvm_reg_byte_en_t = -1,
+    ) -> None:
+        # Called for the frontdoor accesses that are predicted, whether by
+        # auto-prediction or by a uvm_reg_predictor
+        if self._cover_on:
+            self._sample(rw.get_value(), be, is_read, rw.get_map())
+            self._parent._sample(info.offset, is_read, rw.get_map())
+        coverage = self._parent._coverage
+        if coverage is not None and coverage.on:
+            coverage.sample(self, rw.get_value(), is_read, rw.get_local_map())
+
     # TODO: register callback
     # `uvm_register_cb(uvm_reg, uvm_reg_cbs)
 
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from pyuvm._reg.uvm_reg_map import uvm_reg_map
+from pyuvm._reg.uvm_reg_model import uvm_check_e, uvm_door_e
+from pyuvm._reg.uvm_reg_reporting import uvm_reg_report_error as _report_error
+from pyuvm._reg.uvm_reg_reporting import uvm_reg_report_warning as _report_warning
+from pyuvm._reg.uvm_reg_sequence import uvm_reg_sequence
+
+if TYPE_CHECKING:
+    from pyuvm._reg.uvm_reg import uvm_reg
+
+__all__ = ["uvm_reg_access_seq", "uvm_reg_single_access_seq"]
+logger = logging.getLogger("RegModel")
+
+
+class uvm_reg_single_access_seq(uvm_reg_sequence):
+    """Verify the accessibility of register ``rg`` in each of its maps.
+
+    For each map, the complement of the value of the register is written
+    through the frontdoor and checked through the backdoor, then the value
+    is restored through the backdoor and checked through the frontdoor.
+    Without a backdoor both the writes and the checks use the frontdoor.
+
+    Registers with a read-only field, or a field of unknown access policy,
+    are not tested.
+    """
+
+    def __init__(self, name: str = "uvm_reg_single_access_seq"):
+        super().__init__(name)
+        self.rg: uvm_reg = None
+
+    async def body(self):
+        rg = self.rg
+        if rg is None:
+            _report_error(
+                self,
+                "REG_SEQUENCE",
+                f"No register specified to run sequence {self.get_name()!r} on",
+            )
+            return
+        if self._is_excluded(rg, ("NO_REG_TESTS", "NO_REG_ACCESS_TEST")):
+            return
+        maps = []
+        rg.get_maps(maps)
+        for field in rg.get_fields():
+            if any(field.get_access(map) == "RO" for map in maps):
+                logger.info(
+                    "Register %r contains a read-only field, skipped",
+                    rg.get_full_name(),
+                )
+                return
+            if not field.is_known_access():
+                _report_warning(
+                    self,
+                    "REG_SEQUENCE",
+                    f"Register {rg.get_full_name()!r} contains field "
+                    f"{field.get_name()!r} of unknown access policy "
+                    f"{field.get_access()!r}, skipped",
+                )
+                return
+        check_door = (
+            uvm_door_e.UVM_BACKDOOR
+            if self._has_backdoor(rg)
+            else uvm_door_e.UVM_FRONTDOOR
+        )
+        for map in maps:
+            logger.info(
+                "Verifying access of register %r in map %r",
+                rg.get_full_name(),
+                map.get_full_name(),
+            )
+            await self._verify_access(rg, map, check_door)
+
+    async def _verify_access(
+        self, rg: uvm_reg, map: uvm_reg_map, check_door: uvm_door_e
+    ) -> None:
+        name = rg.get_full_name()
+        check_map = (
+            uvm_reg_map.backdoor() if check_door == uvm_door_e.UVM_BACKDOOR else map
+        )
+        value = rg.get()
+        status = await rg.write(
+            ~value & rg.get_mask(), uvm_door_e.UVM_FRONTDOOR, map, self
+        )
+        if not self._status_ok(
+            status, f"writing {name!r} through map {map.get_full_name()!r}"
+        ):
+            return
+        status = await rg.mirror(uvm_check_e.UVM_CHECK, check_door, check_map, self)
+        if not self._status_ok(
+            status, f"reading {name!r} through map {check_map.get_full_name()!r}"
+        ):
+            return
+        status = await rg.write(value, check_door, map, self)
+        if not self._status_ok(
+            status, f"writing {name!r} through map {check_map.get_full_name()!r}"
+        ):
+            return
+        status = await rg.mirror(
+            uvm_check_e.UVM_CHECK, uvm_door_e.UVM_FRONTDOOR, map, self
+        )
+        self._status_ok(status, f"reading {name!r} through map {map.get_full_name()!r}")
+
+
+class uvm_reg_access_seq(uvm_reg_sequence):
+    """Run ``uvm_reg_single_access_seq`` on the registers of ``model``.
+
+    Registers behind different bus sequencers are tested concurrently.
+    Blocks and registers with the ``NO_REG_TESTS`` or ``NO_REG_ACCESS_TEST``
+    attribute are not tested.
+    """
+
+    def __init__(self, name: str = "uvm_reg_access_seq"):
+        super().__init__(name)
+
+    async def body(self):
+        if self.model is None:
+            _report_error(
+                self,
+                "REG_SEQUENCE",
+                f"No register model specified to run sequence {self.get_name()!r} on",
+            )
+            return
+        regs = self._regs_to_test(("NO_REG_TESTS", "NO_REG_ACCESS_TEST"))
+        await self._run_by_sequencer(regs, self._access_reg)
+
+    async def _access_reg(self, rg: uvm_reg) -> None:
+        reg_seq = uvm_reg_single_access_seq("single_reg_access_seq")
+        reg_seq.model = self.model
+        reg_seq.rg = rg
+        await reg_seq.start()
@@ -15,6 +15,8 @@ class uvm_reg_adapter(uvm_object):
         super().__init__(name)
         self.supports_byte_enable: bool = False
         self.provides_responses: bool = False
+        # Set when reg2bus_burst() turns a whole memory burst into one item
+        self.supports_burst: bool = False
         self.parent_sequence: uvm_sequence_base = None
         self._item: uvm_reg_item = None
 
@@ -38,6 +40,20 @@ class uvm_reg_adapter(uvm_object):
     def bus2reg(self, bus_item: uvm_sequence_item, rw: uvm_reg_bus_op) -> None:
         pass
 
+    def reg2bus_burst(self, rw_ops: list[uvm_reg_bus_op]) -> uvm_sequence_item:
+        raise NotImplementedError(
+            f"Adapter {self.get_name()!r} sets supports_burst but does not "
+            "implement reg2bus_burst()"
+        )
+
+    def bus2reg_burst(
+        self, bus_item: uvm_sequence_item, rw_ops: list[uvm_reg_bus_op]
+    ) -> None:
+        raise NotImplementedError(
+            f"Adapter {self.get_name()!r} sets supports_burst but does not "
+            "implement bus2reg_burst()"
+        )
+
 
 class uvm_reg_tlm_adapter(uvm_reg_adapter):
     def __init__(self, name: str = "uvm_reg_tlm_adapter"):
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from pyuvm._reg.uvm_reg_model import uvm_door_e, uvm_status_e
+from pyuvm._reg.uvm_reg_reporting import uvm_reg_report_error as _report_error
+from pyuvm._reg.uvm_reg_reporting import uvm_reg_report_warning as _report_warning
+from pyuvm._reg.uvm_reg_sequence import uvm_reg_sequence
+
+if TYPE_CHECKING:
+    from pyuvm._reg.uvm_reg import uvm_reg
+    from pyuvm._reg.uvm_reg_map import uvm_reg_map
+
+__all__ = ["uvm_reg_bit_bash_seq", "uvm_reg_single_bit_bash_seq"]
+logger = logging.getLogger("RegModel")
+
+# Fields that cannot be read back, so their bits are not compared
+_UNREADABLE_ACCESS = frozenset(("WO", "WOC", "WOS", "WO1", "NOACCESS"))
+
+
+class uvm_reg_single_bit_bash_seq(uvm_reg_sequence):
+    """Write a 1 and a 0 to each bit of register ``rg`` in each of its maps.
+
+    Each write is followed by a frontdoor read, compared with the value
+    predicted by the access policies of the fields.  Bits of fields that
+    cannot be read are not compared.
+    """
+
+    def __init__(self, name: str = "uvm_reg_single_bit_bash_seq"):
+        super().__init__(name)
+        self.rg: uvm_reg = None
+
+    async def body(self):
+        rg = self.rg
+        if rg is None:
+            _report_error(
+                self,
+                "REG_SEQUENCE",
+                f"No register specified to run sequence {self.get_name()!r} on",
+            )
+            return
+        if self._is_excluded(rg, ("NO_REG_TESTS", "NO_REG_BIT_BASH_TEST")):
+            return
+        maps = []
+        rg.get_maps(maps)
+        for map in maps:
+            dc_mask = 0
+            for field in rg.get_fields():
+                if not field.is_known_access(map):
+                    _report_warning(
+                        self,
+                        "REG_SEQUENCE",
+                        f"Register {rg.get_full_name()!r} has field "
+                        f"{field.get_name()!r} with unknown access type "
+                        f"{field.get_access(map)!r}, skipped",
+                    )
+                    return
+                if field.get_access(map) in _UNREADABLE_ACCESS:
+                    field_mask = (1 << field.get_n_bits()) - 1
+                    dc_mask |= field_mask << field.get_lsb_pos()
+            logger.info(
+                "Verifying bits in register %r in map %r",
+                rg.get_full_name(),
+                map.get_full_name(),
+            )
+            for kk in range(rg.get_n_bits()):
+                if not dc_mask >> kk & 1:
+                    await self._bash_kth_bit(rg, kk, map, dc_mask)
+
+    async def _bash_kth_bit(
+        self, rg: uvm_reg, kk: int, map: uvm_reg_map, dc_mask: int
+    ) -> None:
+        for _ in range(2):
+            initial = rg.get()
+            value = initial ^ (1 << kk)
+            status = await rg.write(value, uvm_door_e.UVM_FRONTDOOR, map, self)
+            if not self._status_ok(
+                status,
+                f"writing to register {rg.get_full_name()!r} "
+                f"through map {map.get_full_name()!r}",
+            ):
+                return
+            expected = rg.get() & ~dc_mask
+            status, value_read = await rg.read(uvm_door_e.UVM_FRONTDOOR, map, self)
+            if status != uvm_status_e.UVM_IS_OK:
+                self._status_ok(
+                    status,
+                    f"reading register {rg.get_full_name()!r} "
+                    f"through map {map.get_full_name()!r}",
+                )
+                return
+            value_read &= ~dc_mask
+            if value_read != expected:
+                _report_error(
+                    self,
+                    "REG_SEQUENCE",
+                    f"Writing a {value >> kk & 1} in bit #{kk} of register "
+                    f"{rg.get_full_name()!r} with initial value 0x{initial:X} "
+                    f"yielded 0x{value_read:X} instead of 0x{expected:X}",
+                )
+
+
+class uvm_reg_bit_bash_seq(uvm_reg_sequence):
+    """Run ``uvm_reg_single_bit_bash_seq`` on the registers of ``model``.
+
+    Registers behind different bus sequencers are bashed concurrently.
+    Blocks and registers with the ``NO_REG_TESTS`` or
+    ``NO_REG_BIT_BASH_TEST`` attribute are not tested.
+    """
+
+    def __init__(self, name: str = "uvm_reg_bit_bash_seq"):
+        super().__init__(name)
+
+    async def body(self):
+        if self.model is None:
+            _report_error(
+                self,
+                "REG_SEQUENCE",
+                f"No register model specified to run sequence {self.get_name()!r} on",
+            )
+            return
+        regs = self._regs_to_test(("NO_REG_TESTS", "NO_REG_BIT_BASH_TEST"))
+        await self._run_by_sequencer(regs, self._bash_reg)
+
+    async def _bash_reg(self, rg: uvm_reg) -> None:
+        reg_seq = uvm_reg_single_bit_bash_seq("single_reg_bit_bash_seq")
+        reg_seq.model = self.model
+        reg_seq.rg = rg
+        await reg_seq.start()
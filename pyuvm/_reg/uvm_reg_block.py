@@ -1,21 +1,36 @@
 from __future__ import annotations
 
 import warnings
-from typing import TYPE_CHECKING, ClassVar
+from collections import Counter
+from typing import TYPE_CHECKING, Any, ClassVar
 
+import cocotb
 from cocotb.triggers import Event
 
 from pyuvm._error_classes import UVMFatalError
+from pyuvm._reg.uvm_hdl import _join_hdl_path
 from pyuvm._reg.uvm_mem import uvm_mem
+from pyuvm._reg.uvm_mem_file import _check_width, _read_mem_file, _write_mem_file
 from pyuvm._reg.uvm_reg import uvm_reg
+from pyuvm._reg.uvm_reg_block_state import uvm_reg_block_state
+from pyuvm._reg.uvm_reg_coverage import (
+    _cvr_bits,
+    _included_coverage,
+    _uvm_reg_block_coverage,
+    uvm_reg_coverage,
+)
 from pyuvm._reg.uvm_reg_field import uvm_reg_field
-from pyuvm._reg.uvm_reg_map import uvm_reg_map
+from pyuvm._reg.uvm_reg_field_storage import _uvm_reg_field_storage
+from pyuvm._reg.uvm_reg_item import uvm_reg_bus_op
+from pyuvm._reg.uvm_reg_map import ceildiv, uvm_reg_map
 from pyuvm._reg.uvm_reg_model import (
     UVM_REG_DATA_WIDTH,
+    uvm_access_e,
     uvm_check_e,
     uvm_coverage_model_e,
     uvm_door_e,
     uvm_hier_e,
+    uvm_status_e,
 )
 from pyuvm._reg.uvm_reg_reporting import (
     uvm_reg_report_error as _report_error,
@@ -26,14 +41,19 @@ from pyuvm._reg.uvm_reg_reporting import (
 from pyuvm._s05_base_classes import uvm_object
 
 if TYPE_CHECKING:
+    import os
+    from collections.abc import Awaitable, Callable, Iterable, Mapping
+
+    from cocotb.task import Task
+
     from pyuvm._reg.uvm_reg_backdoor import uvm_reg_backdoor
+    from pyuvm._reg.uvm_reg_map import uvm_reg_transaction_order_policy
     from pyuvm._reg.uvm_reg_model import (
         uvm_endianness_e,
         uvm_path_e,
         uvm_reg_addr_t,
         uvm_reg_cvr_t,
         uvm_reg_data_t,
-        uvm_status_e,
     )
     from pyuvm._reg.uvm_vreg import uvm_vreg
     from pyuvm._reg.uvm_vreg_field import uvm_vreg_field
@@ -41,6 +61,16 @@ if TYPE_CHECKING:
 
 __all__ = ["uvm_reg_block"]
 
+# Element kinds indexed by lock_model(), named after their get_*() method
+_ELEMENT_KINDS = (
+    "blocks",
+    "registers",
+    "fields",
+    "memories",
+    "virtual_registers",
+    "virtual_fields",
+)
+
 
 class uvm_reg_block(uvm_object):
     _root_names: ClassVar[list[str]] = []
@@ -65,7 +95,26 @@ class uvm_reg_block(uvm_object):
         self._lock_model_complete: Event | None = None
         self._default_hdl_path = "RTL"
         self._hdl_paths_pool: dict[str, list[str]] = {}
+        self._root_hdl_paths: dict[str, str] = {}
+        self._array_storage: bool = False
+        # (storage, first, last + 1) of this block's fields once locked with
+        # array storage. The fields of a block are contiguous in the storage.
+        self._field_storage: tuple[_uvm_reg_field_storage, int, int] | None = None
+        # Registers of this block that may need an update: every register
+        # whose fields were set since it was last written or predicted. It
+        # can hold clean registers, which are dropped when found.
+        self._dirty_regs: set[uvm_reg] = set()
+        # Filled by lock_model(): the get_*() results of the locked model,
+        # by (kind, hier), and the hierarchical elements of each kind by
+        # local and by full name
+        self._elements: dict[tuple[str, uvm_hier_e], tuple] = {}
+        self._names: dict[str, dict[str, object]] = {}
         self._backdoor: uvm_reg_backdoor = None
+        self._has_cover: int = _cvr_bits(has_coverage)
+        self._cover_on: int = 0
+        # Built-in UVM_CVR_ADDR_MAP and UVM_CVR_FIELD_VALS bins of the
+        # registers and memories of this block, allocated by lock_model()
+        self._coverage: _uvm_reg_block_coverage | None = None
 
     def configure(self, parent: uvm_reg_block = None, hdl_path: str = "") -> None:
         self._parent = parent
@@ -85,6 +134,59 @@ class uvm_reg_block(uvm_object):
         map.configure(self, base_addr, n_bytes, endian, byte_addressing)
         return map
 
+    def create_reg_array(
+        self,
+        name: str,
+        reg_type: Callable[[str], uvm_reg],
+        size: int,
+        map: uvm_reg_map | None = None,
+        offset: uvm_reg_addr_t = 0,
+        stride: int | None = None,
+        rights: str = "RW",
+    ) -> tuple[uvm_reg, ...]:
+        """
+        :param name: Name of the array, the elements being ``name[0]`` to
+            ``name[size - 1]``
+        :param reg_type: Creates an element with its fields from its name
+        :param size: Number of elements
+        :param map: Map of the elements, the default map if None. They are
+            not mapped if the block has no map.
+        :param offset: Offset of the first element in ``map``
+        :param stride: Offset between two elements, in address units of
+            ``map``. By default, the bus words of an element.
+        :param rights: Access rights of the elements in ``map``
+        :return: The elements
+
+        The elements are complete registers. Their fields share the reset
+        values and compiled access policies of the fields of the first
+        element while they are the same. Call ``set_array_storage()`` to
+        also keep the values of their fields in arrays.
+        """
+        if self.is_locked():
+            _report_error(
+                self, "REG_BLOCK", "Cannot add register to a locked block model"
+            )
+            return ()
+        if map is None:
+            map = self._default_map
+        elements: list[uvm_reg] = []
+        for index in range(size):
+            reg = reg_type(f"{name}[{index}]")
+            reg.configure(self)
+            if elements:
+                reg._share_layout(elements[0])
+            if map is not None:
+                if stride is None:
+                    n_bytes = map.get_n_bytes(uvm_hier_e.UVM_NO_HIER)
+                    stride = (
+                        ceildiv(reg.get_n_bytes(), n_bytes)
+                        * n_bytes
+                        // map.get_addr_unit_bytes()
+                    )
+                map.add_reg(reg, offset + index * stride, rights)
+            elements.append(reg)
+        return tuple(elements)
+
     @staticmethod
     def check_data_width(width: int) -> bool:
         raise NotImplementedError
@@ -155,6 +257,8 @@ class uvm_reg_block(uvm_object):
             )
             return
         self._regs[uid] = reg
+        # Its fields may be volatile or may have been set already
+        self._dirty_regs.add(reg)
 
     def _add_memory(self, mem: uvm_mem) -> None:
         uid = mem.get_inst_id()
@@ -179,7 +283,8 @@ class uvm_reg_block(uvm_object):
     def lock_model(self) -> None:
         if self.is_locked():
             return
-        self.set_lock(True)
+        # Only this block: each sub-block locks itself below
+        self._locked = True
         self._name = self.get_full_name()
         uvm_reg_block._reg_block_registry[self._name] = self
 
@@ -206,21 +311,69 @@ class uvm_reg_block(uvm_object):
                     f"Currently defined as {UVM_REG_DATA_WIDTH}"
                 )
             self._init_address_maps()
-            names = uvm_reg_block._root_names.copy()
-            while names:
-                count = names.count(names[0])
-                _ = names.pop(0)
+            # The rights of the registers in their maps are now known
+            for field in self.get_fields():
+                field._compile_policies()
+            for name, count in Counter(uvm_reg_block._root_names).items():
                 if count > 1:
                     _report_error(
                         self,
                         "REG_BLOCK",
                         f"There are {count} root register models "
-                        "named {repr(name)}. The names of the root register "
+                        f"named {name!r}. The names of the root register "
                         "models have to be unique",
                     )
             # NOTE: Trigger event
             if self._lock_model_complete is not None:
                 self._lock_model_complete.set()
+        self._index_elements()
+        if self._has_cover & _uvm_reg_block_coverage.MODELS:
+            self._coverage = _uvm_reg_block_coverage(self, self._has_cover)
+            self._coverage.on = self._cover_on
+        if self._array_storage and not self._has_array_storage_ancestor():
+            fields = self.get_fields()
+            self._share_field_storage(_uvm_reg_field_storage(fields), 0)
+
+    def set_array_storage(self, on: bool = True) -> None:
+        """
+        :param on: Keep field values in arrays once the model is locked
+        :return: None
+
+        With array storage, the mirrored, desired and current values of the
+        fields of this block and its sub-blocks live in contiguous integer
+        arrays (NumPy if installed), which makes ``reset()`` of large blocks
+        much faster. Must be called before ``lock_model()``.
+        """
+        if self.is_locked():
+            _report_error(
+                self,
+                "BLOCK_LOCKED",
+                f"Cannot change the field storage of locked block "
+                f"{self.get_full_name()!r}",
+            )
+            return
+        self._array_storage = on
+
+    def get_array_storage(self) -> bool:
+        return self._field_storage is not None
+
+    def _has_array_storage_ancestor(self) -> bool:
+        parent = self._parent
+        while parent is not None:
+            if parent._array_storage:
+                return True
+            parent = parent._parent
+        return False
+
+    def _share_field_storage(self, storage: _uvm_reg_field_storage, start: int) -> int:
+        # Follows the field order of get_fields(): own registers first,
+        # then each sub-block.
+        stop = start + sum(len(reg.get_fields()) for reg in self._regs.values())
+        for blk in self._blks.values():
+            stop = blk._share_field_storage(storage, stop)
+        self._field_storage = (storage, start, stop)
+        self._dirty_regs.clear()
+        return stop
 
     def unlock_model(self) -> None:
         raise NotImplementedError
@@ -260,79 +413,129 @@ class uvm_reg_block(uvm_object):
     ) -> list[uvm_reg_block]:
         raise NotImplementedError
 
+    def _index_elements(self) -> None:
+        # Sub-blocks are locked, and indexed, before their parent
+        elements = {}
+        for kind in _ELEMENT_KINDS:
+            getter = getattr(self, f"get_{kind}")
+            for hier in (uvm_hier_e.UVM_HIER, uvm_hier_e.UVM_NO_HIER):
+                elements[kind, hier] = getter(hier)
+        names = {}
+        for kind in _ELEMENT_KINDS:
+            index: dict[str, object] = {}
+            for element in elements[kind, uvm_hier_e.UVM_HIER]:
+                index.setdefault(element.get_name(), element)
+                index.setdefault(element.get_full_name(), element)
+            names[kind] = index
+        self._elements = elements
+        self._names = names
+
+    def _find_by_name(self, kind: str, name: str) -> object | None:
+        index = self._names.get(kind)
+        if index is not None:
+            return index.get(name)
+        for element in getattr(self, f"get_{kind}")(uvm_hier_e.UVM_HIER):
+            if name in (element.get_name(), element.get_full_name()):
+                return element
+        return None
+
     # TODO: Document definition compared to IEEE 1800.2
-    def get_blocks(self, hier: uvm_hier_e = uvm_hier_e.UVM_HIER) -> list[uvm_reg_block]:
-        blks = []
+    def get_blocks(
+        self, hier: uvm_hier_e = uvm_hier_e.UVM_HIER
+    ) -> tuple[uvm_reg_block, ...]:
+        blks = self._elements.get(("blocks", hier))
+        if blks is not None:
+            return blks
+        blks = list(self._blks.values())
         if hier == uvm_hier_e.UVM_HIER:
             for blk in self._blks.values():
-                blks += blk.get_blocks(hier)
-        return list(self._blks.values()) + blks
+                blks.extend(blk.get_blocks(hier))
+        return tuple(blks)
 
     # TODO: Document definition compared to IEEE 1800.2
     def get_maps(self) -> list[uvm_reg_map]:
         return self._maps
 
     # TODO: Document definition compared to IEEE 1800.2
-    def get_registers(self, hier: uvm_hier_e = uvm_hier_e.UVM_HIER) -> list[uvm_reg]:
-        regs = []
+    def get_registers(
+        self, hier: uvm_hier_e = uvm_hier_e.UVM_HIER
+    ) -> tuple[uvm_reg, ...]:
+        regs = self._elements.get(("registers", hier))
+        if regs is not None:
+            return regs
+        regs = list(self._regs.values())
         if hier == uvm_hier_e.UVM_HIER:
             for blk in self._blks.values():
-                regs += blk.get_registers(hier)
-        return list(self._regs.values()) + regs
+                regs.extend(blk.get_registers(hier))
+        return tuple(regs)
 
     # TODO: Document definition compared to IEEE 1800.2
-    def get_fields(self, hier: uvm_hier_e = uvm_hier_e.UVM_HIER) -> list[uvm_reg_field]:
+    def get_fields(
+        self, hier: uvm_hier_e = uvm_hier_e.UVM_HIER
+    ) -> tuple[uvm_reg_field, ...]:
+        fields = self._elements.get(("fields", hier))
+        if fields is not None:
+            return fields
         fields = []
         for reg in self._regs.values():
-            fields += reg.get_fields()
+            fields.extend(reg.get_fields())
         if hier == uvm_hier_e.UVM_HIER:
             for blk in self._blks.values():
-                fields += blk.get_fields(hier)
-        return fields
+                fields.extend(blk.get_fields(hier))
+        return tuple(fields)
 
     # TODO: Document definition compared to IEEE 1800.2
-    def get_memories(self, hier: uvm_hier_e = uvm_hier_e.UVM_HIER) -> list[uvm_mem]:
-        mems = []
+    def get_memories(
+        self, hier: uvm_hier_e = uvm_hier_e.UVM_HIER
+    ) -> tuple[uvm_mem, ...]:
+        mems = self._elements.get(("memories", hier))
+        if mems is not None:
+            return mems
+        mems = list(self._mems.values())
         if hier == uvm_hier_e.UVM_HIER:
             for blk in self._blks.values():
-                mems += blk.get_memories(hier)
-        return list(self._mems.values()) + mems
+                mems.extend(blk.get_memories(hier))
+        return tuple(mems)
 
     # TODO: Document definition compared to IEEE 1800.2
     def get_virtual_registers(
         self, hier: uvm_hier_e = uvm_hier_e.UVM_HIER
-    ) -> list[uvm_vreg]:
-        regs = []
+    ) -> tuple[uvm_vreg, ...]:
+        regs = self._elements.get(("virtual_registers", hier))
+        if regs is not None:
+            return regs
+        regs = list(self._vregs.values())
         if hier == uvm_hier_e.UVM_HIER:
             for blk in self._blks.values():
-                regs += blk.get_virtual_registers(hier)
-        return list(self._vregs.values()) + regs
+                regs.extend(blk.get_virtual_registers(hier))
+        return tuple(regs)
 
     # TODO: Document definition compared to IEEE 1800.2
     def get_virtual_fields(
         self, hier: uvm_hier_e = uvm_hier_e.UVM_HIER
-    ) -> list[uvm_vreg_field]:
+    ) -> tuple[uvm_vreg_field, ...]:
+        fields = self._elements.get(("virtual_fields", hier))
+        if fields is not None:
+            return fields
         fields = []
         if hier == uvm_hier_e.UVM_HIER:
             for blk in self._blks.values():
-                fields += blk.get_virtual_fields(hier)
+                fields.extend(blk.get_virtual_fields(hier))
         for reg in self._vregs.values():
-            fields += list(reg.get_fields())
-        return fields
+            fields.extend(reg.get_fields())
+        return tuple(fields)
 
     def get_block_by_name(self, name: str) -> uvm_reg_block | None:
         if self.get_name() == name:
             return self
-        for blk in self.get_blocks(uvm_hier_e.UVM_HIER):
-            blk_name = blk.get_full_name()
-            block = uvm_reg_block.get_block_by_name(f"{blk_name}.{name}")
-            if block:
-                return block
-        _report_warning(
-            self,
-            "REG_BLOCK",
-            f"Unable to locate block {name!r} in block {self.get_full_name()!r}",
-        )
+        blk = self._find_by_name("blocks", name)
+        if blk is None:
+            _report_warning(
+                self,
+                "REG_BLOCK",
+                f"Unable to locate block {name!r} in block {self.get_full_name()!r}",
+            )
+        return blk
 
     @staticmethod
     def get_block_by_full_name(name: str) -> uvm_reg_block | None:
@@ -349,78 +552,126 @@ class uvm_reg_block(uvm_object):
         )
 
     def get_reg_by_name(self, name: str) -> uvm_reg | None:
-        for reg in self.get_registers(uvm_hier_e.UVM_HIER):
-            if reg.get_name() == name:
-                return reg
-        _report_warning(
-            self,
-            "REG_BLOCK",
-            f"Unable to locate register {name!r} in block {self.get_full_name()!r}",
-        )
+        reg = self._find_by_name("registers", name)
+        if reg is None:
+            _report_warning(
+                self,
+                "REG_BLOCK",
+                f"Unable to locate register {name!r} in block {self.get_full_name()!r}",
+            )
+        return reg
 
     def get_field_by_name(self, name: str) -> uvm_reg_field:
-        for field in self.get_fields(uvm_hier_e.UVM_HIER):
-            if field.get_name() == name:
-                return field
-        _report_warning(
-            self,
-            "REG_BLOCK",
-            f"Unable to locate field {name!r} in block {self.get_full_name()!r}",
-        )
+        field = self._find_by_name("fields", name)
+        if field is None:
+            _report_warning(
+                self,
+                "REG_BLOCK",
+                f"Unable to locate field {name!r} in block {self.get_full_name()!r}",
+            )
+        return field
 
     def get_mem_by_name(self, name: str) -> uvm_mem | None:
-        for mem in self.get_memories(uvm_hier_e.UVM_HIER):
-            if mem.get_name() == name:
-                return mem
-        _report_warning(
-            self,
-            "REG_BLOCK",
-            f"Unable to locate memory {name!r} in block {self.get_full_name()!r}",
-        )
+        mem = self._find_by_name("memories", name)
+        if mem is None:
+            _report_warning(
+                self,
+                "REG_BLOCK",
+                f"Unable to locate memory {name!r} in block {self.get_full_name()!r}",
+            )
+        return mem
 
     def get_vreg_by_name(self, name: str) -> uvm_vreg | None:
-        for vreg in self.get_virtual_registers(uvm_hier_e.UVM_HIER):
-            if vreg.get_name() == name:
-                return vreg
-        _report_warning(
-            self,
-            "REG_BLOCK",
-            f"Unable to locate virtual register {name!r} in block "
-            f"{self.get_full_name()!r}",
-        )
+        vreg = self._find_by_name("virtual_registers", name)
+        if vreg is None:
+            _report_warning(
+                self,
+                "REG_BLOCK",
+                f"Unable to locate virtual register {name!r} in block "
+                f"{self.get_full_name()!r}",
+            )
+        return vreg
 
     def get_vfield_by_name(self, name: str) -> uvm_vreg_field:
-        for vfield in self.get_virtual_fields(uvm_hier_e.UVM_HIER):
-            if vfield.get_name() == name:
-                return vfield
-        _report_warning(
-            self,
-            "REG_BLOCK",
-            f"Unable to locate virtual field {name!r}' in block {self.get_full_name()!r}",
-        )
+        vfield = self._find_by_name("virtual_fields", name)
+        if vfield is None:
+            _report_warning(
+                self,
+                "REG_BLOCK",
+                f"Unable to locate virtual field {name!r}' in block "
+                f"{self.get_full_name()!r}",
+            )
+        return vfield
 
     def build_coverage(self, models: uvm_reg_cvr_t) -> uvm_reg_cvr_t:
-        raise NotImplementedError
+        return _included_coverage(self.get_full_name()) & _cvr_bits(models)
 
     def add_coverage(self, models: uvm_reg_cvr_t) -> None:
-        raise NotImplementedError
+        self._has_cover |= _cvr_bits(models)
 
     def has_coverage(self, models: uvm_reg_cvr_t) -> bool:
-        raise NotImplementedError
+        models = _cvr_bits(models)
+        return self._has_cover & models == models
 
     def set_coverage(self, is_on: uvm_reg_cvr_t) -> uvm_reg_cvr_t:
-        raise NotImplementedError
+        """
+        Turns the sampling of the coverage models ``is_on`` on, and of the
+        other models off, in the block and in its registers, memories and
+        sub-blocks. Only the models the block was constructed with, or that
+        were added with ``add_coverage()``, are turned on.
+
+        :param is_on: Coverage models to sample
+        :return: Coverage models of the block turned on
+        """
+        self._cover_on = self._has_cover & _cvr_bits(is_on)
+        if self._coverage is not None:
+            self._coverage.on = self._cover_on
+        for reg in self._regs.values():
+            reg.set_coverage(is_on)
+        for mem in self._mems.values():
+            mem.set_coverage(is_on)
+        for blk in self._blks.values():
+            blk.set_coverage(is_on)
+        return self._cover_on
 
     def get_coverage(
         self, is_on: uvm_reg_cvr_t = uvm_coverage_model_e.UVM_CVR_ALL
     ) -> bool:
-        raise NotImplementedError
+        is_on = _cvr_bits(is_on)
+        return self.has_coverage(is_on) and self._cover_on & is_on == is_on
 
     def sample(self, offset: uvm_reg_addr_t, is_read: bool, map: uvm_reg_map) -> None:
-        raise NotImplementedError
+        # Functional coverage of derived classes, sampled by the frontdoor
+        # accesses of the registers and memories while their coverage is on
+        pass
 
     def sample_values(self) -> None:
-        raise NotImplementedError
+        """
+        Samples the field values of the registers of the block and its
+        sub-blocks from their mirrored values: calls ``uvm_reg.sample_values()``
+        and, while ``UVM_CVR_FIELD_VALS`` is on, the built-in field-value bins.
+
+        :return: None
+        """
+        coverage = self._coverage
+        if (
+            coverage is not None
+            and not coverage.on & uvm_coverage_model_e.UVM_CVR_FIELD_VALS.value
+        ):
+            coverage = None
+        for reg in self._regs.values():
+            reg.sample_values()
+            if coverage is not None:
+                coverage.sample_fields(reg, reg.get_mirrored_value())
+        for blk in self._blks.values():
+            blk.sample_values()
+
+    def get_coverage_db(self) -> uvm_reg_coverage:
+        """
+        :return: A copy of the built-in coverage bins of the block and its
+            sub-blocks, to save or merge with the bins of other runs
+        """
+        return uvm_reg_coverage.from_blocks((self, *self.get_blocks()))
 
     def _sample(self, addr: uvm_reg_addr_t, is_read: bool, map: uvm_reg_map) -> None:
         self.sample(addr, is_read, map)
@@ -439,13 +690,34 @@ class uvm_reg_block(uvm_object):
         return self.get_default_door()
 
     def reset(self, kind: str = "HARD") -> None:
+        if self._field_storage is not None:
+            storage, start, stop = self._field_storage
+            storage.reset(kind, start, stop)
+            for reg in self.get_registers():
+                reg._reset_access_state()
+            return
         for reg in self._regs.values():
             reg.reset(kind)
-        for block in self.get_blocks():
+        for block in self._blks.values():
             block.reset(kind)
 
     def needs_update(self) -> bool:
-        raise NotImplementedError
+        return len(self._get_dirty_registers()) > 0
+
+    def _get_dirty_registers(self) -> list[uvm_reg]:
+        if self._field_storage is not None:
+            storage, start, stop = self._field_storage
+            fields = storage.fields
+            parents = (
+                fields[index]._parent for index in storage.dirty_fields(start, stop)
+            )
+            return list(dict.fromkeys(parents))
+        dirty = [reg for reg in self._dirty_regs if reg.needs_update()]
+        if len(dirty) != len(self._dirty_regs):
+            self._dirty_regs = set(dirty)
+        for blk in self._blks.values():
+            dirty.extend(blk._get_dirty_registers())
+        return dirty
 
     async def update(
         self,
@@ -457,7 +729,32 @@ class uvm_reg_block(uvm_object):
         fname: str = "",
         lineno: int = 0,
     ) -> uvm_status_e:
-        raise NotImplementedError
+        """
+        Writes the registers of the block and its sub-blocks that need an
+        update, in address order in ``map``, the default map if None.
+        Registers that are not in ``map`` are left to an update through a
+        map they are in.
+        """
+        dirty = self._get_dirty_registers()
+        map = self.get_default_map() if map is None else map
+        if map is not None:
+            dirty = [reg for reg in dirty if reg.is_in_map(map)]
+        if not dirty:
+            return uvm_status_e.UVM_IS_OK
+        dirty.sort(key=lambda reg: reg.get_address(map))
+        for reg in dirty:
+            status = await reg.update(
+                path, map, parent, prior, extension, fname, lineno
+            )
+            if status != uvm_status_e.UVM_IS_OK:
+                _report_error(
+                    self,
+                    "REG_BLOCK",
+                    f"Register {reg.get_full_name()!r} could not be updated",
+                )
+                return status
+            reg._refresh_dirty()
+        return uvm_status_e.UVM_IS_OK
 
     async def mirror(
         self,
@@ -527,11 +824,353 @@ class uvm_reg_block(uvm_object):
     ) -> tuple[uvm_status_e, uvm_reg_data_t]:
         raise NotImplementedError
 
-    async def readmemh(filename: str) -> None:
-        raise NotImplementedError
+    async def write_regs(
+        self,
+        values: Mapping[uvm_reg, uvm_reg_data_t],
+        path: uvm_door_e = uvm_door_e.UVM_DEFAULT_DOOR,
+        map: uvm_reg_map = None,
+        parent: uvm_sequence_base = None,
+        prior: int = -1,
+        extension: uvm_object = None,
+        fname: str = "",
+        lineno: int = 0,
+    ) -> list[uvm_status_e]:
+        """
+        Write several registers at once, see ``_access_regs()`` for the
+        order and concurrency of the writes.
+
+        :param values: Value to write to each register
+        :return: The status of each write, in the order of ``values``
+        """
+        regs = list(values)
+
+        async def write(reg: uvm_reg) -> uvm_status_e:
+            return await reg.write(
+                values[reg], path, map, parent, prior, extension, fname, lineno
+            )
 
-    async def writememh(filename: str) -> None:
-        raise NotImplementedError
+        return await self._access_regs(
+            regs,
+            uvm_access_e.UVM_WRITE,
+            [values[reg] for reg in regs],
+            path,
+            map,
+            write,
+        )
+
+    async def read_regs(
+        self,
+        regs: Iterable[uvm_reg],
+        path: uvm_door_e = uvm_door_e.UVM_DEFAULT_DOOR,
+        map: uvm_reg_map = None,
+        parent: uvm_sequence_base = None,
+        prior: int = -1,
+        extension: uvm_object = None,
+        fname: str = "",
+        lineno: int = 0,
+    ) -> list[tuple[uvm_status_e, uvm_reg_data_t]]:
+        """
+        Read several registers at once, see ``_access_regs()`` for the
+        order and concurrency of the reads.
+
+        :param regs: Registers to read
+        :return: The status and value of each read, in the order of ``regs``
+        """
+        regs = list(regs)
+
+        async def read(reg: uvm_reg) -> tuple[uvm_status_e, uvm_reg_data_t]:
+            return await reg.read(path, map, parent, prior, extension, fname, lineno)
+
+        return await self._access_regs(
+            regs, uvm_access_e.UVM_READ, [0] * len(regs), path, map, read
+        )
+
+    @staticmethod
+    def _start_soon(coro) -> Task:
+        return cocotb.start_soon(coro)
+
+    async def _access_regs(
+        self,
+        regs: list[uvm_reg],
+        kind: uvm_access_e,
+        data: list[uvm_reg_data_t],
+        path: uvm_door_e,
+        map: uvm_reg_map | None,
+        access: Callable[[uvm_reg], Awaitable[Any]],
+    ) -> list[Any]:
+        """Run ``access`` on each register and return the results in order.
+
+        The accesses are grouped by the sequencer of the root map they go
+        through, and the groups run concurrently. Within a group, the
+        accesses are ordered by the transaction order policy of the root
+        map, if any. They are then all started at once when its adapter
+        provides responses, so a pipelined driver can overlap them, and
+        are run one after the other otherwise. Backdoor accesses are all
+        started at once.
+        """
+        results: list[Any] = [None] * len(regs)
+        local_maps: list[uvm_reg_map | None] = []
+        # id(sequencer) -> (indices of the accesses, pipelined, order policy)
+        groups: dict[
+            int | None,
+            tuple[list[int], bool, uvm_reg_transaction_order_policy | None],
+        ] = {}
+        for index, reg in enumerate(regs):
+            door = path
+            if door == uvm_door_e.UVM_DEFAULT_DOOR:
+                door = reg.get_parent().get_default_door()
+            local_map = None
+            if door != uvm_door_e.UVM_BACKDOOR:
+                local_map = reg.get_local_map(map)
+            local_maps.append(local_map)
+            if local_map is None:
+                # Backdoor accesses, and the ones that fail without a map
+                key, pipelined, policy = None, True, None
+            else:
+                root_map = local_map.get_root_map()
+                adapter = root_map.get_adapter()
+                key = id(root_map.get_sequencer())
+                pipelined = adapter is not None and adapter.provides_responses
+                policy = root_map.get_transaction_order_policy()
+            groups.setdefault(key, ([], pipelined, policy))[0].append(index)
+
+        def ordered(
+            indices: list[int], policy: uvm_reg_transaction_order_policy | None
+        ) -> list[int]:
+            if policy is None:
+                return indices
+            bus_ops = [
+                uvm_reg_bus_op(
+                    kind,
+                    regs[index].get_address(local_maps[index]),
+                    data[index],
+                    regs[index].get_n_bits(),
+                )
+                for index in indices
+            ]
+            positions = {id(bus_op): index for bus_op, index in zip(bus_ops, indices)}
+            policy.order(bus_ops)
+            order = [positions.get(id(bus_op)) for bus_op in bus_ops]
+            if None in order or sorted(order) != indices:
+                _report_error(
+                    self,
+                    "REG_BLOCK",
+                    f"Transaction order policy {policy.get_name()!r} must "
+                    "reorder the bus operations it is given in place, "
+                    "accessing the registers in request order",
+                )
+                return indices
+            return order
+
+        async def run(index: int) -> None:
+            results[index] = await access(regs[index])
+
+        async def run_group(
+            indices: list[int],
+            pipelined: bool,
+            policy: uvm_reg_transaction_order_policy | None,
+        ) -> None:
+            indices = ordered(indices, policy)
+            if not pipelined:
+                for index in indices:
+                    await run(index)
+                return
+            tasks = [self._start_soon(run(index)) for index in indices]
+            for task in tasks:
+                await task
+
+        if len(groups) == 1:
+            await run_group(*next(iter(groups.values())))
+        else:
+            tasks = [self._start_soon(run_group(*group)) for group in groups.values()]
+            for task in tasks:
+                await task
+        return results
+
+    async def readmemh(
+        self,
+        filename: str | os.PathLike,
+        path: uvm_door_e = uvm_door_e.UVM_DEFAULT_DOOR,
+        map: uvm_reg_map = None,
+        parent: uvm_sequence_base = None,
+    ) -> uvm_status_e:
+        """
+        Loads a ``$readmemh`` image of the memories of the block and its
+        sub-blocks. The ``@`` addresses of the image are addresses in
+        ``map``, and the words following an address go to consecutive
+        locations of the memory mapped there, in a single ``burst_write()``.
+
+        :param filename: Image to load
+        :param path: Door of the writes
+        :param map: Map of the addresses, the default map by default
+        :param parent: Parent sequence of the writes
+        :return: ``UVM_NOT_OK`` if the image cannot be parsed, an address is
+            not in a memory of the block, a word is wider than its memory,
+            or a write failed
+        """
+        map = self.get_default_map() if map is None else map
+        if map is None:
+            _report_error(
+                self,
+                "REG_BLOCK",
+                f"Cannot load {str(filename)!r}: block "
+                f"{self.get_full_name()!r} has no address map",
+            )
+            return uvm_status_e.UVM_NOT_OK
+        try:
+            runs = _read_mem_file(filename, UVM_REG_DATA_WIDTH, "hex")
+        except ValueError as exc:
+            _report_error(
+                self,
+                "REG_BLOCK",
+                f"Cannot load {str(filename)!r} in block "
+                f"{self.get_full_name()!r}: {exc}",
+            )
+            return uvm_status_e.UVM_NOT_OK
+        mems = set(self.get_memories())
+        status = uvm_status_e.UVM_IS_OK
+        for address, words in runs:
+            mem = map.get_mem_by_offset(address)
+            if mem not in mems:
+                _report_error(
+                    self,
+                    "REG_BLOCK",
+                    f"Address 0x{address:X} of {str(filename)!r} is not in a "
+                    f"memory of block {self.get_full_name()!r} in map "
+                    f"{map.get_full_name()!r}",
+                )
+                status = uvm_status_e.UVM_NOT_OK
+                continue
+            try:
+                _check_width(words, mem.get_n_bits())
+            except ValueError as exc:
+                _report_error(
+                    self,
+                    "REG_BLOCK",
+                    f"Cannot load {str(filename)!r} in memory "
+                    f"{mem.get_full_name()!r}: {exc}",
+                )
+                status = uvm_status_e.UVM_NOT_OK
+                continue
+            base = mem.get_address(0, map)
+            stride = mem.get_address(1, map) - base if mem.get_size() > 1 else 1
+            run_status = await mem.burst_write(
+                (address - base) // stride, words, path, map, parent
+            )
+            if run_status != uvm_status_e.UVM_IS_OK:
+                status = run_status
+        return status
+
+    async def writememh(
+        self,
+        filename: str | os.PathLike,
+        path: uvm_door_e = uvm_door_e.UVM_DEFAULT_DOOR,
+        map: uvm_reg_map = None,
+        parent: uvm_sequence_base = None,
+    ) -> uvm_status_e:
+        """
+        Writes a ``$readmemh`` image of the memories of the block and its
+        sub-blocks mapped in ``map``, each read in a single ``burst_read()``
+        and preceded by its ``@`` address, that ``readmemh()`` can load.
+
+        :param filename: Image to write
+        :param path: Door of the reads
+        :param map: Map of the addresses, the default map by default
+        :param parent: Parent sequence of the reads
+        :return: Status of the reads, the file is not written unless it is
+            ``UVM_IS_OK``
+        """
+        map = self.get_default_map() if map is None else map
+        runs = []
+        n_bits = 1
+        for mem in self.get_memories():
+            if map is None or not mem.is_in_map(map):
+                continue
+            address = mem.get_address(0, map)
+            if address is None:
+                continue
+            words = [0] * mem.get_size()
+            status = await mem.burst_read(0, words, path, map, parent)
+            if status != uvm_status_e.UVM_IS_OK:
+                return status
+            runs.append((address, words))
+            n_bits = max(n_bits, mem.get_n_bits())
+        runs.sort(key=lambda run: run[0])
+        _write_mem_file(filename, runs, n_bits, "hex")
+        return uvm_status_e.UVM_IS_OK
+
+    def get_state(self) -> uvm_reg_block_state:
+        """
+        :return: The mirrored and desired values and the field written flags
+            of all the registers of the block and its sub-blocks
+        """
+        return uvm_reg_block_state.from_registers(self.get_registers())
+
+    def set_state(self, state: uvm_reg_block_state) -> None:
+        """
+        Restore the values and written flags of the registers of the block
+        from ``state``. The DUT is not accessed: poke it through a backdoor,
+        or call ``update()`` after changing the desired values, to bring it
+        in line with the model.
+
+        :param state: State returned by ``get_state()`` or ``load_state()``
+        :return: None
+        """
+        restored = 0
+        not_saved = []
+        for reg in self.get_registers():
+            values = state.regs.get(reg.get_full_name())
+            if values is None:
+                not_saved.append(reg.get_full_name())
+                continue
+            mirrored, desired, written = values
+            for index, field in enumerate(reg.get_fields()):
+                lsb = field.get_lsb_pos()
+                mask = field.get_mask()
+                field._mirrored = mirrored >> lsb & mask
+                field._desired = desired >> lsb & mask
+                field.value = field._desired
+                field._written = bool(written >> index & 1)
+            reg._refresh_dirty()
+            restored += 1
+        if not_saved:
+            _report_warning(
+                self,
+                "REG_BLOCK",
+                f"{len(not_saved)} register(s) of block {self.get_full_name()!r} "
+                f"not in the restored state kept their values, e.g. "
+                f"{not_saved[0]!r}",
+            )
+        if restored != len(state):
+            _report_warning(
+                self,
+                "REG_BLOCK",
+                f"{len(state) - restored} register(s) of the restored state are "
+                f"not in block {self.get_full_name()!r}",
+            )
+
+    def save_state(self, path: str | os.PathLike) -> None:
+        """
+        :param path: File to write the state of the block to, compressed if
+            its suffix is ``.gz``
+        :return: None
+        """
+        self.get_state().save(path)
+
+    def load_state(self, path: str | os.PathLike) -> None:
+        """
+        :param path: File written by ``save_state()``
+        :return: None
+        """
+        self.set_state(uvm_reg_block_state.load(path))
+
+    def diff_state(self, state: uvm_reg_block_state) -> list[str]:
+        """
+        :param state: State to compare the block with
+        :return: Full names of the registers whose values or written flags
+            differ from ``state``, or that are in only one of them
+        """
+        return self.get_state().diff(state)
 
     def get_backdoor(self, inherited: bool = True) -> uvm_reg_backdoor | None:
         if self._backdoor is not None or not inherited:
@@ -549,7 +1188,10 @@ class uvm_reg_block(uvm_object):
         self._backdoor = bkdr
 
     def clear_hdl_path(self, kind: str = "RTL") -> None:
-        raise NotImplementedError
+        if kind == "ALL":
+            self._hdl_paths_pool.clear()
+        else:
+            self._hdl_paths_pool.pop(kind or self.get_default_hdl_path(), None)
 
     def add_hdl_path(self, path: str, kind: str = "RTL") -> None:
         if kind not in self._hdl_paths_pool:
@@ -557,27 +1199,54 @@ class uvm_reg_block(uvm_object):
         self._hdl_paths_pool[kind].append(path)
 
     def has_hdl_path(self, kind: str = "") -> bool:
-        raise NotImplementedError
+        return (kind or self.get_default_hdl_path()) in self._hdl_paths_pool
 
     def get_hdl_path(self, paths: list[str], kind: str = "") -> None:
-        raise NotImplementedError
+        paths.extend(self._hdl_paths_pool.get(kind or self.get_default_hdl_path(), []))
 
     def get_full_hdl_path(
         self, paths: list[str], kind: str = "", separator: str = "."
     ) -> None:
-        raise NotImplementedError
+        # Unlike SystemVerilog, a block without a path for ``kind`` does not
+        # add a level to the paths below it, and an empty list means the
+        # paths start at the cocotb toplevel.
+        kind = kind or self.get_default_hdl_path()
+        if self.is_hdl_path_root(kind):
+            if self._root_hdl_paths[kind]:
+                paths.append(self._root_hdl_paths[kind])
+            return
+        parent_paths: list[str] = []
+        if self._parent is not None:
+            self._parent.get_full_hdl_path(parent_paths, kind, separator)
+        for hdl_path in self._hdl_paths_pool.get(kind, [""]):
+            for parent_path in parent_paths or [""]:
+                full_path = _join_hdl_path(parent_path, hdl_path, separator)
+                if full_path:
+                    paths.append(full_path)
 
     def set_default_hdl_path(self, kind: str) -> None:
-        raise NotImplementedError
+        if kind == "":
+            if self._parent is None:
+                _report_error(
+                    self,
+                    "BLOCK_HDL_KIND",
+                    f"Block {self.get_full_name()!r} has no parent; specify a "
+                    "valid HDL abstraction (kind)",
+                )
+                return
+            kind = self._parent.get_default_hdl_path()
+        self._default_hdl_path = kind
 
     def get_default_hdl_path(self) -> str:
-        raise NotImplementedError
+        if self._default_hdl_path == "" and self._parent is not None:
+            return self._parent.get_default_hdl_path()
+        return self._default_hdl_path
 
     def set_hdl_path_root(self, path: str, kind: str = "RTL") -> None:
-        raise NotImplementedError
+        self._root_hdl_paths[kind or self.get_default_hdl_path()] = path
 
     def is_hdl_path_root(self, kind: str = "") -> bool:
-        raise NotImplementedError
+        return (kind or self.get_default_hdl_path()) in self._root_hdl_paths
 
     def _init_address_maps(self) -> None:
         for map in self._maps:
@@ -0,0 +1,106 @@
+# Register-model state snapshots
+#
+# A uvm_reg_block_state holds the mirrored and desired values of the
+# registers of a block, and the written flags of their fields, keyed by
+# full register name. uvm_reg_block.save_state() pickles it to a file that
+# uvm_reg_block.load_state() restores in one call, so a test can skip a
+# long boot configuration that an earlier test already ran through
+# uvm_reg.write(): restore the model, then poke the DUT through a backdoor.
+#
+# The written flags of a register are packed in an int, bit i being the
+# flag of field i of get_fields(). A ".gz" suffix compresses the file.
+
+from __future__ import annotations
+
+import gzip
+import pickle
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from pyuvm._reg.uvm_reg import uvm_reg
+
+__all__ = ["uvm_reg_block_state"]
+
+# Bump when the pickled state changes shape
+_STATE_VERSION = 1
+
+
+def _open_state_file(path, mode):
+    path = Path(path)
+    if path.suffix == ".gz":
+        return gzip.open(path, mode)
+    return open(path, mode)
+
+
+class uvm_reg_block_state:
+    """
+    Mirrored value, desired value and field written flags of registers,
+    keyed by full register name.
+    """
+
+    def __init__(self, regs: dict[str, tuple[int, int, int]] | None = None):
+        self.regs: dict[str, tuple[int, int, int]] = {} if regs is None else regs
+
+    @classmethod
+    def from_registers(cls, regs: Iterable[uvm_reg]) -> uvm_reg_block_state:
+        state = {}
+        for reg in regs:
+            mirrored = desired = written = 0
+            for index, field in enumerate(reg.get_fields()):
+                lsb = field.get_lsb_pos()
+                mirrored |= field._mirrored << lsb
+                desired |= field._desired << lsb
+                written |= field._written << index
+            state[reg.get_full_name()] = (mirrored, desired, written)
+        return cls(state)
+
+    def save(self, path) -> None:
+        """
+        :param path: File to write, compressed if its suffix is ``.gz``
+        :return: None
+        """
+        with _open_state_file(path, "wb") as state_file:
+            pickle.dump(
+                (_STATE_VERSION, self.regs), state_file, pickle.HIGHEST_PROTOCOL
+            )
+
+    @classmethod
+    def load(cls, path) -> uvm_reg_block_state:
+        """
+        :param path: File written by ``save()``
+        :raises ValueError: If the file was saved by an incompatible version
+        :return: The saved state
+        """
+        with _open_state_file(path, "rb") as state_file:
+            version, regs = pickle.load(state_file)
+        if version != _STATE_VERSION:
+            raise ValueError(
+                f"Register state file {str(path)!r} has version {version}, "
+                f"expected {_STATE_VERSION}"
+            )
+        return cls(regs)
+
+    def diff(self, other: uvm_reg_block_state) -> list[str]:
+        """
+        :param other: State to compare with
+        :return: Full names of the registers whose values or written flags
+            differ, or that are in only one of the states
+        """
+        differ = [
+            name for name, values in self.regs.items() if other.regs.get(name) != values
+        ]
+        differ.extend(name for name in other.regs if name not in self.regs)
+        return differ
+
+    def __len__(self) -> int:
+        return len(self.regs)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, uvm_reg_block_state):
+            return NotImplemented
+        return self.regs == other.regs
+
+    __hash__ = None
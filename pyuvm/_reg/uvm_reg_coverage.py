@@ -0,0 +1,305 @@
+# Built-in register-model coverage
+#
+# A uvm_reg_block constructed with the UVM_CVR_ADDR_MAP or
+# UVM_CVR_FIELD_VALS coverage models allocates, when its model is locked,
+# the bins of its own registers and memories in a _uvm_reg_block_coverage:
+#
+# - UVM_CVR_ADDR_MAP: a read and a write hit counter for each register and
+#   memory of the block in each of its address maps.
+# - UVM_CVR_FIELD_VALS: a bit per value of each field of the registers of
+#   the block, set when the value is read or written. The values of a field
+#   wider than _FIELD_VAL_BITS are binned by their most significant
+#   _FIELD_VAL_BITS bits.
+#
+# Once turned on with set_coverage(), the frontdoor accesses sample the
+# bins with a few index operations, whatever the size of the model. As for
+# the user sample() hooks, register accesses only sample when their map
+# auto-predicts or a uvm_reg_predictor observes them. The counters are
+# NumPy uint64 arrays when NumPy is installed, array.array otherwise. The
+# bitmaps pack eight bins in each byte of a bytearray.
+#
+# uvm_reg_block.get_coverage_db() copies the bins of a block and its
+# sub-blocks in a uvm_reg_coverage, keyed by full block name, that can be
+# saved to a file. merge() adds the counters and ORs the bitmaps of the
+# databases of parallel regression runs, a whole block at a time.
+
+from __future__ import annotations
+
+import pickle
+from array import array
+from typing import TYPE_CHECKING, Any
+
+from pyuvm._reg.uvm_reg_block_state import _open_state_file
+from pyuvm._reg.uvm_reg_model import (
+    _reg_config_path,
+    uvm_coverage_model_e,
+    uvm_hier_e,
+)
+from pyuvm._s13_uvm_component import ConfigDB
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from pyuvm._reg.uvm_mem import uvm_mem
+    from pyuvm._reg.uvm_reg import uvm_reg
+    from pyuvm._reg.uvm_reg_block import uvm_reg_block
+    from pyuvm._reg.uvm_reg_map import uvm_reg_map
+    from pyuvm._reg.uvm_reg_model import uvm_reg_cvr_t
+
+__all__ = ["uvm_reg_coverage"]
+
+# Bump when the pickled database changes shape
+_COVERAGE_VERSION = 2
+
+# Fields wider than this are binned by their most significant bits
+_FIELD_VAL_BITS = 8
+
+_ADDR_MAP = uvm_coverage_model_e.UVM_CVR_ADDR_MAP.value
+_FIELD_VALS = uvm_coverage_model_e.UVM_CVR_FIELD_VALS.value
+
+
+def _cvr_bits(models: uvm_reg_cvr_t | uvm_coverage_model_e) -> int:
+    if isinstance(models, uvm_coverage_model_e):
+        return models.value
+    return int(models)
+
+
+def _included_coverage(full_name: str) -> int:
+    # Models enabled by uvm_reg.include_coverage() for an element
+    models = ConfigDB().get(None, _reg_config_path(full_name), "include_coverage", 0)
+    return _cvr_bits(models)
+
+
+def _counters(size: int) -> Any:
+    if np is not None:
+        return np.zeros(size, dtype=np.uint64)
+    return array("Q", bytes(8 * size))
+
+
+def _copy(bins: Any) -> Any:
+    if isinstance(bins, _uvm_reg_bitmap):
+        return bins.copy()
+    if np is not None:
+        return np.array(bins)
+    return bins[:]
+
+
+def _n_hit(bins: Any) -> int:
+    if np is not None:
+        return int(np.count_nonzero(bins))
+    return sum(1 for hits in bins if hits)
+
+
+class _uvm_reg_bitmap:
+    """Hit bits of ``n_bins`` bins, packed eight to a byte."""
+
+    __slots__ = ("bits", "n_bins")
+
+    def __init__(self, n_bins: int, bits: bytearray | None = None) -> None:
+        self.n_bins = n_bins
+        self.bits = bytearray(n_bins + 7 >> 3) if bits is None else bits
+
+    def __len__(self) -> int:
+        return self.n_bins
+
+    def __getitem__(self, index: int) -> int:
+        if not 0 <= index < self.n_bins:
+            raise IndexError(f"Bin {index} out of range")
+        return self.bits[index >> 3] >> (index & 7) & 1
+
+    def count(self) -> int:
+        return bin(int.from_bytes(self.bits, "little")).count("1")
+
+    def copy(self) -> _uvm_reg_bitmap:
+        return _uvm_reg_bitmap(self.n_bins, self.bits[:])
+
+    def __ior__(self, other: _uvm_reg_bitmap) -> _uvm_reg_bitmap:
+        self.bits[:] = (
+            int.from_bytes(self.bits, "little") | int.from_bytes(other.bits, "little")
+        ).to_bytes(len(self.bits), "little")
+        return self
+
+
+class _uvm_reg_block_coverage:
+    """Built-in coverage bins of the registers and memories of a block."""
+
+    # Coverage models with built-in bins
+    MODELS = _ADDR_MAP | _FIELD_VALS
+
+    def __init__(self, block: uvm_reg_block, models: int) -> None:
+        # Coverage models being sampled, set by uvm_reg_block.set_coverage()
+        self.on = 0
+        elements: list[uvm_reg | uvm_mem] = list(
+            block.get_registers(uvm_hier_e.UVM_NO_HIER)
+        )
+        elements.extend(block.get_memories(uvm_hier_e.UVM_NO_HIER))
+        self.element_index = {element: ii for ii, element in enumerate(elements)}
+        maps: dict[uvm_reg_map, int] = {}
+        for element in elements:
+            element_maps = []
+            element.get_maps(element_maps)
+            for reg_map in element_maps:
+                maps.setdefault(reg_map, len(maps))
+        # Counter of an access: (map * n_elements + element) * 2 + is_read
+        self.map_base = {
+            reg_map: index * len(elements) for reg_map, index in maps.items()
+        }
+        self.addr_hits = None
+        if models & _ADDR_MAP:
+            self.addr_hits = _counters(2 * len(maps) * len(elements))
+        # Register -> (lsb, mask, shift, first bin) of each of its fields
+        self.field_bins: dict[uvm_reg, tuple[tuple[int, int, int, int], ...]] = {}
+        self.field_hits = None
+        if models & _FIELD_VALS:
+            n_bins = 0
+            for reg in block.get_registers(uvm_hier_e.UVM_NO_HIER):
+                layout = []
+                for field in reg.get_fields():
+                    n_bits = field.get_n_bits()
+                    shift = max(n_bits - _FIELD_VAL_BITS, 0)
+                    layout.append(
+                        (field.get_lsb_pos(), field.get_mask(), shift, n_bins)
+                    )
+                    n_bins += 1 << (n_bits - shift)
+                self.field_bins[reg] = tuple(layout)
+            self.field_hits = _uvm_reg_bitmap(n_bins)
+
+    def sample(
+        self,
+        element: uvm_reg | uvm_mem,
+        value: int,
+        is_read: bool,
+        reg_map: uvm_reg_map,
+    ) -> None:
+        """Samples an access of ``element`` through its local map"""
+        if self.on & _ADDR_MAP and self.addr_hits is not None:
+            base = self.map_base.get(reg_map)
+            if base is not None:
+                index = (base + self.element_index[element]) * 2 + is_read
+                self.addr_hits[index] += 1
+        if self.on & _FIELD_VALS:
+            self.sample_fields(element, value)
+
+    def sample_fields(self, element: uvm_reg | uvm_mem, value: int) -> None:
+        layout = self.field_bins.get(element)
+        if layout is None:
+            return
+        bits = self.field_hits.bits
+        for lsb, mask, shift, first in layout:
+            index = first + ((value >> lsb & mask) >> shift)
+            bits[index >> 3] |= 1 << (index & 7)
+
+
+class uvm_reg_coverage:
+    """
+    Address-map hit counters and field-value bitmaps of register blocks,
+    keyed by full block name.
+    """
+
+    def __init__(
+        self,
+        addr_hits: dict[str, Any] | None = None,
+        field_hits: dict[str, Any] | None = None,
+    ):
+        self.addr_hits: dict[str, Any] = {} if addr_hits is None else addr_hits
+        self.field_hits: dict[str, Any] = {} if field_hits is None else field_hits
+
+    @classmethod
+    def from_blocks(cls, blocks: Iterable[uvm_reg_block]) -> uvm_reg_coverage:
+        db = cls()
+        for blk in blocks:
+            bins = blk._coverage
+            if bins is None:
+                continue
+            if bins.addr_hits is not None:
+                db.addr_hits[blk.get_full_name()] = _copy(bins.addr_hits)
+            if bins.field_hits is not None:
+                db.field_hits[blk.get_full_name()] = _copy(bins.field_hits)
+        return db
+
+    def merge(self, other: uvm_reg_coverage) -> None:
+        """
+        Adds the hit counters and ORs the field-value bitmaps of ``other``
+        into this database
+
+        :param other: Database of the same register model
+        :raises ValueError: If a block has a different number of bins in
+            the two databases
+        """
+        for name, hits in other.addr_hits.items():
+            mine = self._mergeable(self.addr_hits, name, hits)
+            if mine is None:
+                continue
+            if np is not None:
+                np.add(mine, hits, out=mine)
+            else:
+                self.addr_hits[name] = array("Q", map(int.__add__, mine, hits))
+        for name, hits in other.field_hits.items():
+            mine = self._mergeable(self.field_hits, name, hits)
+            if mine is None:
+                continue
+            mine |= hits
+
+    @staticmethod
+    def _mergeable(bins: dict[str, Any], name: str, hits: Any) -> Any:
+        # The bins of name to merge hits into, None if they were copied
+        mine = bins.get(name)
+        if mine is None:
+            bins[name] = _copy(hits)
+        elif len(mine) != len(hits):
+            raise ValueError(
+                f"Coverage of block {name!r} has {len(hits)} bins, expected {len(mine)}"
+            )
+        return mine
+
+    def get_coverage(
+        self, models: uvm_reg_cvr_t = uvm_coverage_model_e.UVM_CVR_ALL
+    ) -> float:
+        """
+        :param models: Coverage models to include
+        :return: Percentage of the bins of ``models`` that were hit
+        """
+        models = _cvr_bits(models)
+        n_hit = n_bins = 0
+        if models & _ADDR_MAP:
+            for hits in self.addr_hits.values():
+                n_hit += _n_hit(hits)
+                n_bins += len(hits)
+        if models & _FIELD_VALS:
+            for hits in self.field_hits.values():
+                n_hit += hits.count()
+                n_bins += len(hits)
+        return 100.0 * n_hit / n_bins if n_bins else 0.0
+
+    def save(self, path) -> None:
+        """
+        :param path: File to write, compressed if its suffix is ``.gz``
+        :return: None
+        """
+        with _open_state_file(path, "wb") as db_file:
+            pickle.dump(
+                (_COVERAGE_VERSION, self.addr_hits, self.field_hits),
+                db_file,
+                pickle.HIGHEST_PROTOCOL,
+            )
+
+    @classmethod
+    def load(cls, path) -> uvm_reg_coverage:
+        """
+        :param path: File written by ``save()``
+        :raises ValueError: If the file was saved by an incompatible version
+        :return: The saved database
+        """
+        with _open_state_file(path, "rb") as db_file:
+            version, *bins = pickle.load(db_file)
+        if version != _COVERAGE_VERSION:
+            raise ValueError(
+                f"Register coverage file {str(path)!r} has version {version}, "
+                f"expected {_COVERAGE_VERSION}"
+            )
+        return cls(*bins)
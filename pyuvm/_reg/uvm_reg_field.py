@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 import warnings
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, Any, Callable, ClassVar
 
 from pyuvm._reg.uvm_reg_item import uvm_reg_item
 from pyuvm._reg.uvm_reg_map import uvm_reg_map
@@ -26,6 +26,7 @@ from pyuvm._s24_uvm_reg_includes import uvm_resp_t
 
 if TYPE_CHECKING:
     from pyuvm._reg.uvm_reg import uvm_reg
+    from pyuvm._reg.uvm_reg_field_storage import _uvm_reg_field_storage
     from pyuvm._reg.uvm_reg_map import uvm_reg_map_info
     from pyuvm._reg.uvm_reg_model import (
         uvm_reg_byte_en_t,
@@ -70,14 +71,245 @@ _PREDEFINED_POLICIES: set[str] = {
     "NOACCESS",  # no effect, R: no effect.
 }
 
+# Effective access of a field in a register mapped with "RO" or "WO" rights,
+# see uvm_reg_field.get_access(). Other policies become "NOACCESS".
+_RO_RIGHTS_ACCESS: dict[str, str] = {
+    **dict.fromkeys(
+        ("RW", "RO", "WC", "WS", "W1C", "W1S", "W1T", "W0C", "W0S", "W0T", "W1"),
+        "RO",
+    ),
+    **dict.fromkeys(("RC", "WRC", "W1SRC", "W0SRC", "WSRC"), "RC"),
+    **dict.fromkeys(("RS", "WRS", "W1CRS", "W0CRS", "WCRS"), "RS"),
+    **dict.fromkeys(("WO", "WOC", "WOS", "WO1"), "NOACCESS"),
+}
+_WO_RIGHTS_ACCESS: dict[str, str] = {
+    **dict.fromkeys(("RW", "WRC", "WRS"), "WO"),
+    "W1SRC": "W1S",
+    "W0SRC": "W0S",
+    "W1CRS": "W1C",
+    "W0CRS": "W0C",
+    "WCRS": "WC",
+    "W1": "W1",
+    "W01": "W01",
+    "WSRC": "WS",
+    **dict.fromkeys(("RO", "RC", "RS"), "NOACCESS"),
+}
+
+# Value of a field after writing ``value`` when it holds ``cur``, by access
+# policy: f(cur, value, mask, written). Used for both set() and prediction.
+_uvm_write_effect = Callable[[int, int, int, bool], int]
+
+
+def _write_as_is(cur: int, value: int, mask: int, written: bool) -> int:
+    return value
+
+
+def _write_ignored(cur: int, value: int, mask: int, written: bool) -> int:
+    return cur
+
+
+def _write_clears(cur: int, value: int, mask: int, written: bool) -> int:
+    return 0
+
+
+def _write_sets(cur: int, value: int, mask: int, written: bool) -> int:
+    return mask
+
+
+def _write_1_clears(cur: int, value: int, mask: int, written: bool) -> int:
+    return cur & ~value & mask
+
+
+def _write_1_sets(cur: int, value: int, mask: int, written: bool) -> int:
+    return cur | value
+
+
+def _write_1_toggles(cur: int, value: int, mask: int, written: bool) -> int:
+    return cur ^ value
+
+
+def _write_0_clears(cur: int, value: int, mask: int, written: bool) -> int:
+    return cur & value
+
+
+def _write_0_sets(cur: int, value: int, mask: int, written: bool) -> int:
+    return cur | (~value & mask)
+
+
+def _write_0_toggles(cur: int, value: int, mask: int, written: bool) -> int:
+    return cur ^ (~value & mask)
+
+
+def _write_once(cur: int, value: int, mask: int, written: bool) -> int:
+    return cur if written else value
+
+
+# Module-level functions rather than lambdas so that compiled policies, and
+# so locked models, can be pickled
+_WRITE_EFFECTS: dict[str, _uvm_write_effect] = {
+    **dict.fromkeys(("RO", "RC", "RS", "NOACCESS"), _write_ignored),
+    **dict.fromkeys(("RW", "WRC", "WRS", "WO"), _write_as_is),
+    **dict.fromkeys(("WC", "WCRS", "WOC"), _write_clears),
+    **dict.fromkeys(("WS", "WSRC", "WOS"), _write_sets),
+    **dict.fromkeys(("W1C", "W1CRS"), _write_1_clears),
+    **dict.fromkeys(("W1S", "W1SRC"), _write_1_sets),
+    "W1T": _write_1_toggles,
+    **dict.fromkeys(("W0C", "W0CRS"), _write_0_clears),
+    **dict.fromkeys(("W0S", "W0SRC"), _write_0_sets),
+    "W0T": _write_0_toggles,
+    **dict.fromkeys(("W1", "WO1"), _write_once),
+}
+
+# What a read does to a field, by access policy
+_READ_AS_IS = 0
+_READ_CLEARS = 1
+_READ_SETS = 2
+_READ_IGNORED = 3  # The read value is not predicted
+_READ_EFFECTS: dict[str, int] = {
+    **dict.fromkeys(("RC", "WRC", "WSRC", "W1SRC", "W0SRC"), _READ_CLEARS),
+    **dict.fromkeys(("RS", "WRS", "WCRS", "W1CRS", "W0CRS"), _READ_SETS),
+    **dict.fromkeys(("WO", "WOC", "WOS", "WO1", "NOACCESS"), _READ_IGNORED),
+}
+
+# The access policy of a field in a map, compiled by uvm_reg_field:
+# (effective access, write effect, read effect)
+_uvm_field_policy = tuple[str, _uvm_write_effect, int]
+
+# The policy of each effective access, shared by all the fields
+_FIELD_POLICIES: dict[str, _uvm_field_policy] = {}
+
+
+def _field_policy(access: str) -> _uvm_field_policy:
+    policy = _FIELD_POLICIES.get(access)
+    if policy is None:
+        policy = (
+            access,
+            _WRITE_EFFECTS.get(access, _write_as_is),
+            _READ_EFFECTS.get(access, _READ_AS_IS),
+        )
+        _FIELD_POLICIES[access] = policy
+    return policy
+
+
+class _uvm_reg_field_stored:
+    """
+    Values of a field kept in a _uvm_reg_field_storage. _attach_storage()
+    switches the field to a subclass of its class with these properties,
+    which hide the attributes that hold the values otherwise.
+    """
+
+    __slots__ = ()
+
+    @property
+    def value(self) -> uvm_reg_data_t:
+        return int(self._storage.value[self._storage_index])
+
+    @value.setter
+    def value(self, value: uvm_reg_data_t) -> None:
+        self._storage.value[self._storage_index] = value & self.get_mask()
+
+    @property
+    def _mirrored(self) -> uvm_reg_data_t:
+        return int(self._storage.mirrored[self._storage_index])
+
+    @_mirrored.setter
+    def _mirrored(self, value: uvm_reg_data_t) -> None:
+        self._storage.mirrored[self._storage_index] = value & self.get_mask()
+
+    @property
+    def _desired(self) -> uvm_reg_data_t:
+        return int(self._storage.desired[self._storage_index])
+
+    @_desired.setter
+    def _desired(self, value: uvm_reg_data_t) -> None:
+        self._storage.desired[self._storage_index] = value & self.get_mask()
+
+    @property
+    def _written(self) -> bool:
+        return bool(self._storage.written[self._storage_index])
+
+    @_written.setter
+    def _written(self, written: bool) -> None:
+        self._storage.written[self._storage_index] = written
+
+    def __getstate__(self) -> tuple[dict[str, Any], dict[str, Any]]:
+        # The values are pickled with the storage. Leave out the attributes
+        # hidden by the properties, which are unpickled before the storage.
+        slots = {}
+        for cls in type(self).__mro__:
+            names = cls.__dict__.get("__slots__", ())
+            for name in (names,) if isinstance(names, str) else names:
+                if name not in _STORED_NAMES and hasattr(self, name):
+                    slots[name] = getattr(self, name)
+        return self.__dict__, slots
+
+    def clone(self) -> uvm_reg_field:
+        # A clone is not part of the storage
+        new = type(self).__bases__[1](self.get_name())
+        new.copy(self)
+        return new
+
+
+_STORED_NAMES = ("value", "_mirrored", "_desired", "_written")
+
+
+def _stored_field_class(cls: type[uvm_reg_field]) -> type[uvm_reg_field]:
+    # Named as an attribute of cls so that fields with storage can be pickled
+    return type(
+        f"_{cls.__name__}_stored",
+        (_uvm_reg_field_stored, cls),
+        {
+            "__slots__": (),
+            "__module__": cls.__module__,
+            "__qualname__": f"{cls.__qualname__}._stored_class",
+        },
+    )
+
 
 class uvm_reg_field(uvm_object):
     _max_size: ClassVar[int] = 0
     _policy_names: ClassVar[set[str]] = _PREDEFINED_POLICIES
     _reg_field_registry: ClassVar[dict[str, uvm_reg_field]] = {}
+    # Class of the fields of this class that have storage, see
+    # _attach_storage()
+    _stored_class: ClassVar[type[uvm_reg_field]]
+    # The field state is kept in slots. What uvm_object sets (name, logger,
+    # verbosity) is still in the __dict__ of each field.
+    __slots__ = (
+        "_access",
+        "_check",
+        "_cover_on",
+        "_desired",
+        "_fname",
+        "_individually_accessible",
+        "_layout",
+        "_lineno",
+        "_lsb_pos",
+        "_mirrored",
+        "_parent",
+        "_policies",
+        "_reset",
+        "_response",
+        "_size",
+        "_storage",
+        "_storage_index",
+        "_volatile",
+        "_written",
+        "value",
+    )
 
     def __init__(self, name: str = "uvm_reg_field") -> None:
         super().__init__(name)
+        # Set when the block is locked with array storage, see
+        # uvm_reg_field_storage. The values below are then kept there.
+        self._storage: _uvm_reg_field_storage | None = None
+        self._storage_index: int = -1
+        # Compiled access policy by map, see _get_policy()
+        self._policies: dict[uvm_reg_map | None, _uvm_field_policy] = {}
+        # Field of the first element of a register array, whose reset values
+        # and compiled policies are shared while they are the same, see
+        # uvm_reg_block.create_reg_array(). Both dicts are copied on write.
+        self._layout: uvm_reg_field | None = None
         self.value: uvm_reg_data_t = 0
         self._parent: uvm_reg = None
         self._size: int = 0
@@ -97,6 +329,22 @@ class uvm_reg_field(uvm_object):
         # TODO: Remove backward compatibility
         self._response = uvm_resp_t.PASS_RESP
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if not issubclass(cls, _uvm_reg_field_stored):
+            cls._stored_class = _stored_field_class(cls)
+
+    def _attach_storage(self, storage: _uvm_reg_field_storage, index: int) -> None:
+        # Only fields with storage pay for the properties that read it
+        self._storage = storage
+        self._storage_index = index
+        self.__class__ = self._stored_class
+
+    def _share_layout(self, field: uvm_reg_field) -> None:
+        self._layout = field
+        if self._reset == field._reset:
+            self._reset = field._reset
+
     def configure(
         self,
         parent: uvm_reg,
@@ -224,6 +472,11 @@ class uvm_reg_field(uvm_object):
                 self._access,
             )
             self._access = old_access
+        self._compile_policies()
+        if self._storage is not None:
+            self._storage.invalidate_updates()
+        if self._parent is not None:
+            self._parent._refresh_dirty()
         return old_access
 
     def set_rand_mode(self, rand_mode: bool) -> None:
@@ -244,74 +497,63 @@ class uvm_reg_field(uvm_object):
         return True
 
     def get_access(self, map: uvm_reg_map = None) -> str | None:
-        access = self._access
-        # TODO: Implement backdoor
-        try:
-            if map == uvm_reg_map.backdoor():
-                return access
-        except NotImplementedError:
-            pass
+        policy = self._policies.get(map)
+        if policy is not None:
+            return policy[0]
+        return self._resolve_access(map)
 
-        if self._parent.get_rights(map) in ["RW"]:
+    def _resolve_access(self, map: uvm_reg_map | None) -> str:
+        access = self._access
+        if map is uvm_reg_map.backdoor():
             return access
-        elif self._parent.get_rights(map) in ["RO"]:
-            if access in [
-                "RW",
-                "RO",
-                "WC",
-                "WS",
-                "W1C",
-                "W1S",
-                "W1T",
-                "W0C",
-                "W0S",
-                "W0T",
-                "W1",
-            ]:
-                return "RO"
-            elif access in ["RC", "WRC", "W1SRC", "W0SRC", "WSRC"]:
-                return "RC"
-            elif access in ["RS", "WRS", "W1CRS", "W0CRS", "WCRS"]:
-                return "RS"
-            elif access in ["WO", "WOC", "WOS", "WO1"]:
-                return "NOACCESS"
-        elif self._parent.get_rights(map) in ["WO"]:
-            if access in ["RW", "WRC", "WRS"]:
-                return "WO"
-            elif access in ["W1SRC"]:
-                return "W1S"
-            elif access in ["W0SRC"]:
-                return "W0S"
-            elif access in ["W1CRS"]:
-                return "W1C"
-            elif access in ["W0CRS"]:
-                return "W0C"
-            elif access in ["WCRS"]:
-                return "WC"
-            elif access in ["W1"]:
-                return "W1"
-            elif access in ["W01"]:
-                return "W01"
-            elif access in ["WSRC"]:
-                return "WS"
-            elif access in ["RO", "RC", "RS"]:
-                return "NOACCESS"
-        else:
-            logger.warning(
-                "Register %r containing field %r is mapped in map %r with unknown "
-                "access rights %r",
-                self._parent.get_full_name(),
-                self.get_name(),
-                map.get_full_name(),
-                self._parent.get_rights(map),
-            )
+        rights = self._parent.get_rights(map)
+        if rights == "RW":
+            return access
+        elif rights == "RO":
+            return _RO_RIGHTS_ACCESS.get(access, "NOACCESS")
+        elif rights == "WO":
+            return _WO_RIGHTS_ACCESS.get(access, "NOACCESS")
+        logger.warning(
+            "Register %r containing field %r is mapped in map %r with unknown "
+            "access rights %r",
+            self._parent.get_full_name(),
+            self.get_name(),
+            map.get_full_name(),
+            rights,
+        )
         return "NOACCESS"
 
+    def _get_policy(self, map: uvm_reg_map | None) -> _uvm_field_policy:
+        policy = self._policies.get(map)
+        if policy is None:
+            policy = _field_policy(self._resolve_access(map))
+            # The maps and rights of the register are final once locked
+            if self._parent._locked:
+                self._policies[map] = policy
+        return policy
+
+    def _compile_policies(self) -> None:
+        # Called when the model is locked, and when the access policy changes
+        self._policies = {}
+        if self._parent is None or not self._parent._locked:
+            return
+        for map in (None, *self._parent._maps):
+            self._get_policy(map)
+        # Fields with the same policies in the same maps resolve the maps
+        # added later the same way too, so they can share the dict
+        layout = self._layout
+        if layout is not None and layout._policies == self._policies:
+            self._policies = layout._policies
+
     def is_known_access(self, map: uvm_reg_map = None) -> bool:
         return self.get_access(map) in self._policy_names
 
     def set_volatility(self, volatile: bool) -> None:
         self._volatile = volatile
+        if self._storage is not None:
+            self._storage.invalidate_updates()
+        if self._parent is not None:
+            self._parent._refresh_dirty()
 
     def is_volatile(self) -> bool:
         return self._volatile
@@ -350,34 +592,11 @@ class uvm_reg_field(uvm_object):
         # if the parent is under WRITE there should be no set called.
         # Not yet implemenmted.
         #
-        access = self.get_access()
-        # Return value based on the access
-        if access in ("RO", "RC", "RS", "NOACCESS"):
-            self._desired = self._desired  # Leave the desired value stable
-        elif access in ("RW", "WRC", "WRS", "WO"):
-            self._desired = value
-        elif access in ("WC", "WCRS", "WOC"):
-            self._desired = 0
-        elif access in ("WS", "WSRC", "WOS"):
-            self._desired = _mask
-        elif access in ("W1C", "W1CRS"):
-            self._desired = self._desired & (~value)
-        elif access in ("W1S", "W1SRC"):
-            self._desired = self._desired | value
-        elif access == "W1T":
-            self._desired = self._desired ^ value
-        elif access in ("W0C", "W0CRS"):
-            self._desired = self._desired & value
-        elif access in ("W0S", "W0SRC"):
-            self._desired = self._desired | (~value & _mask)
-        elif access == "W0T":
-            self._desired = self._desired ^ (~value & _mask)
-        elif access in ("W1", "WO1"):
-            if self._written is False:
-                self._desired = value
-        else:
-            self._desired = value
+        write = self._get_policy(None)[1]
+        self._desired = write(self._desired, value, _mask, self._written)
         self.value = self._desired
+        if self._parent is not None:
+            self._parent._mark_dirty()
 
     def get(self, fname: str = "", lineno: int = 0) -> uvm_reg_data_t:
         self._fname = fname
@@ -414,11 +633,15 @@ class uvm_reg_field(uvm_object):
         if kind not in self._reset:
             return False
         if delete:
-            del self._reset[kind]
+            self._reset = {key: val for key, val in self._reset.items() if key != kind}
+            if self._storage is not None:
+                self._storage.invalidate_reset(kind)
         return True
 
     def set_reset(self, value: uvm_reg_data_t, kind: str = "HARD") -> None:
-        self._reset[kind] = value & ((1 << self._size) - 1)
+        self._reset = {**self._reset, kind: value & ((1 << self._size) - 1)}
+        if self._storage is not None:
+            self._storage.invalidate_reset(kind)
 
     def needs_update(self) -> bool:
         if self.get_access() in ("RO", "RC", "RS"):
@@ -670,36 +893,8 @@ class uvm_reg_field(uvm_object):
         self, cur_val: uvm_reg_data_t, wr_val: uvm_reg_data_t, map: uvm_reg_map
     ) -> uvm_reg_data_t:
         mask = (1 << self.get_n_bits()) - 1
-        cur_val &= mask
-        wr_val &= mask
-        access = self.get_access(map)
-        if access in ["RO", "RC", "RS", "NOACCESS"]:
-            return cur_val
-        elif access in ["RW", "WRC", "WRS", "WO"]:
-            return wr_val
-        elif access in ["WC", "WCRS", "WOC"]:
-            return 0
-        elif access in ["WS", "WSRC", "WOS"]:
-            return mask
-        elif access in ["W1C", "W1CRS"]:
-            return cur_val & (~wr_val & mask)
-        elif access in ["W1S", "W1SRC"]:
-            return cur_val | wr_val
-        elif access in ["W1T"]:
-            return cur_val ^ wr_val
-        elif access in ["W0C", "W0CRS"]:
-            return cur_val & wr_val
-        elif access in ["W0S", "W0SRC"]:
-            return cur_val | (~wr_val & mask)
-        elif access in ["W0T"]:
-            return cur_val ^ (~wr_val & mask)
-        elif access in ["W1", "WO1"]:
-            if self._written:
-                return cur_val
-            else:
-                return wr_val
-        else:
-            return wr_val
+        write = self._get_policy(map)[1]
+        return write(cur_val & mask, wr_val & mask, mask, self._written)
 
     def _update(self) -> uvm_reg_data_t:
         return self.get_update_value()
@@ -726,7 +921,8 @@ class uvm_reg_field(uvm_object):
         kind: uvm_predict_e = uvm_predict_e.UVM_PREDICT_DIRECT,
         be: uvm_reg_byte_en_t = -1,
     ) -> None:
-        field_value = rw.get_value(0) & ((1 << self.get_n_bits()) - 1)
+        mask = (1 << self.get_n_bits()) - 1
+        field_value = rw.get_value(0) & mask
         if rw.get_status() != uvm_status_e.UVM_NOT_OK:
             rw.set_status(uvm_status_e.UVM_IS_OK)
         if not be & 0b1:
@@ -738,7 +934,10 @@ class uvm_reg_field(uvm_object):
                 rw.get_door() == uvm_door_e.UVM_FRONTDOOR
                 or rw.get_door() == uvm_door_e.UVM_PREDICT
             ):
-                field_value = self._predict(self._mirrored, field_value, rw.get_map())
+                _, write, _ = self._get_policy(rw.get_map())
+                field_value = write(
+                    self._mirrored & mask, field_value, mask, self._written
+                )
             self._written = True
             # TODDO: implement callbacks
             # callbacks = uvm_reg_field_cb_iter(self)
@@ -746,18 +945,18 @@ class uvm_reg_field(uvm_object):
             #     callback.post_predict(self, self._mirrored, field_value,
             #                           uvm_predict_e.UVM_PREDICT_WRITE,
             #                           rw.get_door(), rw.get_map())
-            field_value &= (1 << self.get_n_bits()) - 1
+            field_value &= mask
         elif kind == uvm_predict_e.UVM_PREDICT_READ:
             if (
                 rw.get_door() == uvm_door_e.UVM_FRONTDOOR
                 or rw.get_door() == uvm_door_e.UVM_PREDICT
             ):
-                access = self.get_access(rw.get_map())
-                if access in ["RC", "WRC", "WSRC", "W1SRC", "W0SRC"]:
+                read = self._get_policy(rw.get_map())[2]
+                if read == _READ_CLEARS:
                     field_value = 0
-                elif access in ["RS", "WRS", "WCRS", "W1CRS", "W0CRS"]:
-                    field_value = (1 << self.get_n_bits()) - 1
-                elif access in ["WO", "WOC", "WOS", "WO1", "NOACCESS"]:
+                elif read == _READ_SETS:
+                    field_value = mask
+                elif read == _READ_IGNORED:
                     return
             # TODO: implement callbacks
             # callbacks = uvm_reg_field_cb_iter(self)
@@ -765,7 +964,7 @@ class uvm_reg_field(uvm_object):
             #     callback.post_predict(self, self._mirrored, field_value,
             #                           uvm_predict_e.UVM_PREDICT_READ,
             #                           rw.get_door(), rw.get_map())
-            field_value &= (1 << self.get_n_bits()) - 1
+            field_value &= mask
         elif kind == uvm_predict_e.UVM_PREDICT_DIRECT:
             if self._parent.is_busy():
                 logger.warning(
@@ -844,3 +1043,6 @@ class uvm_reg_field(uvm_object):
     #                                         uvm_comparer comparer);
     # extern virtual function void do_pack (uvm_packer packer);
     # extern virtual function void do_unpack (uvm_packer packer);
+
+
+uvm_reg_field._stored_class = _stored_field_class(uvm_reg_field)
@@ -0,0 +1,143 @@
+# Array-backed field values
+#
+# A register block locked with set_array_storage(True) keeps the mirrored,
+# desired and current values of all its fields in a _uvm_reg_field_storage
+# instead of in attributes of each uvm_reg_field. A field then reads and
+# writes its element of the arrays, so the field API is unchanged, while
+# block reset() works on whole arrays and block update() and needs_update()
+# compare the desired and mirrored arrays to find the fields to write.
+#
+# The arrays are NumPy uint64 arrays when NumPy is installed and
+# array.array otherwise. Field values fit because the register layer
+# limits fields to UVM_REG_DATA_WIDTH (64) bits.
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Any
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from pyuvm._reg.uvm_reg_field import uvm_reg_field
+
+__all__: list[str] = []
+
+
+def _values(values: list[int]) -> Any:
+    if np is not None:
+        return np.array(values, dtype=np.uint64)
+    return array("Q", values)
+
+
+def _flags(flags: list[bool]) -> Any:
+    if np is not None:
+        return np.array(flags, dtype=bool)
+    return bytearray(flags)
+
+
+class _uvm_reg_field_storage:
+    """Mirrored, desired and current values of a list of fields."""
+
+    def __init__(self, fields: Sequence[uvm_reg_field]) -> None:
+        self.fields = fields
+        # Read the attribute values before the fields start using the arrays
+        self.mirrored = _values([field._mirrored for field in fields])
+        self.desired = _values([field._desired for field in fields])
+        self.value = _values([field.value & field.get_mask() for field in fields])
+        self.written = _flags([field._written for field in fields])
+        # kind -> (sorted indices of fields with that reset, their values)
+        self._resets: dict[str, tuple[Any, Any]] = {}
+        # (fields that can be updated, volatile fields among them)
+        self._updates: tuple[Any, Any] | None = None
+        for index, field in enumerate(fields):
+            field._attach_storage(self, index)
+
+    def invalidate_reset(self, kind: str) -> None:
+        self._resets.pop(kind, None)
+
+    def invalidate_updates(self) -> None:
+        self._updates = None
+
+    def _update_table(self) -> tuple[Any, Any]:
+        if self._updates is None:
+            updatable = []
+            volatile = []
+            for field in self.fields:
+                # Same as uvm_reg_field.needs_update()
+                can_update = field.get_access() not in ("RO", "RC", "RS")
+                updatable.append(can_update)
+                volatile.append(can_update and field.is_volatile())
+            self._updates = (_flags(updatable), _flags(volatile))
+        return self._updates
+
+    def dirty_fields(self, start: int, stop: int) -> list[int]:
+        """Indices of the fields in [start, stop) that need an update"""
+        updatable, volatile = self._update_table()
+        if np is not None:
+            span = slice(start, stop)
+            dirty = self.desired[span] != self.mirrored[span]
+            dirty &= updatable[span]
+            dirty |= volatile[span]
+            return (np.flatnonzero(dirty) + start).tolist()
+        desired, mirrored = self.desired, self.mirrored
+        return [
+            index
+            for index in range(start, stop)
+            if volatile[index] or updatable[index] and desired[index] != mirrored[index]
+        ]
+
+    def _reset_table(self, kind: str) -> tuple[Any, Any]:
+        table = self._resets.get(kind)
+        if table is None:
+            indices = []
+            values = []
+            for index, field in enumerate(self.fields):
+                if field.has_reset(kind):
+                    indices.append(index)
+                    values.append(field.get_reset(kind))
+            if np is not None:
+                table = (np.array(indices, dtype=np.intp), _values(values))
+            else:
+                table = (array("q", indices), _values(values))
+            self._resets[kind] = table
+        return table
+
+    def reset(self, kind: str, start: int, stop: int) -> None:
+        indices, values = self._reset_table(kind)
+        if np is not None:
+            lo, hi = np.searchsorted(indices, (start, stop))
+            indices, values = indices[lo:hi], values[lo:hi]
+            self.mirrored[indices] = values
+            self.desired[indices] = values
+            self.value[indices] = values
+            if kind == "HARD":
+                self.written[indices] = False
+            return
+        lo = bisect_left(indices, start)
+        hi = bisect_left(indices, stop)
+        if hi - lo == stop - start:
+            # Every field in the range has this reset: copy whole slices
+            self.mirrored[start:stop] = values[lo:hi]
+            self.desired[start:stop] = values[lo:hi]
+            self.value[start:stop] = values[lo:hi]
+            if kind == "HARD":
+                self.written[start:stop] = bytes(stop - start)
+            return
+        mirrored, desired, value, written = (
+            self.mirrored,
+            self.desired,
+            self.value,
+            self.written,
+        )
+        hard = kind == "HARD"
+        for index, reset_value in zip(indices[lo:hi], values[lo:hi]):
+            mirrored[index] = desired[index] = value[index] = reset_value
+            if hard:
+                written[index] = False
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from pyuvm._reg.uvm_reg_model import uvm_check_e, uvm_door_e
+from pyuvm._reg.uvm_reg_reporting import uvm_reg_report_error as _report_error
+from pyuvm._reg.uvm_reg_sequence import uvm_reg_sequence
+
+if TYPE_CHECKING:
+    from pyuvm._reg.uvm_reg import uvm_reg
+
+__all__ = ["uvm_reg_hw_reset_seq"]
+logger = logging.getLogger("RegModel")
+
+
+class uvm_reg_hw_reset_seq(uvm_reg_sequence):
+    """Check the reset value of the registers of ``model``.
+
+    The model is reset, then each register is mirrored with ``UVM_CHECK``:
+    once through the backdoor if it has one, otherwise through each map it
+    can be read from.  Registers behind different bus sequencers are
+    checked concurrently.
+
+    Blocks and registers with the ``NO_REG_TESTS`` or
+    ``NO_REG_HW_RESET_TEST`` attribute are not tested.
+    """
+
+    def __init__(self, name: str = "uvm_reg_hw_reset_seq"):
+        super().__init__(name)
+
+    async def body(self):
+        if self.model is None:
+            _report_error(
+                self,
+                "REG_SEQUENCE",
+                f"No register model specified to run sequence {self.get_name()!r} on",
+            )
+            return
+        self.model.reset()
+        regs = self._regs_to_test(("NO_REG_TESTS", "NO_REG_HW_RESET_TEST"))
+        await self._run_by_sequencer(regs, self._check_reset)
+
+    async def _check_reset(self, rg: uvm_reg) -> None:
+        if self._has_backdoor(rg):
+            logger.info(
+                "Verifying reset value of register %r through the backdoor",
+                rg.get_full_name(),
+            )
+            status = await rg.mirror(
+                uvm_check_e.UVM_CHECK, uvm_door_e.UVM_BACKDOOR, None, self
+            )
+            self._status_ok(
+                status,
+                f"reading reset value of register {rg.get_full_name()!r} "
+                "through the backdoor",
+            )
+            return
+        maps = []
+        rg.get_maps(maps)
+        for map in maps:
+            if rg.get_rights(map) == "WO":
+                continue
+            logger.info(
+                "Verifying reset value of register %r in map %r",
+                rg.get_full_name(),
+                map.get_full_name(),
+            )
+            status = await rg.mirror(
+                uvm_check_e.UVM_CHECK, uvm_door_e.UVM_FRONTDOOR, map, self
+            )
+            self._status_ok(
+                status,
+                f"reading reset value of register {rg.get_full_name()!r} "
+                f"through map {map.get_full_name()!r}",
+            )
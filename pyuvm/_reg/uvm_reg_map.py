@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import logging
 import warnings
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
+from heapq import heappop, heappush
+from itertools import accumulate, islice
 from math import gcd
 from typing import TYPE_CHECKING, ClassVar
 
@@ -214,6 +217,99 @@ class _uvm_mem_address_set:
         return None
 
 
+class _uvm_mem_interval_index:
+    """Sorted index over the address sets of every memory in a root map.
+
+    The address sets are sorted by their ``min`` bound.  ``bisect_right`` on
+    those bounds finds the last memory that starts at or below an address,
+    and ``_reach`` holds the running maximum of the ``max`` bounds so the
+    backward scan stops as soon as no earlier memory can reach the address.
+    Without overlapping bounds this visits a single candidate.  Strided
+    memories that interleave, or that overlap by mistake, are all visited
+    and checked exactly with ``_uvm_mem_address_set.contains()``.
+
+    When several memories contain an address the one added to the map last
+    wins, as it does for ``uvm_reg_map._regs_by_offset``.
+    """
+
+    def __init__(self, address_sets: list[_uvm_mem_address_set]):
+        ordered = sorted(enumerate(address_sets), key=lambda entry: entry[1].min)
+        self._ranks = [rank for rank, _ in ordered]
+        self._sets = [address_set for _, address_set in ordered]
+        self._mins = [address_set.min for address_set in self._sets]
+        self._reach = list(accumulate((s.max for s in self._sets), max))
+
+    def find(self, address: uvm_reg_addr_t) -> _uvm_mem_address_set | None:
+        found = None
+        found_rank = -1
+        ii = bisect_right(self._mins, address) - 1
+        while ii >= 0 and self._reach[ii] >= address:
+            if self._ranks[ii] > found_rank and self._sets[ii].contains(address):
+                found = self._sets[ii]
+                found_rank = self._ranks[ii]
+            ii -= 1
+        return found
+
+
+@dataclass(frozen=True)
+class _uvm_bus_op_template:
+    """Bus operation fields that only change when the address map does.
+
+    ``uvm_reg_map._init_address_map()`` builds one template per mapped
+    register and memory, so a frontdoor access copies the address, ``n_bits``
+    and byte enables instead of walking the parent maps again.  ``addrs``
+    holds the physical addresses in the map's endian order; for memories they
+    are the addresses of element zero, and ``strides`` gives the distance to
+    the same address of the next element.  Registers have zero strides.
+
+    An element wider than the bus takes one beat per address, the first beat
+    carrying the least significant bits.  ``beats`` holds the ``n_bits`` and
+    byte enables of each beat; ``n_bits`` and ``byte_en`` are those of the
+    first one.
+    """
+
+    addrs: tuple[uvm_reg_addr_t, ...]
+    strides: tuple[int, ...]
+    bus_width: int
+    n_bits: int
+    byte_en: int
+    beats: tuple[tuple[int, int], ...]
+
+    @classmethod
+    def create(
+        cls,
+        addrs: tuple[uvm_reg_addr_t, ...],
+        strides: tuple[int, ...],
+        n_bits: int,
+        bus_width: int,
+        byte_offset: int,
+    ) -> _uvm_bus_op_template:
+        byte_offset = int(byte_offset)
+        available_bytes = max(bus_width - byte_offset, 0)
+        beats = []
+        for beat in range(max(len(addrs), 1)):
+            beat_bits = min(max(n_bits - beat * bus_width * 8, 0), bus_width * 8)
+            if beat == 0:
+                enabled_bytes = min(ceildiv(beat_bits, 8), available_bytes)
+                byte_en = ((1 << enabled_bytes) - 1) << byte_offset
+            else:
+                byte_en = (1 << ceildiv(beat_bits, 8)) - 1
+            beats.append((beat_bits, byte_en))
+        return cls(
+            tuple(addrs),
+            tuple(strides),
+            bus_width,
+            beats[0][0],
+            beats[0][1],
+            tuple(beats),
+        )
+
+    def element_addrs(self, element: int) -> list[uvm_reg_addr_t]:
+        return [
+            addr + stride * element for addr, stride in zip(self.addrs, self.strides)
+        ]
+
+
 class uvm_reg_map_info:
     def __init__(self):
         self.offset: uvm_reg_addr_t = 0
@@ -224,15 +320,22 @@ class uvm_reg_map_info:
         self.mem_range: uvm_reg_map_addr_range = None
         self.stride: int = 1
         self.is_initialized: bool = False
+        self.bus_op: _uvm_bus_op_template | None = None
 
 
 class uvm_reg_transaction_order_policy(uvm_object):
-    def __init__(self, name: str = "policy"):
-        super().__init__(name)
-        raise NotImplementedError
+    """
+    Orders the bus operations of the accesses that a root map issues
+    together, e.g. for ``uvm_reg_block.write_regs()``. Extend it and
+    override ``order()``, then set it with
+    ``uvm_reg_map.set_transaction_order_policy()``.
+    """
 
     def order(self, q: list[uvm_reg_bus_op]) -> None:
-        raise NotImplementedError
+        """
+        :param q: Bus operations to reorder in place
+        :return: None
+        """
 
 
 class uvm_reg_seq_base(uvm_sequence_base):
@@ -267,24 +370,32 @@ class uvm_reg_map(uvm_object):
         self._regs_by_offset: dict[uvm_reg_addr_t, uvm_reg] = {}
         self._regs_by_offset_wo: dict[uvm_reg_addr_t, uvm_reg] = {}
         self._mems_by_offset: dict[uvm_mem, _uvm_mem_address_set] = {}
+        self._mem_maps: dict[uvm_mem, uvm_reg_map] = {}
+        self._mem_index: _uvm_mem_interval_index | None = None
+        # Bumped on the root map when the offsets above change, so users of
+        # them (uvm_reg_predictor) know when to rebuild what they derived
+        self._offsets_version: int = 0
         self._policy: uvm_reg_transaction_order_policy = None
 
     def _init_address_map(self) -> None:
         bus_width = 0
         root_map = self.get_root_map()
+        root_map._offsets_version += 1
         if self is root_map:
             self._regs_by_offset.clear()
             self._mems_by_offset.clear()
+            self._mem_maps.clear()
             self._regs_by_offset_wo.clear()
         for map in self._submaps:
             map._init_address_map()
         for reg, reg_info in self._regs_info.items():
             reg_info.is_initialized = True
+            reg_info.bus_op = None
             if not reg_info.unmapped:
                 reg_access = reg._get_fields_access(self)
-                bus_width, reg_addrs = self.get_physical_addresses(
-                    reg_info.offset, 0, reg.get_n_bytes()
-                )
+                reg_info.bus_op = self._reg_bus_op_template(reg, reg_info.offset)
+                bus_width = reg_info.bus_op.bus_width
+                reg_addrs = list(reg_info.bus_op.addrs)
                 for addr in reg_addrs:
                     if (
                         addr in self._regs_by_offset
@@ -317,11 +428,25 @@ class uvm_reg_map(uvm_object):
                         root_map._regs_by_offset[addr] = reg
                     # TODO: check memory overlap uvm_reg_map.svh:1619
                 self._regs_info[reg].addr = reg_addrs
-        for mem, mem_info in self._mems_info.items():
-            self._initialize_memory(mem, mem_info)
+        address_sets = {
+            mem: self._initialize_memory(mem, mem_info)
+            for mem, mem_info in self._mems_info.items()
+        }
         if bus_width == 0:
             bus_width = self._n_bytes
         self._system_n_bytes = bus_width
+        # Memory templates use the system bus width, known only from here
+        for mem, address_set in address_sets.items():
+            self._mems_info[mem].bus_op = (
+                None
+                if address_set is None
+                else self._mem_bus_op_template(mem, address_set)
+            )
+        if self is root_map:
+            self._mem_index = _uvm_mem_interval_index(
+                list(self._mems_by_offset.values())
+            )
+            self._check_memory_overlaps()
 
     @staticmethod
     def backdoor() -> uvm_reg_backdoor:
@@ -438,13 +563,15 @@ class uvm_reg_map(uvm_object):
         )
         return addresses
 
-    def _initialize_memory(self, mem: uvm_mem, info: uvm_reg_map_info) -> None:
+    def _initialize_memory(
+        self, mem: uvm_mem, info: uvm_reg_map_info
+    ) -> _uvm_mem_address_set | None:
         root_map = self.get_root_map()
         info.is_initialized = True
         if info.unmapped:
             info.addr = []
             info.mem_range = None
-            return
+            return None
 
         info.addr = self._memory_element_addresses(mem, info, 0)
         second_addresses = None
@@ -454,27 +581,81 @@ class uvm_reg_map(uvm_object):
         info.mem_range = uvm_reg_map_addr_range(
             address_set.min, address_set.max, info.stride
         )
-        for other_mem, other_set in root_map._mems_by_offset.items():
-            overlap = address_set.first_overlap(other_set)
-            if overlap is not None and other_mem is not mem:
-                _report_warning(
-                    self,
-                    "REG_MAP",
-                    f"In map {self.get_full_name()!r} memory "
-                    f"{mem.get_full_name()!r} overlaps memory "
-                    f"{other_mem.get_full_name()!r} at 0x{overlap:X}",
-                )
-        for addr, reg in root_map._regs_by_offset.items():
-            if not address_set.contains(addr):
-                continue
+        # Overlaps are checked once the root map is complete, see
+        # _check_memory_overlaps()
+        root_map._mems_by_offset[mem] = address_set
+        root_map._mem_maps[mem] = self
+        root_map._mem_index = None
+        return address_set
+
+    def _check_memory_overlaps(self) -> None:
+        """Warn about memories overlapping other memories or registers.
+
+        Called on the root map once every map below it is initialized.
+        The address sets are swept in order of their ``min`` bound, keeping
+        a heap of the sets whose ``max`` bound reaches the current one, so
+        only memories whose bounds intersect are compared exactly.  The
+        register addresses are sorted once and bisected into each memory's
+        bounds.  Warnings come out in the order the memories were added.
+        """
+        # (rank of the memory, 0, rank of the other memory, address) or
+        # (rank of the memory, 1, register address, address)
+        overlaps: list[tuple[int, int, int, uvm_reg_addr_t]] = []
+        address_sets = list(self._mems_by_offset.values())
+        ordered = sorted(enumerate(address_sets), key=lambda entry: entry[1].min)
+        active: list[tuple[uvm_reg_addr_t, int]] = []
+        for rank, address_set in ordered:
+            while active and active[0][0] < address_set.min:
+                heappop(active)
+            for _, other_rank in active:
+                later, earlier = max(rank, other_rank), min(rank, other_rank)
+                overlap = address_sets[later].first_overlap(address_sets[earlier])
+                if overlap is not None:
+                    overlaps.append((later, 0, earlier, overlap))
+            heappush(active, (address_set.max, rank))
+        reg_addrs = sorted(self._regs_by_offset)
+        for rank, address_set in enumerate(address_sets):
+            first = bisect_left(reg_addrs, address_set.min)
+            last = bisect_right(reg_addrs, address_set.max)
+            overlaps.extend(
+                (rank, 1, addr, addr)
+                for addr in islice(reg_addrs, first, last)
+                if address_set.contains(addr)
+            )
+        for rank, is_reg, other, addr in sorted(overlaps):
+            mem = address_sets[rank].mem
+            mem_map = self._mem_maps[mem]
+            if is_reg:
+                other_name = f"register {self._regs_by_offset[other].get_full_name()!r}"
+            else:
+                other_name = f"memory {address_sets[other].mem.get_full_name()!r}"
             _report_warning(
-                self,
+                mem_map,
                 "REG_MAP",
-                f"In map {self.get_full_name()!r} memory "
-                f"{mem.get_full_name()!r} overlaps register "
-                f"{reg.get_full_name()!r} at 0x{addr:X}",
+                f"In map {mem_map.get_full_name()!r} memory "
+                f"{mem.get_full_name()!r} overlaps {other_name} at 0x{addr:X}",
             )
-        root_map._mems_by_offset[mem] = address_set
+
+    def _reg_bus_op_template(
+        self, reg: uvm_reg, offset: uvm_reg_addr_t
+    ) -> _uvm_bus_op_template:
+        bus_width, addrs, byte_offset = self._get_physical_addresses_to_map(
+            offset, 0x0, reg.get_n_bytes(), None, None
+        )
+        return _uvm_bus_op_template.create(
+            addrs, (0,) * len(addrs), reg.get_n_bits(), bus_width, byte_offset
+        )
+
+    def _mem_bus_op_template(
+        self, mem: uvm_mem, address_set: _uvm_mem_address_set
+    ) -> _uvm_bus_op_template:
+        return _uvm_bus_op_template.create(
+            address_set.first_addresses,
+            address_set.element_strides,
+            mem.get_n_bits(),
+            self.get_n_bytes(),
+            0,
+        )
 
     def add_submap(self, child_map: uvm_reg_map, offset: uvm_reg_addr_t) -> None:
         if not child_map:
@@ -581,6 +762,7 @@ class uvm_reg_map(uvm_object):
         info = self._regs_info[reg]
         blk = self.get_parent()
         root_map = self.get_root_map()
+        root_map._offsets_version += 1
         # When block is locked we need to resolve the map. This is otherwise
         # handled by the init addresses when the block is locked
         if blk.is_locked():
@@ -603,9 +785,13 @@ class uvm_reg_map(uvm_object):
                             pass
                         del root_map._regs_by_offset_wo[addr]
         # remapping
+        info.bus_op = None
         if not unmapped:
             reg_access = reg._get_fields_access(self)
-            bus_width, addrs = self.get_physical_addresses(offset, 0, reg.get_n_bytes())
+            bus_op = self._reg_bus_op_template(reg, offset)
+            addrs = list(bus_op.addrs)
+            if blk.is_locked():
+                info.bus_op = bus_op
             for addr in addrs:
                 if (
                     addr in root_map._regs_by_offset
@@ -858,11 +1044,23 @@ class uvm_reg_map(uvm_object):
                 f"{self.get_parent().get_full_name()!r} is not locked",
             )
             return None
-        address_sets = self.get_root_map()._mems_by_offset.values()
-        for address_set in reversed(tuple(address_sets)):
-            if address_set.contains(offset):
-                return address_set.mem
-        return None
+        root_map = self.get_root_map()
+        if root_map._mem_index is None:
+            # A submap was initialized on its own after the root map
+            root_map._mem_index = _uvm_mem_interval_index(
+                list(root_map._mems_by_offset.values())
+            )
+        address_set = root_map._mem_index.find(offset)
+        return None if address_set is None else address_set.mem
+
+    def get_element_by_offset(
+        self, offset: uvm_reg_addr_t, read: bool = True
+    ) -> uvm_reg | uvm_mem | None:
+        """Return the register, else the memory, mapped at ``offset``."""
+        reg = self.get_reg_by_offset(offset, read)
+        if reg is not None or not self.get_parent().is_locked():
+            return reg
+        return self.get_mem_by_offset(offset)
 
     def set_auto_predict(self, on: bool = True) -> None:
         self._auto_predict = on
@@ -921,38 +1119,81 @@ class uvm_reg_map(uvm_object):
         rw.set_parent_sequence(sequence)
         return sequence
 
+    def _get_bus_op_template(self, rw: uvm_reg_item) -> _uvm_bus_op_template:
+        element = rw.get_element()
+        if rw.get_element_kind() == uvm_elem_kind_e.UVM_MEM:
+            info = self._mems_info[element]
+            if info.bus_op is not None:
+                return info.bus_op
+            return self._mem_bus_op_template(
+                element,
+                _uvm_mem_address_set.create(
+                    element,
+                    self._memory_element_addresses(element, info, 0),
+                    self._memory_element_addresses(element, info, 1)
+                    if element.get_size() > 1
+                    else None,
+                ),
+            )
+        info = self._regs_info[element]
+        if info.bus_op is not None:
+            return info.bus_op
+        return self._reg_bus_op_template(element, info.offset)
+
     def _make_bus_op(
         self,
         rw: uvm_reg_item,
         access_kind: uvm_access_e,
         adapter: uvm_reg_adapter,
+        template: _uvm_bus_op_template,
     ) -> uvm_reg_bus_op:
-        element = rw.get_element()
-        if rw.get_element_kind() == uvm_elem_kind_e.UVM_MEM:
-            info = self._mems_info[element]
-            addrs = self._memory_element_addresses(element, info, rw.get_offset())
-            bus_width = self.get_n_bytes()
-            byte_offset = 0
-        else:
-            info = self._regs_info[element]
-            bus_width, addrs, byte_offset = self._get_physical_addresses_to_map(
-                info.offset, 0x0, element.get_n_bytes(), None, None
-            )
         bus_op = uvm_reg_bus_op()
         bus_op.kind = access_kind
-        bus_op.addr = addrs[0]
+        if rw.get_element_kind() == uvm_elem_kind_e.UVM_MEM:
+            bus_op.addr = template.element_addrs(rw.get_offset())[0]
+        else:
+            bus_op.addr = template.addrs[0]
         bus_op.data = rw.get_value()
-        bus_op.n_bits = min(element.get_n_bits(), bus_width * 8)
+        bus_op.n_bits = template.n_bits
         bus_op.status = rw.get_status()
-        if adapter.supports_byte_enable:
-            byte_offset = int(byte_offset)
-            available_bytes = max(bus_width - byte_offset, 0)
-            enabled_bytes = min(ceildiv(bus_op.n_bits, 8), available_bytes)
-            bus_op.byte_en = ((1 << enabled_bytes) - 1) << byte_offset
-        else:
-            bus_op.byte_en = -1
+        bus_op.byte_en = template.byte_en if adapter.supports_byte_enable else -1
         return bus_op
 
+    def _make_bus_ops(
+        self,
+        rw: uvm_reg_item,
+        access_kind: uvm_access_e,
+        adapter: uvm_reg_adapter,
+        template: _uvm_bus_op_template,
+    ) -> list[uvm_reg_bus_op]:
+        # The beats of each element accessed, least significant first
+        if rw.get_kind() in (uvm_access_e.UVM_BURST_WRITE, uvm_access_e.UVM_BURST_READ):
+            values = rw.get_value_array()
+        else:
+            values = [rw.get_value()]
+        offset = rw.get_offset()
+        is_mem = rw.get_element_kind() == uvm_elem_kind_e.UVM_MEM
+        multi_beat = len(template.addrs) > 1
+        beat_bits = template.bus_width * 8
+        beat_mask = (1 << beat_bits) - 1
+        bus_ops = []
+        for ii, value in enumerate(values):
+            addrs = template.element_addrs(offset + ii) if is_mem else template.addrs
+            for beat, (addr, (n_bits, byte_en)) in enumerate(
+                zip(addrs, template.beats)
+            ):
+                bus_ops.append(
+                    uvm_reg_bus_op(
+                        access_kind,
+                        addr,
+                        value >> beat * beat_bits & beat_mask if multi_beat else value,
+                        n_bits,
+                        byte_en if adapter.supports_byte_enable else -1,
+                        rw.get_status(),
+                    )
+                )
+        return bus_ops
+
     async def _send_bus_op(
         self,
         rw: uvm_reg_item,
@@ -977,7 +1218,10 @@ class uvm_reg_map(uvm_object):
 
         bus_rsp_item = bus_seq_item
         if adapter.provides_responses:
-            bus_rsp_item = await sequence.get_response()
+            # By id: other accesses may be in flight on the same sequence
+            bus_rsp_item = await sequence.get_response(
+                bus_seq_item.get_transaction_id()
+            )
             if bus_rsp_item is None:
                 raise UVMFatalError(
                     f"Adapter {adapter.get_full_name()!r} expects bus "
@@ -988,17 +1232,58 @@ class uvm_reg_map(uvm_object):
         rw.set_value(bus_op.data)
         rw.set_status(bus_op.status)
 
+    async def _do_bus_access(
+        self,
+        rw: uvm_reg_item,
+        access_kind: uvm_access_e,
+        sequencer: uvm_sequencer_base,
+        adapter: uvm_reg_adapter,
+    ) -> None:
+        template = self._get_bus_op_template(rw)
+        burst = rw.get_kind() in (
+            uvm_access_e.UVM_BURST_WRITE,
+            uvm_access_e.UVM_BURST_READ,
+        )
+        if not burst and len(template.addrs) == 1:
+            bus_op = self._make_bus_op(rw, access_kind, adapter, template)
+            await self._send_bus_op(rw, bus_op, sequencer, adapter)
+            return
+
+        bus_ops = self._make_bus_ops(rw, access_kind, adapter, template)
+        accesses = list(bus_ops)
+        policy = self.get_root_map().get_transaction_order_policy()
+        if policy is not None:
+            policy.order(accesses)
+        await self.perform_accesses(accesses, rw, adapter, sequencer)
+
+        # Reassemble the elements from their beats
+        n_beats = len(template.addrs)
+        if n_beats == 1:
+            values = [bus_op.data for bus_op in bus_ops]
+        else:
+            beat_bits = template.bus_width * 8
+            beat_masks = [(1 << n_bits) - 1 for n_bits, _ in template.beats]
+            values = [
+                sum(
+                    (bus_op.data & beat_masks[beat]) << beat * beat_bits
+                    for beat, bus_op in enumerate(bus_ops[first : first + n_beats])
+                )
+                for first in range(0, len(bus_ops), n_beats)
+            ]
+        if burst:
+            rw.set_value_array(values)
+        else:
+            rw.set_value(values[0])
+
     async def do_bus_write(
         self, rw: uvm_reg_item, sequencer: uvm_sequencer_base, adapter: uvm_reg_adapter
     ) -> None:
-        bus_op = self._make_bus_op(rw, uvm_access_e.UVM_WRITE, adapter)
-        await self._send_bus_op(rw, bus_op, sequencer, adapter)
+        await self._do_bus_access(rw, uvm_access_e.UVM_WRITE, sequencer, adapter)
 
     async def do_bus_read(
         self, rw: uvm_reg_item, sequencer: uvm_sequencer_base, adapter: uvm_reg_adapter
     ) -> None:
-        bus_op = self._make_bus_op(rw, uvm_access_e.UVM_READ, adapter)
-        await self._send_bus_op(rw, bus_op, sequencer, adapter)
+        await self._do_bus_access(rw, uvm_access_e.UVM_READ, sequencer, adapter)
 
     async def do_write(self, rw: uvm_reg_item) -> None:
         sequencer, adapter = self._get_bus_access_config(rw)
@@ -1151,7 +1436,7 @@ class uvm_reg_map(uvm_object):
             uvm_endianness_e.UVM_LITTLE_FIFO,
             uvm_endianness_e.UVM_BIG_FIFO,
         ):
-            local_addr = lbase_addr2 * n_addrs
+            local_addr = [lbase_addr2] * n_addrs
         else:
             _report_error(
                 self,
@@ -1172,7 +1457,79 @@ class uvm_reg_map(uvm_object):
         adapter: uvm_reg_adapter,
         sequencer: uvm_sequencer_base,
     ) -> None:
-        raise NotImplementedError
+        """
+        Send the bus operations of one access, then collect their
+        responses, and set the status of ``rw`` from theirs.
+
+        The beats of a multi-beat element each become a bus item. The
+        elements of a burst become one burst item when the adapter
+        supports bursts.
+
+        The bus items are only pipelined when the adapter provides
+        responses: the driver then calls ``item_done()`` as soon as it
+        accepts an item, so every item is in flight before the first
+        response is collected. Otherwise ``finish_item()`` waits for the
+        driver to complete each item, and they go out one at a time.
+
+        :param accesses: Bus operations in the order to send them, updated
+            with the data and status of their responses
+        :param rw: The register item they belong to
+        :param adapter: Adapter converting them to bus items
+        :param sequencer: Bus sequencer to send the bus items to
+        :return: None
+        """
+        sequence = self._get_bus_sequence(rw, adapter)
+        burst = adapter.supports_burst and rw.get_kind() in (
+            uvm_access_e.UVM_BURST_WRITE,
+            uvm_access_e.UVM_BURST_READ,
+        )
+        adapter.set_item(rw)
+        try:
+            if burst:
+                bus_seq_items = [adapter.reg2bus_burst(accesses)]
+            else:
+                bus_seq_items = [adapter.reg2bus(bus_op) for bus_op in accesses]
+        finally:
+            adapter.set_item(None)
+        if None in bus_seq_items:
+            method = "reg2bus_burst()" if burst else "reg2bus()"
+            raise UVMFatalError(
+                f"Adapter {adapter.get_full_name()!r} {method} returned None"
+            )
+
+        # With responses, all requests are issued before any is collected
+        sequence.sequencer = sequencer
+        for bus_seq_item in bus_seq_items:
+            await sequence.start_item(bus_seq_item)
+            await sequence.finish_item(bus_seq_item)
+
+        bus_rsp_items = bus_seq_items
+        if adapter.provides_responses:
+            bus_rsp_items = [
+                await sequence.get_response(bus_seq_item.get_transaction_id())
+                for bus_seq_item in bus_seq_items
+            ]
+            if None in bus_rsp_items:
+                raise UVMFatalError(
+                    f"Adapter {adapter.get_full_name()!r} expects bus "
+                    "responses, but the sequencer returned None"
+                )
+
+        if burst:
+            adapter.bus2reg_burst(bus_rsp_items[0], accesses)
+        else:
+            for bus_rsp_item, bus_op in zip(bus_rsp_items, accesses):
+                adapter.bus2reg(bus_rsp_item, bus_op)
+        rw.set_status(
+            next(
+                (
+                    bus_op.status
+                    for bus_op in accesses
+                    if bus_op.status != uvm_status_e.UVM_IS_OK
+                ),
+                uvm_status_e.UVM_IS_OK,
+            )
+        )
 
     def unregister(self) -> None:
         raise NotImplementedError
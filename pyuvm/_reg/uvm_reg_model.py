@@ -1,3 +1,4 @@
+import re
 from dataclasses import dataclass
 from enum import Enum, IntEnum
 
@@ -31,6 +32,16 @@ __all__ = [
 ]
 
 
+# Characters of element names that ConfigDB does not accept in a lookup
+_CONFIG_DB_ILLEGAL = re.compile(r"[^A-Za-z0-9_.]")
+
+
+def _reg_config_path(full_name: str) -> str:
+    # ConfigDB path of the attributes of a register-model element, e.g.
+    # NO_REG_TESTS or include_coverage
+    return "REG." + _CONFIG_DB_ILLEGAL.sub("_", full_name)
+
+
 class uvm_reg_data_t(int): ...
 
 
@@ -129,9 +140,24 @@ class uvm_reg_mem_test_e(IntEnum):
 
 
 class uvm_hdl_path_concat(uvm_object):
-    def __init__(self, name: str = ""):
+    def __init__(self, name: str = "unnamed"):
         super().__init__(name)
-        raise NotImplementedError
+        self.slices: list[uvm_hdl_path_slice] = []
+
+    def set(self, t: list[uvm_hdl_path_slice]) -> None:
+        self.slices = list(t)
+
+    def set_slices(self, t: list[uvm_hdl_path_slice]) -> None:
+        self.set(t)
+
+    def get_slices(self) -> list[uvm_hdl_path_slice]:
+        return self.slices
+
+    def add_slice(self, slice: uvm_hdl_path_slice) -> None:
+        self.slices.append(slice)
+
+    def add_path(self, path: str, offset: int = -1, size: int = -1) -> None:
+        self.add_slice(uvm_hdl_path_slice(path, offset, size))
 
 
 class uvm_reg_backdoor(uvm_object):
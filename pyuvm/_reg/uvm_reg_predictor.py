@@ -3,38 +3,228 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
-from pyuvm._s12_uvm_tlm_interfaces import uvm_analysis_imp, uvm_analysis_port
+from pyuvm._error_classes import UVMFatalError
+from pyuvm._reg.uvm_reg_item import uvm_reg_bus_op, uvm_reg_item
+from pyuvm._reg.uvm_reg_model import (
+    uvm_access_e,
+    uvm_door_e,
+    uvm_elem_kind_e,
+    uvm_predict_e,
+    uvm_status_e,
+)
+from pyuvm._reg.uvm_reg_reporting import (
+    uvm_reg_report_error as _report_error,
+)
+from pyuvm._s12_uvm_tlm_interfaces import uvm_analysis_port
+from pyuvm._s13_predefined_component_classes import uvm_subscriber
 from pyuvm._s13_uvm_component import uvm_component
 
 if TYPE_CHECKING:
-    from pyuvm import uvm_phase
+    from collections.abc import Iterable
+
+    from pyuvm._reg.uvm_reg import uvm_reg
     from pyuvm._reg.uvm_reg_adapter import uvm_reg_adapter
-    from pyuvm._reg.uvm_reg_item import uvm_reg_item
     from pyuvm._reg.uvm_reg_map import uvm_reg_map
+    from pyuvm._reg.uvm_reg_model import uvm_reg_addr_t
+    from pyuvm._s14_15_python_sequences import uvm_sequence_item
 
 __all__ = ["uvm_reg_predictor"]
 logger = logging.getLogger("RegModel")
 
+# What an observed address is for: the register, its local map, the shift of
+# the beat in the register value and the number of beats of the register
+_uvm_predict_target = tuple["uvm_reg", "uvm_reg_map", int, int]
+
 
 class uvm_predict_s:
-    addr: list[bool]
-    reg_item: uvm_reg_item
+    """A register transaction being collected from its bus beats."""
+
+    def __init__(self, reg_item: uvm_reg_item) -> None:
+        self.addr: set[uvm_reg_addr_t] = set()
+        self.reg_item = reg_item
 
 
 class uvm_reg_predictor(uvm_component):
+    """
+    Updates the mirror of the registers of ``map`` from the bus transactions
+    written to ``bus_in``, typically by a bus monitor. Use it instead of the
+    auto-prediction of the map when other masters access the registers.
+
+    Set ``map`` and ``adapter`` before the first transaction. Each predicted
+    register transaction is written to ``reg_ap``.
+    """
+
     def __init__(self, name: str, parent: uvm_component) -> None:
-        self.bus_in: uvm_analysis_imp = uvm_analysis_imp("bus_in")
-        self.reg_ap: uvm_analysis_port = uvm_analysis_port("reg_ap")
+        super().__init__(name, parent)
+        self.bus_in = uvm_subscriber.uvm_AnalysisImp("bus_in", self, self.write)
+        self.reg_ap: uvm_analysis_port = uvm_analysis_port("reg_ap", self)
         self.map: uvm_reg_map = None
         self.adapter: uvm_reg_adapter = None
-        self._pending: list[uvm_predict_s] = []
-        raise NotImplementedError
+        self._pending: dict[uvm_reg, uvm_predict_s] = {}
+        # Read and write targets by address, derived from the register
+        # offsets of the root map for (map, offsets version)
+        self._targets: tuple[
+            dict[uvm_reg_addr_t, _uvm_predict_target],
+            dict[uvm_reg_addr_t, _uvm_predict_target],
+        ] = ({}, {})
+        self._targets_key: tuple[uvm_reg_map, int] | None = None
 
     def pre_predict(self, rw: uvm_reg_item) -> None:
-        raise NotImplementedError("Must be implemented by user")
+        """Called with each register transaction before it is predicted."""
+
+    def write(self, tr: uvm_sequence_item) -> None:
+        """
+        :param tr: Bus transaction observed by the monitor
+        :return: None
+        """
+        adapter, targets = self._get_adapter_and_targets()
+        self._predict_bus_op(self._bus2reg(adapter, tr), targets)
+
+    def write_many(self, trs: Iterable[uvm_sequence_item]) -> None:
+        """
+        :param trs: Bus transactions observed by the monitor, in order
+        :return: None
+
+        Same as calling ``write()`` for each transaction, for monitors that
+        sample bursts.
+        """
+        adapter, targets = self._get_adapter_and_targets()
+        predict_bus_op = self._predict_bus_op
+        bus2reg = self._bus2reg
+        for tr in trs:
+            predict_bus_op(bus2reg(adapter, tr), targets)
+
+    @staticmethod
+    def _bus2reg(adapter: uvm_reg_adapter, tr: uvm_sequence_item) -> uvm_reg_bus_op:
+        rw = uvm_reg_bus_op()
+        # In case the adapter does not set them
+        rw.byte_en = -1
+        rw.status = uvm_status_e.UVM_IS_OK
+        adapter.bus2reg(tr, rw)
+        return rw
+
+    def _get_adapter_and_targets(self) -> tuple[uvm_reg_adapter, tuple[dict, dict]]:
+        if self.adapter is None or self.map is None:
+            raise UVMFatalError(
+                f"The map and adapter of predictor {self.get_full_name()!r} "
+                "must be set before it receives transactions"
+            )
+        root_map = self.map.get_root_map()
+        key = (self.map, root_map._offsets_version)
+        if key != self._targets_key:
+            self._targets = self._build_targets()
+            self._targets_key = key
+        return self.adapter, self._targets
+
+    def _build_targets(
+        self,
+    ) -> tuple[
+        dict[uvm_reg_addr_t, _uvm_predict_target],
+        dict[uvm_reg_addr_t, _uvm_predict_target],
+    ]:
+        # Same resolution as uvm_reg_map.get_reg_by_offset(), done once for
+        # every address instead of once per transaction
+        map = self.map
+        if not map.get_parent().is_locked():
+            _report_error(
+                self,
+                "REG_PREDICT",
+                f"Cannot predict from map {map.get_full_name()!r}: block "
+                f"{map.get_parent().get_full_name()!r} is not locked",
+            )
+            return {}, {}
+        beat_bits = map.get_n_bytes() * 8
+        reg_addrs: dict[uvm_reg, tuple[uvm_reg_map, list[uvm_reg_addr_t]]] = {}
+
+        def target(reg: uvm_reg, addr: uvm_reg_addr_t) -> _uvm_predict_target:
+            if reg not in reg_addrs:
+                local_map = reg.get_local_map(map)
+                reg_addrs[reg] = (local_map, local_map.get_reg_map_info(reg).addr)
+            local_map, addrs = reg_addrs[reg]
+            return reg, local_map, addrs.index(addr) * beat_bits, len(addrs)
+
+        reads = {addr: target(reg, addr) for addr, reg in map._regs_by_offset.items()}
+        writes = dict(reads)
+        for addr, reg in map._regs_by_offset_wo.items():
+            writes[addr] = target(reg, addr)
+        return reads, writes
+
+    def _predict_bus_op(
+        self,
+        rw: uvm_reg_bus_op,
+        targets: tuple[
+            dict[uvm_reg_addr_t, _uvm_predict_target],
+            dict[uvm_reg_addr_t, _uvm_predict_target],
+        ],
+    ) -> None:
+        is_read = rw.kind == uvm_access_e.UVM_READ
+        target = targets[0 if is_read else 1].get(rw.addr)
+        if target is None:
+            logger.debug(
+                "Observed transaction does not target a register: 0x%X", rw.addr
+            )
+            return
+        reg, local_map, shift, n_beats = target
+        info = self._pending.get(reg)
+        if info is not None and rw.addr in info.addr:
+            _report_error(
+                self,
+                "REG_PREDICT_COLLISION",
+                f"Collision detected for register {reg.get_full_name()!r}",
+            )
+            del self._pending[reg]
+            info = None
+        if info is None:
+            item = uvm_reg_item()
+            item.set_element_kind(uvm_elem_kind_e.UVM_REG)
+            item.set_element(reg)
+            item.set_door(uvm_door_e.UVM_PREDICT)
+            item.set_map(self.map)
+            item.set_local_map(local_map)
+            item.set_kind(rw.kind)
+            item.set_value(rw.data << shift)
+            item.set_status(rw.status)
+            if n_beats > 1:
+                info = uvm_predict_s(item)
+                info.addr.add(rw.addr)
+                self._pending[reg] = info
+                return
+        else:
+            item = info.reg_item
+            item.value[0] |= rw.data << shift
+            if rw.status != uvm_status_e.UVM_IS_OK:
+                item.set_status(rw.status)
+            info.addr.add(rw.addr)
+            if len(info.addr) < n_beats:
+                return
+            del self._pending[reg]
+        # The whole register transaction has been observed
+        if item.kind == uvm_access_e.UVM_READ:
+            kind = uvm_predict_e.UVM_PREDICT_READ
+            if (
+                local_map.get_check_on_read()
+                and item.get_status() != uvm_status_e.UVM_NOT_OK
+            ):
+                reg.do_check(reg.get_mirrored_value(), item.get_value(), local_map)
+        else:
+            kind = uvm_predict_e.UVM_PREDICT_WRITE
+        self.pre_predict(item)
+        reg.do_predict(item, kind, rw.byte_en)
+        if item.get_status() == uvm_status_e.UVM_IS_OK:
+            reg._sample_access(
+                item, local_map.get_reg_map_info(reg), is_read, rw.byte_en
+            )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Observed %s transaction to register %r: value=0x%X",
+                item.kind.name,
+                reg.get_full_name(),
+                item.get_value(),
+            )
+        self.reg_ap.write(item)
 
-    def check_phase(self, phase: uvm_phase):
-        super().check_phase(phase)
+    def check_phase(self):
+        super().check_phase()
         if self._pending:
             string: str = ""
             for reg in self._pending:
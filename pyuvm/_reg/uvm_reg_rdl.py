@@ -0,0 +1,415 @@
+# Register models from SystemRDL
+#
+# uvm_reg_rdl_generate() compiles SystemRDL files with the systemrdl
+# compiler (the one examples/TinyALU_reg/export.py uses) and returns the
+# source of a Python module describing the register model as tables: one
+# entry per register type, per register and per block. Its build() function
+# hands the tables to uvm_reg_rdl_build(), which creates and locks the
+# uvm_reg_block, uvm_reg and uvm_reg_field objects.
+#
+# uvm_reg_rdl_load() returns the same locked model but keeps it pickled in
+# a cache directory, keyed by a hash of the RDL files, so later runs
+# unpickle it instead of compiling the RDL and configuring every register.
+
+from __future__ import annotations
+
+import gc
+import hashlib
+import importlib.util
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from contextlib import contextmanager
+from itertools import product
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pyuvm._reg.uvm_mem import uvm_mem
+from pyuvm._reg.uvm_reg import uvm_reg
+from pyuvm._reg.uvm_reg_block import uvm_reg_block
+from pyuvm._reg.uvm_reg_field import uvm_reg_field
+from pyuvm._reg.uvm_reg_model import uvm_endianness_e
+
+try:
+    from systemrdl import RDLCompiler
+    from systemrdl.node import AddrmapNode, MemNode, RegfileNode, RegNode
+except ImportError:
+    RDLCompiler = None
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from types import ModuleType
+
+__all__ = ["uvm_reg_rdl_build", "uvm_reg_rdl_generate", "uvm_reg_rdl_load"]
+logger = logging.getLogger("RegModel")
+
+# Bump when the generated tables or the pickled model change shape, so that
+# older cache entries are not loaded
+_RDL_MODEL_FORMAT = 1
+
+# uvm_reg_field access policy of a SystemRDL field, from its sw, onread and
+# onwrite properties, as in PeakRDL-uvm
+_RW_ACCESS = {
+    (None, None): "RW",
+    ("rclr", "woset"): "W1SRC",
+    ("rclr", "wzs"): "W0SRC",
+    ("rclr", "wset"): "WSRC",
+    ("rset", "woclr"): "W1CRS",
+    ("rset", "wzc"): "W0CRS",
+    ("rset", "wclr"): "WCRS",
+    (None, "woclr"): "W1C",
+    (None, "woset"): "W1S",
+    (None, "wot"): "W1T",
+    (None, "wzs"): "W0S",
+    (None, "wzc"): "W0C",
+    (None, "wzt"): "W0T",
+    (None, "wclr"): "WC",
+    (None, "wset"): "WS",
+    ("rclr", None): "WRC",
+    ("rset", None): "WRS",
+}
+_RO_ACCESS = {None: "RO", "rclr": "RC", "rset": "RS"}
+_WO_ACCESS = {None: "WO", "wclr": "WOC", "wset": "WOS"}
+
+
+def _field_access(field: Any) -> str:
+    def name(prop: str) -> str | None:
+        value = field.get_property(prop)
+        return None if value is None else value.name
+
+    sw, onread, onwrite = name("sw"), name("onread"), name("onwrite")
+    if sw == "rw":
+        return _RW_ACCESS.get((onread, onwrite), "RW")
+    if sw == "r":
+        return _RO_ACCESS.get(onread, "RO")
+    if sw == "w":
+        return _WO_ACCESS.get(onwrite, "WO")
+    return {"rw1": "W1", "w1": "WO1"}.get(sw, "NOACCESS")
+
+
+def _field_spec(field: Any) -> tuple:
+    # A reset that is not a constant, e.g. a reference to a signal, is not
+    # part of the model
+    reset = field.get_property("reset")
+    has_reset = isinstance(reset, int)
+    return (
+        field.inst_name,
+        field.width,
+        field.lsb,
+        _field_access(field),
+        field.is_volatile,
+        reset if has_reset else 0,
+        has_reset,
+    )
+
+
+class _uvm_reg_rdl_writer:
+    """Writes the tables of a register model from an elaborated RDL node."""
+
+    def __init__(self) -> None:
+        self.reg_types: dict[str, tuple] = {}
+        self._type_names: dict[tuple, str] = {}
+        self.blocks: list[str] = []
+
+    def reg_type(self, node: Any) -> str:
+        fields = tuple(_field_spec(field) for field in node.fields())
+        reg_type = (node.get_property("regwidth"), fields)
+        name = self._type_names.get(reg_type)
+        if name is None:
+            base = node.type_name or node.inst_name
+            name = base
+            suffix = 0
+            while name in self.reg_types:
+                suffix += 1
+                name = f"{base}_{suffix}"
+            self._type_names[reg_type] = name
+            self.reg_types[name] = reg_type
+        return name
+
+    def block(self, node: Any) -> tuple[str, int]:
+        # Emits the blocks below node first; returns the name of the
+        # constant holding the block and the widest register access in it
+        regs, mems, blocks = [], [], []
+        access_width = 0
+        for child in node.children():
+            dims = tuple(child.array_dimensions or ()) if child.is_array else ()
+            stride = child.array_stride if child.is_array else 0
+            offset = child.raw_address_offset
+            if isinstance(child, RegNode):
+                access_width = max(access_width, child.get_property("accesswidth"))
+                regs.append(
+                    f"        ({child.inst_name!r}, {self.reg_type(child)!r}, "
+                    f"0x{offset:X}, {dims!r}, 0x{stride:X}),\n"
+                )
+            elif isinstance(child, MemNode):
+                access = "RW" if child.is_sw_writable else "RO"
+                mems.append(
+                    f"        ({child.inst_name!r}, 0x{offset:X}, "
+                    f"{child.get_property('mementries')}, "
+                    f"{child.get_property('memwidth')}, {access!r}),\n"
+                )
+            elif isinstance(child, (AddrmapNode, RegfileNode)):
+                const, width = self.block(child)
+                access_width = max(access_width, width)
+                blocks.append(
+                    f"        ({const}, {child.inst_name!r}, 0x{offset:X}, "
+                    f"{dims!r}, 0x{stride:X}),\n"
+                )
+        const = f"_BLOCK{len(self.blocks)}"
+        n_bytes = max(access_width // 8, 1) if access_width else 4
+        self.blocks.append(
+            f"{const} = (\n"
+            f"    {node.inst_name!r},\n"
+            f"    {n_bytes},\n"
+            f"    (\n{''.join(regs)}    ),\n"
+            f"    (\n{''.join(mems)}    ),\n"
+            f"    (\n{''.join(blocks)}    ),\n"
+            ")\n"
+        )
+        return const, access_width
+
+
+def _compile_rdl(rdl_files: Sequence[str], top: str | None) -> Any:
+    if RDLCompiler is None:
+        raise ImportError(
+            "Generating register models from SystemRDL requires the "
+            "systemrdl-compiler package"
+        )
+    rdlc = RDLCompiler()
+    for rdl_file in rdl_files:
+        rdlc.compile_file(os.fspath(rdl_file))
+    return rdlc.elaborate(top_def_name=top).top
+
+
+def uvm_reg_rdl_generate(rdl_files: str | Sequence[str], top: str = None) -> str:
+    """
+    :param rdl_files: SystemRDL file or files, compiled in order
+    :param top: Name of the top addrmap, the last one defined if None
+    :return: Source of a Python module with a ``build(name=None)`` function
+        returning the locked register model
+
+    Raises ``ImportError`` if the systemrdl compiler is not installed and
+    ``systemrdl.RDLCompileError`` if the RDL does not compile.
+    """
+    if isinstance(rdl_files, (str, os.PathLike)):
+        rdl_files = [rdl_files]
+    node = _compile_rdl(rdl_files, top)
+    writer = _uvm_reg_rdl_writer()
+    model, _ = writer.block(node)
+    sources = ", ".join(Path(rdl_file).name for rdl_file in rdl_files)
+    reg_types = "".join(
+        f"    {name!r}: ({n_bits}, (\n"
+        + "".join(f"        {field!r},\n" for field in fields)
+        + "    )),\n"
+        for name, (n_bits, fields) in writer.reg_types.items()
+    )
+    return (
+        f"# Generated by pyuvm.uvm_reg_rdl_generate() from {sources}.\n"
+        "# Do not edit.\n"
+        "from pyuvm import uvm_reg_rdl_build\n"
+        "\n"
+        "# Register types: (n_bits, fields), each field being\n"
+        "# (name, size, lsb, access, volatile, reset, has_reset)\n"
+        f"REG_TYPES = {{\n{reg_types}}}\n"
+        "\n"
+        "# Blocks: (name, n_bytes, registers, memories, sub-blocks) with\n"
+        "# registers as (name, type, offset, array dimensions, stride),\n"
+        "# memories as (name, offset, size, n_bits, access) and\n"
+        "# sub-blocks as (block, name, offset, array dimensions, stride)\n"
+        + "\n".join(writer.blocks)
+        + f"\nMODEL = {model}\n"
+        "\n"
+        "\n"
+        "def build(name=None):\n"
+        "    return uvm_reg_rdl_build(REG_TYPES, MODEL, name)\n"
+    )
+
+
+def _array_names(name: str, dims: tuple[int, ...]) -> list[str]:
+    if not dims:
+        return [name]
+    return [
+        name + "".join(f"[{ii}]" for ii in index)
+        for index in product(*(range(dim) for dim in dims))
+    ]
+
+
+def _nest(elements: list, dims: tuple[int, ...]) -> Any:
+    # Python lists of the array elements, one level per dimension
+    if not dims:
+        return elements[0]
+    for dim in reversed(dims[1:]):
+        elements = [elements[ii : ii + dim] for ii in range(0, len(elements), dim)]
+    return elements
+
+
+def _set_element(parent: Any, name: str, element: Any) -> None:
+    # Like hand-written models, elements are attributes of their parent,
+    # unless that would hide one of its own attributes
+    if not hasattr(parent, name):
+        setattr(parent, name, element)
+
+
+def _build_block(
+    reg_types: dict[str, tuple],
+    model: tuple,
+    name: str,
+    parent: uvm_reg_block | None,
+) -> uvm_reg_block:
+    _, n_bytes, regs, mems, blocks = model
+    block = uvm_reg_block(name)
+    if parent is not None:
+        block.configure(parent)
+    reg_map = block.create_map(
+        "default_map", 0, n_bytes, uvm_endianness_e.UVM_LITTLE_ENDIAN, True
+    )
+    for reg_name, type_name, offset, dims, stride in regs:
+        n_bits, fields = reg_types[type_name]
+        elements = []
+        for index, element_name in enumerate(_array_names(reg_name, dims)):
+            reg = uvm_reg(element_name, n_bits)
+            for field_name, size, lsb, access, volatile, reset, has_reset in fields:
+                field = uvm_reg_field(field_name)
+                field.configure(
+                    reg, size, lsb, access, volatile, reset, has_reset, False, False
+                )
+                _set_element(reg, field_name, field)
+            if elements:
+                reg._share_layout(elements[0])
+            reg.configure(block)
+            reg_map.add_reg(reg, offset + index * stride)
+            elements.append(reg)
+        _set_element(block, reg_name, _nest(elements, dims))
+    for mem_name, offset, size, n_bits, access in mems:
+        mem = uvm_mem(mem_name, size, n_bits, access)
+        mem.configure(block)
+        reg_map.add_mem(mem, offset)
+        _set_element(block, mem_name, mem)
+    for sub_model, block_name, offset, dims, stride in blocks:
+        elements = []
+        for index, element_name in enumerate(_array_names(block_name, dims)):
+            sub_block = _build_block(reg_types, sub_model, element_name, block)
+            reg_map.add_submap(sub_block.get_default_map(), offset + index * stride)
+            elements.append(sub_block)
+        _set_element(block, block_name, _nest(elements, dims))
+    return block
+
+
+def uvm_reg_rdl_build(
+    reg_types: dict[str, tuple], model: tuple, name: str = None
+) -> uvm_reg_block:
+    """
+    :param reg_types: ``REG_TYPES`` table of a generated module
+    :param model: ``MODEL`` table of a generated module
+    :param name: Name of the root block, the addrmap name if None
+    :return: The locked register model
+    """
+    block = _build_block(reg_types, model, name or model[0], None)
+    block.lock_model()
+    return block
+
+
+def _rdl_cache_key(rdl_files: Sequence[str], top: str | None, name: str | None) -> str:
+    digest = hashlib.sha256()
+    digest.update(repr((_RDL_MODEL_FORMAT, sys.version_info[:2], top, name)).encode())
+    for rdl_file in rdl_files:
+        digest.update(Path(rdl_file).read_bytes())
+    return digest.hexdigest()
+
+
+def _register_loaded_model(block: uvm_reg_block) -> None:
+    # An unpickled model skipped lock_model(): fill the class-level lookups
+    # that it fills
+    for blk in (block, *block.get_blocks()):
+        uvm_reg_block._reg_block_registry[blk._name] = blk
+    for reg in block.get_registers():
+        uvm_reg._reg_registry[reg.get_full_name()] = reg
+        uvm_reg._max_size = max(uvm_reg._max_size, reg.get_n_bits())
+        for field in reg.get_fields():
+            uvm_reg_field._reg_field_registry[field.get_full_name()] = field
+            uvm_reg_field._max_size = max(uvm_reg_field._max_size, field.get_n_bits())
+    for mem in block.get_memories():
+        uvm_mem._max_size = max(uvm_mem._max_size, mem.get_n_bits())
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    # A model is hundreds of thousands of objects: without the pause the
+    # cyclic garbage collector runs over and over while they are unpickled
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    # Through a temporary file so that concurrent runs never read a
+    # partial file
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink()
+        raise
+
+
+def _import_model(path: Path) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def uvm_reg_rdl_load(
+    rdl_files: str | Sequence[str],
+    cache_dir: str = ".pyuvm_rdl_cache",
+    top: str = None,
+    name: str = None,
+) -> uvm_reg_block:
+    """
+    :param rdl_files: SystemRDL file or files, compiled in order
+    :param cache_dir: Directory of the generated modules and pickled models
+    :param top: Name of the top addrmap, the last one defined if None
+    :param name: Name of the root block, the addrmap name if None
+    :return: The locked register model
+
+    The model is unpickled from ``cache_dir`` when it was built before from
+    the same RDL files, otherwise it is generated, built and pickled there.
+    Only the given files are hashed: list the files they include too, so
+    that changing them rebuilds the model.
+    """
+    if isinstance(rdl_files, (str, os.PathLike)):
+        rdl_files = [rdl_files]
+    key = _rdl_cache_key(rdl_files, top, name)
+    stem = f"{Path(rdl_files[-1]).stem}_{key[:32]}"
+    path = Path(cache_dir) / f"{stem}.pickle"
+    if path.exists():
+        try:
+            with path.open("rb") as file, _gc_paused():
+                block = pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError) as error:
+            logger.warning(
+                "Cannot load the cached register model %s (%s); rebuilding it",
+                path,
+                error,
+            )
+        else:
+            _register_loaded_model(block)
+            return block
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    module_path = path.with_suffix(".py")
+    _write_file(module_path, uvm_reg_rdl_generate(rdl_files, top).encode())
+    block = _import_model(module_path).build(name)
+    with _gc_paused():
+        data = pickle.dumps(block, pickle.HIGHEST_PROTOCOL)
+    _write_file(path, data)
+    return block
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import logging
+from collections import deque
 from typing import TYPE_CHECKING
 
+import cocotb
 from cocotb.triggers import Lock
 
 from pyuvm._error_classes import UVMSequenceError
@@ -10,16 +12,24 @@ from pyuvm._reg.uvm_mem import uvm_mem
 from pyuvm._reg.uvm_reg import uvm_reg
 from pyuvm._reg.uvm_reg_item import uvm_reg_item
 from pyuvm._reg.uvm_reg_model import (
+    _reg_config_path,
     uvm_access_e,
     uvm_check_e,
     uvm_door_e,
+    uvm_hier_e,
     uvm_status_e,
 )
 from pyuvm._reg.uvm_reg_reporting import uvm_reg_report_error as _report_error
+from pyuvm._s13_uvm_component import ConfigDB
 from pyuvm._s14_15_python_sequences import uvm_sequence
 from pyuvm._utility_classes import current_task
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable
+
+    from cocotb.task import Task
+
+    from pyuvm._reg.uvm_reg_block import uvm_reg_block
     from pyuvm._reg.uvm_reg_map import uvm_reg_map
     from pyuvm._reg.uvm_reg_model import (
         uvm_reg_addr_t,
@@ -38,6 +48,35 @@ class uvm_reg_sequence(uvm_sequence):
         self.model = None
         self.adapter = None
         self.reg_seqr = None
+        # Register items translated at once by body(), see
+        # set_pipeline_depth()
+        self._pipeline_depth = 1
+
+    def set_pipeline_depth(self, depth: int) -> None:
+        """
+        Set how many register items ``body()`` translates at once.
+
+        With a depth of one, each item taken from ``reg_seqr`` is finished
+        with ``item_done()`` once its bus access completed. With a larger
+        depth, the translation is pipelined: each item is accepted with
+        ``item_done()`` as soon as it is taken and translated in its own
+        task, so up to ``depth`` accesses are in flight on the bus
+        sequencer. The completed item is then sent back with
+        ``reg_seqr.put_response(rw)``, and the producer matches it with
+        ``get_response(rw.get_transaction_id())``. Bus responses are matched
+        to their bus items by transaction id, so the adapter should provide
+        responses for the accesses to overlap on the bus.
+
+        :param depth: Maximum number of items in flight, at least one
+        :raises ValueError: If ``depth`` is less than one
+        :return: None
+        """
+        if depth < 1:
+            raise ValueError(f"Pipeline depth must be at least 1, not {depth}")
+        self._pipeline_depth = depth
+
+    def get_pipeline_depth(self) -> int:
+        return self._pipeline_depth
 
     async def body(self):
         if self.reg_seqr is None:
@@ -48,6 +87,9 @@ class uvm_reg_sequence(uvm_sequence):
                 "upstream register sequencer configured",
             )
             return
+        if self._pipeline_depth > 1:
+            await self._pipelined_body()
+            return
 
         while True:
             rw = await self.reg_seqr.get_next_item()
@@ -65,6 +107,34 @@ class uvm_reg_sequence(uvm_sequence):
                     rw.set_parent_sequence(original_parent)
                 self.reg_seqr.item_done()
 
+    async def _pipelined_body(self) -> None:
+        # The items in flight, oldest first. When the window is full the
+        # oldest one is waited for, as a bus completes accesses in order.
+        in_flight: deque[Task] = deque()
+        while True:
+            rw = await self.reg_seqr.get_next_item()
+            self.reg_seqr.item_done()
+            if not isinstance(rw, uvm_reg_item):
+                raise UVMSequenceError(
+                    "Register translation sequence received an item that is "
+                    "not a uvm_reg_item"
+                )
+            while len(in_flight) >= self._pipeline_depth:
+                await in_flight.popleft()
+            in_flight.append(self._start_soon(self._translate(rw)))
+
+    async def _translate(self, rw: uvm_reg_item) -> None:
+        original_parent = rw.get_parent_sequence()
+        rw.set_parent_sequence(self)
+        try:
+            await self.do_reg_item(rw)
+        except BaseException:
+            rw.set_status(uvm_status_e.UVM_NOT_OK)
+            raise
+        finally:
+            rw.set_parent_sequence(original_parent)
+            self.reg_seqr.put_response(rw)
+
     async def do_reg_item(self, rw: uvm_reg_item) -> None:
         if not isinstance(rw, uvm_reg_item):
             raise UVMSequenceError("do_reg_item() requires a uvm_reg_item")
@@ -79,15 +149,107 @@ class uvm_reg_sequence(uvm_sequence):
             raise UVMSequenceError(
                 "Register translation item has no selected local map"
             )
-        if rw.get_kind() == uvm_access_e.UVM_WRITE:
+        if rw.get_kind() in (uvm_access_e.UVM_WRITE, uvm_access_e.UVM_BURST_WRITE):
             await local_map.do_bus_write(rw, self.sequencer, self.adapter)
-        elif rw.get_kind() == uvm_access_e.UVM_READ:
+        elif rw.get_kind() in (uvm_access_e.UVM_READ, uvm_access_e.UVM_BURST_READ):
             await local_map.do_bus_read(rw, self.sequencer, self.adapter)
         else:
             raise UVMSequenceError(
                 f"Unsupported register translation access kind: {rw.get_kind()!r}"
             )
 
+    @staticmethod
+    def _start_soon(coro) -> Task:
+        return cocotb.start_soon(coro)
+
+    @staticmethod
+    def _is_excluded(
+        element: uvm_reg_block | uvm_reg | uvm_mem, attributes: tuple[str, ...]
+    ) -> bool:
+        """Whether a built-in test sequence must skip ``element``.
+
+        The attributes are looked up in the ConfigDB under ``REG.`` followed
+        by the full name of the element, with characters other than letters,
+        digits, ``_`` and ``.`` replaced by ``_``, e.g.::
+
+            ConfigDB().set(None, "REG.top.dma.*", "NO_REG_TESTS", True)
+        """
+        path = _reg_config_path(element.get_full_name())
+        config_db = ConfigDB()
+        return any(
+            config_db.get(None, path, attribute, False) for attribute in attributes
+        )
+
+    def _blocks_to_test(self, attributes: tuple[str, ...]) -> list[uvm_reg_block]:
+        # Excluding a block excludes its sub-blocks
+        blocks = []
+        pending = [self.model]
+        while pending:
+            blk = pending.pop()
+            if self._is_excluded(blk, attributes):
+                continue
+            blocks.append(blk)
+            pending.extend(reversed(blk.get_blocks(uvm_hier_e.UVM_NO_HIER)))
+        return blocks
+
+    def _regs_to_test(self, attributes: tuple[str, ...]) -> list[uvm_reg]:
+        return [
+            rg
+            for blk in self._blocks_to_test(attributes)
+            for rg in blk.get_registers(uvm_hier_e.UVM_NO_HIER)
+            if not self._is_excluded(rg, attributes)
+        ]
+
+    def _mems_to_test(self, attributes: tuple[str, ...]) -> list[uvm_mem]:
+        return [
+            mem
+            for blk in self._blocks_to_test(attributes)
+            for mem in blk.get_memories(uvm_hier_e.UVM_NO_HIER)
+            if not self._is_excluded(mem, attributes)
+        ]
+
+    @staticmethod
+    def _has_backdoor(element: uvm_reg | uvm_mem) -> bool:
+        return element.get_backdoor() is not None or element.has_hdl_path()
+
+    def _status_ok(self, status: uvm_status_e, operation: str) -> bool:
+        if status == uvm_status_e.UVM_IS_OK:
+            return True
+        _report_error(
+            self, "REG_SEQUENCE", f"Status was {status.name} when {operation}"
+        )
+        return False
+
+    async def _run_by_sequencer(
+        self,
+        elements: Iterable[uvm_reg | uvm_mem],
+        test: Callable[[uvm_reg | uvm_mem], Awaitable[None]],
+    ) -> None:
+        """Run ``test`` on each element, one task per bus sequencer.
+
+        Elements are grouped by the sequencer of the first map they are in.
+        Each group is tested in order in its own task, so the buses of
+        independent interfaces are busy at the same time, while any one
+        element is only ever tested by one task.
+        """
+        groups: dict[int, list[uvm_reg | uvm_mem]] = {}
+        for element in elements:
+            maps = []
+            element.get_maps(maps)
+            sequencer = maps[0].get_sequencer() if maps else None
+            groups.setdefault(id(sequencer), []).append(element)
+
+        async def run_group(group: list[uvm_reg | uvm_mem]) -> None:
+            for element in group:
+                await test(element)
+
+        if len(groups) == 1:
+            await run_group(*groups.values())
+            return
+        tasks = [self._start_soon(run_group(group)) for group in groups.values()]
+        for task in tasks:
+            await task
+
     def _valid_target(self, target, expected_type: type, kind: str) -> bool:
         if isinstance(target, expected_type):
             return True
@@ -265,11 +265,16 @@ class uvm_object(uvm_void):
         return self.__str__()
 
     # 5.3.7
-    def record(self):
+    def record(self, stream=None):
         """
-        Not implemented.
+        :param stream: uvm_tr_stream from ``uvm_tr_database.open_stream()``
+        :return: None
+
+        Records the object as one row of ``stream``, with the fields chosen
+        when the stream was opened. Does nothing if ``stream`` is None.
         """
-        raise UVMNotImplemented("Perhaps a future project?")
+        if stream is not None:
+            stream.record(self)
 
     # 5.3.7.2
     def do_record(self):
@@ -473,6 +478,9 @@ class uvm_transaction(uvm_object):
         self._accept_time: Optional[int] = None
         self._begin_time: Optional[int] = None
         self._end_time: Optional[int] = None
+        self._stream = None
+        self._tr_handle = 0
+        self._active = False
 
     def set_id_info(self, other):
         """
@@ -545,11 +553,12 @@ class uvm_transaction(uvm_object):
                 self._begin_time = begin_time
         else:
             self._begin_time = get_sim_time()
-        # TODO: update recodring API calls
+        self._active = True
+        if self._stream is not None:
+            self._tr_handle = self._stream.begin_tr(self)
         self.do_begin_tr()
         # TODO Call 'begin' event pool triggers
-        # Update return value when recording is enabled
-        return 0
+        return self._tr_handle
 
     # 5.4.2.5
     def do_begin_tr(self):
@@ -585,10 +594,13 @@ class uvm_transaction(uvm_object):
                 self._end_time = end_time
         else:
             self._end_time = get_sim_time()
-        # TODO: update recodring API calls
+        self._active = False
+        if self._stream is not None:
+            self._stream.end_tr(self)
+        if free_handle:
+            self._tr_handle = 0
         self.do_end_tr()
         # TODO Call 'end' event pool triggers
-        # Update return value when recording is enabled
 
     # 5.4.2.7
     def do_end_tr(self):
@@ -600,37 +612,39 @@ class uvm_transaction(uvm_object):
     # 5.4.2.8
     def get_tr_handle(self):
         """
-        Not implemented
+        :return: Handle from the recording stream for the transaction
+            in progress, or 0 if it is not being recorded
         """
-        self.__not_implemented()
+        return self._tr_handle
 
     # 5.4.2.9
-    def enable_recording(self):
+    def enable_recording(self, stream):
         """
-        Not implemented
+        :param stream: uvm_tr_stream that ``end_tr()`` records into
+        :return: None
         """
-        self.__not_implemented()
+        self._stream = stream
 
     # 5.4.2.10
     def disable_recording(self):
         """
-        Not implemented
+        Stop recording this transaction
         """
-        self.__not_implemented()
+        self._stream = None
 
     # 5.4.2.11
     def is_recording_enabled(self):
         """
-        Not implemented
+        :return: True if the transaction has a recording stream
         """
-        self.__not_implemented()
+        return self._stream is not None
 
     # 5.4.2.12
     def is_active(self):
         """
-        Not implemented
+        :return: True if ``begin_tr()`` has been called without ``end_tr()``
         """
-        self.__not_implemented()
+        return self._active
 
     # 5.4.2.13
     def get_event_pool(self):
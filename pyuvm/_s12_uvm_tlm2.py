@@ -0,0 +1,486 @@
+# UVM TLM 2
+# 12.3
+#
+# TLM-2.0 moves a generic payload between initiator and target sockets.
+# pyuvm implements the blocking and non-blocking transport interfaces and
+# the generic payload, and adds the SystemC direct memory interface (DMI)
+# so that an initiator can read and write a target's memory model through a
+# memoryview instead of a transaction per access.
+#
+# As in the TLM-1 classes, results are returned from calls rather than
+# through inout arguments. nb_transport_fw() and nb_transport_bw() return
+# (sync, phase, delay) tuples, and b_transport() returns the annotated delay.
+# Delays are plain numbers in whatever time unit the testbench chooses.
+#
+# The SV socket parameterizations and the uvm_tlm_time class are not needed
+# in Python, and the passthrough sockets are not implemented.
+
+from dataclasses import dataclass
+from enum import Enum
+
+from pyuvm._error_classes import UVMTLMConnectionError
+from pyuvm._s12_uvm_tlm_interfaces import uvm_export_base, uvm_port_base
+from pyuvm._s14_15_python_sequences import uvm_sequence_item
+
+
+# 12.3.4.2.1
+class uvm_tlm_command_e(Enum):
+    UVM_TLM_READ_COMMAND = 0
+    UVM_TLM_WRITE_COMMAND = 1
+    UVM_TLM_IGNORE_COMMAND = 2
+
+
+# 12.3.4.2.2
+class uvm_tlm_response_status_e(Enum):
+    UVM_TLM_OK_RESPONSE = 1
+    UVM_TLM_INCOMPLETE_RESPONSE = 0
+    UVM_TLM_GENERIC_ERROR_RESPONSE = -1
+    UVM_TLM_ADDRESS_ERROR_RESPONSE = -2
+    UVM_TLM_COMMAND_ERROR_RESPONSE = -3
+    UVM_TLM_BURST_ERROR_RESPONSE = -4
+    UVM_TLM_BYTE_ENABLE_ERROR_RESPONSE = -5
+
+
+# 12.3.2.1.1
+class uvm_tlm_phase_e(Enum):
+    UNINITIALIZED_PHASE = 0
+    BEGIN_REQ = 1
+    END_REQ = 2
+    BEGIN_RESP = 3
+    END_RESP = 4
+
+
+# 12.3.2.1.2
+class uvm_tlm_sync_e(Enum):
+    UVM_TLM_ACCEPTED = 0
+    UVM_TLM_UPDATED = 1
+    UVM_TLM_COMPLETED = 2
+
+
+# 12.3.4.2
+class uvm_tlm_generic_payload(uvm_sequence_item):
+    """
+    The TLM-2.0 generic payload.
+
+    The data and byte enable arrays are kept as whatever writable
+    bytes-like object they were given (``bytearray`` or ``memoryview``),
+    so a target can read and write them in place without copying.
+    ``bytes`` are copied into a ``bytearray`` because a read response must
+    be able to write into the data array.
+
+    A byte enable of ``0x00`` disables the corresponding data byte. An
+    empty byte enable array enables every byte.
+    """
+
+    def __init__(self, name="generic_payload"):
+        super().__init__(name)
+        self.m_address = 0
+        self.m_command = uvm_tlm_command_e.UVM_TLM_IGNORE_COMMAND
+        self.m_data = bytearray()
+        self.m_length = 0
+        self.m_response_status = uvm_tlm_response_status_e.UVM_TLM_INCOMPLETE_RESPONSE
+        self.m_dmi = False
+        self.m_byte_enable = bytearray()
+        self.m_byte_enable_length = 0
+        self.m_streaming_width = 0
+        self.m_extensions = {}
+
+    @staticmethod
+    def _writable(data):
+        return data if isinstance(data, (bytearray, memoryview)) else bytearray(data)
+
+    def __str__(self):
+        return (
+            f"{self.get_name()}: {self.m_command.name} "
+            f"addr=0x{self.m_address:x} len={self.m_length} "
+            f"data={bytes(self.m_data[: self.m_length]).hex()} "
+            f"{self.m_response_status.name}"
+        )
+
+    def do_copy(self, rhs):
+        super().do_copy(rhs)
+        self.m_address = rhs.m_address
+        self.m_command = rhs.m_command
+        self.m_data = bytearray(rhs.m_data)
+        self.m_length = rhs.m_length
+        self.m_response_status = rhs.m_response_status
+        self.m_dmi = rhs.m_dmi
+        self.m_byte_enable = bytearray(rhs.m_byte_enable)
+        self.m_byte_enable_length = rhs.m_byte_enable_length
+        self.m_streaming_width = rhs.m_streaming_width
+        self.m_extensions = dict(rhs.m_extensions)
+
+    def do_compare(self, rhs):
+        return (
+            self.m_address == rhs.m_address
+            and self.m_command == rhs.m_command
+            and self.m_length == rhs.m_length
+            and self.m_data[: self.m_length] == rhs.m_data[: rhs.m_length]
+            and self.m_response_status == rhs.m_response_status
+            and self.m_byte_enable[: self.m_byte_enable_length]
+            == rhs.m_byte_enable[: rhs.m_byte_enable_length]
+            and self.m_streaming_width == rhs.m_streaming_width
+        )
+
+    # 12.3.4.2.4
+    def get_command(self):
+        return self.m_command
+
+    def set_command(self, command):
+        self.m_command = command
+
+    def is_read(self):
+        return self.m_command == uvm_tlm_command_e.UVM_TLM_READ_COMMAND
+
+    def set_read(self):
+        self.m_command = uvm_tlm_command_e.UVM_TLM_READ_COMMAND
+
+    def is_write(self):
+        return self.m_command == uvm_tlm_command_e.UVM_TLM_WRITE_COMMAND
+
+    def set_write(self):
+        self.m_command = uvm_tlm_command_e.UVM_TLM_WRITE_COMMAND
+
+    # 12.3.4.2.5
+    def set_address(self, addr):
+        self.m_address = addr
+
+    def get_address(self):
+        return self.m_address
+
+    # 12.3.4.2.6
+    def get_data(self):
+        """:return: The data array, not a copy"""
+        return self.m_data
+
+    def set_data(self, data):
+        """
+        :param data: A bytes-like object. ``bytearray`` and ``memoryview``
+            are stored without copying.
+        :return: None
+
+        Also sets the data length to the length of ``data``.
+        """
+        self.m_data = self._writable(data)
+        self.m_length = len(self.m_data)
+
+    def get_data_length(self):
+        return self.m_length
+
+    def set_data_length(self, length):
+        self.m_length = length
+
+    def get_streaming_width(self):
+        return self.m_streaming_width
+
+    def set_streaming_width(self, width):
+        self.m_streaming_width = width
+
+    # 12.3.4.2.7
+    def get_byte_enable(self):
+        """:return: The byte enable array, not a copy"""
+        return self.m_byte_enable
+
+    def set_byte_enable(self, byte_enable):
+        """
+        :param byte_enable: A bytes-like object of 0x00/0xFF bytes
+        :return: None
+
+        Also sets the byte enable length to the length of ``byte_enable``.
+        """
+        self.m_byte_enable = self._writable(byte_enable)
+        self.m_byte_enable_length = len(self.m_byte_enable)
+
+    def get_byte_enable_length(self):
+        return self.m_byte_enable_length
+
+    def set_byte_enable_length(self, length):
+        self.m_byte_enable_length = length
+
+    def is_byte_enabled(self, index):
+        """
+        :param index: Index into the data array
+        :return: True if the data byte at ``index`` is enabled
+
+        The byte enable array repeats if it is shorter than the data.
+        """
+        if self.m_byte_enable_length == 0:
+            return True
+        return self.m_byte_enable[index % self.m_byte_enable_length] != 0
+
+    # 12.3.4.2.8
+    def set_dmi_allowed(self, dmi):
+        self.m_dmi = dmi
+
+    def is_dmi_allowed(self):
+        return self.m_dmi
+
+    # 12.3.4.2.9
+    def get_response_status(self):
+        return self.m_response_status
+
+    def set_response_status(self, status):
+        self.m_response_status = status
+
+    def is_response_ok(self):
+        return self.m_response_status.value > 0
+
+    def is_response_error(self):
+        return not self.is_response_ok()
+
+    def get_response_string(self):
+        return self.m_response_status.name
+
+    # 12.3.4.2.10
+    # Extensions are keyed by their class rather than by an extension handle.
+    def set_extension(self, ext):
+        """
+        :param ext: Extension object
+        :return: The previous extension of the same type, or None
+        """
+        previous = self.m_extensions.get(type(ext))
+        self.m_extensions[type(ext)] = ext
+        return previous
+
+    def get_extension(self, ext_type):
+        return self.m_extensions.get(ext_type)
+
+    def get_num_extensions(self):
+        return len(self.m_extensions)
+
+    def clear_extension(self, ext_type):
+        self.m_extensions.pop(ext_type, None)
+
+    def clear_extensions(self):
+        self.m_extensions.clear()
+
+
+@dataclass
+class uvm_tlm_dmi:
+    """
+    A direct memory interface grant from a target.
+
+    ``memory`` is a memoryview of the target's storage covering
+    ``start_address`` to ``end_address`` inclusive. Writing through it
+    changes the target's memory with no transaction.
+    """
+
+    memory: memoryview
+    start_address: int = 0
+    end_address: int = -1
+    read_allowed: bool = True
+    write_allowed: bool = True
+    read_latency: int = 0
+    write_latency: int = 0
+
+    def __post_init__(self):
+        if not isinstance(self.memory, memoryview):
+            self.memory = memoryview(self.memory)
+        if self.end_address < 0:
+            self.end_address = self.start_address + self.memory.nbytes - 1
+
+    def contains(self, addr, length=1):
+        """
+        :param addr: Target address
+        :param length: Number of bytes
+        :return: True if the whole range falls inside this grant
+        """
+        return self.start_address <= addr and addr + length - 1 <= self.end_address
+
+    def view(self, addr, length):
+        """
+        :param addr: Target address
+        :param length: Number of bytes
+        :return: A zero-copy memoryview of ``length`` bytes at ``addr``
+        :raises: IndexError if the range is outside the grant
+        """
+        if not self.contains(addr, length):
+            raise IndexError(
+                f"DMI range 0x{addr:x}+{length} is outside "
+                f"0x{self.start_address:x}-0x{self.end_address:x}"
+            )
+        offset = addr - self.start_address
+        return self.memory[offset : offset + length]
+
+
+# 12.3.5
+# Sockets
+#
+# A target socket calls into the imp it is constructed with (the parent
+# component by default). An initiator socket connects to a target socket.
+# On the non-blocking path the target socket calls back into the imp of
+# the initiator socket that connected to it.
+
+
+def _check_imp(socket, imp):
+    for method in socket._required_imp_methods:
+        if not hasattr(imp, method):
+            raise UVMTLMConnectionError(
+                f"{imp} must implement '{method}()'"
+                f" to be the imp of a {socket.__class__.__name__}"
+            )
+
+
+class _uvm_tlm_target_socket_base(uvm_export_base):
+    _required_imp_methods = ()
+
+    def __init__(self, name, parent, imp=None):
+        imp = parent if imp is None else imp
+        _check_imp(self, imp)
+        super().__init__(name, parent)
+        self.imp = imp
+
+    def get_direct_mem_ptr(self, t):
+        """
+        :param t: Generic payload with the command and address of interest
+        :return: (allowed, uvm_tlm_dmi) or (False, None) if the imp does
+            not grant DMI
+        """
+        get_direct_mem_ptr = getattr(self.imp, "get_direct_mem_ptr", None)
+        if get_direct_mem_ptr is None:
+            return False, None
+        return get_direct_mem_ptr(t)
+
+    def invalidate_direct_mem_ptr(self, start_range, end_range):
+        """
+        :param start_range: First address of invalidated range
+        :param end_range: Last address of invalidated range
+        :return: None
+
+        Called by the target to revoke DMI grants. Forwarded to the imp of
+        every connected initiator socket that implements it.
+        """
+        for initiator in self.provided_to.values():
+            invalidate = getattr(initiator.imp, "invalidate_direct_mem_ptr", None)
+            if invalidate is not None:
+                invalidate(start_range, end_range)
+
+
+class _uvm_tlm_initiator_socket_base(uvm_port_base):
+    _target_socket_class = _uvm_tlm_target_socket_base
+    _required_imp_methods = ()
+
+    def __init__(self, name, parent, imp=None):
+        imp = parent if imp is None else imp
+        _check_imp(self, imp)
+        super().__init__(name, parent)
+        self.imp = imp
+
+    def _check_export(self, export):
+        if not isinstance(export, self._target_socket_class):
+            raise UVMTLMConnectionError(
+                f"{export} must be a {self._target_socket_class.__name__}"
+                f" to connect to a {self.__class__.__name__}"
+            )
+
+    def _target(self):
+        if self.export is None:
+            raise UVMTLMConnectionError(
+                f"Missing target socket in {self.get_full_name()}. Did you connect it?"
+            )
+        return self.export
+
+    def get_direct_mem_ptr(self, t):
+        """
+        :param t: Generic payload with the command and address of interest
+        :return: (allowed, uvm_tlm_dmi)
+        """
+        return self._target().get_direct_mem_ptr(t)
+
+
+# 12.3.5.3
+class uvm_tlm_b_target_socket(_uvm_tlm_target_socket_base):
+    """
+    Blocking target socket. The imp must implement
+    ``async b_transport(t, delay)``. It may return an updated delay.
+    """
+
+    _required_imp_methods = ("b_transport",)
+
+    async def b_transport(self, t, delay=0):
+        """
+        :param t: Generic payload
+        :param delay: Annotated delay
+        :return: The annotated delay after the target has run
+        """
+        new_delay = await self.imp.b_transport(t, delay)
+        return delay if new_delay is None else new_delay
+
+
+# 12.3.5.1
+class uvm_tlm_b_initiator_socket(_uvm_tlm_initiator_socket_base):
+    """
+    Blocking initiator socket. The optional imp only needs
+    ``invalidate_direct_mem_ptr()`` if it uses DMI.
+    """
+
+    _target_socket_class = uvm_tlm_b_target_socket
+
+    async def b_transport(self, t, delay=0):
+        """
+        :param t: Generic payload
+        :param delay: Annotated delay
+        :raises: UVMTLMConnectionError if the socket is not connected
+        :return: The annotated delay after the target has run
+        """
+        return await self._target().b_transport(t, delay)
+
+
+# 12.3.5.4
+class uvm_tlm_nb_target_socket(_uvm_tlm_target_socket_base):
+    """
+    Non-blocking target socket. The imp must implement
+    ``nb_transport_fw(t, phase, delay)`` returning (sync, phase, delay).
+    """
+
+    _required_imp_methods = ("nb_transport_fw",)
+
+    def nb_transport_fw(self, t, phase, delay=0):
+        return self.imp.nb_transport_fw(t, phase, delay)
+
+    def nb_transport_bw(self, t, phase, delay=0):
+        """
+        :param t: Generic payload
+        :param phase: uvm_tlm_phase_e
+        :param delay: Annotated delay
+        :raises: UVMTLMConnectionError if no initiator is connected
+        :return: (sync, phase, delay) from the initiator's imp
+        """
+        if not self.provided_to:
+            raise UVMTLMConnectionError(
+                f"No initiator socket connected to {self.get_full_name()}"
+            )
+        (initiator,) = self.provided_to.values()
+        return initiator.imp.nb_transport_bw(t, phase, delay)
+
+
+# 12.3.5.2
+class uvm_tlm_nb_initiator_socket(_uvm_tlm_initiator_socket_base):
+    """
+    Non-blocking initiator socket. The imp must implement
+    ``nb_transport_bw(t, phase, delay)`` returning (sync, phase, delay).
+    """
+
+    _target_socket_class = uvm_tlm_nb_target_socket
+    _required_imp_methods = ("nb_transport_bw",)
+
+    def connect(self, export):
+        if export.provided_to:
+            raise UVMTLMConnectionError(
+                f"{export.get_full_name()} is already connected to"
+                f" {next(iter(export.provided_to))}"
+            )
+        super().connect(export)
+
+    def nb_transport_fw(self, t, phase, delay=0):
+        """
+        :param t: Generic payload
+        :param phase: uvm_tlm_phase_e
+        :param delay: Annotated delay
+        :raises: UVMTLMConnectionError if the socket is not connected
+        :return: (sync, phase, delay) from the target's imp
+        """
+        return self._target().nb_transport_fw(t, phase, delay)
+
+    def nb_transport_bw(self, t, phase, delay=0):
+        return self.imp.nb_transport_bw(t, phase, delay)
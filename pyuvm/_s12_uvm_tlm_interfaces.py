@@ -1056,4 +1056,4 @@ class uvm_tlm_transport_channel(uvm_tlm_req_rsp_channel):
 # UVM TLM 2
 # 12.3
 
-# This is left for future development.
+# See _s12_uvm_tlm2.py
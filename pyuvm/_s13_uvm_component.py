@@ -10,13 +10,19 @@ from cocotb.triggers import Event
 from pyuvm._error_classes import UVMConfigItemNotFound, UVMError, UVMNotImplemented
 from pyuvm._s06_reporting_classes import uvm_report_object
 from pyuvm._s08_factory_classes import uvm_factory
-from pyuvm._s09_phasing import uvm_build_phase, uvm_common_phases, uvm_run_phase
+from pyuvm._s09_phasing import (
+    uvm_build_phase,
+    uvm_common_phases,
+    uvm_final_phase,
+    uvm_run_phase,
+)
 from pyuvm._utility_classes import (
     PYUVM_DEBUG,
     FactoryData,
     ObjectionHandler,
     Singleton,
     UVM_ROOT_Singleton,
+    UVMThreadPool,
     uvm_is_match,
 )
 from pyuvm._utils import cocotb_version_info
@@ -529,6 +535,8 @@ class uvm_root(uvm_component, metaclass=UVM_ROOT_Singleton):
             root.running_phase.traverse(root.uvm_test_top)
             if root.running_phase == uvm_run_phase:
                 await ObjectionHandler().run_phase_complete()
+            elif root.running_phase == uvm_final_phase:
+                UVMThreadPool().shutdown()
 
     def _find_all_recurse(self, comp_match, comp) -> list[uvm_component]:
         """
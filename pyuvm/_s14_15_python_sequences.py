@@ -7,10 +7,15 @@
 # SystemVerilog features.
 
 
+import gzip
+import pickle
+from pathlib import Path
+
 from cocotb.queue import QueueEmpty
 from cocotb.triggers import Event as CocotbEvent
+from cocotb.utils import get_sim_time
 
-from pyuvm._error_classes import UVMFatalError, UVMSequenceError
+from pyuvm._error_classes import UVMError, UVMFatalError, UVMSequenceError
 from pyuvm._s05_base_classes import uvm_object, uvm_transaction
 from pyuvm._s12_uvm_tlm_interfaces import (
     UVMQueue,
@@ -190,6 +195,7 @@ class uvm_seq_item_export(uvm_blocking_put_export):
         self.req_q = UVMQueue()
         self.rsp_q = ResponseQueue()
         self.current_item = None
+        self.recorder = None
 
     async def put_req(self, item):
         """
@@ -393,6 +399,10 @@ class uvm_sequencer(uvm_component):
         await item.start_condition.wait()
 
     async def finish_item(self, item):
+        # The item is filled in: record it before the driver can change it
+        recorder = self.seq_item_export.recorder
+        if recorder is not None:
+            recorder.record(item)
         item.item_ready.set()
         item.item_ready.clear()
         await item.finish_condition.wait()
@@ -408,6 +418,150 @@ class uvm_sequencer(uvm_component):
         next_item = await self.seq_item_export.get_next_item()
         return next_item
 
+    def set_stimulus_recorder(self, recorder):
+        """
+        Record every item sent to the driver, once its sequence has filled
+        it in with ``finish_item()``.
+
+        :param recorder: An open uvm_stimulus_recorder, or None to stop
+        """
+        self.seq_item_export.recorder = recorder
+
+
+# Stimulus record and replay
+#
+# Regenerating constrained-random stimulus is often the slowest part of
+# rerunning a failing seed. A uvm_stimulus_recorder attached to a
+# sequencer saves each item when the sequence has finished filling it in
+# with finish_item(), whether the driver takes it with get_next_item() or
+# try_next_item(), and before the driver can change it. A
+# uvm_replay_sequencer feeds the saved items to the driver without running
+# any sequences.
+#
+# Items are pickled without their synchronization events, logger and
+# initiator, so they must otherwise be picklable.
+
+_UNRECORDED_ATTRS = frozenset(
+    (
+        "start_condition",
+        "finish_condition",
+        "item_ready",
+        "_logger",
+        "_uvm_report_core",
+        "_initiator",
+        "_stream",
+        "_tr_handle",
+        "_active",
+    )
+)
+
+
+def _open_stimulus_file(path, mode):
+    path = Path(path)
+    if path.suffix == ".gz":
+        return gzip.open(path, mode)
+    return open(path, mode)
+
+
+class uvm_stimulus_recorder(uvm_object):
+    """
+    Saves sequence items to a file with the sim time their sequence
+    finished them and the id of the sequence that sent them. A ``.gz`` suffix
+    compresses the file.
+    """
+
+    def __init__(self, name="uvm_stimulus_recorder", path=None):
+        super().__init__(name)
+        self.get_time = get_sim_time
+        self._file = None
+        self.items_recorded = 0
+        if path is not None:
+            self.open(path)
+
+    def open(self, path):
+        """:param path: File to write, replacing any existing file"""
+        self.close()
+        self._file = _open_stimulus_file(path, "wb")
+        self.items_recorded = 0
+
+    def is_open(self):
+        return self._file is not None
+
+    def record(self, item):
+        """
+        :param item: uvm_sequence_item to save
+        :raises UVMError: If the recorder is not open
+        :return: None
+        """
+        if self._file is None:
+            raise UVMError(f"{self.get_name()} must be opened before record()")
+        state = {
+            key: value
+            for key, value in vars(item).items()
+            if key not in _UNRECORDED_ATTRS
+        }
+        pickle.dump(
+            (self.get_time(), item.parent_sequence_id, type(item), state),
+            self._file,
+            pickle.HIGHEST_PROTOCOL,
+        )
+        self.items_recorded += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def load_stimulus(path):
+    """
+    :param path: File written by uvm_stimulus_recorder
+    :return: A generator of (sim_time, sequence_id, item) in recorded order
+    """
+    with _open_stimulus_file(path, "rb") as stimulus:
+        while True:
+            try:
+                sim_time, sequence_id, item_type, state = pickle.load(stimulus)
+            except EOFError:
+                return
+            item = item_type.__new__(item_type)
+            uvm_sequence_item.__init__(item, state["_obj_name"])
+            item.__dict__.update(state)
+            yield sim_time, sequence_id, item
+
+
+class uvm_replay_sequencer(uvm_sequencer):
+    """
+    A sequencer that replays a file written by uvm_stimulus_recorder.
+
+    Set ``replay_file`` directly or store it in the ConfigDB under
+    ``"replay_file"``. The run_phase hands each item to the driver in the
+    recorded order, holding an objection until the driver has called
+    ``item_done()`` on the last one. Responses from the driver are
+    discarded.
+    """
+
+    def __init__(self, name, parent=None, replay_file=None):
+        super().__init__(name, parent)
+        self.replay_file = replay_file
+        self.items_replayed = 0
+
+    def build_phase(self):
+        if self.replay_file is None:
+            self.replay_file = self.cdb_get("replay_file")
+
+    async def run_phase(self):
+        self.raise_objection("replaying stimulus")
+        rsp_q = self.seq_item_export.rsp_q
+        for _, _, item in load_stimulus(self.replay_file):
+            await self.seq_item_export.put_req(item)
+            await item.start_condition.wait()
+            await self.finish_item(item)
+            self.items_replayed += 1
+            while not rsp_q.empty():
+                rsp_q.get_nowait()
+        self.drop_objection()
+
 
 class uvm_sequencer_base(uvm_object):
     pass
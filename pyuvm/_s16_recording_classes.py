@@ -0,0 +1,396 @@
+# 16.4 Transaction recording
+#
+# The SV UVM records transactions through a vendor database one attribute
+# at a time. pyuvm instead records each transaction as one row in a
+# columnar store: the transaction id, accept/begin/end times, type and a
+# fixed set of numeric fields chosen when the stream is opened. Columns are
+# preallocated array.array chunks, so recording a transaction is a handful
+# of index assignments. Full chunks are flushed to disk, either to an SQLite
+# database or to one .npy file per column, so recording can stay on in
+# regressions.
+#
+# Neither format needs NumPy to write. load_tr_database() returns NumPy
+# arrays when NumPy is installed and array.array columns otherwise.
+
+import ast
+import sqlite3
+import sys
+from array import array
+from pathlib import Path
+
+from pyuvm._error_classes import UVMError
+from pyuvm._s05_base_classes import uvm_object, uvm_transaction
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_NPY_MAGIC = b"\x93NUMPY\x01\x00"
+_NPY_HEADER_LEN = 118  # Pads magic + length + header to 128 bytes
+_BYTE_ORDER = "<" if sys.byteorder == "little" else ">"
+_STANDARD_COLUMNS = ("tx_id", "accept_time", "begin_time", "end_time", "type_id")
+
+
+def _sql_columns(names):
+    # Field names are identifiers but may be SQL keywords such as "order"
+    return ", ".join(f'"{name}"' for name in names)
+
+
+def _npy_descr(typecode):
+    kind = "f" if typecode in "fd" else "i" if typecode.islower() else "u"
+    return f"{_BYTE_ORDER}{kind}{array(typecode).itemsize}"
+
+
+def _npy_header(typecode, length):
+    header = (
+        f"{{'descr': '{_npy_descr(typecode)}', 'fortran_order': False, "
+        f"'shape': ({length},), }}"
+    )
+    return (
+        _NPY_MAGIC
+        + _NPY_HEADER_LEN.to_bytes(2, "little")
+        + (header.ljust(_NPY_HEADER_LEN - 1) + "\n").encode("latin1")
+    )
+
+
+def _read_npy(path):
+    with open(path, "rb") as npy:
+        if npy.read(len(_NPY_MAGIC)) != _NPY_MAGIC:
+            raise UVMError(f"{path} is not a .npy file written by pyuvm")
+        header_len = int.from_bytes(npy.read(2), "little")
+        header = ast.literal_eval(npy.read(header_len).decode("latin1"))
+        descr = header["descr"]
+        typecode = next(tc for tc in "bBhHiIqQlLfd" if _npy_descr(tc) == descr)
+        column = array(typecode)
+        column.frombytes(npy.read())
+    return column
+
+
+class uvm_tr_stream(uvm_object):
+    """
+    One stream of recorded transactions, created by
+    ``uvm_tr_database.open_stream()``.
+
+    Pass the stream to ``uvm_transaction.enable_recording()``. Each
+    transaction is written as one row when ``end_tr()`` is called.
+    """
+
+    def __init__(self, name, db, stream_id, scope, fields, chunk_size):
+        super().__init__(name)
+        self.db = db
+        self.stream_id = stream_id
+        self.scope = scope
+        self.fields = dict(fields)
+        self.chunk_size = chunk_size
+        self.type_names = []
+        self._type_ids = {}
+        self._typecodes = dict.fromkeys(_STANDARD_COLUMNS, "q")
+        self._typecodes.update(self.fields)
+        self._columns = {
+            name: array(typecode, bytes(array(typecode).itemsize * chunk_size))
+            for name, typecode in self._typecodes.items()
+        }
+        self._count = 0
+        self._next_handle = 1
+        self.rows_recorded = 0
+
+    def get_db(self):
+        return self.db
+
+    def get_scope(self):
+        return self.scope
+
+    def begin_tr(self, tr):
+        """
+        :param tr: The transaction that is beginning
+        :return: A nonzero handle for the transaction
+        """
+        handle = (self.stream_id << 32) | self._next_handle
+        self._next_handle += 1
+        return handle
+
+    def end_tr(self, tr):
+        """
+        :param tr: The transaction that has ended
+        :return: None
+
+        Appends one row. Times that were never set are recorded as -1.
+        Fields missing from the transaction are recorded as 0.
+        """
+        self._append(
+            tr,
+            tr.get_transaction_id(),
+            tr._accept_time,
+            tr._begin_time,
+            tr._end_time,
+        )
+
+    def record(self, obj):
+        """
+        :param obj: The uvm_object to record
+        :return: None
+
+        Appends one row as ``end_tr()`` does. Objects that are not
+        transactions are recorded with -1 as their id and times.
+        """
+        if isinstance(obj, uvm_transaction):
+            self.end_tr(obj)
+        else:
+            self._append(obj, -1, None, None, None)
+
+    def _append(self, tr, tx_id, accept_time, begin_time, end_time):
+        columns = self._columns
+        row = self._count
+        columns["tx_id"][row] = tx_id
+        columns["accept_time"][row] = _time_or_missing(accept_time)
+        columns["begin_time"][row] = _time_or_missing(begin_time)
+        columns["end_time"][row] = _time_or_missing(end_time)
+        type_name = type(tr).__name__
+        type_id = self._type_ids.get(type_name)
+        if type_id is None:
+            type_id = self._type_ids[type_name] = len(self.type_names)
+            self.type_names.append(type_name)
+        columns["type_id"][row] = type_id
+        for field in self.fields:
+            columns[field][row] = getattr(tr, field, 0)
+        self._count = row + 1
+        self.rows_recorded += 1
+        if self._count == self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Write the rows recorded since the last flush to the database."""
+        if self._count:
+            self.db._write_chunk(
+                self, {name: col[: self._count] for name, col in self._columns.items()}
+            )
+            self._count = 0
+
+
+def _time_or_missing(time):
+    return -1 if time is None else int(time)
+
+
+class uvm_tr_database(uvm_object):
+    """
+    A columnar transaction database.
+
+    :param name: Object name
+    :param chunk_size: Rows buffered per stream before writing to disk
+
+    Example::
+
+        db = uvm_tr_database("tr_db")
+        db.open_db("run.sqlite")
+        stream = db.open_stream("bus", "uvm_test_top.env", fields=("addr",))
+        item.enable_recording(stream)
+        ...
+        db.close_db()
+        streams = load_tr_database("run.sqlite")
+    """
+
+    FORMATS = ("sqlite", "npy")
+
+    def __init__(self, name="uvm_tr_database", chunk_size=4096):
+        super().__init__(name)
+        self.chunk_size = chunk_size
+        self.path = None
+        self.format = None
+        self._conn = None
+        self._streams = []
+        self._npy_files = {}
+
+    # 16.4.2.2.1
+    def open_db(self, path, fmt=None, overwrite=False):
+        """
+        :param path: SQLite file, or directory for .npy files
+        :param fmt: "sqlite" or "npy". Defaults to "npy" if ``path`` has no
+            suffix and "sqlite" otherwise.
+        :param overwrite: Replace a database already recorded at ``path``
+        :raises UVMError: If ``path`` holds a database and ``overwrite`` is
+            False
+        :return: True
+        """
+        if self.is_open():
+            raise UVMError(f"{self.get_name()} is already open on {self.path}")
+        self.path = Path(path)
+        if fmt is None:
+            fmt = "sqlite" if self.path.suffix else "npy"
+        if fmt not in self.FORMATS:
+            raise UVMError(f"Unknown recording format {fmt}, use one of {self.FORMATS}")
+        if fmt == "sqlite":
+            existing = [self.path] if self.path.exists() else []
+        else:
+            existing = list(self.path.glob("stream_*"))
+        if existing and not overwrite:
+            raise UVMError(
+                f"{self.path} already holds a recorded database, "
+                "pass overwrite=True to replace it"
+            )
+        self.format = fmt
+        # Each run records a fresh database
+        for stale in existing:
+            stale.unlink()
+        if fmt == "sqlite":
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS streams "
+                "(stream_id INTEGER PRIMARY KEY, name TEXT, scope TEXT, "
+                "columns TEXT, type_names TEXT)"
+            )
+        else:
+            self.path.mkdir(parents=True, exist_ok=True)
+        return True
+
+    # 16.4.2.2.3
+    def is_open(self):
+        return self.format is not None
+
+    # 16.4.2.2.2
+    def close_db(self):
+        """Flush every stream and close the files. Returns True."""
+        if not self.is_open():
+            return True
+        for stream in self._streams:
+            stream.flush()
+            self._write_stream_info(stream)
+        if self._conn is not None:
+            self._conn.commit()
+            self._conn.close()
+            self._conn = None
+        for (stream_id, column), (npy, length) in self._npy_files.items():
+            typecode = self._streams[stream_id]._typecodes[column]
+            npy.seek(0)
+            npy.write(_npy_header(typecode, length))
+            npy.close()
+        self._npy_files = {}
+        self._streams = []
+        self.format = None
+        return True
+
+    # 16.4.2.3.1
+    def open_stream(self, name, scope="", fields=()):
+        """
+        :param name: Stream name
+        :param scope: Hierarchical scope of the stream
+        :param fields: Names of numeric transaction attributes to record,
+            or a dict mapping names to ``array`` typecodes (default "q")
+        :return: uvm_tr_stream
+        """
+        if not self.is_open():
+            raise UVMError(f"{self.get_name()} must be opened before open_stream()")
+        if not isinstance(fields, dict):
+            fields = dict.fromkeys(fields, "q")
+        clashes = set(fields) & set(_STANDARD_COLUMNS)
+        if clashes:
+            raise UVMError(f"Field names {sorted(clashes)} are reserved")
+        bad_names = [field for field in fields if not field.isidentifier()]
+        if bad_names:
+            raise UVMError(f"Field names {bad_names} must be identifiers")
+        stream = uvm_tr_stream(
+            name, self, len(self._streams), scope, fields, self.chunk_size
+        )
+        self._streams.append(stream)
+        if self.format == "sqlite":
+            column_defs = ", ".join(
+                f'"{col}" {"REAL" if tc in "fd" else "INTEGER"}'
+                for col, tc in stream._typecodes.items()
+            )
+            self._conn.execute(
+                f"CREATE TABLE stream_{stream.stream_id} ({column_defs})"
+            )
+            self._write_stream_info(stream)
+        return stream
+
+    def get_streams(self):
+        return list(self._streams)
+
+    def _write_stream_info(self, stream):
+        if self.format == "sqlite":
+            self._conn.execute(
+                "INSERT OR REPLACE INTO streams VALUES (?, ?, ?, ?, ?)",
+                (
+                    stream.stream_id,
+                    stream.get_name(),
+                    stream.scope,
+                    repr(stream._typecodes),
+                    repr(stream.type_names),
+                ),
+            )
+        else:
+            info = {
+                "name": stream.get_name(),
+                "scope": stream.scope,
+                "columns": stream._typecodes,
+                "type_names": stream.type_names,
+            }
+            (self.path / f"stream_{stream.stream_id}.txt").write_text(repr(info))
+
+    def _write_chunk(self, stream, columns):
+        if self.format == "sqlite":
+            names = list(columns)
+            self._conn.executemany(
+                f"INSERT INTO stream_{stream.stream_id} ({_sql_columns(names)}) "
+                f"VALUES ({', '.join('?' * len(names))})",
+                zip(*columns.values()),
+            )
+            return
+        for column, values in columns.items():
+            key = (stream.stream_id, column)
+            if key not in self._npy_files:
+                npy = open(self.path / f"stream_{stream.stream_id}_{column}.npy", "wb")
+                npy.write(_npy_header(values.typecode, 0))
+                self._npy_files[key] = (npy, 0)
+            npy, length = self._npy_files[key]
+            values.tofile(npy)
+            self._npy_files[key] = (npy, length + len(values))
+
+
+def load_tr_database(path):
+    """
+    :param path: A database written by ``uvm_tr_database``
+    :return: dict mapping stream name to a dict of columns
+
+    Each stream's dict holds the ``tx_id``, ``accept_time``, ``begin_time``,
+    ``end_time`` and ``type_id`` columns, a column per recorded field, and
+    ``type_names``, a list that ``type_id`` indexes. Columns are NumPy
+    arrays if NumPy is installed, else ``array.array``.
+    """
+    path = Path(path)
+    streams = {}
+    if path.is_dir():
+        for info_file in sorted(path.glob("stream_*.txt")):
+            info = ast.literal_eval(info_file.read_text())
+            stream = {
+                column: _read_npy(path / f"{info_file.stem}_{column}.npy")
+                if (path / f"{info_file.stem}_{column}.npy").exists()
+                else array(typecode)
+                for column, typecode in info["columns"].items()
+            }
+            stream["type_names"] = info["type_names"]
+            streams[info["name"]] = stream
+    else:
+        with sqlite3.connect(path) as conn:
+            infos = conn.execute(
+                "SELECT stream_id, name, columns, type_names FROM streams"
+            ).fetchall()
+            for stream_id, name, columns, type_names in infos:
+                typecodes = ast.literal_eval(columns)
+                rows = conn.execute(
+                    f"SELECT {_sql_columns(typecodes)} FROM stream_{stream_id}"
+                ).fetchall()
+                stream = {
+                    column: array(typecode, values)
+                    for (column, typecode), values in zip(
+                        typecodes.items(), zip(*rows) if rows else [()] * len(typecodes)
+                    )
+                }
+                stream["type_names"] = ast.literal_eval(type_names)
+                streams[name] = stream
+    if np is not None:
+        for stream in streams.values():
+            for column, values in stream.items():
+                if isinstance(values, array):
+                    stream[column] = np.frombuffer(values, dtype=values.typecode)
+    return streams
@@ -1,3 +1,4 @@
+import concurrent.futures
 import fnmatch
 import inspect
 import logging
@@ -17,8 +18,9 @@ logging.addLevelName(PYUVM_DEBUG, "PYUVM_DEBUG")
 
 
 if int(cocotb.__version__.split(".")[0]) >= 2:
-    from cocotb.task import current_task
+    from cocotb.task import bridge, current_task
 else:
+    from cocotb import external as bridge
 
     def current_task():
         return cocotb.scheduler._current_task
@@ -346,8 +348,12 @@ class UVMQueue(cocotb.queue.Queue):
         """Remove and return an item from the queue.
         If the queue is empty, wait until an item is available.
         """
+        event = None
         while self.empty():
-            event = Event()
+            if event is None:
+                event = Event()
+            else:
+                event.clear()
             self._getters.append((event, current_task()))
             await event.wait()
         return self.peek_nowait()
@@ -363,6 +369,138 @@ class UVMQueue(cocotb.queue.Queue):
         return item
 
 
+async def wait_any(fifos):
+    """
+    Wait until any of several FIFOs has an item and get it.
+
+    :param fifos: An iterable of ``UVMQueue`` or ``uvm_tlm_fifo`` objects
+    :return: (fifo, item) for the first FIFO with an item available
+
+    This lets one coroutine service many channels instead of spawning a
+    task per FIFO. FIFOs are checked in the order given, so earlier FIFOs
+    take priority when several are ready. While blocked, the caller holds a
+    single waiter registration shared by all the FIFOs. Items taken from a
+    ``uvm_tlm_fifo`` are written to its ``get_ap`` as with ``get()``.
+    """
+    sources = [
+        (fifo, fifo if isinstance(fifo, UVMQueue) else fifo.queue) for fifo in fifos
+    ]
+    if not sources:
+        raise ValueError("wait_any() needs at least one FIFO")
+    waiter = None
+    while True:
+        for fifo, queue in sources:
+            if not queue.empty():
+                item = queue.get_nowait() if fifo is queue else fifo.try_get()[1]
+                if waiter is not None:
+                    # Another FIFO may have woken us and consumed our waiter
+                    # while still holding an item; pass the wakeup on.
+                    for _, other in sources:
+                        if not other.empty():
+                            other._wakeup_next(other._getters)
+                return fifo, item
+        if waiter is None:
+            waiter = (Event(), current_task())
+        else:
+            waiter[0].clear()
+        for _, queue in sources:
+            queue._getters.append(waiter)
+        await waiter[0].wait()
+        for _, queue in sources:
+            # The FIFO that woke us has already consumed its registration
+            if waiter in queue._getters:
+                queue._getters.remove(waiter)
+
+
+class UVMThreadPool(metaclass=Singleton):
+    """
+    A shared ``concurrent.futures`` thread pool for blocking calls such as
+    reference models that call into C extensions and release the GIL.
+
+    Calling such a model directly from a ``run_phase`` stalls the cocotb
+    scheduler. Instead, submit it to the pool and await the result::
+
+        result = await UVMThreadPool().run(model.predict, item)
+
+    The call is awaited through a cocotb ``bridge`` (``external`` before
+    cocotb 2.0) thread that waits on its future. Other coroutines ready in
+    the same timestep keep running, then the scheduler sleeps until the call
+    completes rather than polling it. Simulation time does not advance: the
+    call has the same zero-time semantics as calling the model directly.
+
+    The pool is created on first use and shut down by ``uvm_root`` at the end
+    of the final phase.
+    """
+
+    def __init__(self):
+        self._max_workers = None
+        self._executor = None
+
+    def set_max_workers(self, max_workers):
+        """
+        :param max_workers: Number of worker threads, or None for the
+            ``concurrent.futures`` default
+        :return: None
+
+        A running pool is shut down (without waiting for outstanding calls)
+        and recreated with the new size on its next use.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, not {max_workers}")
+        self._max_workers = max_workers
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def get_max_workers(self):
+        """:return: The configured number of worker threads"""
+        return self._max_workers
+
+    def is_running(self):
+        """:return: True if the pool has been started and not shut down"""
+        return self._executor is not None
+
+    def submit(self, func, /, *args, **kwargs):
+        """
+        :param func: The blocking callable to run in a worker thread
+        :return: A ``concurrent.futures.Future`` for the call
+        """
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="pyuvm"
+            )
+        return self._executor.submit(func, *args, **kwargs)
+
+    async def wait(self, future):
+        """
+        :param future: A future returned by ``submit()``
+        :return: The result of the call. Exceptions raised in the worker
+            are re-raised here.
+        """
+        if not future.done():
+            await bridge(concurrent.futures.wait)((future,))
+        return future.result()
+
+    async def run(self, func, /, *args, **kwargs):
+        """
+        :param func: The blocking callable to run in a worker thread
+        :return: The result of ``func(*args, **kwargs)``
+        """
+        return await self.wait(self.submit(func, *args, **kwargs))
+
+    def shutdown(self, wait=True):
+        """
+        :param wait: Wait for running calls to finish
+        :return: None
+
+        Calls that have not started are cancelled. The pool is recreated
+        if it is used again.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+
 @lru_cache(maxsize=128)
 def _get_compiled_pattern(expr: str):
     if expr.startswith("/") and expr.endswith("/"):
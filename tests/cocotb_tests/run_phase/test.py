@@ -1,3 +1,5 @@
+import threading
+
 import cocotb
 from cocotb.triggers import Timer
 from cocotb.utils import get_sim_time
@@ -85,6 +87,43 @@ class SubComponent(uvm_component):
         assert get_sim_time("ms") >= 50
 
 
+class thread_pool_test(uvm_test):
+    """Awaits a blocking model call while another coroutine runs"""
+
+    async def run_phase(self):
+        self.raise_objection()
+        release = threading.Event()
+        ticks = []
+
+        def model(value):
+            # Blocks until the other coroutine has run
+            assert release.wait(timeout=10)
+            return value * 2
+
+        async def other():
+            ticks.append(get_sim_time("ms"))
+            release.set()
+
+        cocotb.start_soon(other())
+        start = get_sim_time("ms")
+        assert await UVMThreadPool().run(model, 21) == 42
+        assert ticks == [start]
+        assert get_sim_time("ms") == start
+
+        def fails():
+            raise ValueError("bad prediction")
+
+        try:
+            await UVMThreadPool().run(fails)
+        except ValueError as error:
+            assert str(error) == "bad prediction"
+        else:
+            raise AssertionError("The model exception was not raised")
+        future = UVMThreadPool().submit(sum, [1, 2, 3])
+        assert await UVMThreadPool().wait(future) == 6
+        self.drop_objection()
+
+
 @cocotb.test()
 async def run_test(dut):
     """Test basic run_phase operation with objection"""
@@ -124,3 +163,9 @@ async def test_sub_component_objections(_):
     regardless of the order in which they are raised or dropped.
     """
     await uvm_root().run_test(TopTest)
+
+
+@cocotb.test()
+async def test_thread_pool(_):
+    """Test that awaiting pool calls lets other coroutines run in zero time"""
+    await uvm_root().run_test(thread_pool_test)
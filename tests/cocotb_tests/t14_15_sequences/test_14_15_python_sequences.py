@@ -1,4 +1,6 @@
 import asyncio
+import tempfile
+from pathlib import Path
 
 import cocotb
 import uvm_unittest
@@ -250,6 +252,80 @@ class py1415_sequence_TestCase(uvm_unittest.uvm_TestCase):
         await uvm_root().run_test("SeqTest")
         self.assertTrue(DataHolder().datum)
 
+    async def test_record_and_replay_stimulus(self):
+        ObjectionHandler().run_phase_done_flag = None
+
+        class RecordingDriver(uvm_driver):
+            async def run_phase(self):
+                while True:
+                    op_item = await self.seq_item_port.get_next_item()
+                    DataHolder().dict_[self.cdb_get("mode")].append(op_item.data)
+                    op_item.data += 1
+                    self.seq_item_port.item_done()
+
+        class PollingDriver(uvm_driver):
+            async def run_phase(self):
+                while True:
+                    success, op_item = self.seq_item_port.try_next_item()
+                    await Timer(1)
+                    if success:
+                        DataHolder().dict_[self.cdb_get("mode")].append(op_item.data)
+                        op_item.data += 1
+                        self.seq_item_port.item_done()
+
+        class Seq(uvm_sequence):
+            async def body(self):
+                for data in range(5):
+                    op = SeqItem("op")
+                    await self.start_item(op)
+                    op.data = data * 3
+                    await self.finish_item(op)
+
+        class RecordTest(uvm_test):
+            def build_phase(self):
+                ConfigDB().set(None, "*", "mode", "live")
+                self.seqr = uvm_sequencer("seqr", self)
+                self.driver = DataHolder().datum("driver", self)
+                self.recorder = uvm_stimulus_recorder(
+                    "recorder", DataHolder().dict_["file"]
+                )
+
+            def connect_phase(self):
+                self.driver.seq_item_port.connect(self.seqr.seq_item_export)
+                self.seqr.set_stimulus_recorder(self.recorder)
+
+            async def run_phase(self):
+                self.raise_objection()
+                await Seq("seq").start(self.seqr)
+                self.recorder.close()
+                self.drop_objection()
+
+        class ReplayTest(uvm_test):
+            def build_phase(self):
+                ConfigDB().set(None, "*", "mode", "replay")
+                ConfigDB().set(None, "*", "replay_file", DataHolder().dict_["file"])
+                self.seqr = uvm_replay_sequencer("seqr", self)
+                self.driver = RecordingDriver("driver", self)
+
+            def connect_phase(self):
+                self.driver.seq_item_port.connect(self.seqr.seq_item_export)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # Polling drivers take items before their sequence fills them in
+            for driver_type in (RecordingDriver, PollingDriver):
+                DataHolder().datum = driver_type
+                DataHolder().dict_ = {
+                    "live": [],
+                    "replay": [],
+                    "file": Path(tmp_dir) / f"{driver_type.__name__}.pkl",
+                }
+                await uvm_root().run_test("RecordTest", keep_set={DataHolder})
+                await uvm_root().run_test("ReplayTest", keep_set={DataHolder})
+                self.assertEqual(DataHolder().dict_["live"], [0, 3, 6, 9, 12])
+                self.assertEqual(
+                    DataHolder().dict_["replay"], DataHolder().dict_["live"]
+                )
+
     async def test_seq_pre_post_body(self):
         ObjectionHandler().run_phase_done_flag = None
 
@@ -65,7 +65,7 @@ def test_memory_configure_registers_with_block_and_name_lookup():
     assert mem.get_parent() is block
     assert mem.get_block() is block
     assert mem.get_full_name() == "top.storage"
-    assert block.get_memories(uvm_hier_e.UVM_NO_HIER) == [mem]
+    assert block.get_memories(uvm_hier_e.UVM_NO_HIER) == (mem,)
     assert block.get_mem_by_name("storage") is mem
     assert mem._mam is None
 
@@ -79,8 +79,8 @@ def test_memory_enumeration_honors_hierarchy():
     local_mem.configure(top)
     child_mem.configure(child)
 
-    assert top.get_memories(uvm_hier_e.UVM_NO_HIER) == [local_mem]
-    assert top.get_memories() == [local_mem, child_mem]
+    assert top.get_memories(uvm_hier_e.UVM_NO_HIER) == (local_mem,)
+    assert top.get_memories() == (local_mem, child_mem)
     assert top.get_mem_by_name("nested") is child_mem
 
 
@@ -103,7 +103,7 @@ def test_configuring_memory_into_locked_block_is_rejected(caplog):
     with caplog.at_level(logging.ERROR, logger="RegModel"):
         mem.configure(block)
 
-    assert block.get_memories() == []
+    assert block.get_memories() == ()
     assert "Cannot add memory to a locked block model" in caplog.text
 
 
@@ -115,7 +115,7 @@ def test_configuring_same_memory_twice_is_rejected(caplog):
     with caplog.at_level(logging.ERROR, logger="RegModel"):
         mem.configure(block)
 
-    assert block.get_memories() == [mem]
+    assert block.get_memories() == (mem,)
     assert "has already been registered" in caplog.text
 
 
@@ -292,4 +292,4 @@ def test_duplicate_root_name_diagnostic_is_reported(monkeypatch, caplog):
     with caplog.at_level(logging.ERROR, logger="RegModel"):
         block.lock_model()
 
-    assert "There are 2 root register models" in caplog.text
+    assert "There are 2 root register models named 'duplicate'" in caplog.text
@@ -0,0 +1,119 @@
+import pytest
+from async_helpers import run_pytest_coro
+from test_uvm_reg_built_in_seqs import build, errors
+
+from pyuvm import uvm_door_e, uvm_reg_backdoor, uvm_status_e
+
+pytestmark = pytest.mark.usefixtures("initialize_pyuvm")
+
+OK = uvm_status_e.UVM_IS_OK
+NOT_OK = uvm_status_e.UVM_NOT_OK
+BACKDOOR = uvm_door_e.UVM_BACKDOOR
+
+# The 8x8 ram of the model is mapped at word address 0x10
+RAM = 0x10
+
+
+class RamBackdoor(uvm_reg_backdoor):
+    """Writes and reads whole bursts, counting them"""
+
+    def __init__(self, dut):
+        super().__init__("ram_backdoor")
+        self.dut = dut
+        self.bursts = 0
+
+    async def write(self, rw):
+        self.bursts += 1
+        for ii, value in enumerate(rw.get_value_array()):
+            self.dut.storage[RAM + rw.get_offset() + ii] = value
+        rw.set_status(OK)
+
+    async def read(self, rw):
+        self.bursts += 1
+        offset = RAM + rw.get_offset()
+        rw.set_value_array(
+            [self.dut.storage.get(offset + ii, 0) for ii in range(rw.get_value_size())]
+        )
+        rw.set_status(OK)
+
+
+def ram(blk):
+    return [blk.dut.storage.get(RAM + ii, 0) for ii in range(8)]
+
+
+def test_hex_image_is_loaded_by_frontdoor_bursts(tmp_path):
+    top, (a,), log = build("a")
+    image = tmp_path / "fw.hex"
+    image.write_text("// boot\n0_1 02 /* skipped\n 03 */\n@5 FF fe\n")
+
+    assert run_pytest_coro(a.ram.load_file(image, offset=1)) == OK
+    assert ram(a) == [0, 1, 2, 0, 0, 0, 0xFF, 0xFE]
+    assert log == ["a"] * 4
+
+    dump = tmp_path / "dump.hex"
+    assert run_pytest_coro(a.ram.dump_file(dump, offset=6)) == OK
+    assert dump.read_text() == "@6\nff\nfe\n"
+
+
+@pytest.mark.parametrize("suffix", [".bin", ".img"])
+def test_binary_image_round_trips_through_the_backdoor(tmp_path, suffix):
+    top, (a,), log = build("a")
+    backdoor = RamBackdoor(a.dut)
+    a.ram.set_backdoor(backdoor)
+    image = tmp_path / f"fw{suffix}"
+    image.write_bytes(bytes(range(0xA0, 0xA8)))
+    fmt = None if suffix == ".bin" else "bin"
+
+    assert run_pytest_coro(a.ram.load_file(image, path=BACKDOOR, fmt=fmt)) == OK
+    assert ram(a) == list(range(0xA0, 0xA8))
+    assert backdoor.bursts == 1
+
+    a.dut.storage[RAM + 3] = 0x33
+    dump = tmp_path / f"dump{suffix}"
+    assert run_pytest_coro(a.ram.dump_file(dump, path=BACKDOOR, fmt=fmt)) == OK
+    assert dump.read_bytes() == bytes([0xA0, 0xA1, 0xA2, 0x33, 0xA4, 0xA5, 0xA6, 0xA7])
+    assert log == []
+
+
+def test_load_file_reports_bad_images(tmp_path, caplog):
+    top, (a,), log = build("a")
+    image = tmp_path / "bad.hex"
+    image.write_text("01 xz 03\n")
+    assert run_pytest_coro(a.ram.load_file(image)) == NOT_OK
+    assert "Cannot load" in errors(caplog)
+    assert "'xz' is not a hex word" in errors(caplog)
+
+    image.write_text("@6 01 02 03\n")
+    assert run_pytest_coro(a.ram.load_file(image)) == NOT_OK
+    assert "does not fit in 'top.a.ram'" in errors(caplog)
+
+    # The 8-bit memory would drop the top bit
+    image.write_text("01 1ff\n")
+    assert run_pytest_coro(a.ram.load_file(image)) == NOT_OK
+    assert "Word 1ff is wider than 8 bits" in errors(caplog)
+    assert ram(a) == [0] * 8
+    assert log == []
+
+
+def test_block_images_are_addressed_in_the_map(tmp_path, caplog):
+    top, (a, b), log = build("a", "b")
+    image = tmp_path / "soc.hex"
+    image.write_text("@10 01 02\n@17 07\n")
+
+    assert run_pytest_coro(a.readmemh(image)) == OK
+    assert ram(a) == [1, 2, 0, 0, 0, 0, 0, 7]
+
+    dump = tmp_path / "dump.hex"
+    assert run_pytest_coro(a.writememh(dump)) == OK
+    assert dump.read_text() == "@10\n01\n02\n00\n00\n00\n00\n00\n07\n"
+
+    image.write_text("@0 01\n")
+    assert run_pytest_coro(a.readmemh(image)) == NOT_OK
+    assert "Address 0x0 of" in errors(caplog)
+    image.write_text("@10 100\n")
+    assert run_pytest_coro(a.readmemh(image)) == NOT_OK
+    assert "Word 100 is wider than 8 bits" in errors(caplog)
+    assert ram(a) == [1, 2, 0, 0, 0, 0, 0, 7]
+    # The top block has no map of its own
+    assert run_pytest_coro(top.readmemh(image)) == NOT_OK
+    assert "block 'top' has no address map" in errors(caplog)
@@ -2,6 +2,7 @@ import pytest
 from async_helpers import run_pytest_coro
 from test_uvm_reg_frontdoor_adapter import (
     AsyncNoopLock,
+    MockBusItem,
     MockSequencer,
     RecordingAdapter,
 )
@@ -112,15 +113,33 @@ def test_read_only_map_rights_reject_write_before_adapter():
     assert adapter.reg2bus_ops == []
 
 
-def test_wide_memory_rejects_unsupported_multibeat_access():
+def test_wide_memory_is_accessed_one_beat_per_bus_word():
     adapter = RecordingAdapter()
-    sequencer = MockSequencer()
+    sequencer = MockSequencer(read_data=0xCAFE_BABE)
     reg_map, mem = build_memory(n_bits=64, adapter=adapter, sequencer=sequencer)
 
-    status = run_pytest_coro(mem.write(0, 1, uvm_door_e.UVM_FRONTDOOR, reg_map))
+    status = run_pytest_coro(
+        mem.write(1, 0x1234_5678_9ABC, uvm_door_e.UVM_FRONTDOOR, reg_map)
+    )
 
-    assert status == uvm_status_e.UVM_NOT_OK
-    assert adapter.reg2bus_ops == []
+    assert status == uvm_status_e.UVM_IS_OK
+    assert [
+        (op.addr, op.data, op.n_bits, op.byte_en) for op in adapter.reg2bus_ops
+    ] == [
+        (0x1028, 0x5678_9ABC, 32, 0xF),
+        (0x102C, 0x1234, 32, 0xF),
+    ]
+
+    values = [0, 0]
+    status = run_pytest_coro(mem.burst_read(2, values, map=reg_map))
+    assert status == uvm_status_e.UVM_IS_OK
+    assert [op.addr for op in adapter.reg2bus_ops[2:]] == [
+        0x1030,
+        0x1034,
+        0x1038,
+        0x103C,
+    ]
+    assert values == [0xCAFE_BABE_CAFE_BABE] * 2
 
 
 def test_adapter_status_and_read_mask_are_propagated():
@@ -182,3 +201,95 @@ def test_write_only_map_rights_reject_read_before_adapter():
     assert status == uvm_status_e.UVM_NOT_OK
     assert value == 0
     assert adapter.reg2bus_ops == []
+
+
+class CountingLock(AsyncNoopLock):
+    def __init__(self):
+        self.acquired = 0
+
+    async def __aenter__(self):
+        self.acquired += 1
+        return self
+
+
+class BurstAdapter(RecordingAdapter):
+    def __init__(self):
+        super().__init__("burst_adapter")
+        self.supports_burst = True
+        self.bursts = []
+
+    def reg2bus_burst(self, rw_ops):
+        self.bursts.append([op.addr for op in rw_ops])
+        return MockBusItem("burst", rw_ops[0].kind, rw_ops[0].addr)
+
+    def bus2reg_burst(self, bus_item, rw_ops):
+        for ii, op in enumerate(rw_ops):
+            op.data = 0x100 + ii
+            op.status = bus_item.status
+
+
+def test_burst_write_and_read_are_pipelined_under_one_lock():
+    adapter = RecordingAdapter()
+    sequencer = MockSequencer(read_data=0x1ABCD, use_response=True)
+    adapter.provides_responses = True
+    reg_map, mem = build_memory(adapter=adapter, sequencer=sequencer)
+    mem._atomic = CountingLock()
+
+    status = run_pytest_coro(
+        mem.burst_write(1, [0x11, 0x22, 0x33], uvm_door_e.UVM_FRONTDOOR, reg_map)
+    )
+    values = [None] * 2
+    read_status = run_pytest_coro(
+        mem.burst_read(0, values, uvm_door_e.UVM_FRONTDOOR, reg_map)
+    )
+
+    assert status == read_status == uvm_status_e.UVM_IS_OK
+    assert values == [0xABCD, 0xABCD]
+    assert mem._atomic.acquired == 2
+    addrs = [op.addr for op in adapter.reg2bus_ops]
+    assert addrs == [0x1022, 0x1024, 0x1026, 0x1020, 0x1022]
+    assert [op.data for op in adapter.reg2bus_ops[:3]] == [0x11, 0x22, 0x33]
+    assert {op.kind for op in adapter.reg2bus_ops[3:]} == {uvm_access_e.UVM_READ}
+    assert len(sequencer.response_txn_ids) == 5
+
+
+def test_burst_uses_adapter_burst_item_when_supported():
+    adapter = BurstAdapter()
+    sequencer = MockSequencer(read_status=uvm_status_e.UVM_HAS_X)
+    reg_map, mem = build_memory(adapter=adapter, sequencer=sequencer)
+
+    values = [0] * 4
+    status = run_pytest_coro(mem.burst_read(0, values, map=reg_map))
+
+    assert status == uvm_status_e.UVM_HAS_X
+    assert values == [0x100, 0x101, 0x102, 0x103]
+    assert adapter.bursts == [[0x1020, 0x1022, 0x1024, 0x1026]]
+    assert len(sequencer.started) == 1
+    assert adapter.reg2bus_ops == []
+
+
+def test_burst_adapter_must_implement_burst_conversion():
+    adapter = RecordingAdapter()
+    adapter.supports_burst = True
+    sequencer = MockSequencer()
+    reg_map, mem = build_memory(adapter=adapter, sequencer=sequencer)
+
+    with pytest.raises(NotImplementedError, match="does not implement reg2bus_burst"):
+        run_pytest_coro(mem.burst_read(0, [0] * 2, map=reg_map))
+    with pytest.raises(NotImplementedError, match="does not implement bus2reg_burst"):
+        adapter.bus2reg_burst(None, [])
+    assert sequencer.started == []
+
+
+@pytest.mark.parametrize(("offset", "length"), [(2, 3), (0, 0)])
+def test_burst_outside_memory_does_not_reach_adapter(offset, length):
+    adapter = RecordingAdapter()
+    sequencer = MockSequencer()
+    reg_map, mem = build_memory(adapter=adapter, sequencer=sequencer)
+
+    status = run_pytest_coro(
+        mem.burst_write(offset, [1] * length, uvm_door_e.UVM_FRONTDOOR, reg_map)
+    )
+
+    assert status == uvm_status_e.UVM_NOT_OK
+    assert adapter.reg2bus_ops == []
@@ -0,0 +1,218 @@
+import random
+
+import pytest
+from async_helpers import run_pytest_coro
+from test_uvm_reg_frontdoor_adapter import AsyncNoopLock
+
+from pyuvm import (
+    uvm_door_e,
+    uvm_endianness_e,
+    uvm_mem,
+    uvm_mem_mam,
+    uvm_mem_mam_cfg,
+    uvm_mem_mam_policy,
+    uvm_reg_backdoor,
+    uvm_reg_block,
+    uvm_status_e,
+)
+
+GREEDY = uvm_mem_mam.alloc_mode_e.GREEDY
+THRIFTY = uvm_mem_mam.alloc_mode_e.THRIFTY
+
+
+class ArrayBackdoor(uvm_reg_backdoor):
+    def __init__(self, size):
+        super().__init__("array")
+        self.data = [0] * size
+
+    async def write(self, rw):
+        offset = rw.get_offset()
+        for ii, value in enumerate(rw.get_value_array()):
+            self.data[offset + ii] = value
+        rw.set_status(uvm_status_e.UVM_IS_OK)
+
+    async def read(self, rw):
+        offset = rw.get_offset()
+        rw.set_value_array(self.data[offset : offset + rw.get_value_size()])
+        rw.set_status(uvm_status_e.UVM_IS_OK)
+
+
+def build_memory(size=64, n_bits=32):
+    block = uvm_reg_block("blk")
+    reg_map = block.create_map("map", 0, 4, uvm_endianness_e.UVM_LITTLE_ENDIAN, True)
+    mem = uvm_mem("ram", size, n_bits)
+    mem.configure(block)
+    reg_map.add_mem(mem, 0)
+    block.lock_model()
+    mem._atomic = AsyncNoopLock()
+    backdoor = ArrayBackdoor(size)
+    mem.set_backdoor(backdoor)
+    return mem, backdoor
+
+
+def spans(mam):
+    spans = []
+    region = mam.for_each(reset=True)
+    while region is not None:
+        spans.append((region.get_start_offset(), region.get_end_offset()))
+        region = mam.for_each()
+    return spans
+
+
+def test_memory_creates_its_manager_on_first_use():
+    mem, _ = build_memory(size=16, n_bits=20)
+    assert mem._mam is None
+    mam = mem.mam
+    assert mem.mam is mam
+    assert mam.get_memory() is mem
+    cfg = mam.reconfigure()
+    assert (cfg.n_bytes, cfg.start_offset, cfg.end_offset) == (3, 0, 15)
+    assert cfg.mode == GREEDY
+
+
+def test_greedy_takes_new_locations_and_thrifty_reuses_released_ones():
+    mam = uvm_mem_mam("mam", uvm_mem_mam_cfg(4, 0, 99))
+    first = mam.request_region(40)
+    second = mam.request_region(5)
+    assert (first.get_start_offset(), first.get_end_offset()) == (0, 9)
+    assert (second.get_len(), second.get_n_bytes()) == (2, 8)
+    assert second.get_start_offset() == 10
+
+    first.release_region()
+    assert mam.request_region(4).get_start_offset() == 12
+
+    mam.reconfigure(uvm_mem_mam_cfg(4, 0, 99, THRIFTY))
+    assert mam.request_region(8).get_start_offset() == 0
+    # The smallest free interval that fits: [2:9], not [13:99]
+    assert mam.request_region(16).get_start_offset() == 2
+    assert spans(mam) == [(10, 11), (12, 12), (0, 1), (2, 5)]
+
+
+def test_policy_alignment_and_bounds():
+    mam = uvm_mem_mam("mam", uvm_mem_mam_cfg(1, 0x10, 0xFF))
+    mam.request_region(3)
+    policy = uvm_mem_mam_policy()
+    policy.alignment = 0x10
+    region = mam.request_region(0x20, policy)
+    assert region.get_start_offset() == policy.start_offset == 0x20
+    assert list(policy.in_use) == [mam.for_each(reset=True), region]
+
+    policy.min_offset = 0x80
+    policy.max_offset = 0x9F
+    assert mam.request_region(0x20, policy).get_start_offset() == 0x80
+    assert mam.request_region(1, policy) is None
+
+
+def test_released_regions_are_merged(caplog):
+    mam = uvm_mem_mam("mam", uvm_mem_mam_cfg(1, 0, 29, THRIFTY))
+    regions = [mam.request_region(10) for _ in range(3)]
+    assert mam.request_region(1) is None
+    assert "Unable to find a free region" in caplog.text
+
+    regions[0].release_region()
+    regions[2].release_region()
+    regions[1].release_region()
+    assert mam.request_region(30).get_len() == 30
+    mam.release_region(regions[1])
+    assert "Attempting to release unallocated region ['ha:'h13]" in caplog.text
+
+    mam.release_all_regions()
+    assert spans(mam) == []
+    assert mam._free == [0]
+
+
+def test_reserve_region_errors(caplog):
+    mam = uvm_mem_mam("mam", uvm_mem_mam_cfg(2, 4, 19))
+    assert mam.reserve_region(8, 8).get_end_offset() == 11
+    assert mam.reserve_region(8, 0) is None
+    assert mam.reserve_region(2, 2) is None
+    assert mam.reserve_region(18, 6) is None
+    assert mam.reserve_region(6, 6) is None
+    assert "overlaps with ['h8:'hb]" in caplog.text
+    assert mam.reserve_region(4, 8) is not None
+
+    assert mam.reconfigure(uvm_mem_mam_cfg(2, 6, 19)).start_offset == 4
+    assert "outside of the managed address range" in caplog.text
+    assert mam.reconfigure(uvm_mem_mam_cfg(4, 4, 19)).n_bytes == 2
+    assert mam.reconfigure(uvm_mem_mam_cfg(2, 0, 39)).end_offset == 19
+    assert mam.request_region(2).get_start_offset() == 12
+
+
+def test_free_list_matches_a_reference_model():
+    rng = random.Random(7)
+    size = 512
+    for mode in (GREEDY, THRIFTY):
+        mam = uvm_mem_mam("mam", uvm_mem_mam_cfg(1, 0, size - 1, mode))
+        used = [False] * size
+        live = []
+        for _ in range(2000):
+            if live and rng.random() < 0.45:
+                region = live.pop(rng.randrange(len(live)))
+                region.release_region()
+                for ii in range(region.get_start_offset(), region.get_end_offset() + 1):
+                    used[ii] = False
+                continue
+            region = mam.request_region(rng.randint(1, 24))
+            if region is None:
+                continue
+            span = range(region.get_start_offset(), region.get_end_offset() + 1)
+            assert not any(used[ii] for ii in span)
+            for ii in span:
+                used[ii] = True
+            live.append(region)
+        free = [(start, mam._free_end[start]) for start in mam._free]
+        expected = []
+        for ii, in_use in enumerate(used):
+            if in_use:
+                continue
+            if expected and expected[-1][1] == ii - 1:
+                expected[-1] = (expected[-1][0], ii)
+            else:
+                expected.append((ii, ii))
+        assert free == expected
+        assert sorted(mam._free_by_len) == mam._free_by_len
+        assert len(mam._free_by_len) == len(free)
+
+
+def test_region_accesses_are_relative_to_the_region(caplog):
+    mem, backdoor = build_memory()
+    mem.mam.reserve_region(0, 16)
+    region = mem.mam.request_region(16)
+    assert region.get_start_offset() == 4
+    backdoor_door = uvm_door_e.UVM_BACKDOOR
+
+    assert run_pytest_coro(region.write(1, 0x11, backdoor_door)) == (
+        uvm_status_e.UVM_IS_OK
+    )
+    assert run_pytest_coro(region.read(1, backdoor_door)) == (
+        uvm_status_e.UVM_IS_OK,
+        0x11,
+    )
+    status = run_pytest_coro(region.burst_write(1, [0x22, 0x33, 0x44], backdoor_door))
+    assert status == uvm_status_e.UVM_IS_OK
+    assert backdoor.data[4:8] == [0, 0x22, 0x33, 0x44]
+    data = [0] * 4
+    status = run_pytest_coro(region.burst_read(0, data, backdoor_door))
+    assert (status, data) == (uvm_status_e.UVM_IS_OK, [0, 0x22, 0x33, 0x44])
+    assert run_pytest_coro(region.poke(3, 0x55)) == uvm_status_e.UVM_IS_OK
+    assert run_pytest_coro(region.peek(3)) == (uvm_status_e.UVM_IS_OK, 0x55)
+
+    assert run_pytest_coro(region.write(4, 1, backdoor_door)) == (
+        uvm_status_e.UVM_NOT_OK
+    )
+    status = run_pytest_coro(region.burst_write(2, [1, 2, 3], backdoor_door))
+    assert status == uvm_status_e.UVM_NOT_OK
+    assert "outside of the allocated region" in caplog.text
+    assert backdoor.data[8] == 0
+
+
+@pytest.mark.parametrize("mode", [GREEDY, THRIFTY])
+def test_many_live_regions(mode):
+    n_regions = 20000
+    mam = uvm_mem_mam("mam", uvm_mem_mam_cfg(1, 0, 4 * n_regions - 1, mode))
+    regions = [mam.request_region(3) for _ in range(n_regions)]
+    for region in regions[::2]:
+        region.release_region()
+    regions = [mam.request_region(3) for _ in range(n_regions // 2)]
+    assert None not in regions
+    assert len(mam._in_use) == n_regions
@@ -1,4 +1,5 @@
 import logging
+import time
 
 import pytest
 
@@ -11,6 +12,7 @@ from pyuvm import (
 from pyuvm._reg.uvm_reg_map import (
     _first_progression_overlap,
     _uvm_mem_address_set,
+    _uvm_mem_interval_index,
 )
 
 
@@ -458,3 +460,98 @@ def test_single_element_map_descriptor_and_register_remap_overlap(caplog):
     assert descriptor.element_strides == (0,)
     assert descriptor.contains(0x10)
     assert "overlaps with memory" in caplog.text
+
+
+def test_interval_index_resolves_many_memories():
+    block, reg_map = make_map()
+    mems = [
+        add_memory(block, reg_map, f"mem{ii}", size=4, n_bits=32, offset=0x100 * ii)
+        for ii in reversed(range(50))
+    ]
+    block.lock_model()
+
+    for mem in mems:
+        first = reg_map.get_mem_map_info(mem).addr[0]
+        assert reg_map.get_mem_by_offset(first) is mem
+        assert reg_map.get_mem_by_offset(first + 0xC) is mem
+        assert reg_map.get_mem_by_offset(first + 0x10) is None
+    assert reg_map.get_mem_by_offset(-1) is None
+
+
+def test_interval_index_checks_every_candidate_and_prefers_latest():
+    mem = uvm_mem("mem", 4, 8)
+    wide = _uvm_mem_address_set.create(mem, [0x0], [0x10])
+    inner = _uvm_mem_address_set.create(mem, [0x8], [0x9])
+    late = _uvm_mem_address_set.create(mem, [0x20], [0x21])
+    index = _uvm_mem_interval_index([late, wide, inner])
+
+    assert index.find(0x10) is wide
+    assert index.find(0x9) is inner
+    assert index.find(0xC) is None
+    assert _uvm_mem_interval_index([wide, late]).find(0x20) is late
+    assert _uvm_mem_interval_index([late, wide]).find(0x20) is wide
+
+
+def test_get_element_by_offset_returns_register_or_memory(caplog):
+    block, reg_map = make_map()
+    mem = add_memory(block, reg_map, size=2, n_bits=32, offset=0x10)
+    reg = uvm_reg("reg", 32)
+    reg.configure(block)
+    reg_map.add_reg(reg, 0x30)
+
+    with caplog.at_level(logging.ERROR, logger="RegModel"):
+        assert reg_map.get_element_by_offset(0x30) is None
+    assert caplog.text.count("is not locked") == 1
+
+    block.lock_model()
+    assert reg_map.get_element_by_offset(0x30) is reg
+    assert reg_map.get_element_by_offset(0x14) is mem
+    assert reg_map.get_element_by_offset(0x20) is None
+
+
+def test_overlaps_are_reported_in_the_order_memories_are_added(caplog):
+    top, root_map = make_map("top")
+    child = uvm_reg_block("child")
+    child.configure(top)
+    child_map = child.create_map("child_map", 0, 4, uvm_endianness_e.UVM_LITTLE_ENDIAN)
+    root_map.add_submap(child_map, 0x100)
+    add_memory(child, child_map, "low", size=4, n_bits=32, offset=0x0)
+    add_memory(top, root_map, "wide", size=16, n_bits=32, offset=0x0)
+    add_memory(top, root_map, "high", size=4, n_bits=32, offset=0x10C)
+    reg = uvm_reg("reg", 32)
+    reg.configure(top)
+    root_map.add_reg(reg, 0x104)
+
+    with caplog.at_level(logging.WARNING, logger="RegModel"):
+        top.lock_model()
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages == [
+        (
+            "In map 'top.child.child_map' memory 'top.child.low' overlaps "
+            "register 'top.reg' at 0x104"
+        ),
+        "In map 'top.map' memory 'top.high' overlaps memory 'top.child.low' at 0x10C",
+    ]
+
+
+def test_lock_time_of_a_large_model(record_property):
+    n_regs = 100_000
+    n_mems = 1_000
+    block, reg_map = make_map("large")
+    for ii in range(n_regs):
+        reg = uvm_reg(f"reg{ii}", 32)
+        reg.configure(block)
+        reg_map.add_reg(reg, 4 * ii)
+    for ii in range(n_mems):
+        add_memory(block, reg_map, f"mem{ii}", 16, 32, 4 * n_regs + 64 * ii)
+
+    start = time.perf_counter()
+    block.lock_model()
+    lock_time = time.perf_counter() - start
+    record_property("lock_time", lock_time)
+
+    assert reg_map.get_mem_by_offset(4 * n_regs + 64 * 500 + 8).get_name() == "mem500"
+    assert reg_map.get_reg_by_offset(4 * (n_regs - 1)).get_name() == f"reg{n_regs - 1}"
+    # Quadratic overlap checks took minutes on this model
+    assert lock_time < 30
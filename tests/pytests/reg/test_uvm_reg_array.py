@@ -0,0 +1,129 @@
+import tracemalloc
+
+import pytest
+
+from pyuvm import (
+    uvm_endianness_e,
+    uvm_predict_e,
+    uvm_reg,
+    uvm_reg_block,
+    uvm_reg_field,
+)
+
+pytestmark = pytest.mark.usefixtures("initialize_pyuvm")
+
+
+class ChannelReg(uvm_reg):
+    """[0] RW enable, [7:4] RO state, [31:16] W1C count"""
+
+    def __init__(self, name):
+        super().__init__(name, 32)
+        self.en = uvm_reg_field("en")
+        self.en.configure(self, 1, 0, "RW", False, 0x1, True, False, False)
+        self.state = uvm_reg_field("state")
+        self.state.configure(self, 4, 4, "RO", False, 0x0, True, False, False)
+        self.count = uvm_reg_field("count")
+        self.count.configure(self, 16, 16, "W1C", False, 0x0, True, False, False)
+
+
+def bytes_per_register(size, array):
+    tracemalloc.start()
+    try:
+        if array:
+            blk = channels(size)
+        else:
+            blk = uvm_reg_block("soc")
+            reg_map = blk.create_map(
+                "map", 0x100, 2, uvm_endianness_e.UVM_LITTLE_ENDIAN, False
+            )
+            for index in range(size):
+                reg = ChannelReg(f"ch{index}")
+                reg.configure(blk)
+                reg_map.add_reg(reg, 2 * index)
+        blk.lock_model()
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return allocated / size
+
+
+def channels(size=4, **kwargs):
+    blk = uvm_reg_block("soc")
+    # 16-bit word-addressed bus: a channel register takes two addresses
+    blk.create_map("map", 0x100, 2, uvm_endianness_e.UVM_LITTLE_ENDIAN, False)
+    blk.ch = blk.create_reg_array("ch", ChannelReg, size, **kwargs)
+    return blk
+
+
+def test_elements_are_mapped_at_their_stride():
+    blk = channels(offset=0x10)
+    blk.lock_model()
+
+    assert [reg.get_name() for reg in blk.ch] == ["ch[0]", "ch[1]", "ch[2]", "ch[3]"]
+    assert [reg.get_address() for reg in blk.ch] == [0x110, 0x112, 0x114, 0x116]
+    assert blk.get_reg_by_name("ch[2]") is blk.ch[2]
+    # Arrays do not change the field storage of the block
+    assert not blk.get_array_storage()
+
+    blk = channels(size=2, stride=8, rights="RO")
+    blk.lock_model()
+    assert [reg.get_address() for reg in blk.ch] == [0x100, 0x108]
+    assert blk.ch[1].en.get_access(blk.get_default_map()) == "RO"
+
+
+def test_elements_share_the_layout_of_their_fields():
+    blk = channels()
+    blk.lock_model()
+    first, *others = blk.ch
+
+    for reg in others:
+        for field, shared in zip(reg.get_fields(), first.get_fields()):
+            assert field._reset is shared._reset
+            assert field._policies is shared._policies
+    assert "_fields" not in vars(first)
+    assert "_reset" not in vars(first.en)
+    # The lock of an element is only created when it is accessed
+    assert first._atomic_lock is None
+
+
+@pytest.mark.parametrize("array_storage", [False, True])
+def test_elements_keep_their_own_state(array_storage):
+    blk = channels()
+    blk.set_array_storage(array_storage)
+    blk.lock_model()
+    assert blk.get_array_storage() == array_storage
+    blk.reset()
+    ch0, ch1, ch2, _ = blk.ch
+
+    ch1.en.set_reset(0, "HARD")
+    ch2.count.set_access("RW")
+    blk.reset("HARD")
+
+    assert [reg.en.get_reset() for reg in blk.ch] == [1, 0, 1, 1]
+    assert [reg.get_mirrored_value() for reg in blk.ch] == [1, 0, 1, 1]
+    assert [reg.count.get_access() for reg in blk.ch] == ["W1C", "W1C", "RW", "W1C"]
+    ch2.count.predict(0xFFFF, kind=uvm_predict_e.UVM_PREDICT_WRITE)
+    ch0.count.predict(0xFFFF, kind=uvm_predict_e.UVM_PREDICT_WRITE)
+    assert ch2.count.get_mirrored_value() == 0xFFFF
+    assert ch0.count.get_mirrored_value() == 0
+    assert ch1.en._reset is not ch0.en._reset
+    assert ch0.en._reset is blk.ch[3].en._reset
+
+
+def test_locked_blocks_reject_arrays(caplog):
+    blk = channels()
+    blk.lock_model()
+    assert blk.create_reg_array("late", ChannelReg, 2) == ()
+    assert "Cannot add register to a locked block model" in caplog.text
+
+
+def test_elements_take_less_memory_than_separate_registers():
+    # The first models fill the caches shared by all the models
+    bytes_per_register(16, False)
+    bytes_per_register(16, True)
+    separate = bytes_per_register(256, False)
+    element = bytes_per_register(256, True)
+    # Elements are still complete registers and fields, sharing only the
+    # reset values and compiled access policies of their fields: about
+    # 2.9 kB per register of 3 fields against 4.1 kB for separate registers
+    assert element < 0.8 * separate
@@ -0,0 +1,318 @@
+import cocotb
+import pytest
+from async_helpers import run_pytest_coro
+from cocotb.handle import Force, Release
+from test_uvm_reg_frontdoor_adapter import AsyncNoopLock
+
+from pyuvm import (
+    uvm_door_e,
+    uvm_endianness_e,
+    uvm_hdl_check_path,
+    uvm_hdl_deposit,
+    uvm_hdl_force,
+    uvm_hdl_path_slice,
+    uvm_hdl_read,
+    uvm_hdl_release,
+    uvm_mem,
+    uvm_reg,
+    uvm_reg_backdoor,
+    uvm_reg_block,
+    uvm_reg_field,
+    uvm_status_e,
+)
+from pyuvm._reg import uvm_hdl
+from pyuvm._reg.uvm_hdl import _Deposit
+
+
+class FakeValue(int):
+    """A resolvable value, like a LogicArray without X or Z bits."""
+
+    is_resolvable = True
+
+
+class FakeXValue(int):
+    is_resolvable = False
+
+    def resolve(self, how):
+        return int(self)
+
+    @property
+    def binstr(self):
+        # What a cocotb 1.x BinaryValue has instead of resolve()
+        return "xz" + format(int(self), "06b")
+
+
+class FakeSignal:
+    def __init__(self, name, value=0):
+        self._name = name
+        self.writes = []
+        self.forced = False
+        self._value = FakeValue(value)
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, action):
+        self.writes.append(action)
+        if isinstance(action, Release):
+            self.forced = False
+            return
+        self.forced = isinstance(action, Force)
+        self._value = FakeValue(action.value)
+
+
+class FakeScope:
+    """cocotb 2.x hierarchy object: name lookup raises KeyError, indexing
+    IndexError."""
+
+    def __init__(self, name, children=()):
+        self._name = name
+        self.lookups = 0
+        self._children = {child._name: child for child in children}
+
+    def __getitem__(self, key):
+        self.lookups += 1
+        if isinstance(key, int):
+            raise IndexError(key)
+        return self._children[key]
+
+
+class FakeScope1(FakeScope):
+    """cocotb 1.x hierarchy object: names are looked up with _id(), which
+    raises AttributeError, and cannot be indexed."""
+
+    def __getitem__(self, key):
+        raise TypeError("'HierarchyObject' object is not subscriptable")
+
+    def _id(self, name, extended=True):
+        self.lookups += 1
+        try:
+            return self._children[name]
+        except KeyError:
+            raise AttributeError(
+                f"{self._name} contains no object named {name}"
+            ) from None
+
+
+class FakeArray:
+    def __init__(self, name, size):
+        self._name = name
+        self._elements = [FakeSignal(f"{name}[{ii}]") for ii in range(size)]
+
+    def __getitem__(self, index):
+        return self._elements[index]
+
+
+class CtrlReg(uvm_reg):
+    def __init__(self, name="ctrl"):
+        super().__init__(name, 16)
+        self.enable = uvm_reg_field("enable")
+        self.irq = uvm_reg_field("irq")
+        self.count = uvm_reg_field("count")
+        self.enable.configure(self, 4, 0, "RW", False, 0, True, False, False)
+        self.irq.configure(self, 4, 4, "W1C", False, 0, True, False, False)
+        self.count.configure(self, 8, 8, "RC", False, 0, True, False, False)
+
+
+@pytest.fixture(params=[(1, 9), (2, 0)], ids=["cocotb1", "cocotb2"])
+def dut(request, monkeypatch):
+    monkeypatch.setattr(uvm_hdl, "cocotb_version_info", request.param)
+    scope = FakeScope1 if request.param < (2, 0) else FakeScope
+    regs = scope(
+        "u_regs",
+        [
+            FakeSignal("ctrl_q"),
+            FakeSignal("split_lo"),
+            FakeSignal("split_hi"),
+            FakeArray("ram", 8),
+        ],
+    )
+    top = scope("top", [regs])
+    monkeypatch.setattr(cocotb, "top", top, raising=False)
+    return top
+
+
+def build_model(block_path="u_regs"):
+    block = uvm_reg_block("blk")
+    block.configure(None, block_path)
+    reg_map = block.create_map("map", 0, 4, uvm_endianness_e.UVM_LITTLE_ENDIAN, True)
+    reg = CtrlReg()
+    reg.configure(block, hdl_path="ctrl_q")
+    reg_map.add_reg(reg, 0)
+    mem = uvm_mem("ram", 8, 16)
+    mem.configure(block, "ram")
+    reg_map.add_mem(mem, 0x100)
+    block.lock_model()
+    reg._atomic = AsyncNoopLock()
+    mem._atomic = AsyncNoopLock()
+    return block, reg, mem
+
+
+def signal(top, name):
+    return top._children["u_regs"]._children[name]
+
+
+def test_uvm_hdl_routines_resolve_paths_from_toplevel(dut):
+    assert uvm_hdl_check_path("top.u_regs.ctrl_q")
+    assert uvm_hdl_check_path("u_regs.ram[3]")
+    assert not uvm_hdl_check_path("u_regs.missing")
+    assert not uvm_hdl_check_path("u_regs.ram[9]")
+
+    assert uvm_hdl_deposit("u_regs.ctrl_q", 0x12)
+    assert isinstance(signal(dut, "ctrl_q").writes[-1], _Deposit)
+    assert uvm_hdl_read("top.u_regs.ctrl_q") == (uvm_status_e.UVM_IS_OK, 0x12)
+    assert uvm_hdl_force("u_regs.ctrl_q", 0x34)
+    assert signal(dut, "ctrl_q").forced
+    assert uvm_hdl_release("u_regs.ctrl_q")
+    assert not signal(dut, "ctrl_q").forced
+    assert uvm_hdl_read("u_regs.missing") == (uvm_status_e.UVM_NOT_OK, 0)
+    assert not uvm_hdl_deposit("u_regs.missing", 1)
+
+    signal(dut, "ctrl_q")._value = FakeXValue(0x5)
+    assert uvm_hdl_read("u_regs.ctrl_q") == (uvm_status_e.UVM_HAS_X, 0x5)
+
+
+def test_full_hdl_paths_prefix_block_paths():
+    block, reg, mem = build_model()
+    paths = []
+    reg.get_full_hdl_path(paths)
+    assert [[s.path for s in concat.get_slices()] for concat in paths] == [
+        ["u_regs.ctrl_q"]
+    ]
+    assert reg.has_hdl_path()
+    assert not reg.has_hdl_path("GATE")
+    kinds = []
+    mem.get_hdl_path_kinds(kinds)
+    assert kinds == ["RTL"]
+
+    block.set_hdl_path_root("tb.dut")
+    paths = []
+    mem.get_full_hdl_path(paths)
+    assert paths[0].get_slices()[0].path == "tb.dut.ram"
+
+    reg.clear_hdl_path("ALL")
+    assert not reg.has_hdl_path()
+
+
+def test_reg_poke_and_peek_use_cached_handles(dut):
+    _, reg, _ = build_model()
+    ctrl_q = signal(dut, "ctrl_q")
+
+    assert run_pytest_coro(reg.poke(0x10FF5)) == uvm_status_e.UVM_IS_OK
+    assert ctrl_q.value == 0xFF5
+    assert isinstance(ctrl_q.writes[-1], _Deposit)
+    assert reg.get_mirrored_value() == 0xFF5
+
+    lookups = dut.lookups
+    ctrl_q._value = FakeValue(0xA5A)
+    assert run_pytest_coro(reg.peek()) == (uvm_status_e.UVM_IS_OK, 0xA5A)
+    assert reg.get_mirrored_value() == 0xA5A
+    # Peeking does not clear the read-to-clear count field
+    assert ctrl_q.value == 0xA5A
+
+    status, value = run_pytest_coro(reg.count.peek())
+    assert (status, value) == (uvm_status_e.UVM_IS_OK, 0xA)
+    assert run_pytest_coro(reg.enable.poke(0x3)) == uvm_status_e.UVM_IS_OK
+    assert ctrl_q.value == 0xA53
+    assert dut.lookups == lookups
+
+
+def test_reg_backdoor_write_and_read_mimic_field_side_effects(dut):
+    _, reg, _ = build_model()
+    signal(dut, "ctrl_q")._value = FakeValue(0x7F0)
+
+    status = run_pytest_coro(reg.write(0x3A, uvm_door_e.UVM_BACKDOOR))
+
+    assert status == uvm_status_e.UVM_IS_OK
+    # enable is written, irq bits written with 1 are cleared, count is kept
+    assert signal(dut, "ctrl_q").value == 0x7CA
+    assert reg.get_mirrored_value() == 0x7CA
+
+    status, value = run_pytest_coro(reg.read(uvm_door_e.UVM_BACKDOOR))
+
+    assert (status, value) == (uvm_status_e.UVM_IS_OK, 0x7CA)
+    assert signal(dut, "ctrl_q").value == 0x0CA
+
+
+def test_reg_slices_and_copies(dut, caplog):
+    block, reg, _ = build_model()
+    reg.clear_hdl_path()
+    reg.add_hdl_path(
+        [
+            uvm_hdl_path_slice("split_lo", 0, 8),
+            uvm_hdl_path_slice("split_hi", 8, 8),
+        ]
+    )
+
+    assert run_pytest_coro(reg.poke(0xBEEF)) == uvm_status_e.UVM_IS_OK
+    assert signal(dut, "split_lo").value == 0xEF
+    assert signal(dut, "split_hi").value == 0xBE
+    assert run_pytest_coro(reg.peek()) == (uvm_status_e.UVM_IS_OK, 0xBEEF)
+
+    reg.add_hdl_path_slice("ctrl_q", -1, -1, first=True)
+    assert run_pytest_coro(reg.poke(0x1234)) == uvm_status_e.UVM_IS_OK
+    assert signal(dut, "ctrl_q").value == 0x1234
+    signal(dut, "ctrl_q")._value = FakeValue(0x4321)
+    assert run_pytest_coro(reg.peek()) == (uvm_status_e.UVM_IS_OK, 0x1234)
+    assert "different values in its HDL copies" in caplog.text
+
+
+def test_reg_backdoor_errors(dut, caplog):
+    block, reg, _ = build_model()
+    reg.clear_hdl_path()
+
+    assert run_pytest_coro(reg.poke(1)) == uvm_status_e.UVM_NOT_OK
+    assert "No backdoor access available" in caplog.text
+
+    reg.add_hdl_path_slice("missing_q", -1, -1)
+    assert run_pytest_coro(reg.peek()) == (uvm_status_e.UVM_NOT_OK, 0)
+    assert "Cannot resolve the 'RTL' HDL path" in caplog.text
+
+
+def test_user_backdoor_takes_precedence_over_hdl_paths(dut):
+    class ModelBackdoor(uvm_reg_backdoor):
+        def __init__(self, name):
+            super().__init__(name)
+            self.data = 0x0F0
+
+        async def write(self, rw):
+            self.data = rw.get_value()
+            rw.set_status(uvm_status_e.UVM_IS_OK)
+
+        async def read(self, rw):
+            rw.set_value(self.data)
+            rw.set_status(uvm_status_e.UVM_IS_OK)
+
+    block, reg, _ = build_model()
+    backdoor = ModelBackdoor("model")
+    block.set_backdoor(backdoor)
+
+    assert run_pytest_coro(reg.write(0x13, uvm_door_e.UVM_BACKDOOR)) == (
+        uvm_status_e.UVM_IS_OK
+    )
+    assert backdoor.data == 0x0E3
+    assert signal(dut, "ctrl_q").writes == []
+
+
+def test_mem_poke_peek_and_backdoor_bursts(dut):
+    _, _, mem = build_model()
+    ram = signal(dut, "ram")
+
+    assert run_pytest_coro(mem.poke(2, 0x1ABCD)) == uvm_status_e.UVM_IS_OK
+    assert ram[2].value == 0xABCD
+    assert run_pytest_coro(mem.peek(2)) == (uvm_status_e.UVM_IS_OK, 0xABCD)
+
+    status = run_pytest_coro(
+        mem.burst_write(4, [0x11, 0x22, 0x33, 0x44], uvm_door_e.UVM_BACKDOOR)
+    )
+    assert status == uvm_status_e.UVM_IS_OK
+    assert [ram[ii].value for ii in range(4, 8)] == [0x11, 0x22, 0x33, 0x44]
+
+    data = [0] * 3
+    status = run_pytest_coro(mem.burst_read(1, data, uvm_door_e.UVM_BACKDOOR))
+    assert status == uvm_status_e.UVM_IS_OK
+    assert data == [0, 0xABCD, 0]
+
+    assert run_pytest_coro(mem.peek(8)) == (uvm_status_e.UVM_NOT_OK, 0)
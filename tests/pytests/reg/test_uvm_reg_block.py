@@ -2,12 +2,26 @@
 import itertools
 
 import pytest
+from async_helpers import run_pytest_coro
+from test_uvm_reg_frontdoor_adapter import (
+    AsyncNoopLock,
+    MockSequencer,
+    RecordingAdapter,
+)
 
 from pyuvm._reg.uvm_reg import uvm_reg
+from pyuvm._reg.uvm_reg_backdoor import uvm_reg_backdoor
 from pyuvm._reg.uvm_reg_block import uvm_reg_block
 from pyuvm._reg.uvm_reg_field import uvm_reg_field
 from pyuvm._reg.uvm_reg_map import uvm_reg_map
-from pyuvm._reg.uvm_reg_model import uvm_endianness_e, uvm_hier_e, uvm_predict_e
+from pyuvm._reg.uvm_reg_model import (
+    uvm_access_e,
+    uvm_door_e,
+    uvm_endianness_e,
+    uvm_hier_e,
+    uvm_predict_e,
+    uvm_status_e,
+)
 
 ##############################################################################
 # TIPS
@@ -135,8 +149,8 @@ def test_get_field_empty_reg():
     block = uvm_reg_block()
     reg = uvm_reg("reg", 32)
     reg.configure(block, None, "")
-    assert block.get_fields() == []
-    assert block.get_registers() == [reg]
+    assert block.get_fields() == ()
+    assert block.get_registers() == (reg,)
 
 
 def test_reg_block_get_field_single_reg():
@@ -149,7 +163,7 @@ def test_reg_block_get_field_single_reg():
     block = uvm_reg_block()
     reg0 = temp_reg()
     reg0.configure(block)
-    assert block.get_fields() == [reg0.test_field_1]
+    assert block.get_fields() == (reg0.test_field_1,)
 
 
 def test_reg_block_get_field_multiple_regs():
@@ -238,7 +252,7 @@ def test_reg_block_get_field_sub_reg_block():
     blk0 = temp_blk_1()
     blk0.configure(block, "path")
 
-    assert block.get_fields() == [
+    assert block.get_fields() == (
         reg0.test_field_1,
         reg0.test_field_2,
         reg1.test_field_3,
@@ -246,14 +260,14 @@ def test_reg_block_get_field_sub_reg_block():
         reg1.test_field_5,
         blk0.test_reg_1.test_field_6,
         blk0.test_reg_1.test_field_7,
-    ]
-    assert block.get_fields(hier=uvm_hier_e.UVM_NO_HIER) == [
+    )
+    assert block.get_fields(hier=uvm_hier_e.UVM_NO_HIER) == (
         reg0.test_field_1,
         reg0.test_field_2,
         reg1.test_field_3,
         reg1.test_field_4,
         reg1.test_field_5,
-    ]
+    )
 
 
 def test_reg_map_get_name():
@@ -623,3 +637,179 @@ def test_simple_reg_model():
 
     LSR.predict(12, kind=uvm_predict_e.UVM_PREDICT_READ)
     assert LSR.get_mirrored_value() == 12
+
+
+def test_block_update_writes_only_dirty_registers_in_address_order():
+    class LogBackdoor(uvm_reg_backdoor):
+        def __init__(self):
+            super().__init__("log")
+            self.writes = []
+
+        async def write(self, rw):
+            self.writes.append((rw.get_element().get_name(), rw.get_value()))
+            rw.set_status(uvm_status_e.UVM_IS_OK)
+
+        async def read(self, rw):
+            rw.set_value(rw.get_element().get_mirrored_value())
+            rw.set_status(uvm_status_e.UVM_IS_OK)
+
+    class DataReg(uvm_reg):
+        def __init__(self, name):
+            super().__init__(name, 16)
+            self.data = uvm_reg_field("data")
+            self.data.configure(self, 16, 0, "RW", False, 0, True, False, False)
+
+    block = uvm_reg_block("blk")
+    reg_map = block.create_map("map", 0, 2, uvm_endianness_e.UVM_LITTLE_ENDIAN)
+    regs = {}
+    for ii in range(8):
+        reg = DataReg(f"r{ii}")
+        reg.configure(block)
+        # Registers are added in the reverse of their address order
+        reg_map.add_reg(reg, 2 * (7 - ii))
+        reg._atomic = AsyncNoopLock()
+        regs[reg.get_name()] = reg
+    block.lock_model()
+    backdoor = LogBackdoor()
+    block.set_backdoor(backdoor)
+    block.reset()
+    assert not block.needs_update()
+    assert len(block._dirty_regs) == 0
+
+    regs["r2"].data.set(0x22)
+    regs["r5"].set(0x55)
+    # Setting the mirrored value does not make a register dirty
+    regs["r6"].data.set(0)
+    assert block.needs_update()
+
+    status = run_pytest_coro(block.update(uvm_door_e.UVM_BACKDOOR))
+
+    assert status == uvm_status_e.UVM_IS_OK
+    assert backdoor.writes == [("r5", 0x55), ("r2", 0x22)]
+    assert not block.needs_update()
+    assert len(block._dirty_regs) == 0
+
+    regs["r3"].data.set(0x33)
+    regs["r3"].predict(0x33)
+    assert not block.needs_update()
+    assert run_pytest_coro(block.update(uvm_door_e.UVM_BACKDOOR)) == (
+        uvm_status_e.UVM_IS_OK
+    )
+    assert len(backdoor.writes) == 2
+
+
+def test_block_update_goes_through_the_given_map():
+    class DataReg(uvm_reg):
+        def __init__(self, name):
+            super().__init__(name, 32)
+            self.data = uvm_reg_field("data")
+            self.data.configure(self, 32, 0, "RW", False, 0, True, False, False)
+
+    block = uvm_reg_block("blk")
+    cpu_map = block.create_map("cpu", 0, 4, uvm_endianness_e.UVM_LITTLE_ENDIAN)
+    dbg_map = block.create_map("dbg", 0x800, 4, uvm_endianness_e.UVM_LITTLE_ENDIAN)
+    regs = []
+    for ii in range(3):
+        reg = DataReg(f"r{ii}")
+        reg.configure(block)
+        cpu_map.add_reg(reg, 4 * ii)
+        # The debug map has the registers in the reverse order
+        dbg_map.add_reg(reg, 4 * (2 - ii))
+        reg._atomic = AsyncNoopLock()
+        regs.append(reg)
+    block.lock_model()
+    adapter = RecordingAdapter()
+    # Only the debug map has a sequencer
+    dbg_map.set_sequencer(MockSequencer(), adapter)
+    dbg_map.set_auto_predict(True)
+    block.reset()
+
+    regs[0].data.set(0x10)
+    regs[2].data.set(0x12)
+    status = run_pytest_coro(block.update(uvm_door_e.UVM_FRONTDOOR, dbg_map))
+
+    assert status == uvm_status_e.UVM_IS_OK
+    assert [(op.kind, op.addr, op.data) for op in adapter.reg2bus_ops] == [
+        (uvm_access_e.UVM_WRITE, 0x800, 0x12),
+        (uvm_access_e.UVM_WRITE, 0x808, 0x10),
+    ]
+    assert not block.needs_update()
+
+
+def test_block_update_skips_registers_not_in_the_map():
+    class DataReg(uvm_reg):
+        def __init__(self, name):
+            super().__init__(name, 32)
+            self.data = uvm_reg_field("data")
+            self.data.configure(self, 32, 0, "RW", False, 0, True, False, False)
+
+    block = uvm_reg_block("blk")
+    cpu_map = block.create_map("cpu", 0, 4, uvm_endianness_e.UVM_LITTLE_ENDIAN)
+    dbg_map = block.create_map("dbg", 0x800, 4, uvm_endianness_e.UVM_LITTLE_ENDIAN)
+    both = DataReg("both")
+    both.configure(block)
+    cpu_map.add_reg(both, 0x0)
+    dbg_map.add_reg(both, 0x0)
+    dbg_only = DataReg("dbg_only")
+    dbg_only.configure(block)
+    dbg_map.add_reg(dbg_only, 0x4)
+    block.set_default_map(cpu_map)
+    block.lock_model()
+    adapters = {}
+    for reg_map in (cpu_map, dbg_map):
+        adapters[reg_map] = RecordingAdapter()
+        reg_map.set_sequencer(MockSequencer(), adapters[reg_map])
+        reg_map.set_auto_predict(True)
+    for reg in (both, dbg_only):
+        reg._atomic = AsyncNoopLock()
+    block.reset()
+    assert dbg_only.get_addresses(cpu_map) == (-1, [])
+    assert dbg_only.get_address(cpu_map) == -1
+
+    both.set(0x11)
+    dbg_only.set(0x22)
+    status = run_pytest_coro(block.update(uvm_door_e.UVM_FRONTDOOR))
+
+    assert status == uvm_status_e.UVM_IS_OK
+    assert [(op.addr, op.data) for op in adapters[cpu_map].reg2bus_ops] == [(0x0, 0x11)]
+    assert block.needs_update()
+    status = run_pytest_coro(block.update(uvm_door_e.UVM_FRONTDOOR, dbg_map))
+    assert status == uvm_status_e.UVM_IS_OK
+    assert [(op.addr, op.data) for op in adapters[dbg_map].reg2bus_ops] == [
+        (0x804, 0x22)
+    ]
+    assert not block.needs_update()
+
+
+def test_locked_block_lookups_use_name_indexes(caplog):
+    class DataReg(uvm_reg):
+        def __init__(self, name):
+            super().__init__(name, 8)
+            self.data = uvm_reg_field("data")
+            self.data.configure(self, 8, 0, "RW", False, 0, True, False, False)
+
+    soc = uvm_reg_block("soc")
+    top_reg = DataReg("ctrl")
+    top_reg.configure(soc)
+    sub = uvm_reg_block("sub")
+    sub.configure(soc)
+    sub_reg = DataReg("ctrl")
+    sub_reg.configure(sub)
+    status = DataReg("status")
+    status.configure(sub)
+    # Before locking the model the lookups scan the hierarchy
+    assert soc.get_reg_by_name("soc.sub.ctrl") is sub_reg
+    soc.lock_model()
+
+    assert soc.get_registers() is soc.get_registers()
+    assert soc.get_registers() == (top_reg, sub_reg, status)
+    assert soc.get_registers(uvm_hier_e.UVM_NO_HIER) == (top_reg,)
+    # A local name finds the first element in get_*() order
+    assert soc.get_reg_by_name("ctrl") is top_reg
+    assert soc.get_reg_by_name("soc.sub.ctrl") is sub_reg
+    assert soc.get_reg_by_name("status") is status
+    assert soc.get_field_by_name("soc.sub.status.data") is status.data
+    assert soc.get_block_by_name("sub") is sub
+    assert soc.get_block_by_name("soc") is soc
+    assert soc.get_reg_by_name("missing") is None
+    assert "Unable to locate register 'missing'" in caplog.text
@@ -0,0 +1,120 @@
+import asyncio
+
+import pytest
+from async_helpers import run_pytest_coro
+from test_uvm_reg_built_in_seqs import BusAdapter, DutBackdoor, build, errors
+
+from pyuvm import (
+    uvm_access_e,
+    uvm_door_e,
+    uvm_reg_transaction_order_policy,
+    uvm_status_e,
+)
+
+pytestmark = pytest.mark.usefixtures("initialize_pyuvm")
+
+OK = uvm_status_e.UVM_IS_OK
+
+
+class ResponseAdapter(BusAdapter):
+    def __init__(self, name):
+        super().__init__(name)
+        self.provides_responses = True
+
+
+class PipelinedSequencer:
+    """Accepts every item at once and responds to them one cycle later."""
+
+    def __init__(self, dut):
+        self.dut = dut
+        self.in_flight = {}
+        self.max_in_flight = 0
+        self.issued = []
+
+    async def start_item(self, item):
+        pass
+
+    async def finish_item(self, item):
+        self.issued.append(item.addr)
+        self.in_flight[item.get_transaction_id()] = item
+        self.max_in_flight = max(self.max_in_flight, len(self.in_flight))
+
+    async def get_response(self, txn_id=None):
+        await asyncio.sleep(0)
+        item = self.in_flight.pop(txn_id)
+        if item.kind == uvm_access_e.UVM_WRITE:
+            self.dut.write(item.addr, item.data)
+        else:
+            item.data = self.dut.read(item.addr)
+        return item
+
+
+class DescendingAddresses(uvm_reg_transaction_order_policy):
+    def order(self, q):
+        q.sort(key=lambda bus_op: -bus_op.addr)
+
+
+class DropsAccesses(uvm_reg_transaction_order_policy):
+    def order(self, q):
+        q.pop()
+
+
+def bulk_model(*buses):
+    top, blocks, log = build(*buses)
+    top._start_soon = asyncio.ensure_future
+    return top, blocks, log
+
+
+def test_buses_are_accessed_concurrently_and_results_kept_in_order():
+    top, (a, b), log = bulk_model("a", "b")
+
+    statuses = run_pytest_coro(
+        top.write_regs({a.data: 0x1111, a.ctrl: 0x3, b.data: 0x2222, b.ctrl: 0x4})
+    )
+    assert statuses == [OK] * 4
+    assert log == ["a", "b", "a", "b"]
+    assert a.dut.storage[1] == 0x1111
+    assert b.dut.storage[0] == 0x4
+
+    results = run_pytest_coro(top.read_regs([b.data, a.data, b.data]))
+    assert results == [(OK, 0x2222), (OK, 0x1111), (OK, 0x2222)]
+    assert a.data.get_mirrored_value() == 0x1111
+
+
+def test_accesses_are_pipelined_when_the_adapter_provides_responses():
+    top, (a,), _ = bulk_model("a")
+    sequencer = PipelinedSequencer(a.dut)
+    a.get_default_map().set_sequencer(sequencer, ResponseAdapter("adapter"))
+
+    assert run_pytest_coro(top.write_regs({a.ctrl: 0x7, a.data: 0xBEEF})) == [OK] * 2
+    assert sequencer.max_in_flight == 2
+    results = run_pytest_coro(top.read_regs([a.data, a.ctrl]))
+    assert results == [(OK, 0xBEEF), (OK, 0x7)]
+    assert sequencer.issued == [0, 1, 1, 0]
+
+
+def test_order_policy_of_the_root_map_orders_the_accesses(caplog):
+    top, (a,), log = bulk_model("a")
+    sequencer = PipelinedSequencer(a.dut)
+    reg_map = a.get_default_map()
+    reg_map.set_sequencer(sequencer, ResponseAdapter("adapter"))
+    reg_map.set_transaction_order_policy(DescendingAddresses("descending"))
+
+    results = run_pytest_coro(top.read_regs([a.ctrl, a.data]))
+    assert results == [(OK, 0x5), (OK, 0xA5)]
+    assert sequencer.issued == [1, 0]
+
+    reg_map.set_transaction_order_policy(DropsAccesses("drops"))
+    run_pytest_coro(top.write_regs({a.ctrl: 0x1, a.data: 0x2}))
+    assert sequencer.issued[2:] == [0, 1]
+    assert "Transaction order policy 'drops' must reorder" in errors(caplog)
+
+
+def test_backdoor_accesses_bypass_the_buses():
+    top, (a, b), log = bulk_model("a", "b")
+    for blk in (a, b):
+        blk.set_backdoor(DutBackdoor(blk.dut, blk.get_default_map()))
+
+    results = run_pytest_coro(top.read_regs([a.data, b.ctrl], uvm_door_e.UVM_BACKDOOR))
+    assert results == [(OK, 0xA5), (OK, 0x5)]
+    assert log == []
@@ -0,0 +1,85 @@
+import logging
+
+import pytest
+from test_uvm_reg_field_storage import build_soc
+
+from pyuvm import uvm_predict_e, uvm_reg_block_state
+
+pytestmark = pytest.mark.usefixtures("initialize_pyuvm")
+
+
+def boot(regs):
+    """Stand-in for a boot configuration written through uvm_reg.write()"""
+    for ii, reg in enumerate(regs):
+        reg.mode.predict(ii + 5, kind=uvm_predict_e.UVM_PREDICT_WRITE)
+    regs[-1].mode.set(0xC)
+
+
+def values(regs):
+    return [
+        (reg.get_mirrored_value(), reg.get(), [f._written for f in reg.get_fields()])
+        for reg in regs
+    ]
+
+
+@pytest.mark.parametrize("suffix", [".pickle", ".pickle.gz"])
+@pytest.mark.parametrize("array_storage", [False, True])
+def test_restore_skips_the_boot_configuration(tmp_path, suffix, array_storage):
+    soc, _, regs = build_soc(array_storage)
+    soc.reset()
+    boot(regs)
+    booted = values(regs)
+    path = tmp_path / f"boot{suffix}"
+    soc.save_state(path)
+
+    soc.reset()
+    assert values(regs) != booted
+    assert not soc.needs_update()
+    # top_status0 is booted to its reset mode, but was written
+    assert soc.diff_state(uvm_reg_block_state.load(path)) == [
+        reg.get_full_name() for reg in regs
+    ]
+
+    soc.load_state(path)
+    assert values(regs) == booted
+    assert soc.diff_state(uvm_reg_block_state.load(path)) == []
+    # The desired value that was never written still needs an update
+    assert soc.needs_update()
+    assert regs[-1].mode.get() == 0xC
+    assert regs[-1].mode.get_mirrored_value() == 0xA
+
+
+def test_diff_between_states_and_partial_restore(caplog):
+    soc, sub, regs = build_soc(False)
+    soc.reset()
+    before = soc.get_state()
+    regs[0].mode.predict(0x3)
+    after = soc.get_state()
+    assert len(after) == len(regs)
+    assert before.diff(after) == after.diff(before) == ["soc.top_status0"]
+    assert after != before
+    assert after == uvm_reg_block_state(dict(after.regs))
+
+    # Only the registers of the sub-block are restored
+    partial = sub.get_state()
+    partial.regs["soc.sub.gone"] = (0, 0, 0)
+    regs[-1].mode.predict(0x9)
+    soc.set_state(partial)
+    assert regs[0].mode.get_mirrored_value() == 0x3
+    assert regs[-1].mode.get_mirrored_value() == 0x5
+    warnings = [r.getMessage() for r in caplog.records if r.levelno == logging.WARNING]
+    assert (
+        "3 register(s) of block 'soc' not in the restored state kept their "
+        "values, e.g. 'soc.top_status0'" in warnings
+    )
+    assert "1 register(s) of the restored state are not in block 'soc'" in warnings
+
+
+def test_load_rejects_a_state_of_another_version(tmp_path, monkeypatch):
+    soc, _, _ = build_soc(False)
+    path = tmp_path / "state.pickle"
+    monkeypatch.setattr("pyuvm._reg.uvm_reg_block_state._STATE_VERSION", 0)
+    soc.save_state(path)
+    monkeypatch.undo()
+    with pytest.raises(ValueError, match="has version 0, expected 1"):
+        soc.load_state(path)
@@ -0,0 +1,243 @@
+import asyncio
+import logging
+
+import pytest
+from async_helpers import run_pytest_coro
+from test_uvm_reg_frontdoor_adapter import AsyncNoopLock
+
+from pyuvm import (
+    ConfigDB,
+    uvm_access_e,
+    uvm_endianness_e,
+    uvm_mem,
+    uvm_mem_walk_seq,
+    uvm_reg,
+    uvm_reg_access_seq,
+    uvm_reg_adapter,
+    uvm_reg_backdoor,
+    uvm_reg_bit_bash_seq,
+    uvm_reg_block,
+    uvm_reg_field,
+    uvm_reg_hw_reset_seq,
+    uvm_sequence_item,
+    uvm_status_e,
+)
+
+pytestmark = pytest.mark.usefixtures("initialize_pyuvm")
+
+
+class BusItem(uvm_sequence_item):
+    def __init__(self, kind, addr, data):
+        super().__init__("bus_item")
+        self.kind = kind
+        self.addr = addr
+        self.data = data
+
+
+class BusAdapter(uvm_reg_adapter):
+    def reg2bus(self, rw):
+        return BusItem(rw.kind, rw.addr, rw.data)
+
+    def bus2reg(self, bus_item, rw):
+        rw.data = bus_item.data
+        rw.status = uvm_status_e.UVM_IS_OK
+
+
+class Dut:
+    """Word-addressed storage; ``read_only`` bits ignore writes."""
+
+    def __init__(self):
+        self.storage = {}
+        self.read_only = {}
+        self.write_only = {}
+        self.stuck_at_0 = {}
+
+    def write(self, addr, data):
+        keep = self.read_only.get(addr, 0)
+        data = (data & ~keep) | (self.storage.get(addr, 0) & keep)
+        self.storage[addr] = data & ~self.stuck_at_0.get(addr, 0)
+
+    def read(self, addr):
+        return self.storage.get(addr, 0) & ~self.write_only.get(addr, 0)
+
+
+class BusSequencer:
+    """Applies each item to the DUT after yielding to the other buses."""
+
+    def __init__(self, name, dut, log):
+        self.name = name
+        self.dut = dut
+        self.log = log
+
+    async def start_item(self, item):
+        pass
+
+    async def finish_item(self, item):
+        await asyncio.sleep(0)
+        self.log.append(self.name)
+        if item.kind == uvm_access_e.UVM_WRITE:
+            self.dut.write(item.addr, item.data)
+        else:
+            item.data = self.dut.read(item.addr)
+
+
+class DutBackdoor(uvm_reg_backdoor):
+    def __init__(self, dut, reg_map):
+        super().__init__("dut_backdoor")
+        self.dut = dut
+        self.map = reg_map
+        self.reads = 0
+
+    async def write(self, rw):
+        self.dut.storage[rw.get_element().get_address(self.map)] = rw.get_value()
+        rw.set_status(uvm_status_e.UVM_IS_OK)
+
+    async def read(self, rw):
+        self.reads += 1
+        rw.set_value(self.dut.storage.get(rw.get_element().get_address(self.map), 0))
+        rw.set_status(uvm_status_e.UVM_IS_OK)
+
+
+class CtrlReg(uvm_reg):
+    """[3:0] RW, [7:4] RO, [11:8] WO"""
+
+    def __init__(self, name):
+        super().__init__(name, 16)
+        self.mode = uvm_reg_field("mode")
+        self.mode.configure(self, 4, 0, "RW", False, 0x5, True, False, False)
+        self.state = uvm_reg_field("state")
+        self.state.configure(self, 4, 4, "RO", False, 0x0, True, False, False)
+        self.cmd = uvm_reg_field("cmd")
+        self.cmd.configure(self, 4, 8, "WO", False, 0x0, True, False, False)
+
+
+class DataReg(uvm_reg):
+    def __init__(self, name):
+        super().__init__(name, 16)
+        self.data = uvm_reg_field("data")
+        self.data.configure(self, 16, 0, "RW", False, 0xA5, True, False, False)
+
+
+def build_bus(top, name, log):
+    """A sub-block with its own root map, sequencer and DUT."""
+    blk = uvm_reg_block(name)
+    blk.configure(top)
+    reg_map = blk.create_map("map", 0, 2, uvm_endianness_e.UVM_LITTLE_ENDIAN, False)
+    blk.ctrl = CtrlReg("ctrl")
+    blk.data = DataReg("data")
+    for offset, reg in enumerate((blk.ctrl, blk.data)):
+        reg.configure(blk)
+        reg_map.add_reg(reg, offset)
+    blk.ram = uvm_mem("ram", 8, 8)
+    blk.ram.configure(blk)
+    reg_map.add_mem(blk.ram, 0x10)
+    dut = Dut()
+    dut.storage = {0: 0x5, 1: 0xA5}
+    dut.read_only[0] = 0xF0F0
+    dut.write_only[0] = 0xF00
+    blk.dut = dut
+    blk.bus = BusSequencer(name, dut, log)
+    reg_map.set_sequencer(blk.bus, BusAdapter("adapter"))
+    reg_map.set_auto_predict(True)
+    return blk
+
+
+def build(*buses):
+    log = []
+    top = uvm_reg_block("top")
+    blocks = [build_bus(top, name, log) for name in buses]
+    top.lock_model()
+    top.reset()
+    for blk in blocks:
+        for element in (blk.ctrl, blk.data, blk.ram):
+            element._atomic = AsyncNoopLock()
+    return top, blocks, log
+
+
+def errors(caplog):
+    return "\n".join(
+        record.getMessage()
+        for record in caplog.records
+        if record.levelno >= logging.ERROR
+    )
+
+
+def run(seq, model):
+    seq.model = model
+    seq._start_soon = asyncio.ensure_future
+    run_pytest_coro(seq.start())
+
+
+def test_hw_reset_checks_through_the_backdoor_when_available(caplog):
+    top, (a, b), log = build("a", "b")
+    backdoor = DutBackdoor(b.dut, b.get_default_map())
+    b.set_backdoor(backdoor)
+    a.dut.storage[1] = 0xA4
+
+    run(uvm_reg_hw_reset_seq(), top)
+
+    assert log == ["a", "a"]
+    assert backdoor.reads == 2
+    assert caplog.text.count("does not match mirrored value") == 1
+    assert "Register 'top.a.data' value read from DUT (0xA4)" in caplog.text
+
+
+def test_bit_bash_runs_independent_buses_concurrently(caplog):
+    top, (a, b), log = build("a", "b")
+    b.dut.stuck_at_0[1] = 0x8
+
+    run(uvm_reg_bit_bash_seq(), top)
+
+    # The 16 bits of data and all but the 4 WO bits of ctrl, written and
+    # read twice each
+    assert log.count("a") == log.count("b") == 28 * 4
+    assert log[:4] == ["a", "b", "a", "b"]
+    assert "Writing a 1 in bit #3 of register 'top.b.data'" in errors(caplog)
+    assert "top.a." not in errors(caplog)
+    assert a.data.get() == 0xA5
+
+
+def test_access_seq_checks_through_the_backdoor_when_available(caplog):
+    top, (a, b), log = build("a", "b")
+    backdoor = DutBackdoor(a.dut, a.get_default_map())
+    a.data.set_backdoor(backdoor)
+
+    with caplog.at_level("INFO", logger="RegModel"):
+        run(uvm_reg_access_seq(), top)
+
+    assert "Register 'top.a.ctrl' contains a read-only field, skipped" in caplog.text
+    # Frontdoor write and backdoor check, backdoor write and frontdoor check
+    assert log.count("a") == 2
+    # A backdoor write() reads the register to apply the access policies
+    assert backdoor.reads == 2
+    # Without a backdoor both the writes and the checks use the frontdoor
+    assert log.count("b") == 4
+    assert "does not match" not in caplog.text
+    assert a.data.get_mirrored_value() == b.data.get_mirrored_value() == 0xA5
+
+
+def test_mem_walk_reports_a_stuck_bit(caplog):
+    top, (a, b), log = build("a", "b")
+    b.dut.stuck_at_0[0x12] = 0x1
+
+    run(uvm_mem_walk_seq(), top)
+
+    # 8 writes, 7 reads of the previous address, 7 writes back and 1 read
+    assert log.count("a") == log.count("b") == 23
+    assert errors(caplog) == "top.b.ram[2] read back as 0xFC instead of 0xFD"
+
+
+def test_attributes_exclude_blocks_and_elements(caplog):
+    top, (a, b), log = build("a", "b")
+    ConfigDB().set(None, "REG.top.b", "NO_REG_TESTS", True)
+    ConfigDB().set(None, "REG.top.a.ctrl", "NO_REG_BIT_BASH_TEST", True)
+
+    run(uvm_reg_bit_bash_seq(), top)
+    assert log == ["a"] * 64
+
+    ConfigDB().set(None, "REG.top.a.*", "NO_MEM_WALK_TEST", True)
+    run(uvm_mem_walk_seq(), top)
+    assert len(log) == 64
+
+    run(uvm_reg_hw_reset_seq(), None)
+    assert "No register model specified" in caplog.text
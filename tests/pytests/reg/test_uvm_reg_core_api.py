@@ -329,10 +329,6 @@ def test_unimplemented_hooks_raise():
     item = uvm_reg_item()
     backdoor = uvm_reg_backdoor("bkdr")
 
-    with pytest.raises(NotImplementedError):
-        reg.sample(0, 0, False, None)
-    with pytest.raises(NotImplementedError):
-        reg.sample_values()
     with pytest.raises(NotImplementedError):
         run_pytest_coro(reg.pre_write(item))
     with pytest.raises(NotImplementedError):
@@ -355,13 +351,6 @@ def test_unimplemented_hooks_raise():
     with pytest.raises(NotImplementedError):
         run_pytest_coro(reg.low.post_read(item))
 
-    with pytest.raises(NotImplementedError):
-        block.sample(0, False, None)
-    with pytest.raises(NotImplementedError):
-        block._sample(0, False, None)
-    with pytest.raises(NotImplementedError):
-        block.sample_values()
-
     with pytest.raises(NotImplementedError):
         run_pytest_coro(backdoor.do_pre_read(item))
     with pytest.raises(NotImplementedError):
@@ -0,0 +1,145 @@
+import pytest
+from async_helpers import run_pytest_coro
+from test_uvm_reg_built_in_seqs import build_bus
+from test_uvm_reg_frontdoor_adapter import AsyncNoopLock
+from test_uvm_reg_predictor import BusAdapter, BusItem
+
+from pyuvm import (
+    uvm_coverage_model_e,
+    uvm_predict_e,
+    uvm_reg,
+    uvm_reg_block,
+    uvm_reg_coverage,
+    uvm_reg_predictor,
+)
+
+pytestmark = pytest.mark.usefixtures("initialize_pyuvm")
+
+ALL = uvm_coverage_model_e.UVM_CVR_ALL
+ADDR_MAP = uvm_coverage_model_e.UVM_CVR_ADDR_MAP
+FIELD_VALS = uvm_coverage_model_e.UVM_CVR_FIELD_VALS
+
+# Field-value bins of a block: 16 for each 4-bit field of ctrl, then the
+# 16-bit data field binned by its 8 most significant bits
+CTRL_MODE, CTRL_STATE, CTRL_CMD, DATA = 0, 16, 32, 48
+
+
+def covered_model(scope):
+    uvm_reg.include_coverage(scope, ALL)
+    top = uvm_reg_block("top")
+    a = build_bus(top, "a", [])
+    a.add_coverage(a.build_coverage(ALL))
+    top.lock_model()
+    top.reset()
+    for element in (a.ctrl, a.data, a.ram):
+        element._atomic = AsyncNoopLock()
+    return top, a
+
+
+def hit(bins):
+    return [index for index, hits in enumerate(bins) if hits]
+
+
+def test_frontdoor_accesses_sample_the_built_in_bins():
+    top, a = covered_model("top.a")
+    run_pytest_coro(a.data.write(0x1234))
+    assert hit(top.get_coverage_db().addr_hits["top.a"]) == []
+
+    assert top.set_coverage(ALL) == 0
+    assert a.get_coverage(ADDR_MAP) and not top.get_coverage(ADDR_MAP)
+    assert not a.ctrl.get_coverage(FIELD_VALS)
+    run_pytest_coro(a.ctrl.write(0x3))
+    run_pytest_coro(a.data.read())
+    run_pytest_coro(a.data.read())
+    run_pytest_coro(a.ram.write(2, 0x7F))
+
+    db = top.get_coverage_db()
+    assert list(db.field_hits) == list(db.addr_hits) == ["top.a"]
+    # (write, read) counters of ctrl, data and ram
+    assert list(db.addr_hits["top.a"]) == [1, 0, 0, 2, 1, 0]
+    assert hit(db.field_hits["top.a"]) == [
+        CTRL_MODE + 0x3,
+        CTRL_STATE,
+        CTRL_CMD,
+        DATA + 0x12,
+    ]
+    # The 304 field-value bins are packed eight to a byte
+    assert len(db.field_hits["top.a"]) == 304
+    assert len(db.field_hits["top.a"].bits) == 38
+    assert db.get_coverage(ADDR_MAP) == pytest.approx(50.0)
+    assert db.get_coverage() == pytest.approx(100.0 * 7 / (6 + 48 + 256))
+
+    top.set_coverage(uvm_coverage_model_e.UVM_NO_COVERAGE)
+    run_pytest_coro(a.ctrl.write(0x3))
+    assert list(top.get_coverage_db().addr_hits["top.a"]) == [1, 0, 0, 2, 1, 0]
+
+
+def test_explicit_prediction_samples_the_built_in_bins():
+    top, a = covered_model("top.a")
+    top.set_coverage(ALL)
+    a.get_default_map().set_auto_predict(False)
+    run_pytest_coro(a.data.write(0x1234))
+    assert hit(top.get_coverage_db().addr_hits["top.a"]) == []
+
+    predictor = uvm_reg_predictor("predictor", None)
+    predictor.map = a.get_default_map()
+    predictor.adapter = BusAdapter("adapter")
+    predictor.write(BusItem(0x1, 0x1234))
+    predictor.write(BusItem(0x0, 0x3, read=True))
+    predictor.write(BusItem(0x0, 0x4, ok=False))
+
+    db = top.get_coverage_db()
+    assert list(db.addr_hits["top.a"]) == [0, 1, 1, 0, 0, 0]
+    assert hit(db.field_hits["top.a"]) == [
+        CTRL_MODE + 0x3,
+        CTRL_STATE,
+        CTRL_CMD,
+        DATA + 0x12,
+    ]
+
+
+def test_sample_values_covers_the_mirrored_values():
+    top, a = covered_model("*")
+    top.set_coverage(FIELD_VALS)
+    a.data.predict(0xBEEF, kind=uvm_predict_e.UVM_PREDICT_WRITE)
+
+    top.sample_values()
+
+    db = top.get_coverage_db()
+    assert hit(db.field_hits["top.a"]) == [
+        CTRL_MODE + 0x5,
+        CTRL_STATE,
+        CTRL_CMD,
+        DATA + 0xBE,
+    ]
+    assert hit(db.addr_hits["top.a"]) == []
+
+
+@pytest.mark.parametrize("suffix", [".pickle", ".pickle.gz"])
+def test_databases_of_parallel_runs_merge(tmp_path, suffix):
+    top, a = covered_model("top.a")
+    top.set_coverage(ALL)
+    run_pytest_coro(a.ctrl.write(0x3))
+    first = top.get_coverage_db()
+    run_pytest_coro(a.ctrl.read())
+    run_pytest_coro(a.data.write(0xFF00))
+    path = tmp_path / f"run{suffix}"
+    top.get_coverage_db().save(path)
+
+    merged = uvm_reg_coverage()
+    merged.merge(first)
+    merged.merge(uvm_reg_coverage.load(path))
+
+    assert list(merged.addr_hits["top.a"]) == [2, 1, 1, 0, 0, 0]
+    assert hit(merged.field_hits["top.a"]) == [
+        CTRL_MODE + 0x3,
+        CTRL_STATE,
+        CTRL_CMD,
+        DATA + 0xFF,
+    ]
+    # Merging copies the bins of the first database
+    assert list(first.addr_hits["top.a"]) == [1, 0, 0, 0, 0, 0]
+
+    other = uvm_reg_coverage({"top.a": first.addr_hits["top.a"][:4]})
+    with pytest.raises(ValueError, match="has 4 bins, expected 6"):
+        merged.merge(other)
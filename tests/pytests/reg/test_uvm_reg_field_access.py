@@ -366,6 +366,36 @@ def test_field_read_prediction_applies_access_policy(access, expected):
     assert field.get() == expected
 
 
+def test_field_access_is_compiled_per_map_and_follows_set_access():
+    block = uvm_reg_block("compiled_policy_block")
+    rw_map = block.create_map("rw", 0, 4, uvm_endianness_e.UVM_LITTLE_ENDIAN, True)
+    ro_map = block.create_map("ro", 0, 4, uvm_endianness_e.UVM_LITTLE_ENDIAN, True)
+    reg = PolicyReg("compiled_policy_reg", "W1C", 0xA)
+    reg.configure(block)
+    rw_map.add_reg(reg, 0, "RW")
+    ro_map.add_reg(reg, 0, "RO")
+    field = reg.field
+    assert field.get_access(ro_map) == "RO"
+    block.lock_model()
+    reg.reset()
+
+    assert set(field._policies) == {None, rw_map, ro_map}
+    assert field.get_access(rw_map) == "W1C"
+    assert field.get_access(ro_map) == "RO"
+    field.predict(0x3, kind=uvm_predict_e.UVM_PREDICT_WRITE, map=ro_map)
+    assert field.get_mirrored_value() == 0xA
+    field.predict(0x3, kind=uvm_predict_e.UVM_PREDICT_WRITE, map=rw_map)
+    assert field.get_mirrored_value() == 0x8
+
+    field.set_access("WRC")
+    assert field.get_access(rw_map) == "WRC"
+    assert field.get_access(ro_map) == "RC"
+    field.set(0x5)
+    assert field.get() == 0x5
+    field.predict(0x7, kind=uvm_predict_e.UVM_PREDICT_READ, map=ro_map)
+    assert field.get_mirrored_value() == 0
+
+
 @pytest.mark.parametrize(
     ("access", "mirrored", "desired", "expected"),
     [
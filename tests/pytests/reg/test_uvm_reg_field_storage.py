@@ -0,0 +1,158 @@
+import pickle
+
+import pytest
+
+from pyuvm import (
+    uvm_endianness_e,
+    uvm_predict_e,
+    uvm_reg,
+    uvm_reg_block,
+    uvm_reg_field,
+)
+from pyuvm._reg import uvm_reg_field_storage as field_storage
+
+
+class LevelField(uvm_reg_field):
+    pass
+
+
+class StatusReg(uvm_reg):
+    def __init__(self, name="status"):
+        super().__init__(name, 32)
+        self.mode = uvm_reg_field("mode")
+        self.flags = uvm_reg_field("flags")
+        self.level = LevelField("level")
+        self.mode.configure(self, 4, 0, "RW", False, 0x5, True, False, False)
+        self.flags.configure(self, 4, 4, "W1C", False, 0xF, True, False, False)
+        self.level.configure(self, 8, 8, "RO", True, 0, False, False, False)
+        self.level.set_reset(0x80, "SOFT")
+
+
+def build_soc(array_storage, n_regs=3):
+    soc = uvm_reg_block("soc")
+    reg_map = soc.create_map("map", 0, 4, uvm_endianness_e.UVM_LITTLE_ENDIAN, True)
+    regs = []
+    for name in ("top", "sub"):
+        blk = soc
+        if name == "sub":
+            blk = uvm_reg_block("sub")
+            blk.configure(soc)
+            sub_map = blk.create_map(
+                "map", 0, 4, uvm_endianness_e.UVM_LITTLE_ENDIAN, True
+            )
+            reg_map.add_submap(sub_map, 0x100)
+        for ii in range(n_regs):
+            reg = StatusReg(f"{name}_status{ii}")
+            reg.configure(blk)
+            (reg_map if blk is soc else sub_map).add_reg(reg, 4 * ii)
+            regs.append(reg)
+    soc.set_array_storage(array_storage)
+    soc.lock_model()
+    return soc, blk, regs
+
+
+@pytest.mark.parametrize("array_storage", [False, True])
+def test_reset_and_needs_update_match_attribute_storage(array_storage):
+    soc, sub, regs = build_soc(array_storage)
+    assert soc.get_array_storage() == array_storage
+    assert sub.get_array_storage() == array_storage
+
+    soc.reset()
+    assert [reg.get_mirrored_value() for reg in regs] == [0xF5] * len(regs)
+    assert [reg.mode.value for reg in regs] == [0x5] * len(regs)
+    assert not soc.needs_update()
+
+    regs[-1].mode.set(0xA)
+    assert soc.needs_update()
+    assert sub.needs_update()
+    regs[-1].mode.predict(0xA)
+    assert not soc.needs_update()
+
+    # Read-only fields never need an update
+    regs[0].level.set_access("RW")
+    regs[0].level.set(0x3)
+    assert soc.needs_update()
+    assert not sub.needs_update()
+    regs[0].level.set_access("RO")
+    assert not soc.needs_update()
+
+    sub.reset("SOFT")
+    assert regs[-1].level.get_mirrored_value() == 0x80
+    assert regs[-1].mode.get_mirrored_value() == 0xA
+    assert regs[0].level.get_mirrored_value() == 0
+
+
+@pytest.mark.parametrize("array_storage", [False, True])
+def test_fields_stay_views_of_the_storage(array_storage):
+    soc, _, regs = build_soc(array_storage, n_regs=1)
+    reg = regs[0]
+    soc.reset()
+
+    reg.flags.predict(0x3, kind=uvm_predict_e.UVM_PREDICT_DIRECT)
+    reg.mode.value = 0x1F
+    assert reg.flags.get_mirrored_value() == 0x3
+    assert reg.get() == 0x35
+    assert reg.mode.value == (0xF if array_storage else 0x1F)
+
+    reg.mode.set_reset(0x9)
+    reg.flags.has_reset(delete=True)
+    soc.reset()
+    assert reg.mode.get() == 0x9
+    assert reg.flags.get() == 0x3
+    reg.mode.set_volatility(True)
+    assert soc.needs_update()
+
+
+@pytest.mark.parametrize("array_storage", [False, True])
+def test_only_fields_with_storage_read_it(array_storage):
+    soc, _, regs = build_soc(array_storage, n_regs=1)
+    reg = regs[0]
+    assert isinstance(reg.level, LevelField)
+    assert (type(reg.mode) is uvm_reg_field) != array_storage
+    assert (type(reg.level) is LevelField) != array_storage
+
+    soc.reset()
+    reg.level.predict(0x42)
+    reg.mode.set(0x6)
+    loaded = pickle.loads(pickle.dumps(soc))
+    loaded_reg = loaded.get_registers()[0]
+    assert type(loaded_reg.level) is type(reg.level)
+    assert loaded_reg.get_mirrored_value() == 0x42F5
+    assert loaded_reg.get() == 0x42F6
+    loaded_reg.mode.predict(0x1)
+    assert loaded_reg.mode.get_mirrored_value() == 0x1
+    assert reg.mode.get_mirrored_value() == 0x5
+
+    clone = reg.level.clone()
+    assert type(clone) is LevelField
+
+
+def test_array_storage_cannot_change_after_lock(caplog):
+    soc, _, _ = build_soc(False, n_regs=1)
+    soc.set_array_storage(True)
+    assert "Cannot change the field storage" in caplog.text
+    assert not soc.get_array_storage()
+
+
+@pytest.mark.parametrize("numpy", [True, False], ids=["numpy", "array"])
+def test_array_storage_finds_the_registers_to_update(monkeypatch, numpy):
+    if not numpy:
+        monkeypatch.setattr(field_storage, "np", None)
+    elif field_storage.np is None:
+        pytest.skip("NumPy is not installed")
+    soc, sub, regs = build_soc(True)
+    soc.reset()
+    assert soc._get_dirty_registers() == []
+
+    regs[4].mode.set(0x1)
+    regs[1].mode.set(0xA)
+    assert soc._get_dirty_registers() == [regs[1], regs[4]]
+    assert sub._get_dirty_registers() == [regs[4]]
+
+    regs[2].level.set_access("RW")
+    regs[2].level.set_volatility(True)
+    assert soc._get_dirty_registers() == [regs[1], regs[2], regs[4]]
+    regs[2].level.set_access("RO")
+    assert soc._get_dirty_registers() == [regs[1], regs[4]]
+    # The arrays replace the sets of registers to check
+    assert not soc._dirty_regs and not sub._dirty_regs
@@ -8,6 +8,7 @@ from pyuvm._reg.uvm_reg import uvm_reg
 from pyuvm._reg.uvm_reg_adapter import uvm_reg_adapter
 from pyuvm._reg.uvm_reg_block import uvm_reg_block
 from pyuvm._reg.uvm_reg_field import uvm_reg_field
+from pyuvm._reg.uvm_reg_map import uvm_reg_transaction_order_policy
 from pyuvm._reg.uvm_reg_model import (
     uvm_access_e,
     uvm_door_e,
@@ -249,6 +250,25 @@ def test_adapter_without_byte_enable_uses_all_bytes_sentinel():
     assert adapter.reg2bus_ops[-1].byte_en == -1
 
 
+def test_frontdoor_access_uses_bus_op_template_built_at_lock(monkeypatch):
+    adapter = RecordingAdapter()
+    sequencer = MockSequencer()
+    _, reg_map, reg = build_model(adapter, sequencer)
+    template = reg_map.get_reg_map_info(reg).bus_op
+    assert (template.addrs, template.n_bits, template.byte_en) == ((0x1020,), 32, 0xF)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("address recomputed on access")
+
+    monkeypatch.setattr(reg_map, "_get_physical_addresses_to_map", fail)
+    run_pytest_coro(reg.write(1, uvm_door_e.UVM_FRONTDOOR, reg_map))
+    monkeypatch.undo()
+
+    reg.set_offset(reg_map, 0x40)
+    run_pytest_coro(reg.write(2, uvm_door_e.UVM_FRONTDOOR, reg_map))
+    assert [op.addr for op in adapter.reg2bus_ops] == [0x1020, 0x1040]
+
+
 def test_adapter_parent_sequence_and_responses_are_used():
     adapter = RecordingAdapter()
     adapter.provides_responses = True
@@ -364,3 +384,53 @@ def test_legacy_response_spelling_updates_canonical_property():
 
     assert adapter.provides_response
     assert adapter.provides_responses
+
+
+class WideReg(uvm_reg):
+    def __init__(self, name="wide_reg"):
+        super().__init__(name, 48)
+        self.data = uvm_reg_field("data")
+        self.data.configure(self, 48, 0, "RW", False, 0, True, False, False)
+
+
+class ReversedBeats(uvm_reg_transaction_order_policy):
+    def order(self, q):
+        q.reverse()
+
+
+@pytest.mark.parametrize("policy", [None, ReversedBeats("reversed")])
+def test_wide_register_beats_follow_map_endianness(policy):
+    adapter = RecordingAdapter()
+    adapter.provides_responses = True
+    sequencer = MockSequencer(read_data=0x8765_4321, use_response=True)
+    block = uvm_reg_block("wide_block")
+    reg_map = block.create_map("csr", 0x1000, 4, uvm_endianness_e.UVM_BIG_ENDIAN)
+    reg = WideReg()
+    reg.configure(block)
+    reg_map.add_reg(reg, 0x20)
+    block.lock_model()
+    reg._atomic = AsyncNoopLock()
+    reg_map.set_auto_predict(True)
+    reg_map.set_sequencer(sequencer, adapter)
+    reg_map.set_transaction_order_policy(policy)
+
+    status = run_pytest_coro(
+        reg.write(0x1234_5678_9ABC, uvm_door_e.UVM_FRONTDOOR, reg_map)
+    )
+    assert status == uvm_status_e.UVM_IS_OK
+    beats = [(0x1024, 0x5678_9ABC, 32, 0xF), (0x1020, 0x1234, 16, 0x3)]
+    if policy is not None:
+        beats.reverse()
+    assert [
+        (op.addr, op.data, op.n_bits, op.byte_en) for op in adapter.reg2bus_ops
+    ] == beats
+    # Both beats are issued before their responses are collected
+    assert len(sequencer.started) == 2
+    assert sequencer.response_txn_ids == [
+        item.transaction_id for item in sequencer.started
+    ]
+    assert reg.get_mirrored_value() == 0x1234_5678_9ABC
+
+    status, value = run_pytest_coro(reg.read(uvm_door_e.UVM_FRONTDOOR, reg_map))
+    assert status == uvm_status_e.UVM_IS_OK
+    assert value == 0x4321_8765_4321
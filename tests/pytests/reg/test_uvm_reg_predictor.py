@@ -0,0 +1,147 @@
+import pytest
+
+from pyuvm import (
+    UVMFatalError,
+    uvm_access_e,
+    uvm_endianness_e,
+    uvm_reg,
+    uvm_reg_adapter,
+    uvm_reg_block,
+    uvm_reg_field,
+    uvm_reg_predictor,
+    uvm_sequence_item,
+    uvm_status_e,
+    uvm_subscriber,
+)
+
+pytestmark = pytest.mark.usefixtures("initialize_pyuvm")
+
+
+class BusItem(uvm_sequence_item):
+    def __init__(self, addr, data=0, read=False, ok=True):
+        super().__init__("bus_item")
+        self.addr = addr
+        self.data = data
+        self.read = read
+        self.ok = ok
+
+
+class BusAdapter(uvm_reg_adapter):
+    def bus2reg(self, bus_item, rw):
+        rw.kind = uvm_access_e.UVM_READ if bus_item.read else uvm_access_e.UVM_WRITE
+        rw.addr = bus_item.addr
+        rw.data = bus_item.data
+        rw.status = uvm_status_e.UVM_IS_OK if bus_item.ok else uvm_status_e.UVM_NOT_OK
+
+
+class DataReg(uvm_reg):
+    def __init__(self, name, n_bits=32, access="RW"):
+        super().__init__(name, n_bits)
+        self.data = uvm_reg_field("data")
+        self.data.configure(self, n_bits, 0, access, False, 0, True, False, False)
+
+
+class Collector(uvm_subscriber):
+    def __init__(self, name, parent):
+        super().__init__(name, parent)
+        self.items = []
+
+    def write(self, tt):
+        self.items.append((tt.get_element().get_name(), tt.get_kind(), tt.get_value()))
+
+
+def build(lock=True):
+    block = uvm_reg_block("blk")
+    reg_map = block.create_map("map", 0, 4, uvm_endianness_e.UVM_LITTLE_ENDIAN, True)
+    regs = {
+        "ctrl": DataReg("ctrl"),
+        "status": DataReg("status", access="W1C"),
+        "wide": DataReg("wide", 64),
+        "rx": DataReg("rx", access="RO"),
+        "tx": DataReg("tx", access="WO"),
+    }
+    for reg, offset in zip(regs.values(), (0x0, 0x4, 0x8, 0x10, 0x10)):
+        reg.configure(block)
+        reg_map.add_reg(reg, offset)
+    if lock:
+        block.lock_model()
+    block.reset()
+    predictor = uvm_reg_predictor("predictor", None)
+    predictor.map = reg_map
+    predictor.adapter = BusAdapter("adapter")
+    collector = Collector("collector", None)
+    predictor.reg_ap.connect(collector.analysis_export)
+    return regs, predictor, collector
+
+
+def test_predictor_updates_mirror_from_observed_transactions():
+    regs, predictor, collector = build()
+    regs["status"].predict(0xFF)
+
+    predictor.bus_in.write(BusItem(0x0, 0x1234))
+    predictor.write(BusItem(0x4, 0x0F))
+    predictor.write(BusItem(0x10, 0x55))
+    predictor.write(BusItem(0x10, 0xAA, read=True))
+    predictor.write(BusItem(0x40, 0x1))
+
+    assert regs["ctrl"].get_mirrored_value() == 0x1234
+    # The written value goes through the access policy of the field
+    assert regs["status"].get_mirrored_value() == 0xF0
+    assert regs["tx"].get_mirrored_value() == 0x55
+    assert regs["rx"].get_mirrored_value() == 0xAA
+    assert collector.items == [
+        ("ctrl", uvm_access_e.UVM_WRITE, 0x1234),
+        ("status", uvm_access_e.UVM_WRITE, 0x0F),
+        ("tx", uvm_access_e.UVM_WRITE, 0x55),
+        ("rx", uvm_access_e.UVM_READ, 0xAA),
+    ]
+
+
+def test_multi_beat_registers_are_predicted_once_complete(caplog):
+    regs, predictor, collector = build()
+
+    predictor.write(BusItem(0xC, 0x89ABCDEF))
+    assert list(predictor._pending) == [regs["wide"]]
+    assert collector.items == []
+    predictor.write(BusItem(0x8, 0x01234567))
+    assert regs["wide"].get_mirrored_value() == 0x89ABCDEF01234567
+    assert predictor._pending == {}
+
+    predictor.write_many([BusItem(0x8, 0x1), BusItem(0x0, 0x7), BusItem(0xC, 0x2)])
+    assert regs["wide"].get_mirrored_value() == 0x200000001
+    assert regs["ctrl"].get_mirrored_value() == 0x7
+    assert [name for name, _, _ in collector.items] == ["wide", "ctrl", "wide"]
+
+    # A beat seen twice restarts the register transaction
+    predictor.write(BusItem(0x8, 0x3))
+    predictor.write(BusItem(0x8, 0x4))
+    assert "Collision detected for register 'blk.wide'" in caplog.text
+    assert predictor._pending[regs["wide"]].reg_item.get_value() == 0x4
+    predictor.check_phase()
+    assert "1 incomplete register transactions" in caplog.text
+    predictor.flush()
+    assert predictor._pending == {}
+
+
+def test_failed_transactions_are_not_predicted():
+    regs, predictor, _ = build()
+    predictor.write(BusItem(0x0, 0x5, ok=False))
+    assert regs["ctrl"].get_mirrored_value() == 0
+
+
+def test_address_table_follows_the_map():
+    regs, predictor, _ = build()
+    predictor.write(BusItem(0x0, 0x1))
+    predictor.map._set_reg_offset(regs["ctrl"], 0x20, False)
+    predictor.write(BusItem(0x20, 0x2))
+    assert regs["ctrl"].get_mirrored_value() == 0x2
+
+
+def test_predictor_requires_a_locked_map_and_an_adapter(caplog):
+    regs, predictor, _ = build(lock=False)
+    predictor.write(BusItem(0x0, 0x1))
+    assert "is not locked" in caplog.text
+    assert regs["ctrl"].get_mirrored_value() == 0
+    predictor.adapter = None
+    with pytest.raises(UVMFatalError):
+        predictor.write(BusItem(0x0, 0x1))
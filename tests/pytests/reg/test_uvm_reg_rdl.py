@@ -0,0 +1,159 @@
+from pathlib import Path
+
+import pytest
+
+from pyuvm import (
+    uvm_mem,
+    uvm_reg,
+    uvm_reg_block,
+    uvm_reg_field,
+    uvm_reg_rdl_generate,
+    uvm_reg_rdl_load,
+)
+from pyuvm._reg import uvm_reg_rdl
+
+TINYALU_RDL = Path(__file__).parents[3] / "examples" / "TinyALU_reg" / "TinyALUreg.rdl"
+
+RDL_DIR = Path(__file__).parent / "rdl"
+SOC_RDL = RDL_DIR / "soc.rdl"
+
+# What uvm_reg_rdl_generate() writes for soc.rdl, an addrmap with a register
+# array, a memory and an array of sub-blocks
+GENERATED = (RDL_DIR / "soc_generated.txt").read_text()
+
+
+def import_generated(tmp_path, source):
+    path = tmp_path / "model.py"
+    path.write_text(source)
+    return uvm_reg_rdl._import_model(path)
+
+
+def test_build_creates_a_locked_model_from_the_tables(tmp_path):
+    model = import_generated(tmp_path, GENERATED)
+    soc = model.build()
+    assert soc.is_locked()
+    assert soc.get_name() == "soc"
+    reg_map = soc.get_default_map()
+
+    assert soc.ctrl.get_address(reg_map) == 0x0
+    assert soc.ctrl.get_n_bits() == 32
+    assert soc.ctrl.irq.get_access() == "W1C"
+    assert soc.ctrl.irq.is_volatile()
+    assert soc.ctrl.enable.get_reset() == 1
+    # A field named after a uvm_reg method is not an attribute of the register
+    assert callable(soc.ctrl.read)
+    assert not soc.ctrl.get_field_by_name("read").has_reset()
+    assert [
+        (field.get_name(), field.get_access()) for field in soc.ctrl.get_fields()
+    ] == [
+        ("enable", "RW"),
+        ("irq", "W1C"),
+        ("read", "RO"),
+        ("w1src", "W1SRC"),
+        ("w1t", "W1T"),
+        ("rs", "RS"),
+        ("woc", "WOC"),
+        ("wo", "WO"),
+        ("once", "W1"),
+        ("wonce", "WO1"),
+    ]
+    assert soc.data.data.get_reset() == 0x1234
+    assert isinstance(soc.buf, uvm_mem)
+    assert soc.buf.get_address(0, reg_map) == 0x100
+
+    assert [dma.get_name() for dma in soc.dma] == ["dma[0]", "dma[1]"]
+    chan = soc.dma[1].chan
+    assert [[reg.get_name() for reg in row] for row in chan] == [
+        ["chan[0][0]", "chan[0][1]", "chan[0][2]"],
+        ["chan[1][0]", "chan[1][1]", "chan[1][2]"],
+    ]
+    assert chan[1][2].get_address(reg_map) == 0x300 + 5 * 8
+    assert soc.get_reg_by_name("chan[1][2]") is soc.dma[0].chan[1][2]
+    assert len(soc.get_registers()) == 14
+
+    assert model.build("other").get_name() == "other"
+
+
+@pytest.fixture
+def rdl_file(tmp_path, monkeypatch):
+    calls = []
+
+    def generate(rdl_files, top=None):
+        calls.append(list(rdl_files))
+        return GENERATED
+
+    monkeypatch.setattr(uvm_reg_rdl, "uvm_reg_rdl_generate", generate)
+    rdl_file = tmp_path / "soc.rdl"
+    rdl_file.write_text("addrmap soc {};\n")
+    return rdl_file, calls
+
+
+def test_load_pickles_the_model_and_reuses_it(rdl_file, tmp_path):
+    rdl_file, calls = rdl_file
+    cache_dir = tmp_path / "cache"
+
+    first = uvm_reg_rdl_load(str(rdl_file), cache_dir)
+    assert calls == [[str(rdl_file)]]
+    assert sorted(path.suffix for path in cache_dir.iterdir()) == [".pickle", ".py"]
+
+    second = uvm_reg_rdl_load(str(rdl_file), cache_dir)
+    assert len(calls) == 1
+    assert second is not first
+    assert second.is_locked()
+    assert second.dma[1].chan[0][1].get_address() == 0x308
+    # The lookups filled by lock_model() find the loaded model
+    assert uvm_reg_block.get_block_by_full_name("soc.dma[1]") is second.dma[1]
+    assert uvm_reg.get_reg_by_full_name("soc.ctrl") is second.ctrl
+    assert uvm_reg_field.get_field_by_full_name("soc.ctrl.irq") is second.ctrl.irq
+
+    second.ctrl.predict(0x1)
+    assert second.ctrl.get_mirrored_value() == 0x1
+    assert first.ctrl.get_mirrored_value() == 0x0
+
+    # Another name or other RDL contents are another model
+    assert uvm_reg_rdl_load(str(rdl_file), cache_dir, name="top").get_name() == "top"
+    rdl_file.write_text("addrmap soc { };\n")
+    uvm_reg_rdl_load(str(rdl_file), cache_dir)
+    assert len(calls) == 3
+    assert len(list(cache_dir.glob("*.pickle"))) == 3
+
+
+def test_load_rebuilds_an_unreadable_cache_entry(rdl_file, tmp_path, caplog):
+    rdl_file, calls = rdl_file
+    uvm_reg_rdl_load(rdl_file, tmp_path)
+    (cache_file,) = tmp_path.glob("*.pickle")
+    cache_file.write_bytes(b"not a pickle")
+
+    soc = uvm_reg_rdl_load(rdl_file, tmp_path)
+    assert "Cannot load the cached register model" in caplog.text
+    assert len(calls) == 2
+    assert soc.data.data.get_n_bits() == 16
+    assert uvm_reg_rdl_load(rdl_file, tmp_path).get_name() == "soc"
+    assert len(calls) == 2
+
+
+def test_generate_matches_the_golden_model():
+    pytest.importorskip("systemrdl")
+    assert uvm_reg_rdl_generate(SOC_RDL) == GENERATED
+
+
+def test_generate_tinyalu_model(tmp_path):
+    pytest.importorskip("systemrdl")
+    source = uvm_reg_rdl_generate(TINYALU_RDL)
+    assert source.startswith(
+        "# Generated by pyuvm.uvm_reg_rdl_generate() from TinyALUreg.rdl."
+    )
+    block = import_generated(tmp_path, source).build()
+    assert block.get_name() == "TinyALUreg"
+    assert block.get_default_map().get_n_bytes() == 2
+    assert [reg.get_address() for reg in block.get_registers()] == [0x0, 0x2, 0x4]
+    assert block.SRC.data1.get_lsb_pos() == 8
+    assert block.RESULT.data.get_access() == "RO"
+    assert block.CMD.reserved.get_access() == "RW"
+    assert block.CMD.done.get_n_bits() == 1
+
+
+def test_generate_requires_the_systemrdl_compiler(monkeypatch):
+    monkeypatch.setattr(uvm_reg_rdl, "RDLCompiler", None)
+    with pytest.raises(ImportError, match="systemrdl-compiler"):
+        uvm_reg_rdl_generate(TINYALU_RDL)
@@ -156,6 +156,101 @@ def test_translation_body_rejects_non_register_item_and_finishes_it():
     assert upstream.item_done_calls == 1
 
 
+class ItemsUpstream:
+    """Hands out items, then stops once all of them got a response."""
+
+    def __init__(self, items):
+        self.items = list(items)
+        self.pending = len(self.items)
+        self.responses = []
+        self.item_done_calls = 0
+
+    async def get_next_item(self):
+        if self.items:
+            return self.items.pop(0)
+        while len(self.responses) < self.pending:
+            await asyncio.sleep(0)
+        raise StopTranslation
+
+    def item_done(self):
+        self.item_done_calls += 1
+
+    def put_response(self, item):
+        self.responses.append(item)
+
+
+class SlowBusMap:
+    """Completes each access after a few scheduling rounds."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def do_bus_write(self, rw, sequencer, adapter):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        for _ in range(3):
+            await asyncio.sleep(0)
+        if rw.get_value() == 0xBAD:
+            self.in_flight -= 1
+            raise RuntimeError("bus failure")
+        rw.set_status(uvm_status_e.UVM_IS_OK)
+        self.in_flight -= 1
+
+
+@pytest.mark.parametrize("depth", [2, 4])
+def test_pipelined_translation_keeps_depth_items_in_flight(depth):
+    local_map = SlowBusMap()
+    items = []
+    for ii in range(6):
+        rw = uvm_reg_item(f"rw{ii}")
+        rw.set_kind(uvm_access_e.UVM_WRITE)
+        rw.set_value(ii)
+        rw.set_local_map(local_map)
+        items.append(rw)
+    upstream = ItemsUpstream(items)
+    sequence = uvm_reg_sequence()
+    sequence.sequencer = object()
+    sequence.adapter = object()
+    sequence.reg_seqr = upstream
+    sequence._start_soon = asyncio.ensure_future
+    sequence.set_pipeline_depth(depth)
+
+    with pytest.raises(StopTranslation):
+        run_pytest_coro(sequence.body())
+
+    assert local_map.max_in_flight == depth
+    assert upstream.item_done_calls == 6
+    assert sorted(rw.get_transaction_id() for rw in upstream.responses) == sorted(
+        rw.get_transaction_id() for rw in items
+    )
+    assert all(rw.get_status() == uvm_status_e.UVM_IS_OK for rw in items)
+    assert all(rw.get_parent_sequence() is None for rw in items)
+
+
+def test_pipelined_translation_responds_to_failed_items():
+    rw = uvm_reg_item("rw")
+    rw.set_kind(uvm_access_e.UVM_WRITE)
+    rw.set_value(0xBAD)
+    rw.set_status(uvm_status_e.UVM_IS_OK)
+    rw.set_local_map(SlowBusMap())
+    upstream = ItemsUpstream([rw])
+    sequence = uvm_reg_sequence()
+    sequence.sequencer = object()
+    sequence.adapter = object()
+    sequence.reg_seqr = upstream
+    sequence._start_soon = asyncio.ensure_future
+    sequence.set_pipeline_depth(2)
+
+    with pytest.raises(StopTranslation):
+        run_pytest_coro(sequence.body())
+
+    assert upstream.responses == [rw]
+    assert rw.get_status() == uvm_status_e.UVM_NOT_OK
+    with pytest.raises(ValueError, match="at least 1"):
+        sequence.set_pipeline_depth(0)
+
+
 def test_translation_body_without_upstream_reports_and_returns(caplog):
     sequence = uvm_reg_sequence()
 
@@ -169,6 +264,8 @@ def test_translation_body_without_upstream_reports_and_returns(caplog):
     [
         (uvm_access_e.UVM_WRITE, "write"),
         (uvm_access_e.UVM_READ, "read"),
+        (uvm_access_e.UVM_BURST_WRITE, "write"),
+        (uvm_access_e.UVM_BURST_READ, "read"),
     ],
 )
 def test_do_reg_item_uses_selected_map_bus_path(kind, expected):
@@ -192,7 +289,7 @@ def test_do_reg_item_uses_selected_map_bus_path(kind, expected):
         (lambda seq, rw: setattr(seq, "adapter", None), "no adapter"),
         (lambda seq, rw: rw.set_local_map(None), "no selected local map"),
         (
-            lambda seq, rw: rw.set_kind(uvm_access_e.UVM_BURST_WRITE),
+            lambda seq, rw: rw.set_kind(None),
             "Unsupported register translation access kind",
         ),
     ],
@@ -1,11 +1,15 @@
 import pytest
 
 from pyuvm import (
+    UVMError,
     UVMSequenceError,
+    load_stimulus,
     uvm_root,
     uvm_seq_item_export,
     uvm_seq_item_port,
     uvm_sequence_item,
+    uvm_sequencer,
+    uvm_stimulus_recorder,
 )
 
 pytestmark = pytest.mark.usefixtures("initialize_pyuvm")
@@ -67,3 +71,56 @@ def test_try_next_item_raises_assertion_error_if_export_is_disconnected():
 
     with pytest.raises(AssertionError, match="export is not connected"):
         port.try_next_item()
+
+
+class StimItem(uvm_sequence_item):
+    def __init__(self, name, data):
+        super().__init__(name)
+        self.data = data
+
+
+@pytest.mark.parametrize("file_name", ["stim.pkl", "stim.pkl.gz"])
+def test_stimulus_recorder_saves_items(tmp_path, file_name):
+    _, export = make_connected_port()
+    recorder = uvm_stimulus_recorder("recorder", tmp_path / file_name)
+    times = iter([10, 20, 30])
+    recorder.get_time = lambda: next(times)
+    for ii in range(3):
+        item = StimItem(f"item{ii}", data=ii * 7)
+        item.parent_sequence_id = 100 + ii
+        item.set_initiator(export)
+        recorder.record(item)
+    recorder.close()
+
+    replayed = list(load_stimulus(tmp_path / file_name))
+    assert [(t, seq_id) for t, seq_id, _ in replayed] == [
+        (10, 100),
+        (20, 101),
+        (30, 102),
+    ]
+    items = [item for _, _, item in replayed]
+    assert [type(item) for item in items] == [StimItem] * 3
+    assert [item.data for item in items] == [0, 7, 14]
+    assert items[1].get_name() == "item1"
+    assert items[1].get_initiator() is None
+    assert items[1].start_condition is not None
+
+
+def test_closed_stimulus_recorder_cannot_record(tmp_path):
+    recorder = uvm_stimulus_recorder("recorder")
+    with pytest.raises(UVMError, match="recorder must be opened"):
+        recorder.record(StimItem("item", data=1))
+    recorder.open(tmp_path / "stim.pkl")
+    recorder.close()
+    with pytest.raises(UVMError, match="recorder must be opened"):
+        recorder.record(StimItem("item", data=1))
+
+
+def test_sequencer_attaches_stimulus_recorder(tmp_path):
+    seqr = uvm_sequencer("seqr", uvm_root())
+    recorder = uvm_stimulus_recorder("recorder")
+    seqr.set_stimulus_recorder(recorder)
+    assert seqr.seq_item_export.recorder is recorder
+    seqr.set_stimulus_recorder(None)
+    assert seqr.seq_item_export.recorder is None
+    assert not recorder.is_open()
@@ -0,0 +1,76 @@
+"""Tests for the shared UVMThreadPool used to offload blocking model calls.
+
+Awaiting an unfinished call goes through a cocotb bridge thread and is
+covered by tests/cocotb_tests/run_phase. These tests exercise the pool lifecycle and the
+result path for calls that have already completed.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from pyuvm import UVMThreadPool
+
+pytestmark = pytest.mark.usefixtures("initialize_pyuvm")
+
+
+def test_thread_pool_is_a_shared_singleton():
+    assert UVMThreadPool() is UVMThreadPool()
+
+
+def test_submit_runs_in_a_worker_thread():
+    pool = UVMThreadPool()
+    future = pool.submit(threading.current_thread)
+    assert future.result(timeout=5) is not threading.current_thread()
+    assert future.result().name.startswith("pyuvm")
+    pool.shutdown()
+
+
+def test_wait_returns_result_of_completed_call():
+    pool = UVMThreadPool()
+    future = pool.submit(sum, [1, 2, 3])
+    future.result(timeout=5)
+    assert asyncio.run(pool.wait(future)) == 6
+    pool.shutdown()
+
+
+def test_wait_reraises_worker_exception():
+    def model():
+        raise ValueError("bad prediction")
+
+    pool = UVMThreadPool()
+    future = pool.submit(model)
+    with pytest.raises(ValueError, match="bad prediction"):
+        future.result(timeout=5)
+    with pytest.raises(ValueError, match="bad prediction"):
+        asyncio.run(pool.wait(future))
+    pool.shutdown()
+
+
+def test_set_max_workers_recreates_running_pool():
+    pool = UVMThreadPool()
+    pool.submit(int).result(timeout=5)
+    assert pool.is_running()
+    pool.set_max_workers(2)
+    assert not pool.is_running()
+    assert pool.get_max_workers() == 2
+    pool.submit(int).result(timeout=5)
+    assert pool._executor._max_workers == 2
+    pool.shutdown()
+
+
+def test_set_max_workers_rejects_empty_pool():
+    with pytest.raises(ValueError, match="at least 1"):
+        UVMThreadPool().set_max_workers(0)
+
+
+def test_shutdown_is_idempotent_and_pool_restarts():
+    pool = UVMThreadPool()
+    pool.shutdown()
+    pool.submit(int).result(timeout=5)
+    pool.shutdown()
+    pool.shutdown()
+    assert not pool.is_running()
+    assert pool.submit(int).result(timeout=5) == 0
+    pool.shutdown()
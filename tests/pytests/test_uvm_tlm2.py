@@ -0,0 +1,240 @@
+"""Tests for the TLM-2.0 generic payload and sockets (IEEE 1800.2 section 12.3)."""
+
+import asyncio
+
+import pytest
+
+from pyuvm import (
+    UVMTLMConnectionError,
+    uvm_component,
+    uvm_tlm_b_initiator_socket,
+    uvm_tlm_b_target_socket,
+    uvm_tlm_command_e,
+    uvm_tlm_dmi,
+    uvm_tlm_generic_payload,
+    uvm_tlm_nb_initiator_socket,
+    uvm_tlm_nb_target_socket,
+    uvm_tlm_phase_e,
+    uvm_tlm_response_status_e,
+    uvm_tlm_sync_e,
+)
+
+pytestmark = pytest.mark.usefixtures("initialize_pyuvm")
+
+
+class Memory(uvm_component):
+    """A byte-addressed target memory model with DMI."""
+
+    def __init__(self, name, parent, size=64):
+        super().__init__(name, parent)
+        self.mem = bytearray(size)
+        self.socket = uvm_tlm_b_target_socket("socket", self)
+
+    async def b_transport(self, t, delay):
+        addr = t.get_address()
+        length = t.get_data_length()
+        if addr + length > len(self.mem):
+            t.set_response_status(
+                uvm_tlm_response_status_e.UVM_TLM_ADDRESS_ERROR_RESPONSE
+            )
+            return None
+        data = t.get_data()
+        for ii in range(length):
+            if not t.is_byte_enabled(ii):
+                continue
+            if t.is_write():
+                self.mem[addr + ii] = data[ii]
+            else:
+                data[ii] = self.mem[addr + ii]
+        t.set_dmi_allowed(True)
+        t.set_response_status(uvm_tlm_response_status_e.UVM_TLM_OK_RESPONSE)
+        return delay + 10
+
+    def get_direct_mem_ptr(self, t):
+        return True, uvm_tlm_dmi(memoryview(self.mem))
+
+
+class Initiator(uvm_component):
+    def __init__(self, name, parent):
+        super().__init__(name, parent)
+        self.socket = uvm_tlm_b_initiator_socket("socket", self)
+        self.invalidated = []
+
+    def invalidate_direct_mem_ptr(self, start_range, end_range):
+        self.invalidated.append((start_range, end_range))
+
+
+def make_payload(command, addr, data, byte_enable=None):
+    gp = uvm_tlm_generic_payload("gp")
+    gp.set_command(command)
+    gp.set_address(addr)
+    gp.set_data(data)
+    if byte_enable is not None:
+        gp.set_byte_enable(byte_enable)
+    return gp
+
+
+def test_generic_payload_defaults_and_accessors():
+    gp = uvm_tlm_generic_payload()
+    assert gp.get_command() == uvm_tlm_command_e.UVM_TLM_IGNORE_COMMAND
+    assert not gp.is_response_ok()
+    assert gp.get_response_string() == "UVM_TLM_INCOMPLETE_RESPONSE"
+    gp.set_read()
+    assert gp.is_read()
+    assert not gp.is_write()
+    gp.set_data(b"\x01\x02")
+    assert isinstance(gp.get_data(), bytearray)
+    assert gp.get_data_length() == 2
+
+
+def test_generic_payload_keeps_memoryview_without_copy():
+    backing = bytearray(8)
+    gp = uvm_tlm_generic_payload()
+    gp.set_data(memoryview(backing)[2:6])
+    gp.get_data()[0] = 0xAB
+    assert backing[2] == 0xAB
+    assert gp.get_data_length() == 4
+
+
+def test_generic_payload_copy_and_compare():
+    gp = make_payload(uvm_tlm_command_e.UVM_TLM_WRITE_COMMAND, 4, b"\x11\x22")
+    other = uvm_tlm_generic_payload()
+    other.copy(gp)
+    assert other.compare(gp)
+    other.get_data()[0] = 0
+    assert not other.compare(gp)
+    assert gp.get_data()[0] == 0x11
+
+
+def test_generic_payload_extensions_are_keyed_by_type():
+    class Tag:
+        def __init__(self, value):
+            self.value = value
+
+    gp = uvm_tlm_generic_payload()
+    assert gp.set_extension(Tag(1)) is None
+    assert gp.set_extension(Tag(2)).value == 1
+    assert gp.get_extension(Tag).value == 2
+    assert gp.get_num_extensions() == 1
+    gp.clear_extension(Tag)
+    assert gp.get_extension(Tag) is None
+
+
+def test_b_transport_write_read_with_byte_enables():
+    mem = Memory("mem", None)
+    init = Initiator("init", None)
+    init.socket.connect(mem.socket)
+
+    write = make_payload(
+        uvm_tlm_command_e.UVM_TLM_WRITE_COMMAND,
+        8,
+        b"\x01\x02\x03\x04",
+        byte_enable=b"\xff\x00",
+    )
+    delay = asyncio.run(init.socket.b_transport(write, 5))
+    assert delay == 15
+    assert write.is_response_ok()
+    assert mem.mem[8:12] == b"\x01\x00\x03\x00"
+
+    read = make_payload(uvm_tlm_command_e.UVM_TLM_READ_COMMAND, 8, bytearray(4))
+    assert asyncio.run(init.socket.b_transport(read)) == 10
+    assert read.get_data() == b"\x01\x00\x03\x00"
+    assert read.is_dmi_allowed()
+
+
+def test_b_transport_keeps_delay_when_target_returns_none():
+    mem = Memory("mem", None, size=4)
+    init = Initiator("init", None)
+    init.socket.connect(mem.socket)
+    gp = make_payload(uvm_tlm_command_e.UVM_TLM_READ_COMMAND, 2, bytearray(4))
+    assert asyncio.run(init.socket.b_transport(gp, 7)) == 7
+    assert gp.is_response_error()
+
+
+def test_dmi_gives_zero_copy_view_of_target_memory():
+    mem = Memory("mem", None)
+    init = Initiator("init", None)
+    init.socket.connect(mem.socket)
+
+    gp = make_payload(uvm_tlm_command_e.UVM_TLM_READ_COMMAND, 0, bytearray(1))
+    allowed, dmi = init.socket.get_direct_mem_ptr(gp)
+    assert allowed
+    assert (dmi.start_address, dmi.end_address) == (0, 63)
+    view = dmi.view(16, 4)
+    view[:] = b"\xde\xad\xbe\xef"
+    assert mem.mem[16:20] == b"\xde\xad\xbe\xef"
+    with pytest.raises(IndexError, match="outside"):
+        dmi.view(62, 4)
+
+    mem.socket.invalidate_direct_mem_ptr(0, 63)
+    assert init.invalidated == [(0, 63)]
+
+
+def test_target_without_dmi_refuses_grant():
+    class NoDmi(uvm_component):
+        async def b_transport(self, t, delay):
+            pass
+
+    target = NoDmi("target", None)
+    target_socket = uvm_tlm_b_target_socket("socket", target)
+    init = Initiator("init", None)
+    init.socket.connect(target_socket)
+    assert init.socket.get_direct_mem_ptr(uvm_tlm_generic_payload()) == (False, None)
+
+
+def test_socket_connection_errors():
+    init = Initiator("init", None)
+    with pytest.raises(UVMTLMConnectionError, match="Did you connect it"):
+        asyncio.run(init.socket.b_transport(uvm_tlm_generic_payload()))
+    with pytest.raises(UVMTLMConnectionError, match="must implement 'b_transport"):
+        uvm_tlm_b_target_socket("socket", init)
+
+    class NbTarget(uvm_component):
+        def nb_transport_fw(self, t, phase, delay):
+            return uvm_tlm_sync_e.UVM_TLM_ACCEPTED, phase, delay
+
+    nb_target = uvm_tlm_nb_target_socket("socket", NbTarget("nb", None))
+    with pytest.raises(UVMTLMConnectionError, match="must be a uvm_tlm_b_target"):
+        init.socket.connect(nb_target)
+
+
+def test_nb_transport_forward_and_backward_paths():
+    class NbInitiator(uvm_component):
+        def __init__(self, name, parent):
+            super().__init__(name, parent)
+            self.socket = uvm_tlm_nb_initiator_socket("socket", self)
+            self.bw = []
+
+        def nb_transport_bw(self, t, phase, delay):
+            self.bw.append(phase)
+            return uvm_tlm_sync_e.UVM_TLM_COMPLETED, uvm_tlm_phase_e.END_RESP, delay
+
+    class NbTarget(uvm_component):
+        def __init__(self, name, parent):
+            super().__init__(name, parent)
+            self.socket = uvm_tlm_nb_target_socket("socket", self)
+
+        def nb_transport_fw(self, t, phase, delay):
+            assert phase == uvm_tlm_phase_e.BEGIN_REQ
+            return uvm_tlm_sync_e.UVM_TLM_UPDATED, uvm_tlm_phase_e.END_REQ, delay + 1
+
+    init = NbInitiator("init", None)
+    target = NbTarget("target", None)
+    init.socket.connect(target.socket)
+    gp = uvm_tlm_generic_payload()
+
+    assert init.socket.nb_transport_fw(gp, uvm_tlm_phase_e.BEGIN_REQ, 3) == (
+        uvm_tlm_sync_e.UVM_TLM_UPDATED,
+        uvm_tlm_phase_e.END_REQ,
+        4,
+    )
+    assert target.socket.nb_transport_bw(gp, uvm_tlm_phase_e.BEGIN_RESP) == (
+        uvm_tlm_sync_e.UVM_TLM_COMPLETED,
+        uvm_tlm_phase_e.END_RESP,
+        0,
+    )
+    assert init.bw == [uvm_tlm_phase_e.BEGIN_RESP]
+
+    other = NbInitiator("other", None)
+    with pytest.raises(UVMTLMConnectionError, match="already connected"):
+        other.socket.connect(target.socket)
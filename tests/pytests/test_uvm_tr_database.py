@@ -0,0 +1,162 @@
+"""Tests for transaction recording into the columnar uvm_tr_database."""
+
+import pytest
+
+from pyuvm import (
+    UVMError,
+    load_tr_database,
+    uvm_object,
+    uvm_tr_database,
+    uvm_transaction,
+)
+
+
+class BusTxn(uvm_transaction):
+    def __init__(self, name, addr=0, data=0):
+        super().__init__(name)
+        self.addr = addr
+        self.data = data
+
+
+class OtherTxn(uvm_transaction): ...
+
+
+def record(stream, txn, accept, begin, end):
+    txn.enable_recording(stream)
+    txn.accept_tr(accept)
+    handle = txn.begin_tr(begin)
+    assert txn.is_active()
+    assert txn.get_tr_handle() == handle != 0
+    txn.end_tr(end)
+    assert not txn.is_active()
+    assert txn.get_tr_handle() == 0
+
+
+@pytest.mark.parametrize("db_name", ["run.sqlite", "run_npy"])
+def test_recorded_streams_round_trip(tmp_path, db_name):
+    db = uvm_tr_database("db", chunk_size=3)
+    db.open_db(tmp_path / db_name)
+    bus = db.open_stream("bus", "env.agent", fields=("addr", "data"))
+    other = db.open_stream("other")
+    for ii in range(7):
+        txn = BusTxn(f"txn{ii}", addr=0x100 + ii, data=ii * ii)
+        txn.set_transaction_id(ii)
+        record(bus, txn, 10 * ii + 1, 10 * ii + 2, 10 * ii + 5)
+    record(other, OtherTxn("o"), 1, 2, 3)
+    db.close_db()
+
+    streams = load_tr_database(tmp_path / db_name)
+    bus_cols = streams["bus"]
+    assert list(bus_cols["tx_id"]) == list(range(7))
+    assert list(bus_cols["addr"]) == [0x100 + ii for ii in range(7)]
+    assert list(bus_cols["data"]) == [ii * ii for ii in range(7)]
+    latency = [e - b for b, e in zip(bus_cols["begin_time"], bus_cols["end_time"])]
+    assert latency == [3] * 7
+    assert bus_cols["type_names"] == ["BusTxn"]
+    assert set(bus_cols["type_id"]) == {0}
+    assert streams["other"]["type_names"] == ["OtherTxn"]
+    assert list(streams["other"]["end_time"]) == [3]
+
+
+def test_fields_named_as_sql_keywords(tmp_path):
+    db = uvm_tr_database("db")
+    db.open_db(tmp_path / "run.sqlite")
+    stream = db.open_stream("bus", fields=("from", "order", "group"))
+    txn = uvm_transaction("txn")
+    txn.order = 3
+    record(stream, txn, 1, 2, 3)
+    db.close_db()
+    cols = load_tr_database(tmp_path / "run.sqlite")["bus"]
+    assert list(cols["order"]) == [3]
+    assert list(cols["from"]) == list(cols["group"]) == [0]
+
+
+def test_full_chunks_are_flushed_before_close(tmp_path):
+    db = uvm_tr_database("db", chunk_size=2)
+    db.open_db(tmp_path / "run.sqlite")
+    stream = db.open_stream("bus", fields=("addr",))
+    for ii in range(5):
+        record(stream, BusTxn(f"t{ii}", addr=ii), 1, 2, 3)
+    assert stream.rows_recorded == 5
+    assert stream._count == 1
+    db.close_db()
+    assert len(load_tr_database(tmp_path / "run.sqlite")["bus"]["addr"]) == 5
+
+
+def test_unset_times_and_missing_fields_use_sentinels(tmp_path):
+    db = uvm_tr_database("db")
+    db.open_db(tmp_path / "run_npy")
+    stream = db.open_stream("bus", fields={"addr": "q", "ratio": "d"})
+    txn = uvm_transaction("bare")
+    txn.enable_recording(stream)
+    txn.begin_tr(4)
+    txn.end_tr(6)
+    db.close_db()
+    cols = load_tr_database(tmp_path / "run_npy")["bus"]
+    assert list(cols["accept_time"]) == [-1]
+    assert list(cols["addr"]) == [0]
+    assert list(cols["ratio"]) == [0.0]
+
+
+def test_disable_recording_stops_rows(tmp_path):
+    db = uvm_tr_database("db")
+    db.open_db(tmp_path / "run.sqlite")
+    stream = db.open_stream("bus")
+    txn = BusTxn("t")
+    txn.enable_recording(stream)
+    assert txn.is_recording_enabled()
+    txn.disable_recording()
+    txn.begin_tr(1)
+    assert txn.get_tr_handle() == 0
+    txn.end_tr(2)
+    assert stream.rows_recorded == 0
+    db.close_db()
+
+
+def test_database_errors(tmp_path):
+    db = uvm_tr_database("db")
+    with pytest.raises(UVMError, match="must be opened"):
+        db.open_stream("bus")
+    with pytest.raises(UVMError, match="Unknown recording format"):
+        db.open_db(tmp_path / "run.sqlite", fmt="csv")
+    db.open_db(tmp_path / "run.sqlite")
+    with pytest.raises(UVMError, match="already open"):
+        db.open_db(tmp_path / "other.sqlite")
+    with pytest.raises(UVMError, match="reserved"):
+        db.open_stream("bus", fields=("tx_id",))
+    db.close_db()
+    assert not db.is_open()
+
+
+@pytest.mark.parametrize("db_name", ["run.sqlite", "run_npy"])
+def test_reopening_a_path_records_a_fresh_run(tmp_path, db_name):
+    for run in range(2):
+        db = uvm_tr_database("db")
+        if run:
+            with pytest.raises(UVMError, match="overwrite=True"):
+                db.open_db(tmp_path / db_name)
+            assert not db.is_open()
+        db.open_db(tmp_path / db_name, overwrite=bool(run))
+        stream = db.open_stream("bus")
+        record(stream, BusTxn(f"t{run}"), 1, 2, 3)
+        db.close_db()
+    assert len(load_tr_database(tmp_path / db_name)["bus"]["tx_id"]) == 1
+
+
+def test_objects_record_one_row(tmp_path):
+    db = uvm_tr_database("db")
+    db.open_db(tmp_path / "run.sqlite")
+    stream = db.open_stream("bus", fields=("addr",))
+    config = uvm_object("config")
+    config.addr = 0x40
+    config.record(stream)
+    txn = BusTxn("txn", addr=0x80)
+    txn.accept_tr(5)
+    txn.record(stream)
+    db.close_db()
+
+    bus = load_tr_database(tmp_path / "run.sqlite")["bus"]
+    assert list(bus["addr"]) == [0x40, 0x80]
+    assert list(bus["tx_id"]) == [-1, txn.get_transaction_id()]
+    assert list(bus["accept_time"]) == [-1, 5]
+    assert bus["type_names"] == ["uvm_object", "BusTxn"]
@@ -0,0 +1,97 @@
+"""Tests for wait_any(), the multi-FIFO select primitive.
+
+Blocking waits are driven by stepping the coroutine by hand, with a stand-in
+for the current cocotb task, so no simulator is needed.
+"""
+
+import asyncio
+
+import pytest
+
+import pyuvm._utility_classes as utility_classes
+from pyuvm import UVMQueue, uvm_subscriber, uvm_tlm_fifo, wait_any
+
+pytestmark = pytest.mark.usefixtures("initialize_pyuvm")
+
+
+class FakeTask:
+    def done(self):
+        return False
+
+
+@pytest.fixture()
+def fake_task(monkeypatch):
+    task = FakeTask()
+    monkeypatch.setattr(utility_classes, "current_task", lambda: task)
+    return task
+
+
+def step(coro):
+    """Run coro until it blocks. Return its result, or None if blocked."""
+    try:
+        coro.send(None)
+    except StopIteration as done:
+        return done.value
+    return None
+
+
+def test_wait_any_returns_first_ready_queue():
+    q0, q1, q2 = UVMQueue(), UVMQueue(), UVMQueue()
+    q1.put_nowait("b")
+    q2.put_nowait("c")
+    assert asyncio.run(wait_any([q0, q1, q2])) == (q1, "b")
+    assert q1.empty()
+    assert q2.qsize() == 1
+
+
+def test_wait_any_requires_a_fifo():
+    with pytest.raises(ValueError, match="at least one"):
+        asyncio.run(wait_any([]))
+
+
+def test_wait_any_on_tlm_fifo_writes_get_ap():
+    class Listener(uvm_subscriber):
+        def __init__(self, name, parent):
+            super().__init__(name, parent)
+            self.seen = []
+
+        def write(self, tt):
+            self.seen.append(tt)
+
+    fifos = [uvm_tlm_fifo(f"fifo{ii}", None, size=0) for ii in range(3)]
+    listener = Listener("listener", None)
+    fifos[2].get_ap.connect(listener.analysis_export)
+    fifos[2].put_export.try_put(42)
+    assert asyncio.run(wait_any(fifos)) == (fifos[2], 42)
+    assert listener.seen == [42]
+
+
+def test_wait_any_blocks_with_one_shared_registration(fake_task):
+    queues = [UVMQueue() for _ in range(4)]
+    coro = wait_any(queues)
+    assert step(coro) is None
+    waiters = [q._getters[0] for q in queues]
+    assert all(len(q._getters) == 1 for q in queues)
+    assert all(waiter is waiters[0] for waiter in waiters)
+
+    queues[3].put_nowait("late")
+    assert not queues[3]._getters
+    assert step(coro) == (queues[3], "late")
+    assert not any(q._getters for q in queues)
+
+
+def test_wait_any_passes_on_wakeup_it_did_not_use(fake_task):
+    q0, q1 = UVMQueue(), UVMQueue()
+    coro = wait_any([q0, q1])
+    step(coro)
+
+    # q1 wakes us first, then q0 receives an item before we resume. We take
+    # from q0 (higher priority), so q1's item must wake its next getter.
+    q1.put_nowait("one")
+    q0.put_nowait("zero")
+    other = utility_classes.Event()
+    q1._getters.append((other, FakeTask()))
+    assert step(coro) == (q0, "zero")
+    assert other.is_set()
+    assert not q0._getters
+    assert not q1._getters